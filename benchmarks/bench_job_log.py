@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""Compare job log throughput: per-line open/append/close vs JobLogWriter."""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from game_web.jobs import JobLogWriter
+from game_web.services.job_service import append_job_log
+
+SAMPLE_LINE = (
+    "Batch 123: 7872/1000000 docs encode=0.52s serialize=0.01s upload=0.05s "
+    "task=0.30s 120.3 docs/s ETA 8246s"
+)
+
+
+def bench_append_job_log(path: Path, lines: int) -> float:
+    started = time.perf_counter()
+    for _ in range(lines):
+        append_job_log(str(path), SAMPLE_LINE)
+    return time.perf_counter() - started
+
+
+def bench_job_log_writer(path: Path, lines: int) -> float:
+    started = time.perf_counter()
+    with JobLogWriter(str(path)) as writer:
+        for _ in range(lines):
+            writer.log(SAMPLE_LINE)
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark job log writers (lines/sec).")
+    parser.add_argument("--lines", type=int, default=50000, help="Lines written per run.")
+    parser.add_argument("--output-json", dest="output_json", help="Optional path to write results JSON.")
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, bench in (
+            ("append_job_log", bench_append_job_log),
+            ("JobLogWriter", bench_job_log_writer),
+        ):
+            path = Path(tmp) / f"{name}.log"
+            elapsed = bench(path, args.lines)
+            written = len(path.read_text(encoding="utf-8").splitlines())
+            if written != args.lines:
+                raise SystemExit(f"{name} wrote {written} lines, expected {args.lines}")
+            results.append({"writer": name, "lines": args.lines, "seconds": elapsed, "lines_per_sec": args.lines / elapsed})
+
+    for row in results:
+        print(f"{row['writer']:<16} {row['lines_per_sec']:>12.0f} lines/s ({row['seconds']:.3f}s)")
+    print(f"speedup: {results[0]['seconds'] / results[1]['seconds']:.1f}x")
+    if args.output_json:
+        Path(args.output_json).write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
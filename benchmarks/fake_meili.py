@@ -0,0 +1,705 @@
+"""In-process stand-in for the Meilisearch HTTP API, for offline load and failure testing.
+
+Only the subset ``MeiliGameIndex`` and the web UI use is implemented: index
+create/delete/get/stats, settings, document add and paged fetch, the task
+queue, vector and hybrid search, multi-search and index swaps. Writes go
+through an asynchronous task queue like the real server, vector search is
+exact brute force with numpy, and ``FakeMeiliProfile`` injects latency and
+failures from a seeded RNG so runs are repeatable.
+"""
+
+import datetime
+import json
+import logging
+import random
+import re
+import threading
+import time
+from collections import Counter, deque
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+
+DEFAULT_SETTINGS: Dict[str, Any] = {
+    "displayedAttributes": ["*"],
+    "searchableAttributes": ["*"],
+    "filterableAttributes": [],
+    "sortableAttributes": [],
+    "rankingRules": ["words", "typo", "proximity", "attribute", "sort", "exactness"],
+    "stopWords": [],
+    "synonyms": {},
+    "distinctAttribute": None,
+    "embedders": {},
+}
+
+
+@dataclass
+class FakeMeiliProfile:
+    """
+    Latency and failure injection for FakeMeiliServer.
+
+    ``request_latency`` is added to every HTTP response; each task then takes
+    ``task_latency`` plus ``document_latency`` per document before it
+    finishes. ``error_rate`` answers that share of requests (health checks
+    excepted) with HTTP 503 without touching state, and ``task_failure_rate``
+    makes that share of document additions end as failed tasks.
+    """
+
+    request_latency: float = 0.0
+    task_latency: float = 0.0
+    document_latency: float = 0.0
+    error_rate: float = 0.0
+    task_failure_rate: float = 0.0
+    seed: int = 0
+
+
+class FakeMeiliError(Exception):
+    """An API error rendered as Meilisearch's JSON error body."""
+
+    def __init__(self, status: int, code: str, message: str, error_type: str = "invalid_request"):
+        super().__init__(message)
+        self.status = status
+        self.code = code
+        self.error_type = error_type
+
+    def body(self) -> Dict[str, Any]:
+        return {"message": str(self), "code": self.code, "type": self.error_type, "link": ""}
+
+
+def _now() -> str:
+    return datetime.datetime.now(datetime.timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def _index_not_found(uid: str) -> FakeMeiliError:
+    return FakeMeiliError(404, "index_not_found", f"Index `{uid}` not found.")
+
+
+class _Index:
+    def __init__(self, uid: str, primary_key: Optional[str] = None):
+        self.uid = uid
+        self.primary_key = primary_key
+        self.documents: Dict[Any, Dict[str, Any]] = {}
+        self.settings: Dict[str, Any] = json.loads(json.dumps(DEFAULT_SETTINGS))
+        self.created_at = self.updated_at = _now()
+        self._vector_cache: Dict[str, Tuple[List[Any], np.ndarray]] = {}
+
+    def info(self) -> Dict[str, Any]:
+        return {"uid": self.uid, "primaryKey": self.primary_key, "createdAt": self.created_at, "updatedAt": self.updated_at}
+
+    def touch(self) -> None:
+        self.updated_at = _now()
+        self._vector_cache.clear()
+
+    def vectors(self, embedder: str) -> Tuple[List[Any], np.ndarray]:
+        """Ids and row-normalized vectors of every document with a vector for ``embedder``."""
+        if embedder not in self._vector_cache:
+            ids, rows = [], []
+            for doc_id, doc in self.documents.items():
+                vector = (doc.get("_vectors") or {}).get(embedder)
+                if vector:
+                    ids.append(doc_id)
+                    rows.append(vector)
+            matrix = np.asarray(rows, dtype=np.float32).reshape(len(rows), -1)
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True) if len(rows) else np.ones((0, 1), dtype=np.float32)
+            self._vector_cache[embedder] = (ids, matrix / np.maximum(norms, 1e-12))
+        return self._vector_cache[embedder]
+
+    def project(self, doc: Dict[str, Any], fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        displayed = self.settings.get("displayedAttributes") or ["*"]
+        keys = [key for key in doc if key != "_vectors" and ("*" in displayed or key in displayed)]
+        if fields and "*" not in fields:
+            keys = [key for key in keys if key in fields]
+        return {key: doc[key] for key in keys}
+
+
+class FakeMeiliState:
+    """Indexes, the task queue and request accounting behind a FakeMeiliServer."""
+
+    def __init__(self, profile: Optional[FakeMeiliProfile] = None):
+        self.profile = profile or FakeMeiliProfile()
+        self.indexes: Dict[str, _Index] = {}
+        self.tasks: Dict[int, Dict[str, Any]] = {}
+        self.request_counts: Counter = Counter()
+        self._rng = random.Random(self.profile.seed)
+        self._lock = threading.RLock()
+        self._pending: Deque[Tuple[Dict[str, Any], Callable[[Dict[str, Any]], None]]] = deque()
+        self._wakeup = threading.Condition(self._lock)
+        self._scripted_failures: Deque[Tuple[Optional[str], int]] = deque()
+        self._next_uid = 0
+        self._stopped = False
+        self._worker = threading.Thread(target=self._process_tasks, name="fake-meili-tasks", daemon=True)
+        self._worker.start()
+
+    # --- failure injection -------------------------------------------------
+
+    def fail_next(self, count: int = 1, *, status: int = 503, path_prefix: Optional[str] = None) -> None:
+        """Answer the next ``count`` requests (optionally only those under ``path_prefix``) with ``status``."""
+        with self._lock:
+            self._scripted_failures.extend([(path_prefix, status)] * count)
+
+    def injected_failure(self, path: str) -> Optional[int]:
+        with self._lock:
+            for position, (prefix, status) in enumerate(self._scripted_failures):
+                if prefix is None or path.startswith(prefix):
+                    del self._scripted_failures[position]
+                    return status
+            if self.profile.error_rate and self._rng.random() < self.profile.error_rate:
+                return 503
+        return None
+
+    # --- task queue --------------------------------------------------------
+
+    def enqueue(
+        self, task_type: str, index_uid: Optional[str], details: Dict[str, Any], apply: Callable[[Dict[str, Any]], None]
+    ) -> Dict[str, Any]:
+        with self._lock:
+            uid = self._next_uid
+            self._next_uid += 1
+            task = {
+                "uid": uid,
+                "batchUid": None,
+                "indexUid": index_uid,
+                "status": "enqueued",
+                "type": task_type,
+                "canceledBy": None,
+                "details": details,
+                "error": None,
+                "duration": None,
+                "enqueuedAt": _now(),
+                "startedAt": None,
+                "finishedAt": None,
+            }
+            self.tasks[uid] = task
+            self._pending.append((task, apply))
+            self._wakeup.notify()
+        return {"taskUid": uid, "indexUid": index_uid, "status": "enqueued", "type": task_type, "enqueuedAt": task["enqueuedAt"]}
+
+    def _process_tasks(self) -> None:
+        while True:
+            with self._lock:
+                while not self._pending and not self._stopped:
+                    self._wakeup.wait()
+                if self._stopped:
+                    return
+                task, apply = self._pending[0]
+                task["status"] = "processing"
+                task["startedAt"] = _now()
+                task["batchUid"] = task["uid"]
+                documents = int((task["details"] or {}).get("receivedDocuments") or 0)
+            delay = self.profile.task_latency + self.profile.document_latency * documents
+            if delay > 0:
+                time.sleep(delay)
+            started = time.perf_counter()
+            with self._lock:
+                try:
+                    if task["type"] == "documentAdditionOrUpdate" and self.profile.task_failure_rate:
+                        if self._rng.random() < self.profile.task_failure_rate:
+                            raise FakeMeiliError(500, "internal", "Injected task failure.", "internal")
+                    apply(task)
+                    task["status"] = "succeeded"
+                except FakeMeiliError as exc:
+                    task["status"] = "failed"
+                    task["error"] = exc.body()
+                except Exception as exc:  # noqa: BLE001 - a broken task must not kill the queue
+                    logging.exception("Fake Meilisearch task %s crashed", task["uid"])
+                    task["status"] = "failed"
+                    task["error"] = FakeMeiliError(500, "internal", str(exc), "internal").body()
+                task["finishedAt"] = _now()
+                task["duration"] = f"PT{delay + time.perf_counter() - started:.6f}S"
+                self._pending.popleft()
+                self._wakeup.notify_all()
+
+    def wait_idle(self, timeout: float = 5.0) -> bool:
+        """Block until every enqueued task has finished; False on timeout."""
+        deadline = time.monotonic() + timeout
+        with self._lock:
+            while self._pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._wakeup.wait(remaining)
+        return True
+
+    def stop(self) -> None:
+        with self._lock:
+            self._stopped = True
+            self._wakeup.notify_all()
+        self._worker.join(timeout=5)
+
+    # --- helpers used by the routes ----------------------------------------
+
+    def get_index(self, uid: str) -> _Index:
+        index = self.indexes.get(uid)
+        if index is None:
+            raise _index_not_found(uid)
+        return index
+
+    def index_for_write(self, uid: str) -> _Index:
+        """Document and settings tasks create a missing index, as Meilisearch does."""
+        if uid not in self.indexes:
+            self.indexes[uid] = _Index(uid)
+        return self.indexes[uid]
+
+
+def _keyword_scores(index: _Index, query: str) -> Dict[Any, float]:
+    """Share of query words found in the searchable attributes, for documents matching any word."""
+    words = [word for word in query.lower().split() if word]
+    if not words:
+        return {}
+    searchable = index.settings.get("searchableAttributes") or ["*"]
+    scores = {}
+    for doc_id, doc in index.documents.items():
+        text = " ".join(
+            str(value) for key, value in doc.items() if key != "_vectors" and ("*" in searchable or key in searchable)
+        ).lower()
+        matched = sum(1 for word in words if word in text)
+        if matched:
+            scores[doc_id] = matched / len(words)
+    return scores
+
+
+def search_index(index: _Index, body: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Run one search request body against an index.
+
+    Vector scores are cosine similarity mapped to [0, 1]. Hybrid requests
+    blend them linearly with the keyword score by ``semanticRatio``; this is
+    simpler than Meilisearch's own merge but orders hits the same way for the
+    pure-vector and pure-keyword cases.
+    """
+    started = time.perf_counter()
+    query = body.get("q") or ""
+    limit = int(body.get("limit", 20))
+    offset = int(body.get("offset", 0))
+    vector = body.get("vector")
+    hybrid = body.get("hybrid") or {}
+    ratio = float(hybrid.get("semanticRatio", 0.5)) if hybrid else 0.0
+    semantic: Dict[Any, float] = {}
+    if vector is not None:
+        embedder = hybrid.get("embedder")
+        config = (index.settings.get("embedders") or {}).get(embedder)
+        if config is None:
+            raise FakeMeiliError(400, "invalid_search_embedder", f"Cannot find embedder with name `{embedder}`.")
+        dimensions = config.get("dimensions")
+        if dimensions and len(vector) != dimensions:
+            raise FakeMeiliError(
+                400,
+                "invalid_vector_dimensions",
+                f"Expected {dimensions} dimensions for embedder `{embedder}`, got {len(vector)}.",
+            )
+        ids, matrix = index.vectors(embedder)
+        if ids:
+            query_vector = np.asarray(vector, dtype=np.float32)
+            query_vector /= max(float(np.linalg.norm(query_vector)), 1e-12)
+            similarities = (matrix @ query_vector + 1.0) / 2.0
+            semantic = dict(zip(ids, similarities.tolist()))
+    keyword = _keyword_scores(index, query) if query and ratio < 1.0 else {}
+    if vector is None:
+        scored = keyword
+    elif not keyword:
+        scored = semantic
+    else:
+        scored = {
+            doc_id: ratio * semantic.get(doc_id, 0.0) + (1.0 - ratio) * keyword.get(doc_id, 0.0)
+            for doc_id in set(semantic) | set(keyword)
+        }
+    ranked = sorted(scored.items(), key=lambda item: -item[1])
+    hits = []
+    for doc_id, score in ranked[offset : offset + limit]:
+        hit = index.project(index.documents[doc_id], body.get("attributesToRetrieve"))
+        if body.get("showRankingScore"):
+            hit["_rankingScore"] = score
+        hits.append(hit)
+    result = {
+        "hits": hits,
+        "query": query,
+        "processingTimeMs": int((time.perf_counter() - started) * 1000),
+        "limit": limit,
+        "offset": offset,
+        "estimatedTotalHits": len(ranked),
+    }
+    if vector is not None:
+        result["semanticHitCount"] = sum(1 for doc_id, _ in ranked[offset : offset + limit] if doc_id in semantic)
+    return result
+
+
+def _route_label(method: str, pattern: str) -> str:
+    return f"{method} " + re.sub(r"\(\?P<(\w+)>[^)]*\)", r"{\1}", pattern)
+
+
+# (method, compiled path, label used in request_counts such as "GET /tasks/{task_uid}", handler)
+_ROUTES: List[Tuple[str, "re.Pattern[str]", str, str]] = [
+    (method, re.compile(f"^{pattern}$"), _route_label(method, pattern), handler)
+    for method, pattern, handler in (
+        ("GET", r"/health", "_health"),
+        ("GET", r"/indexes", "_list_indexes"),
+        ("POST", r"/indexes", "_create_index"),
+        ("GET", r"/indexes/(?P<uid>[^/]+)", "_get_index"),
+        ("DELETE", r"/indexes/(?P<uid>[^/]+)", "_delete_index"),
+        ("GET", r"/indexes/(?P<uid>[^/]+)/stats", "_index_stats"),
+        ("GET", r"/indexes/(?P<uid>[^/]+)/settings", "_get_settings"),
+        ("PATCH", r"/indexes/(?P<uid>[^/]+)/settings", "_update_settings"),
+        ("POST", r"/indexes/(?P<uid>[^/]+)/documents", "_add_documents"),
+        ("PUT", r"/indexes/(?P<uid>[^/]+)/documents", "_add_documents"),
+        ("GET", r"/indexes/(?P<uid>[^/]+)/documents", "_get_documents"),
+        ("POST", r"/indexes/(?P<uid>[^/]+)/documents/fetch", "_fetch_documents"),
+        ("POST", r"/indexes/(?P<uid>[^/]+)/search", "_search"),
+        ("POST", r"/multi-search", "_multi_search"),
+        ("POST", r"/swap-indexes", "_swap_indexes"),
+        ("GET", r"/tasks", "_list_tasks"),
+        ("GET", r"/tasks/(?P<task_uid>\d+)", "_get_task"),
+    )
+]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "_HTTPServer"
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002 - BaseHTTPRequestHandler signature
+        logging.debug("fake-meili %s - %s", self.address_string(), format % args)
+
+    def do_GET(self) -> None:
+        self._dispatch("GET")
+
+    def do_POST(self) -> None:
+        self._dispatch("POST")
+
+    def do_PUT(self) -> None:
+        self._dispatch("PUT")
+
+    def do_PATCH(self) -> None:
+        self._dispatch("PATCH")
+
+    def do_DELETE(self) -> None:
+        self._dispatch("DELETE")
+
+    def _send(self, status: int, payload: Any) -> None:
+        latency = self.server.state.profile.request_latency
+        if latency > 0:
+            time.sleep(latency)
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _dispatch(self, method: str) -> None:
+        state = self.server.state
+        parts = urlsplit(self.path)
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        for route_method, pattern, label, handler_name in _ROUTES:
+            match = pattern.match(parts.path)
+            if match and route_method == method:
+                break
+        else:
+            self._send(404, FakeMeiliError(404, "not_found", f"No route for {method} {parts.path}.").body())
+            return
+        with state._lock:
+            state.request_counts[label] += 1
+        try:
+            if parts.path != "/health":
+                self._check_auth()
+                status = state.injected_failure(parts.path)
+                if status is not None:
+                    raise FakeMeiliError(status, "fake_unavailable", "Injected failure.", "system")
+            body = json.loads(raw) if raw else None
+            query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+            status, payload = getattr(self, handler_name)(body=body, query=query, **match.groupdict())
+        except FakeMeiliError as exc:
+            self._send(exc.status, exc.body())
+        except json.JSONDecodeError as exc:
+            self._send(400, FakeMeiliError(400, "malformed_payload", f"Invalid JSON: {exc}").body())
+        else:
+            self._send(status, payload)
+
+    def _check_auth(self) -> None:
+        api_key = self.server.api_key
+        if not api_key:
+            return
+        header = self.headers.get("Authorization") or ""
+        if not header:
+            raise FakeMeiliError(401, "missing_authorization_header", "The Authorization header is missing.", "auth")
+        if header != f"Bearer {api_key}":
+            raise FakeMeiliError(403, "invalid_api_key", "The provided API key is invalid.", "auth")
+
+    # --- routes --------------------------------------------------------------
+    # Reads run under the state lock; writes only enqueue a task whose apply()
+    # runs on the worker thread.
+
+    def _health(self, **_kwargs: Any) -> Tuple[int, Any]:
+        return 200, {"status": "available"}
+
+    def _list_indexes(self, query: Dict[str, str], **_kwargs: Any) -> Tuple[int, Any]:
+        state = self.server.state
+        offset, limit = int(query.get("offset", 0)), int(query.get("limit", 20))
+        with state._lock:
+            infos = [state.indexes[uid].info() for uid in sorted(state.indexes)]
+        return 200, {"results": infos[offset : offset + limit], "offset": offset, "limit": limit, "total": len(infos)}
+
+    def _create_index(self, body: Optional[Dict[str, Any]], **_kwargs: Any) -> Tuple[int, Any]:
+        state = self.server.state
+        uid = (body or {}).get("uid")
+        if not uid:
+            raise FakeMeiliError(400, "missing_index_uid", "Missing index uid.")
+        primary_key = (body or {}).get("primaryKey")
+
+        def apply(_task: Dict[str, Any]) -> None:
+            if uid in state.indexes:
+                raise FakeMeiliError(409, "index_already_exists", f"Index `{uid}` already exists.")
+            state.indexes[uid] = _Index(uid, primary_key)
+
+        return 202, state.enqueue("indexCreation", uid, {"primaryKey": primary_key}, apply)
+
+    def _get_index(self, uid: str, **_kwargs: Any) -> Tuple[int, Any]:
+        with self.server.state._lock:
+            return 200, self.server.state.get_index(uid).info()
+
+    def _delete_index(self, uid: str, **_kwargs: Any) -> Tuple[int, Any]:
+        state = self.server.state
+
+        def apply(task: Dict[str, Any]) -> None:
+            index = state.indexes.pop(uid, None)
+            if index is None:
+                raise _index_not_found(uid)
+            task["details"]["deletedDocuments"] = len(index.documents)
+
+        return 202, state.enqueue("indexDeletion", uid, {"deletedDocuments": None}, apply)
+
+    def _index_stats(self, uid: str, **_kwargs: Any) -> Tuple[int, Any]:
+        state = self.server.state
+        with state._lock:
+            index = state.get_index(uid)
+            fields: Counter = Counter(key for doc in index.documents.values() for key in doc if key != "_vectors")
+            indexing = any(task["indexUid"] == uid for task, _ in state._pending)
+            return 200, {
+                "numberOfDocuments": len(index.documents),
+                "isIndexing": indexing,
+                "fieldDistribution": dict(fields),
+            }
+
+    def _get_settings(self, uid: str, **_kwargs: Any) -> Tuple[int, Any]:
+        with self.server.state._lock:
+            return 200, json.loads(json.dumps(self.server.state.get_index(uid).settings))
+
+    def _update_settings(self, uid: str, body: Optional[Dict[str, Any]], **_kwargs: Any) -> Tuple[int, Any]:
+        state = self.server.state
+        updates = body or {}
+        unknown = sorted(set(updates) - set(DEFAULT_SETTINGS))
+        if unknown:
+            raise FakeMeiliError(400, "bad_request", f"Unknown settings: {', '.join(unknown)}.")
+
+        def apply(_task: Dict[str, Any]) -> None:
+            index = state.index_for_write(uid)
+            for key, value in updates.items():
+                if value is None:
+                    index.settings[key] = json.loads(json.dumps(DEFAULT_SETTINGS[key]))
+                elif key == "embedders":
+                    # Embedders merge by name; a null entry removes one.
+                    for name, config in value.items():
+                        if config is None:
+                            index.settings["embedders"].pop(name, None)
+                        else:
+                            index.settings["embedders"][name] = config
+                else:
+                    index.settings[key] = value
+            index.touch()
+
+        return 202, state.enqueue("settingsUpdate", uid, dict(updates), apply)
+
+    def _add_documents(
+        self, uid: str, body: Any, query: Dict[str, str], **_kwargs: Any
+    ) -> Tuple[int, Any]:
+        state = self.server.state
+        if isinstance(body, dict):
+            body = [body]
+        if not isinstance(body, list):
+            raise FakeMeiliError(400, "malformed_payload", "Documents must be a JSON array or object.")
+        docs = body
+        requested_key = query.get("primaryKey")
+
+        def apply(task: Dict[str, Any]) -> None:
+            index = state.index_for_write(uid)
+            primary_key = index.primary_key or requested_key
+            if primary_key is None and docs:
+                candidates = [key for key in docs[0] if key.lower().endswith("id")]
+                if len(candidates) != 1:
+                    raise FakeMeiliError(
+                        400, "index_primary_key_no_candidate_found", "The primary key inference failed."
+                    )
+                primary_key = candidates[0]
+            embedders = index.settings.get("embedders") or {}
+            for doc in docs:
+                if primary_key not in doc:
+                    raise FakeMeiliError(
+                        400, "missing_document_id", f"Document doesn't have a `{primary_key}` attribute."
+                    )
+                for name, vector in (doc.get("_vectors") or {}).items():
+                    dimensions = (embedders.get(name) or {}).get("dimensions")
+                    if dimensions and vector is not None and len(vector) != dimensions:
+                        raise FakeMeiliError(
+                            400,
+                            "invalid_vector_dimensions",
+                            f"Expected {dimensions} dimensions for embedder `{name}`, got {len(vector)}.",
+                        )
+            index.primary_key = primary_key
+            for doc in docs:
+                index.documents[doc[primary_key]] = doc
+            index.touch()
+            task["details"]["indexedDocuments"] = len(docs)
+
+        details = {"receivedDocuments": len(docs), "indexedDocuments": None}
+        return 202, state.enqueue("documentAdditionOrUpdate", uid, details, apply)
+
+    def _document_page(self, uid: str, offset: int, limit: int, fields: Optional[List[str]]) -> Tuple[int, Any]:
+        state = self.server.state
+        with state._lock:
+            index = state.get_index(uid)
+            docs = list(index.documents.values())[offset : offset + limit]
+            results = [index.project(doc, fields) for doc in docs]
+            return 200, {"results": results, "offset": offset, "limit": limit, "total": len(index.documents)}
+
+    def _get_documents(self, uid: str, query: Dict[str, str], **_kwargs: Any) -> Tuple[int, Any]:
+        fields = query["fields"].split(",") if query.get("fields") else None
+        return self._document_page(uid, int(query.get("offset", 0)), int(query.get("limit", 20)), fields)
+
+    def _fetch_documents(self, uid: str, body: Optional[Dict[str, Any]], **_kwargs: Any) -> Tuple[int, Any]:
+        body = body or {}
+        if body.get("filter"):
+            raise FakeMeiliError(400, "invalid_document_filter", "Filters are not supported by the fake server.")
+        return self._document_page(uid, int(body.get("offset", 0)), int(body.get("limit", 20)), body.get("fields"))
+
+    def _search(self, uid: str, body: Optional[Dict[str, Any]], **_kwargs: Any) -> Tuple[int, Any]:
+        with self.server.state._lock:
+            return 200, search_index(self.server.state.get_index(uid), body or {})
+
+    def _multi_search(self, body: Optional[Dict[str, Any]], **_kwargs: Any) -> Tuple[int, Any]:
+        body = body or {}
+        if body.get("federation"):
+            raise FakeMeiliError(400, "invalid_multi_search_federation", "Federated search is not supported.")
+        results = []
+        with self.server.state._lock:
+            for position, search in enumerate(body.get("queries") or []):
+                uid = search.get("indexUid")
+                try:
+                    result = search_index(self.server.state.get_index(uid), search)
+                except FakeMeiliError as exc:
+                    raise FakeMeiliError(exc.status, exc.code, f"Inside `.queries[{position}]`: {exc}") from exc
+                results.append({"indexUid": uid, **result})
+        return 200, {"results": results}
+
+    def _swap_indexes(self, body: Any, **_kwargs: Any) -> Tuple[int, Any]:
+        state = self.server.state
+        pairs = [tuple(entry.get("indexes") or ()) for entry in body or []]
+        if any(len(pair) != 2 for pair in pairs):
+            raise FakeMeiliError(400, "invalid_swap_indexes", "Each swap must name exactly two indexes.")
+
+        def apply(_task: Dict[str, Any]) -> None:
+            for first, second in pairs:
+                for uid in (first, second):
+                    state.get_index(uid)
+            for first, second in pairs:
+                left, right = state.indexes[first], state.indexes[second]
+                left.uid, right.uid = second, first
+                state.indexes[first], state.indexes[second] = right, left
+                left.touch()
+                right.touch()
+
+        details = {"swaps": [{"indexes": list(pair)} for pair in pairs]}
+        return 202, state.enqueue("indexSwap", None, details, apply)
+
+    def _list_tasks(self, query: Dict[str, str], **_kwargs: Any) -> Tuple[int, Any]:
+        state = self.server.state
+
+        def values(name: str) -> Optional[set]:
+            raw = query.get(name)
+            return set(raw.split(",")) if raw else None
+
+        uids, statuses, types, index_uids = values("uids"), values("statuses"), values("types"), values("indexUids")
+        limit = int(query.get("limit", 20))
+        start = int(query["from"]) if "from" in query else None
+        with state._lock:
+            selected = [
+                dict(task)
+                for uid, task in sorted(state.tasks.items(), reverse=True)
+                if (start is None or uid <= start)
+                and (uids is None or str(uid) in uids)
+                and (statuses is None or task["status"] in statuses)
+                and (types is None or task["type"] in types)
+                and (index_uids is None or task["indexUid"] in index_uids)
+            ]
+        page = selected[:limit]
+        next_uid = selected[limit]["uid"] if len(selected) > limit else None
+        return 200, {"results": page, "total": len(selected), "limit": limit, "from": page[0]["uid"] if page else None, "next": next_uid}
+
+    def _get_task(self, task_uid: str, **_kwargs: Any) -> Tuple[int, Any]:
+        with self.server.state._lock:
+            task = self.server.state.tasks.get(int(task_uid))
+            if task is None:
+                raise FakeMeiliError(404, "task_not_found", f"Task `{task_uid}` not found.")
+            return 200, dict(task)
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    state: FakeMeiliState
+    api_key: Optional[str]
+
+
+class FakeMeiliServer:
+    """
+    Serve the fake API on a local port from a background thread.
+
+    Use as a context manager (``with FakeMeiliServer() as server:``) and
+    point clients at ``server.url``; ``server.state`` exposes the indexes,
+    tasks, per-route request counts and ``fail_next`` for scripted failures.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        *,
+        profile: Optional[FakeMeiliProfile] = None,
+        api_key: Optional[str] = None,
+    ):
+        self.state = FakeMeiliState(profile)
+        self._httpd = _HTTPServer((host, port), _Handler)
+        self._httpd.state = self.state
+        self._httpd.api_key = api_key or None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeMeiliServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="fake-meili-http", daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        try:
+            self._httpd.serve_forever()
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join(timeout=5)
+            self._thread = None
+        self._httpd.server_close()
+        self.state.stop()
+
+    def __enter__(self) -> "FakeMeiliServer":
+        return self.start()
+
+    def __exit__(self, *_exc: Any) -> None:
+        self.close()
@@ -0,0 +1,34 @@
+"""Deterministic stand-in for the embedding model used by the benchmarks.
+
+The embedder hashes character trigrams instead of running BGE-M3, so it does
+not model the model's cost. What the benchmarks measure is the repository's
+own overhead around it (batching, serialization, SQLite, caches, scoring
+loops); Meilisearch is served by ``benchmarks.fake_meili``.
+"""
+
+import zlib
+from typing import List
+
+import numpy as np
+
+from game_semantic.embedding import DenseEmbedder
+
+
+class HashEmbedder(DenseEmbedder):
+    """Feature-hashed character trigrams, L2-normalized; similar names get similar vectors."""
+
+    def __init__(self, model_name: str = "hash", use_fp16: bool = False, dim: int = 1024):
+        self.dim = dim
+
+    def token_lengths(self, texts: List[str], max_length: int = 128) -> List[int]:
+        return [min(len(text) + 2, max_length) for text in texts]
+
+    def _encode_batch(self, texts: List[str], batch_size: int, max_length: int) -> np.ndarray:
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            padded = f"  {text.lower()[: max_length]}  "
+            for start in range(len(padded) - 2):
+                bucket = zlib.crc32(padded[start : start + 3].encode("utf-8"))
+                vectors[row, bucket % self.dim] += 1.0 if bucket & 1 else -1.0
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.maximum(norms, 1e-12)
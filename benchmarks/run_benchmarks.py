@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""Run the offline benchmark suite, write JSON results and check them against a baseline."""
+
+import argparse
+import json
+import logging
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from benchmarks.suite import BENCHMARKS, QUICK_SIZES, BenchSizes, compare_reports, run_suite
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark build, search, dedupe and library-list hot paths offline.")
+    parser.add_argument("--quick", action="store_true", help="Use small sizes (for smoke runs and CI).")
+    parser.add_argument("--repeats", type=int, default=3, help="Runs per timed benchmark; the best is kept.")
+    parser.add_argument("--only", nargs="+", choices=list(BENCHMARKS), help="Run only these benchmarks.")
+    parser.add_argument("--output-json", dest="output_json", help="Write the report to this JSON file.")
+    parser.add_argument("--baseline", help="Report from an earlier commit to compare against.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="Allowed slowdown before a metric counts as a regression (fraction, default 0.25).",
+    )
+    args = parser.parse_args()
+    # The code under test calls logging.basicConfig(INFO); configure first so it stays quiet.
+    logging.basicConfig(level=logging.WARNING)
+
+    report = run_suite(QUICK_SIZES if args.quick else BenchSizes(), repeats=args.repeats, only=args.only)
+    for name, metric in report["metrics"].items():
+        print(f"{name:<44} {metric['value']:>14.2f} {metric['unit']}")
+    if args.output_json:
+        with open(args.output_json, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, ensure_ascii=False, indent=2)
+
+    if not args.baseline:
+        return
+    with open(args.baseline, "r", encoding="utf-8") as handle:
+        baseline = json.load(handle)
+    try:
+        regressions = compare_reports(report, baseline, args.threshold)
+    except ValueError as exc:
+        print(f"Cannot compare with {args.baseline}: {exc}", file=sys.stderr)
+        sys.exit(2)
+    if regressions:
+        print(f"\nRegressions versus {baseline.get('commit') or args.baseline} (threshold {args.threshold:.0%}):")
+        for row in regressions:
+            print(f"  {row['metric']}: {row['baseline']:.2f} -> {row['current']:.2f} {row['unit']} ({row['change']:+.1%})")
+        sys.exit(1)
+    print(f"\nNo regressions beyond {args.threshold:.0%} versus {baseline.get('commit') or args.baseline}.")
+
+
+if __name__ == "__main__":
+    main()
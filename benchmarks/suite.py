@@ -0,0 +1,352 @@
+"""Offline benchmarks for the build, search, dedupe and library-list hot paths.
+
+Every benchmark runs against ``fakes.HashEmbedder`` and a
+``fake_meili.FakeMeiliServer`` on a local port, so results are reproducible
+without a model download or a Meilisearch server. ``run_suite`` returns a JSON-serializable
+report; ``compare_reports`` checks it against a baseline from an earlier
+commit.
+"""
+
+import contextlib
+import datetime
+import io
+import platform
+import random
+import subprocess
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional
+from unittest import mock
+
+import numpy as np
+
+from benchmarks.fake_meili import FakeMeiliServer
+from benchmarks.fakes import HashEmbedder
+from game_semantic.synthetic import CatalogueSpec, generate_catalogue
+
+# 2: names come from game_semantic.synthetic instead of a fixed word list.
+# 3: Meilisearch calls go over HTTP to FakeMeiliServer instead of an in-memory client.
+REPORT_SCHEMA = 3
+ROOT = Path(__file__).resolve().parent.parent
+
+@dataclass
+class BenchSizes:
+    build_docs: int = 20000
+    upload_docs: int = 5000
+    search_docs: int = 20000
+    search_queries: int = 200
+    dedupe_sizes: List[int] = field(default_factory=lambda: [250, 500, 1000])
+    library_counts: List[int] = field(default_factory=lambda: [10, 50, 200])
+
+
+QUICK_SIZES = BenchSizes(
+    build_docs=2000,
+    upload_docs=1000,
+    search_docs=2000,
+    search_queries=50,
+    dedupe_sizes=[100, 200],
+    library_counts=[5, 25],
+)
+
+
+def synthetic_names(count: int, seed: int = 0) -> List[str]:
+    """Deterministic, unique, mixed-script game-like names (no repeats, no near-duplicates)."""
+    spec = CatalogueSpec(rows=count, seed=seed, variant_rate=0.0, repeat_rate=0.0)
+    return [row.name for row in generate_catalogue(spec)]
+
+
+def _metric(value: float, unit: str, higher_is_better: bool) -> Dict[str, Any]:
+    return {"value": float(value), "unit": unit, "higher_is_better": higher_is_better}
+
+
+def _best_of(repeats: int, run: Callable[[], float]) -> float:
+    return min(run() for _ in range(max(repeats, 1)))
+
+
+@contextlib.contextmanager
+def _offline_services():
+    """Serve a fake Meilisearch and route model loaders to the hash embedder; yields the server URL."""
+    with contextlib.ExitStack() as stack:
+        server = stack.enter_context(FakeMeiliServer())
+        stack.enter_context(mock.patch("game_semantic.embedding.BgeM3Embedder", HashEmbedder))
+        stack.enter_context(mock.patch("game_semantic.index_builder.get_cached_embedder", lambda *_args: HashEmbedder()))
+        stack.enter_context(mock.patch("game_semantic.deduper.create_embedder", lambda *_args: HashEmbedder()))
+        yield server.url
+
+
+def bench_build_index(workdir: Path, meili_url: str, docs: int, repeats: int) -> Dict[str, Dict[str, Any]]:
+    from game_semantic.config import Config
+    from game_semantic.index_builder import build_index
+
+    txt_path = workdir / "build_names.txt"
+    txt_path.write_text("\n".join(synthetic_names(docs, seed=1)) + "\n", encoding="utf-8")
+    config = Config(meili_url=meili_url, meili_index_uid="build", txt_path=str(txt_path))
+
+    def run() -> float:
+        started = time.perf_counter()
+        build_index(config)
+        return time.perf_counter() - started
+
+    seconds = _best_of(repeats, run)
+    return {"build_index.docs_per_second": _metric(docs / seconds, "docs/s", True)}
+
+
+def bench_upload(meili_url: str, docs: int, repeats: int, batch_size: int = 256) -> Dict[str, Dict[str, Any]]:
+    from game_semantic.meili_client import MeiliGameIndex
+
+    names = synthetic_names(docs, seed=2)
+    vectors = HashEmbedder().encode_dense(names, batch_size=256)
+    documents = [
+        {"id": position + 1, "name": name, "_vectors": {"bge_m3": vector.tolist()}}
+        for position, (name, vector) in enumerate(zip(names, vectors))
+    ]
+    index = MeiliGameIndex(url=meili_url, api_key="", index_uid="upload")
+    total_bytes = 0.0
+
+    def run() -> float:
+        nonlocal total_bytes
+        total_bytes = 0.0
+        started = time.perf_counter()
+        for start in range(0, len(documents), batch_size):
+            timings = index.add_documents(documents[start : start + batch_size], wait=True)
+            total_bytes += timings["bytes"]
+        return time.perf_counter() - started
+
+    seconds = _best_of(repeats, run)
+    return {
+        "upload.bytes_per_second": _metric(total_bytes / seconds, "bytes/s", True),
+        "upload.docs_per_second": _metric(docs / seconds, "docs/s", True),
+    }
+
+
+def _searchable_app(workdir: Path, libraries: int, meili_url: str, index_prefix: str = "library") -> str:
+    from game_web.db import connect_db, init_db
+    from game_web.services import dataset_service, job_service, library_service
+    from game_web.services.settings_service import set_setting
+
+    db_path = workdir / f"app-{libraries}.db"
+    init_db(str(db_path))
+    conn = connect_db(str(db_path))
+    try:
+        set_setting(conn, "meili_url", meili_url, commit=False)
+        for position in range(1, libraries + 1):
+            library_service.create_library(conn, name=f"Library {position}", index_uid=f"{index_prefix}-{position}")
+            dataset = dataset_service.create_dataset(
+                conn,
+                data_dir=workdir / "data",
+                library_id=position,
+                filename="games.txt",
+                content=b"A\n",
+                commit=False,
+            )
+            job_service.create_job(
+                conn,
+                library_id=position,
+                dataset_id=int(dataset["id"]),
+                job_type="build",
+                status="done",
+                commit=False,
+            )
+        conn.commit()
+    finally:
+        conn.close()
+    return str(db_path)
+
+
+def _percentile_metrics(prefix: str, latencies_ms: List[float]) -> Dict[str, Dict[str, Any]]:
+    return {
+        f"{prefix}.p50_ms": _metric(np.percentile(latencies_ms, 50), "ms", False),
+        f"{prefix}.p95_ms": _metric(np.percentile(latencies_ms, 95), "ms", False),
+        f"{prefix}.p99_ms": _metric(np.percentile(latencies_ms, 99), "ms", False),
+    }
+
+
+def bench_execute_search(workdir: Path, meili_url: str, docs: int, queries: int) -> Dict[str, Dict[str, Any]]:
+    from game_semantic.meili_client import MeiliGameIndex
+    from game_web.services.search_cache import get_search_cache
+    from game_web.services.search_executor import execute_search
+
+    db_path = _searchable_app(workdir, 1, meili_url, "search")
+    names = synthetic_names(docs, seed=3)
+    vectors = HashEmbedder().encode_dense(names, batch_size=256)
+    index = MeiliGameIndex(url=meili_url, api_key="", index_uid="search-1")
+    index.ensure_settings()
+    index.add_documents(
+        [{"id": position + 1, "name": name, "_vectors": {"bge_m3": vector.tolist()}} for position, (name, vector) in enumerate(zip(names, vectors))],
+        wait=True,
+    )
+
+    rng = random.Random(4)
+    texts = [f"{name.rsplit(' ', 1)[0]} q{position}" for position, name in enumerate(rng.choices(names, k=queries))]
+    search_cache = get_search_cache()
+    search_cache.clear()
+    execute_search(db_path, 1, "warm up", data_dir=workdir / "data")
+    latencies_ms = []
+    for text in texts:
+        started = time.perf_counter()
+        execute_search(db_path, 1, text, data_dir=workdir / "data")
+        latencies_ms.append((time.perf_counter() - started) * 1000.0)
+    search_cache.clear()
+    return _percentile_metrics("execute_search", latencies_ms)
+
+
+def bench_execute_search_all(
+    workdir: Path, meili_url: str, docs: int, queries: int, libraries: int = 3
+) -> Dict[str, Dict[str, Any]]:
+    from game_semantic.meili_client import MeiliGameIndex
+    from game_web.services.search_cache import get_search_cache
+    from game_web.services.search_executor import execute_search_all
+
+    app_dir = workdir / "search-all"
+    app_dir.mkdir()
+    db_path = _searchable_app(app_dir, libraries, meili_url, "search-all")
+    names = synthetic_names(docs, seed=3)
+    vectors = HashEmbedder().encode_dense(names, batch_size=256)
+    for position in range(1, libraries + 1):
+        index = MeiliGameIndex(url=meili_url, api_key="", index_uid=f"search-all-{position}")
+        index.ensure_settings()
+        index.add_documents(
+            [
+                {"id": row + 1, "name": name, "_vectors": {"bge_m3": vector.tolist()}}
+                for row, (name, vector) in enumerate(zip(names, vectors))
+                if row % libraries == position - 1
+            ],
+            wait=True,
+        )
+
+    rng = random.Random(4)
+    texts = [f"{name.rsplit(' ', 1)[0]} q{position}" for position, name in enumerate(rng.choices(names, k=queries))]
+    search_cache = get_search_cache()
+    search_cache.clear()
+    execute_search_all(db_path, "warm up", data_dir=app_dir / "data")
+    latencies_ms = []
+    for text in texts:
+        started = time.perf_counter()
+        execute_search_all(db_path, text, data_dir=app_dir / "data")
+        latencies_ms.append((time.perf_counter() - started) * 1000.0)
+    search_cache.clear()
+    return {
+        f"{name}[libraries={libraries}]": metric
+        for name, metric in _percentile_metrics("execute_search_all", latencies_ms).items()
+    }
+
+
+def bench_dedupe(meili_url: str, sizes: List[int], repeats: int) -> Dict[str, Dict[str, Any]]:
+    from game_semantic.config import Config
+    from game_semantic.deduper import ItemRecord, dedupe_items
+
+    results = {}
+    for size in sizes:
+        # Default rates: ~10% near-duplicates and ~2% exact repeats, so grouping has work to do.
+        rows = generate_catalogue(CatalogueSpec(rows=size, seed=5, files=True))
+        items = [ItemRecord(**row.to_item()) for row in rows]
+        config = Config(meili_url=meili_url, meili_index_uid=f"dedupe-{size}", top_k=5)
+
+        def run() -> float:
+            started = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                dedupe_items(items, config, threshold=0.9)
+            return time.perf_counter() - started
+
+        results[f"dedupe_items.seconds[n={size}]"] = _metric(_best_of(repeats, run), "s", False)
+    return results
+
+
+def bench_library_list(
+    workdir: Path, meili_url: str, counts: List[int], repeats: int, calls: int = 5
+) -> Dict[str, Dict[str, Any]]:
+    from game_web.db import connect_db
+    from game_web.routes.library import _library_list_context
+
+    results = {}
+    for count in counts:
+        db_path = _searchable_app(workdir, count, meili_url)
+        request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(db_path=db_path, data_dir=workdir / "data")))
+
+        def run() -> float:
+            conn = connect_db(db_path)
+            try:
+                started = time.perf_counter()
+                for _ in range(calls):
+                    _library_list_context(conn, request)
+                return (time.perf_counter() - started) / calls
+            finally:
+                conn.close()
+
+        results[f"library_list_context.ms[libraries={count}]"] = _metric(_best_of(repeats, run) * 1000.0, "ms", False)
+    return results
+
+
+BENCHMARKS = ("build", "upload", "search", "dedupe", "library_list")
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True, timeout=10
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return completed.stdout.strip() or None
+
+
+def run_suite(sizes: BenchSizes, *, repeats: int = 3, only: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Run the selected benchmarks and return a report dict (see ``compare_reports``)."""
+    selected = [name for name in BENCHMARKS if not only or name in only]
+    metrics: Dict[str, Dict[str, Any]] = {}
+    with tempfile.TemporaryDirectory() as tmp, _offline_services() as meili_url:
+        workdir = Path(tmp)
+        if "build" in selected:
+            metrics.update(bench_build_index(workdir, meili_url, sizes.build_docs, repeats))
+        if "upload" in selected:
+            metrics.update(bench_upload(meili_url, sizes.upload_docs, repeats))
+        if "search" in selected:
+            metrics.update(bench_execute_search(workdir, meili_url, sizes.search_docs, sizes.search_queries))
+            metrics.update(bench_execute_search_all(workdir, meili_url, sizes.search_docs, sizes.search_queries))
+        if "dedupe" in selected:
+            metrics.update(bench_dedupe(meili_url, sizes.dedupe_sizes, repeats))
+        if "library_list" in selected:
+            metrics.update(bench_library_list(workdir, meili_url, sizes.library_counts, repeats))
+    return {
+        "schema": REPORT_SCHEMA,
+        "commit": _git_commit(),
+        "created_at": datetime.datetime.now(datetime.timezone.utc).replace(microsecond=0).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "sizes": asdict(sizes),
+        "metrics": metrics,
+    }
+
+
+def compare_reports(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[Dict[str, Any]]:
+    """
+    Return the metrics that regressed by more than ``threshold`` (a fraction) versus the baseline.
+
+    Only metrics present in both reports are compared. Reports run with
+    different sizes are not comparable and raise ValueError.
+    """
+    if current.get("schema") != baseline.get("schema"):
+        raise ValueError("Benchmark reports use different schemas")
+    if current.get("sizes") != baseline.get("sizes"):
+        raise ValueError("Benchmark reports were run with different sizes")
+    regressions = []
+    for name, metric in sorted(current["metrics"].items()):
+        reference = baseline["metrics"].get(name)
+        if reference is None or reference["value"] <= 0:
+            continue
+        change = metric["value"] / reference["value"] - 1.0
+        worse = -change if metric["higher_is_better"] else change
+        if worse > threshold:
+            regressions.append(
+                {
+                    "metric": name,
+                    "baseline": reference["value"],
+                    "current": metric["value"],
+                    "unit": metric["unit"],
+                    "change": change,
+                }
+            )
+    return regressions
@@ -9,7 +9,7 @@ ROOT = Path(__file__).resolve().parent.parent
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from game_semantic.config import load_config_from_env_and_args
+from game_semantic.config import EMBEDDER_BACKENDS, RERANK_MODES, load_config_from_env_and_args
 from game_semantic import service
 
 
@@ -30,8 +30,80 @@ def main():
     parser.set_defaults(bge_use_fp16=None)
     parser.add_argument("--bge-use-fp16", dest="bge_use_fp16", action="store_true", help="Force FP16.")
     parser.add_argument("--bge-use-fp32", dest="bge_use_fp16", action="store_false", help="Force FP32/FP16 off.")
+    parser.add_argument(
+        "--embedder-backend",
+        dest="embedder_backend",
+        choices=list(EMBEDDER_BACKENDS),
+        help="Embedding backend: torch (default), onnx or onnx-int8 (see bin/export_onnx.py).",
+    )
+    parser.add_argument("--onnx-model-dir", dest="onnx_model_dir", help="Root directory of exported ONNX models.")
+    parser.add_argument(
+        "--vector-dims",
+        dest="vector_dims",
+        type=int,
+        help=(
+            "Store PCA-projected vectors of this width (0 = full 1024 dims). "
+            "The PCA is fitted on 4096 names sampled evenly from the input."
+        ),
+    )
+    parser.add_argument("--projection-path", dest="projection_path", help="PCA projection file (default projections/<index uid>.npz).")
     parser.add_argument("--encode-batch-size", dest="encode_batch_size", type=int, help="Batch size for embedding.")
+    parser.add_argument(
+        "--encode-token-budget",
+        dest="encode_token_budget",
+        type=int,
+        help="Max padded tokens per length-bucketed encode batch (0 = fixed-size batches in file order).",
+    )
     parser.add_argument("--index-batch-size", dest="index_batch_size", type=int, help="Batch size for index writes.")
+    parser.add_argument(
+        "--index-max-payload-bytes",
+        dest="index_max_payload_bytes",
+        type=int,
+        help="Cut index write batches before their JSON payload exceeds this many bytes (0 = no cap).",
+    )
+    parser.add_argument(
+        "--adaptive-batching",
+        dest="adaptive_batching",
+        action="store_true",
+        default=None,
+        help="Tune encode and index batch sizes from observed docs/s (the batch size options become starting points).",
+    )
+    parser.add_argument(
+        "--index-pipeline-depth",
+        dest="index_pipeline_depth",
+        type=int,
+        help="Upload tasks left indexing in Meilisearch while encoding continues (1 = wait for each batch).",
+    )
+    parser.add_argument(
+        "--meili-max-retries",
+        dest="meili_max_retries",
+        type=int,
+        help="Retries per failing upload or task poll, with exponential backoff (0 = fail on the first error).",
+    )
+    parser.add_argument("--meili-retry-backoff", dest="meili_retry_backoff", type=float, help="First retry delay in seconds.")
+    parser.add_argument(
+        "--meili-failure-budget",
+        dest="meili_failure_budget",
+        type=int,
+        help="Total Meilisearch retries allowed per build before giving up.",
+    )
+    parser.add_argument(
+        "--rerank-mode",
+        dest="rerank_mode",
+        choices=list(RERANK_MODES),
+        help="Also cache BGE-M3 lexical weights and/or ColBERT vectors for reranking (torch backend only).",
+    )
+    parser.add_argument("--rerank-store-path", dest="rerank_store_path", help="Candidate output cache (default rerank/<index uid>.sqlite).")
+    parser.add_argument(
+        "--settings-state-path",
+        dest="settings_state_path",
+        help="File remembering the applied index settings, so unchanged settings skip the read-back.",
+    )
+    parser.add_argument(
+        "--prefix-index-path",
+        dest="prefix_index_path",
+        help="Also write an autocomplete prefix index of the names (sqlite) to this path.",
+    )
     parser.add_argument("--debug", dest="debug", action="store_true", default=None, help="Enable debug logging.")
 
     args = parser.parse_args()
@@ -23,7 +23,7 @@ def main():
     parser = argparse.ArgumentParser(
         description="Group near-duplicate filenames/items by similarity threshold."
     )
-    parser.add_argument("-i", "--input", dest="input_path", help="Input file path (txt or json).")
+    parser.add_argument("-i", "--input", dest="input_path", help="Input file path (txt, json or ndjson).")
     parser.add_argument("--fs", dest="fs_path", help="Recursively scan a directory as input.")
     parser.add_argument(
         "--output-json", dest="output_json", help="When using --fs, save scan output to JSON."
@@ -79,7 +79,7 @@ def main():
         if not input_path:
             parser.error("Provide --input or --fs.")
         suffix = Path(input_path).suffix.lower()
-        if suffix == ".json":
+        if suffix in (".json", ".ndjson", ".jsonl"):
             items = load_items_from_json(input_path)
         else:
             items = load_items_from_txt(input_path)
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""CLI entrypoint to compare neighbour recall@k and vector size across PCA widths."""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from game_semantic.config import load_config_from_env_and_args
+
+
+def _parse_dims(raw: str) -> list[int]:
+    dims = []
+    for part in raw.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        value = int(part)
+        if value <= 0:
+            raise argparse.ArgumentTypeError(f"dims must be positive: {value}")
+        dims.append(value)
+    if not dims:
+        raise argparse.ArgumentTypeError("at least one width is required")
+    return dims
+
+
+def _read_names(path: str, limit: int) -> list[str]:
+    from game_semantic.index_builder import iter_game_names, iter_unique
+
+    names = []
+    for name in iter_unique(iter_game_names(path)):
+        names.append(name)
+        if len(names) >= limit:
+            break
+    return names
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report recall@k vs. stored vector size for PCA-reduced vectors.")
+    parser.add_argument("-c", "--config", dest="config_path", help="Path to config.json (defaults to ./config.json).")
+    parser.add_argument("--txt-path", dest="txt_path", help="Dataset to sample documents from.")
+    parser.add_argument("--sample-size", type=int, default=5000, help="Documents encoded from the dataset.")
+    parser.add_argument("--queries", dest="queries_path", help="Query texts, one per line (default: sampled names).")
+    parser.add_argument("--query-count", type=int, default=500, help="Queries used when --queries is not given.")
+    parser.add_argument(
+        "--dims",
+        type=_parse_dims,
+        default=[1024, 512, 384, 256, 128],
+        help="Comma-separated widths to compare (default 1024,512,384,256,128).",
+    )
+    parser.add_argument("--k", dest="k", type=int, default=10, help="Cut-off for recall@k.")
+    parser.add_argument("--output-json", dest="output_json", help="Also write the report to this JSON file.")
+    parser.add_argument("--bge-model-name", dest="bge_model_name", help="Model name to load.")
+    parser.add_argument("--debug", dest="debug", action="store_true", default=None, help="Enable debug logging.")
+    args = parser.parse_args()
+    config = load_config_from_env_and_args(args, config_path=args.config_path)
+
+    from game_semantic.embedding import get_cached_embedder
+    from game_semantic.projection import projection_report
+
+    names = _read_names(config.txt_path, args.sample_size)
+    if not names:
+        parser.error("No names found in the dataset.")
+    queries = _read_names(args.queries_path, args.query_count) if args.queries_path else names[: args.query_count]
+
+    embedder = get_cached_embedder(
+        config.bge_model_name,
+        config.bge_use_fp16,
+        config.embedder_backend,
+        config.onnx_model_dir,
+    )
+    encode = dict(
+        batch_size=config.encode_batch_size,
+        max_length=config.embedding_max_length,
+        token_budget=config.encode_token_budget or None,
+    )
+    doc_vectors = embedder.encode_dense(names, **encode)
+    query_vectors = embedder.encode_dense(queries, **encode)
+    # A PCA needs more samples than components; the full width needs no fit.
+    widths = [dims for dims in args.dims if dims < len(names) or dims >= doc_vectors.shape[1]]
+    report = projection_report(doc_vectors, query_vectors, widths, k=args.k)
+
+    recall_key = f"recall_at_{args.k}"
+    print(f"{'dims':>6}  {'recall@' + str(args.k):>10}  {'float32 B':>10}  {'JSON B':>8}  {'size':>6}")
+    for row in report:
+        print(
+            f"{row['dims']:>6}  {row[recall_key]:>10.3f}  {row['float32_bytes']:>10}  "
+            f"{row['json_bytes']:>8}  {row['size_ratio']:>6.2f}"
+        )
+    if args.output_json:
+        with open(args.output_json, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""CLI entrypoint to compare recall@k and latency across semantic ratios."""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from game_semantic.config import RERANK_MODES, load_config_from_env_and_args
+
+
+def _parse_ratios(raw: str) -> list[float]:
+    ratios = []
+    for part in raw.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        value = float(part)
+        if not 0.0 <= value <= 1.0:
+            raise argparse.ArgumentTypeError(f"semantic ratio out of range: {value}")
+        ratios.append(value)
+    if not ratios:
+        raise argparse.ArgumentTypeError("at least one semantic ratio is required")
+    return ratios
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evaluate vector vs hybrid search on a labelled query set.")
+    parser.add_argument("-c", "--config", dest="config_path", help="Path to config.json (defaults to ./config.json).")
+    parser.add_argument("--labels", dest="labels_path", required=True, help="JSON/JSONL file of {query, relevant}.")
+    parser.add_argument(
+        "--ratios",
+        dest="ratios",
+        type=_parse_ratios,
+        default=[1.0, 0.8, 0.5],
+        help="Comma-separated semantic ratios to compare (default 1.0,0.8,0.5).",
+    )
+    parser.add_argument("--k", dest="k", type=int, default=10, help="Cut-off for recall@k.")
+    parser.add_argument(
+        "--rerank-mode",
+        dest="rerank_mode",
+        choices=list(RERANK_MODES),
+        help="Compare dense ranking with this rerank mode instead of comparing semantic ratios.",
+    )
+    parser.add_argument("--rerank-candidates", dest="rerank_candidates", type=int, help="Dense candidates reranked per query (default 50).")
+    parser.add_argument("--rerank-store-path", dest="rerank_store_path", help="Candidate output cache (default rerank/<index uid>.sqlite).")
+    parser.add_argument("--output-json", dest="output_json", help="Also write the report to this JSON file.")
+    parser.add_argument("--meili-url", dest="meili_url", help="Meilisearch endpoint URL.")
+    parser.add_argument("--meili-api-key", dest="meili_api_key", help="Meilisearch API key.")
+    parser.add_argument("--index-uid", dest="meili_index_uid", help="Index UID to use.")
+    parser.add_argument("--bge-model-name", dest="bge_model_name", help="Model name to load.")
+    parser.set_defaults(bge_use_fp16=None)
+    parser.add_argument("--bge-use-fp16", dest="bge_use_fp16", action="store_true", help="Force FP16.")
+    parser.add_argument("--bge-use-fp32", dest="bge_use_fp16", action="store_false", help="Force FP32/FP16 off.")
+    parser.add_argument("--debug", dest="debug", action="store_true", default=None, help="Enable debug logging.")
+
+    args = parser.parse_args()
+    config = load_config_from_env_and_args(args, config_path=args.config_path)
+
+    from game_semantic.embedding import get_cached_embedder
+    from game_semantic.meili_client import MeiliGameIndex
+    from game_semantic.search_eval import evaluate_rerank, evaluate_semantic_ratios, load_labelled_queries
+
+    labelled = load_labelled_queries(args.labels_path)
+    if not labelled:
+        parser.error("No usable labelled queries found.")
+
+    game_index = MeiliGameIndex(
+        url=config.meili_url,
+        api_key=config.meili_api_key,
+        index_uid=config.meili_index_uid,
+        embedder_name="bge_m3",
+        embedding_dim=1024,
+    )
+    embedder = get_cached_embedder(
+        config.bge_model_name,
+        config.bge_use_fp16,
+        config.embedder_backend,
+        config.onnx_model_dir,
+    )
+    recall_key = f"recall_at_{args.k}"
+    if args.rerank_mode:
+        from game_semantic.index_builder import check_rerank_mode, rerank_store_path_for
+        from game_semantic.rerank import CandidateStore, Reranker
+
+        check_rerank_mode(config)
+        reranker = Reranker(
+            embedder,
+            config.rerank_mode,
+            CandidateStore(rerank_store_path_for(config)),
+            encode_budget=config.rerank_encode_budget,
+            max_length=config.embedding_max_length,
+        )
+        report = evaluate_rerank(
+            game_index,
+            reranker,
+            labelled,
+            k=args.k,
+            candidates=config.rerank_candidates,
+            max_length=config.embedding_max_length,
+            encode_batch_size=config.encode_batch_size,
+        )
+        print(f"{'mode':>14}  {'recall@' + str(args.k):>10}  {'p50 ms':>8}  {'p95 ms':>8}")
+        for row in report:
+            print(
+                f"{row['mode']:>14}  {row[recall_key]:>10.3f}  "
+                f"{row['latency_p50_ms']:>8.1f}  {row['latency_p95_ms']:>8.1f}"
+            )
+    else:
+        report = evaluate_semantic_ratios(
+            game_index,
+            embedder,
+            labelled,
+            args.ratios,
+            k=args.k,
+            max_length=config.embedding_max_length,
+            encode_batch_size=config.encode_batch_size,
+        )
+        print(f"{'ratio':>6}  {'recall@' + str(args.k):>10}  {'p50 ms':>8}  {'p95 ms':>8}")
+        for row in report:
+            print(
+                f"{row['semantic_ratio']:>6.2f}  {row[recall_key]:>10.3f}  "
+                f"{row['latency_p50_ms']:>8.1f}  {row['latency_p95_ms']:>8.1f}"
+            )
+    if args.output_json:
+        with open(args.output_json, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Export the BGE-M3 dense head to ONNX, check parity with PyTorch and compare throughput."""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from game_semantic.config import (
+    BACKEND_ONNX,
+    BACKEND_ONNX_INT8,
+    BACKEND_TORCH,
+    load_config_from_env_and_args,
+)
+
+SAMPLE_TEXTS = [
+    "明日方舟 / アークナイツ / Arknights",
+    "CLANNAD -クラナド-",
+    "Steins;Gate / シュタインズ・ゲート / 命运石之门",
+    "The Legend of Zelda: Breath of the Wild",
+    "ファイナルファンタジーVII リメイク",
+    "原神 Genshin Impact",
+    "Persona 5 Royal / ペルソナ5 ザ・ロイヤル / 女神异闻录5 皇家版",
+    "Hollow Knight",
+]
+
+
+def _load_texts(path: str | None, limit: int) -> list[str]:
+    if not path:
+        return list(SAMPLE_TEXTS)
+    texts = []
+    with open(path, "r", encoding="utf-8") as handle:
+        for line in handle:
+            name = line.strip()
+            if name:
+                texts.append(name)
+            if len(texts) >= limit:
+                break
+    return texts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export BGE-M3 dense vectors to ONNX Runtime and verify parity.")
+    parser.add_argument("-c", "--config", dest="config_path", help="Path to config.json (defaults to ./config.json).")
+    parser.add_argument("--bge-model-name", dest="bge_model_name", help="Model name to export.")
+    parser.add_argument("--onnx-model-dir", dest="onnx_model_dir", help="Output root (default models/onnx).")
+    parser.add_argument("--quantize", action="store_true", help="Also write an int8 dynamically quantized model.")
+    parser.add_argument("--skip-export", action="store_true", help="Only run parity/throughput on existing files.")
+    parser.add_argument("--sample-file", help="Text file (one name per line) used for parity and throughput.")
+    parser.add_argument("--sample-size", type=int, default=512, help="Max lines read from --sample-file.")
+    parser.add_argument("--min-cosine", type=float, default=None, help="Parity threshold (default 0.99).")
+    parser.add_argument("--repeats", type=int, default=3, help="Timed runs per backend (best is reported).")
+    parser.add_argument("--output-json", dest="output_json", help="Also write the report to this JSON file.")
+    args = parser.parse_args()
+    config = load_config_from_env_and_args(args, config_path=args.config_path)
+
+    from game_semantic.embedding import create_embedder
+    from game_semantic.onnx_embedder import PARITY_MIN_COSINE, dense_parity, export_dense_onnx, measure_throughput
+
+    min_cosine = PARITY_MIN_COSINE if args.min_cosine is None else args.min_cosine
+    if not args.skip_export:
+        paths = export_dense_onnx(config.bge_model_name, config.onnx_model_dir, quantize=args.quantize)
+        for backend, path in paths.items():
+            print(f"Exported {backend}: {path}")
+
+    texts = _load_texts(args.sample_file, args.sample_size)
+    backends = [BACKEND_TORCH, BACKEND_ONNX] + ([BACKEND_ONNX_INT8] if args.quantize else [])
+    embedders = {
+        backend: create_embedder(config.bge_model_name, False, backend, config.onnx_model_dir) for backend in backends
+    }
+    reference = embedders[BACKEND_TORCH].encode_dense(
+        texts, batch_size=config.encode_batch_size, max_length=config.embedding_max_length
+    )
+
+    report = []
+    failed = False
+    print(f"{'backend':>10}  {'min cos':>8}  {'mean cos':>8}  {'docs/s':>9}")
+    for backend, embedder in embedders.items():
+        row = {"backend": backend}
+        if backend != BACKEND_TORCH:
+            vectors = embedder.encode_dense(
+                texts, batch_size=config.encode_batch_size, max_length=config.embedding_max_length
+            )
+            row.update(dense_parity(reference, vectors))
+            row["parity_ok"] = row["min_cosine"] >= min_cosine
+            failed = failed or not row["parity_ok"]
+        row["docs_per_second"] = measure_throughput(
+            embedder,
+            texts,
+            batch_size=config.encode_batch_size,
+            max_length=config.embedding_max_length,
+            repeats=args.repeats,
+        )
+        report.append(row)
+        print(
+            f"{backend:>10}  {row.get('min_cosine', 1.0):>8.4f}  {row.get('mean_cosine', 1.0):>8.4f}  "
+            f"{row['docs_per_second']:>9.1f}"
+        )
+
+    if args.output_json:
+        with open(args.output_json, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, ensure_ascii=False, indent=2)
+    if failed:
+        print(f"Parity check failed: min cosine below {min_cosine}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""Run the in-process fake Meilisearch server for offline load and failure testing."""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from benchmarks.fake_meili import FakeMeiliProfile, FakeMeiliServer
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a local Meilisearch stand-in with injectable latency and failures.")
+    parser.add_argument("--host", default="127.0.0.1", help="Bind address (default 127.0.0.1).")
+    parser.add_argument("--port", type=int, default=7700, help="Port (default 7700, 0 picks a free one).")
+    parser.add_argument("--api-key", dest="api_key", help="Require this key as a Bearer token.")
+    parser.add_argument("--request-latency", type=float, default=0.0, help="Seconds added to every response.")
+    parser.add_argument("--task-latency", type=float, default=0.0, help="Seconds each task takes.")
+    parser.add_argument("--document-latency", type=float, default=0.0, help="Extra task seconds per document.")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests answered with HTTP 503.")
+    parser.add_argument("--task-failure-rate", type=float, default=0.0, help="Share of document tasks that fail.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the injected failures.")
+    parser.add_argument("--debug", action="store_true", help="Log every request.")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.DEBUG if args.debug else logging.INFO)
+
+    profile = FakeMeiliProfile(
+        request_latency=args.request_latency,
+        task_latency=args.task_latency,
+        document_latency=args.document_latency,
+        error_rate=args.error_rate,
+        task_failure_rate=args.task_failure_rate,
+        seed=args.seed,
+    )
+    server = FakeMeiliServer(args.host, args.port, profile=profile, api_key=args.api_key)
+    logging.info("Fake Meilisearch listening on %s", server.url)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""Generate a reproducible synthetic games catalogue (txt, JSON or NDJSON) for scale testing."""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from game_semantic.synthetic import CatalogueSpec, generate_catalogue, write_catalogue
+
+
+def main():
+    defaults = CatalogueSpec()
+    parser = argparse.ArgumentParser(description="Write mixed Chinese/Japanese/English game titles with near-duplicates.")
+    parser.add_argument("-o", "--output", required=True, help="Output path.")
+    parser.add_argument(
+        "--format",
+        choices=["txt", "json", "ndjson"],
+        help="txt = games.txt, json/ndjson = dedupe input records (default: from the output suffix, else txt).",
+    )
+    parser.add_argument("--rows", type=int, default=defaults.rows, help="Rows to write (default 10000).")
+    parser.add_argument("--seed", type=int, default=defaults.seed, help="Random seed; the same seed gives the same file.")
+    parser.add_argument("--variant-rate", type=float, default=defaults.variant_rate, help="Share of near-duplicate rows.")
+    parser.add_argument("--repeat-rate", type=float, default=defaults.repeat_rate, help="Share of exact repeats.")
+    parser.add_argument("--alias-rate", type=float, default=defaults.alias_rate, help="Share of titles with ' / ' aliases.")
+    parser.add_argument("--mean-words", type=float, default=defaults.mean_words, help="Mean title length in words.")
+    parser.add_argument("--max-words", type=int, default=defaults.max_words, help="Longest title in words.")
+    parser.add_argument("--subtitle-rate", type=float, default=defaults.subtitle_rate, help="Share of titles with a subtitle.")
+    parser.add_argument(
+        "--files",
+        action="store_true",
+        help="Emit filesystem-like records (extension, path, size, ctime, mtime); implied for json/ndjson.",
+    )
+    args = parser.parse_args()
+
+    fmt = args.format
+    if fmt is None:
+        suffix = Path(args.output).suffix.lower()
+        fmt = {".json": "json", ".ndjson": "ndjson", ".jsonl": "ndjson"}.get(suffix, "txt")
+    spec = CatalogueSpec(
+        rows=args.rows,
+        seed=args.seed,
+        variant_rate=args.variant_rate,
+        repeat_rate=args.repeat_rate,
+        alias_rate=args.alias_rate,
+        mean_words=args.mean_words,
+        max_words=args.max_words,
+        subtitle_rate=args.subtitle_rate,
+        files=args.files or fmt != "txt",
+    )
+    try:
+        stats = write_catalogue(generate_catalogue(spec), args.output, fmt)
+    except ValueError as exc:
+        parser.error(str(exc))
+    print(json.dumps(stats.to_dict(), ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
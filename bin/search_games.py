@@ -9,7 +9,7 @@ ROOT = Path(__file__).resolve().parent.parent
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from game_semantic.config import load_config_from_env_and_args
+from game_semantic.config import EMBEDDER_BACKENDS, RERANK_MODES, load_config_from_env_and_args
 from game_semantic import service
 
 
@@ -19,10 +19,44 @@ def main():
     parser.add_argument("--meili-api-key", dest="meili_api_key", help="Meilisearch API key.")
     parser.add_argument("--index-uid", dest="meili_index_uid", help="Index UID to use.")
     parser.add_argument("--top-k", dest="top_k", type=int, help="Number of results to return.")
+    parser.add_argument(
+        "--semantic-ratio",
+        dest="semantic_ratio",
+        type=float,
+        help="Hybrid weight between vector (1.0) and keyword (0.0) ranking.",
+    )
     parser.add_argument("--bge-model-name", dest="bge_model_name", help="Model name to load.")
     parser.set_defaults(bge_use_fp16=None)
     parser.add_argument("--bge-use-fp16", dest="bge_use_fp16", action="store_true", help="Force FP16.")
     parser.add_argument("--bge-use-fp32", dest="bge_use_fp16", action="store_false", help="Force FP32/FP16 off.")
+    parser.add_argument(
+        "--embedder-backend",
+        dest="embedder_backend",
+        choices=list(EMBEDDER_BACKENDS),
+        help="Embedding backend: torch (default), onnx or onnx-int8 (see bin/export_onnx.py).",
+    )
+    parser.add_argument("--onnx-model-dir", dest="onnx_model_dir", help="Root directory of exported ONNX models.")
+    parser.add_argument(
+        "--vector-dims",
+        dest="vector_dims",
+        type=int,
+        help="Store PCA-projected vectors of this width (0 = full 1024 dims).",
+    )
+    parser.add_argument("--projection-path", dest="projection_path", help="PCA projection file (default projections/<index uid>.npz).")
+    parser.add_argument(
+        "--rerank-mode",
+        dest="rerank_mode",
+        choices=list(RERANK_MODES),
+        help="Rerank dense candidates with BGE-M3 lexical weights and/or ColBERT vectors (torch backend only).",
+    )
+    parser.add_argument("--rerank-candidates", dest="rerank_candidates", type=int, help="Dense candidates fetched before reranking (default 50).")
+    parser.add_argument(
+        "--rerank-encode-budget",
+        dest="rerank_encode_budget",
+        type=int,
+        help="Max uncached candidates encoded per query (default 32).",
+    )
+    parser.add_argument("--rerank-store-path", dest="rerank_store_path", help="Candidate output cache (default rerank/<index uid>.sqlite).")
     parser.add_argument("--debug", dest="debug", action="store_true", default=None, help="Enable debug logging.")
 
     args = parser.parse_args()
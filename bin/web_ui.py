@@ -23,6 +23,18 @@ def main():
     parser.add_argument("--host", dest="host", default="127.0.0.1")
     parser.add_argument("--port", dest="port", type=int, default=8000)
     parser.add_argument("--reload", dest="reload", action="store_true")
+    parser.add_argument(
+        "--no-warm-up",
+        dest="warm_up",
+        action="store_false",
+        help="Do not preload query embedding models in the background after startup.",
+    )
+    parser.add_argument(
+        "--metrics-token",
+        dest="metrics_token",
+        default=os.environ.get("GAME_WEB_METRICS_TOKEN"),
+        help="Bearer token that lets scrapers read /metrics without logging in (default $GAME_WEB_METRICS_TOKEN).",
+    )
     args = parser.parse_args()
 
     data_dir = resolve_data_dir(args.data_dir)
@@ -30,6 +42,9 @@ def main():
     db_path = data_dir / "app.db"
     os.environ["GAME_WEB_DB_PATH"] = str(db_path)
     os.environ["GAME_WEB_DATA_DIR"] = str(data_dir)
+    os.environ["GAME_WEB_WARM_UP"] = "1" if args.warm_up else "0"
+    if args.metrics_token:
+        os.environ["GAME_WEB_METRICS_TOKEN"] = args.metrics_token
 
     uvicorn.run(
         "game_web.app:create_web_ui_app",
@@ -0,0 +1,131 @@
+"""Throughput-driven batch sizing for the build pipeline."""
+
+import logging
+import math
+from typing import Optional
+
+# Search bounds for the adaptive encode and upload batch sizes.
+ENCODE_BATCH_MIN = 8
+ENCODE_BATCH_MAX = 512
+INDEX_BATCH_MIN = 32
+INDEX_BATCH_MAX = 8192
+# An upload batch whose add+task round trip exceeds this stops the upload size from growing further.
+MAX_UPLOAD_BATCH_SECONDS = 30.0
+
+
+class AdaptiveBatchSizer:
+    """
+    Hill-climb a batch size towards the best observed items per second.
+
+    Each size is measured over ``samples`` batches (after ``warmup`` batches
+    that are ignored, e.g. the first encode call paying for lazy kernel
+    setup). While throughput improves by more than ``tolerance`` the size
+    keeps moving by ``growth`` in the same direction; once it stops
+    improving the search returns to the best size, reverses and halves the
+    step in log space. When the step drops below ``min_growth`` the sizer
+    settles on the best size and stops probing.
+
+    ``limit`` caps the size from outside (e.g. a payload byte budget) and
+    ``max_seconds`` shrinks and caps it when a single batch takes too long,
+    so the search never settles on sizes that make tasks unbounded.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        initial: int,
+        *,
+        minimum: int,
+        maximum: int,
+        growth: float = 2.0,
+        min_growth: float = 1.15,
+        samples: int = 2,
+        warmup: int = 1,
+        tolerance: float = 0.05,
+        max_seconds: Optional[float] = None,
+    ):
+        if minimum < 1 or maximum < minimum:
+            raise ValueError("Batch size bounds must satisfy 1 <= minimum <= maximum")
+        self.name = name
+        self.minimum = minimum
+        self.maximum = maximum
+        self.growth = growth
+        self.min_growth = min_growth
+        self.samples = max(samples, 1)
+        self.tolerance = tolerance
+        self.max_seconds = max_seconds
+        self.limit: Optional[int] = None
+        self.settled = False
+        self.best_size: Optional[int] = None
+        self.best_rate = 0.0
+        self._size = self._clamp(initial)
+        self._direction = 1
+        self._warmup = max(warmup, 0)
+        self._items = 0
+        self._seconds = 0.0
+        self._count = 0
+
+    @property
+    def size(self) -> int:
+        return self._clamp(self._size)
+
+    def _clamp(self, value: float) -> int:
+        upper = self.maximum if self.limit is None else max(min(self.maximum, self.limit), self.minimum)
+        return int(min(max(round(value), self.minimum), upper))
+
+    def observe(self, items: int, seconds: float) -> None:
+        """Record one finished batch of ``items`` that took ``seconds``."""
+        if items <= 0 or seconds <= 0:
+            return
+        if self._warmup:
+            self._warmup -= 1
+            return
+        if self.max_seconds is not None and seconds > self.max_seconds and self._size > self.minimum:
+            # Too slow per batch regardless of throughput: never come back above this size.
+            self.maximum = max(self.minimum, min(self.maximum, self.size - 1))
+            self._move(self._size / self.growth, "batch took %.1fs" % seconds)
+            self._direction = -1
+            self._reset_window()
+            return
+        if self.settled:
+            return
+        self._items += items
+        self._seconds += seconds
+        self._count += 1
+        if self._count < self.samples:
+            return
+        rate = self._items / self._seconds
+        measured = self.size
+        self._reset_window()
+        if self.best_size is None or rate > self.best_rate * (1.0 + self.tolerance):
+            self.best_size, self.best_rate = measured, rate
+            target = measured * self.growth ** self._direction
+            if self._clamp(target) == measured:
+                # Hit a bound: search the other side of the best size with a smaller step.
+                self._narrow()
+                target = self.best_size * self.growth ** self._direction
+            self._move(target, "%.1f items/s at %d" % (rate, measured))
+            return
+        self._narrow()
+        self._move(self.best_size * self.growth ** self._direction, "%.1f items/s at %d" % (rate, measured))
+
+    def _narrow(self) -> None:
+        self._direction = -self._direction
+        self.growth = math.sqrt(self.growth)
+        if self.growth < self.min_growth:
+            self.settled = True
+
+    def _move(self, target: float, reason: str) -> None:
+        if self.settled and self.best_size is not None:
+            target = self.best_size
+        previous = self.size
+        self._size = self._clamp(target)
+        if self.settled:
+            logging.info("Adaptive %s batch size settled at %d (best %.1f items/s)", self.name, self.size, self.best_rate)
+        elif self.size != previous:
+            logging.info("Adaptive %s batch size %d -> %d (%s)", self.name, previous, self.size, reason)
+
+    def _reset_window(self) -> None:
+        self._items = 0
+        self._seconds = 0.0
+        self._count = 0
@@ -5,6 +5,16 @@ import os
 from dataclasses import asdict, dataclass
 from typing import Dict, Optional
 
+BACKEND_TORCH = "torch"
+BACKEND_ONNX = "onnx"
+BACKEND_ONNX_INT8 = "onnx-int8"
+EMBEDDER_BACKENDS = (BACKEND_TORCH, BACKEND_ONNX, BACKEND_ONNX_INT8)
+DEFAULT_ONNX_MODEL_DIR = "models/onnx"
+RERANK_SPARSE = "sparse"
+RERANK_COLBERT = "colbert"
+RERANK_BOTH = "sparse+colbert"
+RERANK_MODES = (RERANK_SPARSE, RERANK_COLBERT, RERANK_BOTH)
+
 
 def _parse_bool(value: Optional[str]) -> Optional[bool]:
     """Convert an environment string to a bool, returning None when ambiguous."""
@@ -28,6 +38,16 @@ def _parse_int(value: Optional[str]) -> Optional[int]:
         return None
 
 
+def _parse_float(value: Optional[str]) -> Optional[float]:
+    """Convert an environment string to float, returning None on failure."""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
 @dataclass
 class Config:
     """Container for all runtime settings."""
@@ -39,9 +59,27 @@ class Config:
     bge_model_name: str = "BAAI/bge-m3"
     bge_use_fp16: bool = False
     embedding_max_length: int = 128
+    vector_dims: int = 0  # stored vector width; 0 = full 1024, otherwise PCA-projected
+    projection_path: str = ""  # where the fitted PCA is saved; default projections/<index uid>.npz
+    embedder_backend: str = BACKEND_TORCH  # torch | onnx | onnx-int8
+    onnx_model_dir: str = ""  # empty = $ONNX_MODEL_DIR, else models/onnx (see onnx_model_path)
     encode_batch_size: int = 64
+    encode_token_budget: int = 8192  # max padded tokens per encode batch; 0 = fixed-size batches
     index_batch_size: int = 256
+    index_max_payload_bytes: int = 16 * 1024 * 1024  # upload batches are cut before exceeding this; 0 = no cap
+    adaptive_batching: bool = False  # tune encode/index batch sizes from observed docs/s during a build
+    index_pipeline_depth: int = 4  # upload tasks left in flight while the build carries on; 1 = wait for each batch
+    meili_max_retries: int = 5  # retries per failing upload / task poll during a build; 0 = fail on first error
+    meili_retry_backoff: float = 0.5  # first retry delay in seconds, doubled per attempt (with jitter)
+    meili_failure_budget: int = 50  # total retries allowed per build before it gives up
     top_k: int = 10
+    semantic_ratio: float = 1.0  # 1.0 = pure vector search; lower blends in keyword ranking
+    rerank_mode: str = ""  # "" = dense only | sparse | colbert | sparse+colbert
+    rerank_candidates: int = 50  # dense hits fetched from Meilisearch before reranking
+    rerank_encode_budget: int = 32  # max uncached candidates encoded per query
+    rerank_store_path: str = ""  # candidate sparse/ColBERT cache; default rerank/<index uid>.sqlite
+    settings_state_path: str = ""  # fingerprint of applied index settings; empty = always read them back
+    prefix_index_path: str = ""  # autocomplete prefix index written during builds; empty = none
     txt_path: str = "games.txt"
     debug: bool = False
 
@@ -78,9 +116,27 @@ def load_config_from_env_and_args(args: object, config_path: Optional[str] = Non
     env_bge_model_name = os.getenv("BGE_MODEL_NAME", file_cfg.get("bge_model_name"))
     env_bge_use_fp16 = _parse_bool(os.getenv("BGE_USE_FP16")) if os.getenv("BGE_USE_FP16") is not None else _parse_bool(str(file_cfg.get("bge_use_fp16")) if file_cfg.get("bge_use_fp16") is not None else None)
     env_embedding_max_length = _parse_int(os.getenv("EMBEDDING_MAX_LENGTH")) if os.getenv("EMBEDDING_MAX_LENGTH") is not None else _parse_int(str(file_cfg.get("embedding_max_length")) if file_cfg.get("embedding_max_length") is not None else None)
+    env_vector_dims = _parse_int(os.getenv("VECTOR_DIMS")) if os.getenv("VECTOR_DIMS") is not None else _parse_int(str(file_cfg.get("vector_dims")) if file_cfg.get("vector_dims") is not None else None)
+    env_projection_path = os.getenv("PROJECTION_PATH", file_cfg.get("projection_path"))
+    env_embedder_backend = os.getenv("EMBEDDER_BACKEND", file_cfg.get("embedder_backend"))
+    env_onnx_model_dir = os.getenv("ONNX_MODEL_DIR", file_cfg.get("onnx_model_dir"))
     env_encode_batch_size = _parse_int(os.getenv("ENCODE_BATCH_SIZE")) if os.getenv("ENCODE_BATCH_SIZE") is not None else _parse_int(str(file_cfg.get("encode_batch_size")) if file_cfg.get("encode_batch_size") is not None else None)
+    env_encode_token_budget = _parse_int(os.getenv("ENCODE_TOKEN_BUDGET")) if os.getenv("ENCODE_TOKEN_BUDGET") is not None else _parse_int(str(file_cfg.get("encode_token_budget")) if file_cfg.get("encode_token_budget") is not None else None)
     env_index_batch_size = _parse_int(os.getenv("INDEX_BATCH_SIZE")) if os.getenv("INDEX_BATCH_SIZE") is not None else _parse_int(str(file_cfg.get("index_batch_size")) if file_cfg.get("index_batch_size") is not None else None)
+    env_index_max_payload_bytes = _parse_int(os.getenv("INDEX_MAX_PAYLOAD_BYTES")) if os.getenv("INDEX_MAX_PAYLOAD_BYTES") is not None else _parse_int(str(file_cfg.get("index_max_payload_bytes")) if file_cfg.get("index_max_payload_bytes") is not None else None)
+    env_adaptive_batching = _parse_bool(os.getenv("ADAPTIVE_BATCHING")) if os.getenv("ADAPTIVE_BATCHING") is not None else _parse_bool(str(file_cfg.get("adaptive_batching")) if file_cfg.get("adaptive_batching") is not None else None)
+    env_index_pipeline_depth = _parse_int(os.getenv("INDEX_PIPELINE_DEPTH")) if os.getenv("INDEX_PIPELINE_DEPTH") is not None else _parse_int(str(file_cfg.get("index_pipeline_depth")) if file_cfg.get("index_pipeline_depth") is not None else None)
+    env_meili_max_retries = _parse_int(os.getenv("MEILI_MAX_RETRIES")) if os.getenv("MEILI_MAX_RETRIES") is not None else _parse_int(str(file_cfg.get("meili_max_retries")) if file_cfg.get("meili_max_retries") is not None else None)
+    env_meili_retry_backoff = _parse_float(os.getenv("MEILI_RETRY_BACKOFF")) if os.getenv("MEILI_RETRY_BACKOFF") is not None else _parse_float(str(file_cfg.get("meili_retry_backoff")) if file_cfg.get("meili_retry_backoff") is not None else None)
+    env_meili_failure_budget = _parse_int(os.getenv("MEILI_FAILURE_BUDGET")) if os.getenv("MEILI_FAILURE_BUDGET") is not None else _parse_int(str(file_cfg.get("meili_failure_budget")) if file_cfg.get("meili_failure_budget") is not None else None)
     env_top_k = _parse_int(os.getenv("TOP_K")) if os.getenv("TOP_K") is not None else _parse_int(str(file_cfg.get("top_k")) if file_cfg.get("top_k") is not None else None)
+    env_semantic_ratio = _parse_float(os.getenv("SEMANTIC_RATIO")) if os.getenv("SEMANTIC_RATIO") is not None else _parse_float(str(file_cfg.get("semantic_ratio")) if file_cfg.get("semantic_ratio") is not None else None)
+    env_rerank_mode = os.getenv("RERANK_MODE", file_cfg.get("rerank_mode"))
+    env_rerank_candidates = _parse_int(os.getenv("RERANK_CANDIDATES")) if os.getenv("RERANK_CANDIDATES") is not None else _parse_int(str(file_cfg.get("rerank_candidates")) if file_cfg.get("rerank_candidates") is not None else None)
+    env_rerank_encode_budget = _parse_int(os.getenv("RERANK_ENCODE_BUDGET")) if os.getenv("RERANK_ENCODE_BUDGET") is not None else _parse_int(str(file_cfg.get("rerank_encode_budget")) if file_cfg.get("rerank_encode_budget") is not None else None)
+    env_rerank_store_path = os.getenv("RERANK_STORE_PATH", file_cfg.get("rerank_store_path"))
+    env_settings_state_path = os.getenv("SETTINGS_STATE_PATH", file_cfg.get("settings_state_path"))
+    env_prefix_index_path = os.getenv("PREFIX_INDEX_PATH", file_cfg.get("prefix_index_path"))
     env_txt_path = os.getenv("TXT_PATH", file_cfg.get("txt_path"))
     env_debug = _parse_bool(os.getenv("DEBUG")) if os.getenv("DEBUG") is not None else _parse_bool(str(file_cfg.get("debug")) if file_cfg.get("debug") is not None else None)
 
@@ -91,9 +147,27 @@ def load_config_from_env_and_args(args: object, config_path: Optional[str] = Non
     bge_model_name = pick(getattr(args, "bge_model_name", None), env_bge_model_name, Config.bge_model_name)
     bge_use_fp16 = pick(getattr(args, "bge_use_fp16", None), env_bge_use_fp16, Config.bge_use_fp16)
     embedding_max_length = pick(getattr(args, "embedding_max_length", None), env_embedding_max_length, Config.embedding_max_length)
+    vector_dims = pick(getattr(args, "vector_dims", None), env_vector_dims, Config.vector_dims)
+    projection_path = pick(getattr(args, "projection_path", None), env_projection_path, Config.projection_path)
+    embedder_backend = pick(getattr(args, "embedder_backend", None), env_embedder_backend, Config.embedder_backend)
+    onnx_model_dir = pick(getattr(args, "onnx_model_dir", None), env_onnx_model_dir, Config.onnx_model_dir)
     encode_batch_size = pick(getattr(args, "encode_batch_size", None), env_encode_batch_size, Config.encode_batch_size)
+    encode_token_budget = pick(getattr(args, "encode_token_budget", None), env_encode_token_budget, Config.encode_token_budget)
     index_batch_size = pick(getattr(args, "index_batch_size", None), env_index_batch_size, Config.index_batch_size)
+    index_max_payload_bytes = pick(getattr(args, "index_max_payload_bytes", None), env_index_max_payload_bytes, Config.index_max_payload_bytes)
+    adaptive_batching = pick(getattr(args, "adaptive_batching", None), env_adaptive_batching, Config.adaptive_batching)
+    index_pipeline_depth = pick(getattr(args, "index_pipeline_depth", None), env_index_pipeline_depth, Config.index_pipeline_depth)
+    meili_max_retries = pick(getattr(args, "meili_max_retries", None), env_meili_max_retries, Config.meili_max_retries)
+    meili_retry_backoff = pick(getattr(args, "meili_retry_backoff", None), env_meili_retry_backoff, Config.meili_retry_backoff)
+    meili_failure_budget = pick(getattr(args, "meili_failure_budget", None), env_meili_failure_budget, Config.meili_failure_budget)
     top_k = pick(getattr(args, "top_k", None), env_top_k, Config.top_k)
+    semantic_ratio = pick(getattr(args, "semantic_ratio", None), env_semantic_ratio, Config.semantic_ratio)
+    rerank_mode = pick(getattr(args, "rerank_mode", None), env_rerank_mode, Config.rerank_mode)
+    rerank_candidates = pick(getattr(args, "rerank_candidates", None), env_rerank_candidates, Config.rerank_candidates)
+    rerank_encode_budget = pick(getattr(args, "rerank_encode_budget", None), env_rerank_encode_budget, Config.rerank_encode_budget)
+    rerank_store_path = pick(getattr(args, "rerank_store_path", None), env_rerank_store_path, Config.rerank_store_path)
+    settings_state_path = pick(getattr(args, "settings_state_path", None), env_settings_state_path, Config.settings_state_path)
+    prefix_index_path = pick(getattr(args, "prefix_index_path", None), env_prefix_index_path, Config.prefix_index_path)
     txt_path = pick(getattr(args, "txt_path", None), env_txt_path, Config.txt_path)
     debug = pick(getattr(args, "debug", None), env_debug, Config.debug)
 
@@ -105,9 +179,27 @@ def load_config_from_env_and_args(args: object, config_path: Optional[str] = Non
         bge_model_name=bge_model_name,
         bge_use_fp16=bool(bge_use_fp16),
         embedding_max_length=int(embedding_max_length),
+        vector_dims=max(int(vector_dims), 0),
+        projection_path=projection_path,
+        embedder_backend=str(embedder_backend).strip().lower(),
+        onnx_model_dir=onnx_model_dir,
         encode_batch_size=int(encode_batch_size),
+        encode_token_budget=max(int(encode_token_budget), 0),
         index_batch_size=int(index_batch_size),
+        index_max_payload_bytes=max(int(index_max_payload_bytes), 0),
+        adaptive_batching=bool(adaptive_batching),
+        index_pipeline_depth=max(int(index_pipeline_depth), 1),
+        meili_max_retries=max(int(meili_max_retries), 0),
+        meili_retry_backoff=max(float(meili_retry_backoff), 0.0),
+        meili_failure_budget=max(int(meili_failure_budget), 0),
         top_k=int(top_k),
+        semantic_ratio=min(max(float(semantic_ratio), 0.0), 1.0),
+        rerank_mode=str(rerank_mode or "").strip().lower(),
+        rerank_candidates=max(int(rerank_candidates), 1),
+        rerank_encode_budget=max(int(rerank_encode_budget), 0),
+        rerank_store_path=rerank_store_path,
+        settings_state_path=settings_state_path,
+        prefix_index_path=prefix_index_path,
         txt_path=txt_path,
         debug=bool(debug),
     )
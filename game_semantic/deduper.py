@@ -11,7 +11,7 @@ from typing import Dict, List, Optional, Set, Tuple
 import numpy as np
 
 from .config import Config
-from .embedding import BgeM3Embedder
+from .embedding import create_embedder
 from .meili_client import MeiliGameIndex
 
 
@@ -51,9 +51,15 @@ def load_items_from_txt(path: str) -> List[ItemRecord]:
 
 
 def load_items_from_json(path: str) -> List[ItemRecord]:
-    """读取 JSON 列表格式的记录。"""
+    """读取 JSON 列表或 NDJSON（每行一个对象）格式的记录。"""
     with open(path, "r", encoding="utf-8") as handle:
-        data = json.load(handle)
+        text = handle.read()
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError:
+        data = [json.loads(line) for line in text.splitlines() if line.strip()]
+    if isinstance(data, dict):
+        data = [data]
     if not isinstance(data, list):
         logging.warning("JSON 数据不是列表，忽略。")
         return []
@@ -172,6 +178,7 @@ def _create_index(config: Config, displayed_attributes: List[str]) -> MeiliGameI
         embedder_name="bge_m3",
         embedding_dim=1024,
         displayed_attributes=displayed_attributes,
+        settings_state_path=config.settings_state_path or None,
     )
 
 
@@ -205,8 +212,7 @@ def dedupe_items(
     game_index = _create_index(config, displayed_attributes=displayed_attributes)
 
     if mode == "rebuild":
-        game_index.delete_index()
-        game_index = _create_index(config, displayed_attributes=displayed_attributes)
+        game_index.recreate_index()
 
     game_index.ensure_settings()
 
@@ -222,7 +228,12 @@ def dedupe_items(
             logging.info("没有新名称需要追加，结束。")
             return
 
-    embedder = BgeM3Embedder(model_name=config.bge_model_name, use_fp16=config.bge_use_fp16)
+    embedder = create_embedder(
+        config.bge_model_name,
+        config.bge_use_fp16,
+        config.embedder_backend,
+        config.onnx_model_dir,
+    )
     names = [item.name for item in items]
     dense_vecs = embedder.encode_dense(
         names,
@@ -1,28 +1,220 @@
-"""BGE-M3 embedding wrapper."""
+"""BGE-M3 embedding wrappers and backend selection."""
 
+import abc
+from dataclasses import dataclass
 from functools import lru_cache
-from typing import List
+from typing import Any, Dict, List, Optional, Sequence
 
 import numpy as np
-from FlagEmbedding import BGEM3FlagModel
 
+from .config import BACKEND_ONNX, BACKEND_ONNX_INT8, BACKEND_TORCH, EMBEDDER_BACKENDS
 
-class BgeM3Embedder:
-    """Encapsulates BGEM3FlagModel for dense encoding."""
+# Resolved on first use: importing FlagEmbedding pulls in torch and
+# transformers, which costs seconds and is not needed by --help, admin pages
+# or the ONNX backend.
+BGEM3FlagModel = None
 
-    def __init__(self, model_name: str = "BAAI/bge-m3", use_fp16: bool = False):
-        self.model = BGEM3FlagModel(model_name, use_fp16=use_fp16)
 
-    def encode_dense(self, texts: List[str], batch_size: int = 64, max_length: int = 128) -> np.ndarray:
+def _flag_model_class():
+    global BGEM3FlagModel
+    if BGEM3FlagModel is None:
+        from FlagEmbedding import BGEM3FlagModel as flag_model_class
+
+        BGEM3FlagModel = flag_model_class
+    return BGEM3FlagModel
+
+
+@dataclass
+class PaddingStats:
+    """Token accounting for length-bucketed encoding.
+
+    ``padded_tokens`` is what the model actually processed (batch size times
+    the longest input in each batch); ``unbucketed_padded_tokens`` is what
+    fixed-size batches in input order would have processed.
+    """
+
+    real_tokens: int = 0
+    padded_tokens: int = 0
+    unbucketed_padded_tokens: int = 0
+
+    @property
+    def padding_ratio(self) -> float:
+        return (self.padded_tokens / self.real_tokens) if self.real_tokens else 1.0
+
+
+def plan_length_buckets(lengths: Sequence[int], max_batch_size: int, token_budget: int) -> List[List[int]]:
+    """
+    Group input positions into batches of similar length.
+
+    Positions are sorted by length, then packed so that each batch holds at
+    most ``max_batch_size`` items and ``len(batch) * longest`` stays within
+    ``token_budget``. An input longer than the budget gets a batch of its own.
+    """
+    order = sorted(range(len(lengths)), key=lambda position: lengths[position])
+    batches: List[List[int]] = []
+    current: List[int] = []
+    for position in order:
+        longest = lengths[position]
+        if current and (len(current) >= max_batch_size or (len(current) + 1) * longest > token_budget):
+            batches.append(current)
+            current = []
+        current.append(position)
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _unbucketed_padded_tokens(lengths: Sequence[int], batch_size: int) -> int:
+    total = 0
+    for start in range(0, len(lengths), batch_size):
+        chunk = lengths[start : start + batch_size]
+        total += len(chunk) * max(chunk)
+    return total
+
+
+class DenseEmbedder(abc.ABC):
+    """
+    Backend-neutral dense encoder.
+
+    Backends implement ``token_lengths`` and ``_encode_batch``; batching,
+    length bucketing and padding accounting live here so every backend
+    produces the same layout.
+    """
+
+    dim = 1024
+
+    @abc.abstractmethod
+    def token_lengths(self, texts: List[str], max_length: int = 128) -> List[int]:
+        """Tokenized length of each text (special tokens included, truncated to max_length)."""
+
+    @abc.abstractmethod
+    def _encode_batch(self, texts: List[str], batch_size: int, max_length: int) -> np.ndarray:
+        """Dense vectors for ``texts`` in input order, run in chunks of ``batch_size``."""
+
+    def encode_dense(
+        self,
+        texts: List[str],
+        batch_size: int = 64,
+        max_length: int = 128,
+        token_budget: Optional[int] = None,
+        stats: Optional[PaddingStats] = None,
+    ) -> np.ndarray:
         """
         Encode a list of texts into dense vectors.
 
         Returns a numpy array with shape (len(texts), 1024). Empty input returns
         an empty array with the same second dimension.
+
+        With a ``token_budget``, inputs are sorted by tokenized length and
+        packed into batches of at most ``batch_size`` items and
+        ``token_budget`` padded tokens; vectors come back in input order and
+        token counts are added to ``stats``.
         """
         if not texts:
-            return np.zeros((0, 1024), dtype=np.float32)
+            return np.zeros((0, self.dim), dtype=np.float32)
+        if token_budget:
+            return self._encode_bucketed(texts, batch_size, max_length, token_budget, stats)
+        return self._encode_batch(texts, batch_size, max_length)
+
+    def encode_multi(
+        self,
+        texts: List[str],
+        batch_size: int = 64,
+        max_length: int = 128,
+        *,
+        sparse: bool = True,
+        colbert: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Encode texts into dense vectors plus BGE-M3 lexical weights and/or ColBERT vectors.
+
+        Returns ``dense_vecs`` and, when requested, ``lexical_weights`` (one
+        ``{token_id: weight}`` dict per text) and ``colbert_vecs`` (one
+        ``(tokens, dim)`` array per text). Only backends that keep the sparse
+        and ColBERT heads support this.
+        """
+        raise NotImplementedError(f"{type(self).__name__} only produces dense vectors")
+
+    def _encode_bucketed(
+        self,
+        texts: List[str],
+        batch_size: int,
+        max_length: int,
+        token_budget: int,
+        stats: Optional[PaddingStats],
+    ) -> np.ndarray:
+        lengths = self.token_lengths(texts, max_length)
+        output: Optional[np.ndarray] = None
+        padded_tokens = 0
+        for bucket in plan_length_buckets(lengths, batch_size, token_budget):
+            dense_vecs = np.asarray(
+                self._encode_batch([texts[position] for position in bucket], len(bucket), max_length)
+            )
+            if output is None:
+                output = np.empty((len(texts), dense_vecs.shape[1]), dtype=dense_vecs.dtype)
+            output[bucket] = dense_vecs
+            padded_tokens += len(bucket) * lengths[bucket[-1]]
+        if stats is not None:
+            stats.real_tokens += sum(lengths)
+            stats.padded_tokens += padded_tokens
+            stats.unbucketed_padded_tokens += _unbucketed_padded_tokens(lengths, batch_size)
+        return output
 
+
+class BgeM3Embedder(DenseEmbedder):
+    """Encapsulates the PyTorch BGEM3FlagModel for dense encoding."""
+
+    def __init__(self, model_name: str = "BAAI/bge-m3", use_fp16: bool = False):
+        self.model = _flag_model_class()(model_name, use_fp16=use_fp16)
+
+    def token_lengths(self, texts: List[str], max_length: int = 128) -> List[int]:
+        tokenizer = getattr(self.model, "tokenizer", None)
+        if tokenizer is None:
+            # Rough fallback: one token per character plus CLS/SEP.
+            return [min(len(text) + 2, max_length) for text in texts]
+        input_ids = tokenizer(
+            list(texts),
+            add_special_tokens=True,
+            truncation=True,
+            max_length=max_length,
+        )["input_ids"]
+        return [len(ids) for ids in input_ids]
+
+    def encode_multi(
+        self,
+        texts: List[str],
+        batch_size: int = 64,
+        max_length: int = 128,
+        *,
+        sparse: bool = True,
+        colbert: bool = True,
+    ) -> Dict[str, Any]:
+        if not texts:
+            outputs: Dict[str, Any] = {"dense_vecs": np.zeros((0, self.dim), dtype=np.float32)}
+            if sparse:
+                outputs["lexical_weights"] = []
+            if colbert:
+                outputs["colbert_vecs"] = []
+            return outputs
+        encoded = self.model.encode(
+            texts,
+            batch_size=batch_size,
+            max_length=max_length,
+            return_dense=True,
+            return_sparse=sparse,
+            return_colbert_vecs=colbert,
+        )
+        outputs = {"dense_vecs": np.asarray(encoded["dense_vecs"])}
+        if sparse:
+            outputs["lexical_weights"] = [
+                {str(token): float(weight) for token, weight in weights.items()}
+                for weights in encoded["lexical_weights"]
+            ]
+        if colbert:
+            outputs["colbert_vecs"] = [np.asarray(vecs, dtype=np.float32) for vecs in encoded["colbert_vecs"]]
+        return outputs
+
+    def _encode_batch(self, texts: List[str], batch_size: int, max_length: int) -> np.ndarray:
         encoded = self.model.encode(
             texts,
             batch_size=batch_size,
@@ -31,11 +223,52 @@ class BgeM3Embedder:
             return_sparse=False,
             return_colbert_vecs=False,
         )
-        dense_vecs = encoded["dense_vecs"]
-        return dense_vecs
+        return encoded["dense_vecs"]
+
+
+def create_embedder(
+    model_name: str,
+    use_fp16: bool = False,
+    backend: str = BACKEND_TORCH,
+    onnx_model_dir: Optional[str] = None,
+) -> DenseEmbedder:
+    """
+    Build an embedder for the given backend.
+
+    ``torch`` loads BGEM3FlagModel; ``onnx`` / ``onnx-int8`` load the dense
+    head exported by ``bin/export_onnx.py`` from ``onnx_model_dir``.
+    """
+    if backend == BACKEND_TORCH:
+        return BgeM3Embedder(model_name=model_name, use_fp16=use_fp16)
+    if backend in (BACKEND_ONNX, BACKEND_ONNX_INT8):
+        from .onnx_embedder import OnnxBgeM3Embedder
+
+        return OnnxBgeM3Embedder(
+            model_name=model_name,
+            model_dir=onnx_model_dir,
+            quantized=backend == BACKEND_ONNX_INT8,
+        )
+    raise ValueError(f"Unknown embedder backend '{backend}' (expected one of {', '.join(EMBEDDER_BACKENDS)})")
 
 
 @lru_cache(maxsize=None)
 def get_cached_bge_m3(model_name: str, use_fp16: bool) -> BgeM3Embedder:
     """Return one cached embedder instance per (model_name, use_fp16) pair."""
     return BgeM3Embedder(model_name=model_name, use_fp16=use_fp16)
+
+
+@lru_cache(maxsize=None)
+def _get_cached_onnx(model_name: str, backend: str, onnx_model_dir: Optional[str]) -> DenseEmbedder:
+    return create_embedder(model_name, False, backend, onnx_model_dir)
+
+
+def get_cached_embedder(
+    model_name: str,
+    use_fp16: bool,
+    backend: str = BACKEND_TORCH,
+    onnx_model_dir: Optional[str] = None,
+) -> DenseEmbedder:
+    """Return one cached embedder per model and backend (use_fp16 only applies to torch)."""
+    if backend == BACKEND_TORCH:
+        return get_cached_bge_m3(model_name, use_fp16)
+    return _get_cached_onnx(model_name, backend, onnx_model_dir)
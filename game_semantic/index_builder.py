@@ -1,45 +1,242 @@
 """Build the Meilisearch index from a plain-text games list."""
 
+import itertools
+import json
 import logging
+import os
+import random
 import time
-from typing import List
+from dataclasses import asdict, dataclass
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple, Union
 
-from .config import Config
-from .embedding import get_cached_bge_m3
-from .meili_client import MeiliGameIndex
+import numpy as np
+
+from .batching import (
+    ENCODE_BATCH_MAX,
+    ENCODE_BATCH_MIN,
+    INDEX_BATCH_MAX,
+    INDEX_BATCH_MIN,
+    MAX_UPLOAD_BATCH_SECONDS,
+    AdaptiveBatchSizer,
+)
+from .config import BACKEND_TORCH, RERANK_MODES, Config
+from .embedding import PaddingStats, get_cached_embedder
+from .hashset import HashSet64
+from .meili_client import MeiliGameIndex, MeiliRetry, TaskTracker
+from .metrics import BUILD_DOCS_ENCODED, BUILD_ENCODE_DOCS_PER_SECOND
+from .prefix_index import PrefixIndex
+from .projection import FULL_DIMS, PCA_SAMPLE_SIZE, PcaProjection, fit_pca
+from .rerank import CandidateStore, mode_uses_colbert, mode_uses_sparse, outputs_from_encoding
 
 VALID_MODES = {"rebuild", "append", "refine"}
+# With a token budget, each encode_dense call sees this many encode batches'
+# worth of names so it has enough inputs to bucket by length.
+ENCODE_BUCKET_WINDOW = 8
 
 
-def load_game_names(txt_path: str) -> List[str]:
+@dataclass
+class BuildProgress:
+    """Telemetry for one uploaded document batch of a build."""
+
+    batch: int
+    batch_docs: int
+    docs_done: int
+    docs_total: Optional[int]
+    encode_seconds: float
+    serialize_seconds: float
+    upload_seconds: float
+    task_seconds: float
+    elapsed_seconds: float
+    docs_per_second: float
+    eta_seconds: Optional[float]
+    finished: bool = False
+    real_tokens: int = 0
+    padded_tokens: int = 0
+    index_batch_size: int = 0  # current adaptive sizes; 0 when batch sizes are fixed
+    encode_batch_size: int = 0
+    retries: int = 0  # Meilisearch retries so far in this build
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    def format_line(self) -> str:
+        eta = "?" if self.eta_seconds is None else f"{self.eta_seconds:.0f}s"
+        total = "?" if self.docs_total is None else self.docs_total
+        return (
+            f"Batch {self.batch}: {self.docs_done}/{total} docs "
+            f"encode={self.encode_seconds:.2f}s serialize={self.serialize_seconds:.2f}s "
+            f"upload={self.upload_seconds:.2f}s task={self.task_seconds:.2f}s "
+            f"{self.docs_per_second:.1f} docs/s ETA {eta}"
+            + (f" tokens={self.real_tokens}/{self.padded_tokens} padded" if self.padded_tokens else "")
+            + (
+                f" batch_size={self.index_batch_size} encode_batch_size={self.encode_batch_size}"
+                if self.index_batch_size
+                else ""
+            )
+            + (f" retries={self.retries}" if self.retries else "")
+        )
+
+
+ProgressCallback = Callable[[BuildProgress], None]
+
+
+def iter_game_names(txt_path: str) -> Iterator[str]:
     """
-    Read non-empty lines from the given text file.
+    Stream non-empty lines from the given text file.
 
     Leading/trailing whitespace is stripped; empty lines are ignored.
     """
-    names: List[str] = []
     with open(txt_path, "r", encoding="utf-8") as handle:
         for line in handle:
             name = line.strip()
             if name:
-                names.append(name)
-    return names
+                yield name
+
+
+def load_game_names(txt_path: str) -> List[str]:
+    """Read all non-empty, stripped lines from the given text file."""
+    return list(iter_game_names(txt_path))
+
+
+def iter_unique(names: Iterable[str], seen: Optional[HashSet64] = None) -> Iterator[str]:
+    """Yield names not seen before, tracking them by 64-bit hash."""
+    if seen is None:
+        seen = HashSet64()
+    for name in names:
+        if seen.add_name(name):
+            yield name
 
 
 def _deduplicate_preserve_order(items: List[str]) -> List[str]:
     """Remove duplicates while preserving order."""
-    seen = set()
-    output = []
-    for item in items:
-        if item in seen:
-            continue
-        seen.add(item)
-        output.append(item)
-    return output
+    return list(iter_unique(items))
+
+
+def _iter_batches(names: Iterable[str], size: Union[int, Callable[[], int]]) -> Iterator[Tuple[List[str], bool]]:
+    """
+    Yield ``(batch, is_last)`` pairs, looking one batch ahead.
+
+    ``size`` may be a callable, read each time a batch is cut, so an adaptive
+    sizer can change it between batches.
+    """
+    size_of = size if callable(size) else lambda: size
+    iterator = iter(names)
+    batch = list(itertools.islice(iterator, size_of()))
+    while batch:
+        upcoming = list(itertools.islice(iterator, size_of()))
+        yield batch, not upcoming
+        batch = upcoming
+
+
+def _sample_names(names: Iterable[str], size: int, seed: int = 0) -> Tuple[List[str], int]:
+    """
+    Uniform sample of up to ``size`` names from a stream, and the stream's length.
+
+    Reservoir sampling, seeded so the same input always yields the same sample.
+    """
+    rng = random.Random(seed)
+    sample: List[str] = []
+    total = 0
+    for total, name in enumerate(names, start=1):
+        if total <= size:
+            sample.append(name)
+        else:
+            slot = rng.randrange(total)
+            if slot < size:
+                sample[slot] = name
+    return sample, total
+
+
+def _fit_projection(vectors: np.ndarray, vector_dims: int, path: str) -> PcaProjection:
+    if len(vectors) <= vector_dims:
+        raise ValueError(
+            f"Cannot fit a {vector_dims}-dim projection on {len(vectors)} names; lower vector_dims or use full vectors"
+        )
+    projection = fit_pca(vectors, vector_dims)
+    projection.save(path)
+    logging.info("Fitted %d-dim PCA projection on %d names -> %s", vector_dims, len(vectors), path)
+    return projection
+
+
+def _peek(names: Iterator[str]) -> Optional[Iterator[str]]:
+    """Return an equivalent iterator, or None when ``names`` is empty."""
+    first = next(names, None)
+    if first is None:
+        return None
+    return itertools.chain([first], names)
+
+
+def projection_path_for(config: Config) -> str:
+    """Where the PCA projection for this index is stored (``projections/<index uid>.npz`` by default)."""
+    return config.projection_path or os.path.join("projections", f"{config.meili_index_uid}.npz")
+
+
+def load_projection(path: str, vector_dims: int) -> PcaProjection:
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Projection {path} not found; rebuild the index to fit one")
+    projection = PcaProjection.load(path)
+    if projection.dims != vector_dims:
+        raise ValueError(f"Projection {path} has {projection.dims} dims, expected {vector_dims}")
+    return projection
+
+
+def rerank_store_path_for(config: Config) -> str:
+    """Where candidate sparse/ColBERT outputs are cached (``rerank/<index uid>.sqlite`` by default)."""
+    return config.rerank_store_path or os.path.join("rerank", f"{config.meili_index_uid}.sqlite")
+
+
+def check_rerank_mode(config: Config) -> None:
+    if not config.rerank_mode:
+        return
+    if config.rerank_mode not in RERANK_MODES:
+        raise ValueError(f"Unknown rerank mode '{config.rerank_mode}' (expected one of {', '.join(RERANK_MODES)})")
+    if config.embedder_backend != BACKEND_TORCH:
+        raise ValueError("Reranking needs the sparse/ColBERT heads, which only the torch backend provides")
+
+
+def build_index(
+    config: Config,
+    progress: Optional[ProgressCallback] = None,
+    expected_docs: Optional[int] = None,
+):
+    """
+    Load names, embed them, and push to Meilisearch.
+
+    The text file is streamed and deduplicated through a compact hash set, so
+    memory does not grow with the dataset and encoding starts on the first
+    batch. When given, ``progress`` is called with a BuildProgress after every
+    uploaded document batch; ``expected_docs`` (e.g. the dataset's known
+    unique-line count) lets it report totals and an ETA before the end.
 
+    With ``config.vector_dims`` below 1024, rebuild/refine fit a PCA on a
+    uniform sample of ``PCA_SAMPLE_SIZE`` names, drawn in an extra pass over
+    the input before streaming, and save it to ``projection_path_for(config)``;
+    append reuses the saved projection. Stored vectors are projected.
 
-def build_index(config: Config):
-    """Load names, embed them, and push to Meilisearch."""
+    With ``config.rerank_mode`` set, names are encoded with the sparse and/or
+    ColBERT heads as well and those outputs are cached by document id in
+    ``rerank_store_path_for(config)`` for query-time reranking.
+
+    With ``config.prefix_index_path`` set, every indexed name and its id are
+    also written to a PrefixIndex there for autocomplete.
+
+    Upload batches are cut before their JSON payload would exceed
+    ``config.index_max_payload_bytes``. With ``config.adaptive_batching`` the
+    encode and upload batch sizes start from the configured values and are
+    tuned per build from observed docs/s (see AdaptiveBatchSizer); the current
+    sizes are reported in every BuildProgress.
+
+    Uploads and task polls are retried with backoff within
+    ``config.meili_max_retries`` per call and ``config.meili_failure_budget``
+    per build (see MeiliRetry), so a transient Meilisearch error does not
+    discard the build; retry counts are reported in BuildProgress and logged
+    at the end.
+
+    Up to ``config.index_pipeline_depth`` upload tasks stay in flight: the
+    build keeps encoding while Meilisearch indexes earlier batches, and a
+    TaskTracker polls all outstanding tasks in one request. The last
+    progress report comes after every task has succeeded.
+    """
     log_level = logging.DEBUG if config.debug else logging.INFO
     logging.basicConfig(level=log_level, format="%(asctime)s [%(levelname)s] %(message)s")
     start_time = time.time()
@@ -49,103 +246,318 @@ def build_index(config: Config):
         logging.warning("Unknown mode '%s', defaulting to 'rebuild'", mode)
         mode = "rebuild"
 
+    check_rerank_mode(config)
+    vector_dims = config.vector_dims if 0 < config.vector_dims < FULL_DIMS else FULL_DIMS
+    projection_path = projection_path_for(config)
+    projection = None
+    if vector_dims < FULL_DIMS and mode == "append":
+        # Appended vectors must live in the space the index was built with.
+        projection = load_projection(projection_path, vector_dims)
+
+    retry = MeiliRetry(
+        max_retries=config.meili_max_retries,
+        backoff_seconds=config.meili_retry_backoff,
+        failure_budget=config.meili_failure_budget,
+    )
     game_index = MeiliGameIndex(
         url=config.meili_url,
         api_key=config.meili_api_key,
         index_uid=config.meili_index_uid,
         embedder_name="bge_m3",
-        embedding_dim=1024,
+        embedding_dim=vector_dims,
+        retry=retry,
+        settings_state_path=config.settings_state_path or None,
     )
 
+    seen = HashSet64()
     if mode == "refine":
         logging.info("Mode=refine: fetching all existing names for dedup + rebuild.")
-        names = game_index.fetch_all_names_list()
-        names = _deduplicate_preserve_order(names)
+        fetched = game_index.fetch_all_names_list()
+        names = list(iter_unique(fetched, seen))
+        del fetched
         logging.info("Refine: fetched %d names after dedup", len(names))
         if not names:
             logging.warning("No names found in index; nothing to refine.")
             return
         logging.info("Deleting index %s before refining", config.meili_index_uid)
-        game_index.delete_index()
-        game_index = MeiliGameIndex(
-            url=config.meili_url,
-            api_key=config.meili_api_key,
-            index_uid=config.meili_index_uid,
-            embedder_name="bge_m3",
-            embedding_dim=1024,
-        )
+        game_index.recreate_index()
+        name_stream = iter(names)
     else:
-        names = load_game_names(config.txt_path)
-        names = _deduplicate_preserve_order(names)
-        logging.info("Loaded %d game names from %s (deduplicated)", len(names), config.txt_path)
-        logging.debug("Sample names: %s", names[:3] if names else [])
-        if not names:
-            logging.warning("No names to index; aborting.")
-            return
-
+        logging.info("Streaming game names from %s", config.txt_path)
         if mode == "rebuild":
+            name_stream = _peek(iter_unique(iter_game_names(config.txt_path), seen))
+            if name_stream is None:
+                logging.warning("No names to index; aborting.")
+                return
             logging.info("Mode=rebuild: deleting target index %s before rebuild", config.meili_index_uid)
-            game_index.delete_index()
-            game_index = MeiliGameIndex(
-                url=config.meili_url,
-                api_key=config.meili_api_key,
-                index_uid=config.meili_index_uid,
-                embedder_name="bge_m3",
-                embedding_dim=1024,
-            )
+            game_index.recreate_index()
 
     game_index.ensure_settings()
 
-    existing_names = set()
     start_id = 1
     if mode == "append":
         logging.info("Mode=append: fetching existing names for deduplication...")
         existing_names, max_id = game_index.fetch_existing_names_and_max_id()
         start_id = max_id + 1
-        before_filter = len(names)
-        names = [n for n in names if n not in existing_names]
-        logging.info(
-            "Append mode: %d new names after filtering %d existing; start id=%d",
-            len(names),
-            before_filter - len(names),
-            start_id,
-        )
-        if not names:
+        for name in existing_names:
+            seen.add_name(name)
+        existing_count = len(existing_names)
+        del existing_names
+        logging.info("Append mode: skipping %d existing names; start id=%d", existing_count, start_id)
+        name_stream = _peek(iter_unique(iter_game_names(config.txt_path), seen))
+        if name_stream is None:
             logging.warning("No new names to append; exiting.")
             return
 
-    embedder = get_cached_bge_m3(config.bge_model_name, config.bge_use_fp16)
+    embedder = get_cached_embedder(
+        config.bge_model_name,
+        config.bge_use_fp16,
+        config.embedder_backend,
+        config.onnx_model_dir,
+    )
+    token_budget = config.encode_token_budget
+    padding = PaddingStats()
+    rerank_store = None
+    if config.rerank_mode:
+        rerank_store = CandidateStore(rerank_store_path_for(config))
+        if mode != "append":
+            # Ids restart at 1, so outputs cached by an earlier build are stale.
+            rerank_store.clear()
+    prefix_index = None
+    if config.prefix_index_path:
+        prefix_index = PrefixIndex(config.prefix_index_path)
+        if mode != "append":
+            prefix_index.clear()
+    encode_sizer = upload_sizer = None
+    if config.adaptive_batching:
+        encode_sizer = AdaptiveBatchSizer(
+            "encode", config.encode_batch_size, minimum=ENCODE_BATCH_MIN, maximum=ENCODE_BATCH_MAX
+        )
+        upload_sizer = AdaptiveBatchSizer(
+            "upload",
+            config.index_batch_size,
+            minimum=INDEX_BATCH_MIN,
+            maximum=INDEX_BATCH_MAX,
+            max_seconds=MAX_UPLOAD_BATCH_SECONDS,
+        )
+
+    def _encode_batch_size() -> int:
+        return encode_sizer.size if encode_sizer is not None else config.encode_batch_size
+
+    def _encode_window() -> int:
+        return _encode_batch_size() * (ENCODE_BUCKET_WINDOW if token_budget else 1)
+
+    # Mean JSON bytes per document, first estimated from one document and then
+    # taken from the uploads, to keep batches under the payload budget.
+    doc_bytes = 0.0
+
+    def _upload_limit() -> int:
+        size = upload_sizer.size if upload_sizer is not None else config.index_batch_size
+        if config.index_max_payload_bytes and doc_bytes:
+            size = min(size, max(int(config.index_max_payload_bytes // doc_bytes), 1))
+        return size
+
+    pipeline_depth = max(config.index_pipeline_depth, 1)
+    tracker: Optional[TaskTracker] = None
+
+    docs_done = 0
+    batch_number = 0
+    pending_encode_seconds = 0.0
+    encode_phase_started = time.perf_counter()
+
+    def _flush(docs_batch, finished):
+        nonlocal docs_done, batch_number, pending_encode_seconds, doc_bytes, tracker
+        if pipeline_depth == 1:
+            timings = game_index.add_documents(docs_batch, wait=True) or {}
+        else:
+            timings = dict(game_index.add_documents(docs_batch, wait=False) or {})
+            if timings.get("task_uid") is not None:
+                if tracker is None:
+                    tracker = TaskTracker(game_index.client, retry=retry)
+                batch = docs_batch
+                tracker.add(timings["task_uid"], lambda: game_index.add_documents(batch, wait=False)["task_uid"])
+            if tracker is not None:
+                # Time spent here waiting for older tasks is this batch's share of the indexing wait.
+                timings["task_seconds"] = tracker.wait(0 if finished else pipeline_depth - 1)
+        if timings.get("bytes"):
+            doc_bytes = float(timings["bytes"]) / len(docs_batch)
+        if upload_sizer is not None:
+            upload_sizer.observe(
+                len(docs_batch),
+                float(timings.get("serialize_seconds", 0.0))
+                + float(timings.get("upload_seconds", 0.0))
+                + float(timings.get("task_seconds", 0.0)),
+            )
+        docs_done += len(docs_batch)
+        batch_number += 1
+        if progress is not None:
+            elapsed_seconds = time.perf_counter() - encode_phase_started
+            docs_per_second = docs_done / elapsed_seconds if elapsed_seconds > 0 else 0.0
+            if finished:
+                docs_total = docs_done
+            elif expected_docs is not None and expected_docs >= docs_done:
+                docs_total = expected_docs
+            else:
+                docs_total = None
+            eta_seconds = None
+            if docs_total is not None and docs_per_second > 0:
+                eta_seconds = (docs_total - docs_done) / docs_per_second
+            progress(
+                BuildProgress(
+                    batch=batch_number,
+                    batch_docs=len(docs_batch),
+                    docs_done=docs_done,
+                    docs_total=docs_total,
+                    encode_seconds=pending_encode_seconds,
+                    serialize_seconds=float(timings.get("serialize_seconds", 0.0)),
+                    upload_seconds=float(timings.get("upload_seconds", 0.0)),
+                    task_seconds=float(timings.get("task_seconds", 0.0)),
+                    elapsed_seconds=elapsed_seconds,
+                    docs_per_second=docs_per_second,
+                    eta_seconds=eta_seconds,
+                    finished=finished,
+                    real_tokens=padding.real_tokens,
+                    padded_tokens=padding.padded_tokens,
+                    index_batch_size=_upload_limit() if upload_sizer is not None else 0,
+                    encode_batch_size=_encode_batch_size() if encode_sizer is not None else 0,
+                    retries=retry.total,
+                )
+            )
+        pending_encode_seconds = 0.0
+
+    if vector_dims < FULL_DIMS and projection is None:
+        # Sample the whole input, not its head, so sorted or grouped files fit
+        # a representative PCA. Inputs no larger than the sample are held and
+        # fitted on in full while streaming below, without encoding twice.
+        source = names if mode == "refine" else iter_unique(iter_game_names(config.txt_path))
+        sample, total = _sample_names(source, PCA_SAMPLE_SIZE)
+        if total > PCA_SAMPLE_SIZE:
+            logging.info("Encoding %d of %d names sampled to fit the PCA projection", len(sample), total)
+            sample_vecs = embedder.encode_dense(
+                sample,
+                batch_size=config.encode_batch_size,
+                max_length=config.embedding_max_length,
+                token_budget=token_budget or None,
+            )
+            projection = _fit_projection(np.asarray(sample_vecs, dtype=np.float32), vector_dims, projection_path)
+        del sample
 
     docs_batch = []
     next_id = start_id
-    for start in range(0, len(names), config.encode_batch_size):
-        batch_names = names[start : start + config.encode_batch_size]
-        logging.debug("Encoding batch [%d:%d) size=%d", start, start + len(batch_names), len(batch_names))
-        dense_vecs = embedder.encode_dense(
-            batch_names,
-            batch_size=len(batch_names),
-            max_length=config.embedding_max_length,
-        )
 
-        for name, vec in zip(batch_names, dense_vecs):
+    def _add_encoded(batch_names, dense_vecs, is_last_batch, rerank_outputs=None):
+        nonlocal docs_batch, next_id, doc_bytes
+        if projection is not None:
+            dense_vecs = projection.project(dense_vecs)
+        if rerank_outputs is not None:
+            rerank_store.put_many(zip(range(next_id, next_id + len(batch_names)), rerank_outputs))
+        if prefix_index is not None:
+            prefix_index.put_many(zip(range(next_id, next_id + len(batch_names)), batch_names))
+        for position, (name, vec) in enumerate(zip(batch_names, dense_vecs)):
             doc = {
                 "id": next_id,
                 "name": name,
                 "_vectors": {"bge_m3": vec.tolist()},
             }
+            if not doc_bytes:
+                doc_bytes = float(len(json.dumps(doc, ensure_ascii=False, separators=(",", ":")).encode("utf-8")))
             docs_batch.append(doc)
             next_id += 1
 
-            if len(docs_batch) >= config.index_batch_size:
+            if len(docs_batch) >= _upload_limit():
                 logging.info("Writing %d documents (up to id=%d)", len(docs_batch), next_id - 1)
                 logging.debug("First doc of batch: %s", docs_batch[0])
-                game_index.add_documents(docs_batch, wait=True)
+                _flush(docs_batch, is_last_batch and position == len(batch_names) - 1)
                 docs_batch = []
 
+    # With a reduced width and an input no larger than the PCA sample, hold
+    # every encoded batch and fit on all of them.
+    held_batches = []
+    held_count = 0
+    for batch_names, is_last_batch in _iter_batches(name_stream, _encode_window):
+        logging.debug("Encoding batch from id=%d size=%d", next_id, len(batch_names))
+        encode_started = time.perf_counter()
+        rerank_outputs = None
+        if rerank_store is not None:
+            # The sparse/ColBERT heads come from one FlagEmbedding call per window, unbucketed.
+            encoded = embedder.encode_multi(
+                batch_names,
+                batch_size=_encode_batch_size(),
+                max_length=config.embedding_max_length,
+                sparse=mode_uses_sparse(config.rerank_mode),
+                colbert=mode_uses_colbert(config.rerank_mode),
+            )
+            dense_vecs = encoded["dense_vecs"]
+            rerank_outputs = [outputs_from_encoding(encoded, position) for position in range(len(batch_names))]
+        elif token_budget:
+            dense_vecs = embedder.encode_dense(
+                batch_names,
+                batch_size=_encode_batch_size(),
+                max_length=config.embedding_max_length,
+                token_budget=token_budget,
+                stats=padding,
+            )
+        else:
+            dense_vecs = embedder.encode_dense(
+                batch_names,
+                batch_size=len(batch_names),
+                max_length=config.embedding_max_length,
+            )
+        encode_elapsed = time.perf_counter() - encode_started
+        pending_encode_seconds += encode_elapsed
+        BUILD_DOCS_ENCODED.inc(len(batch_names))
+        if encode_elapsed > 0:
+            BUILD_ENCODE_DOCS_PER_SECOND.observe(len(batch_names) / encode_elapsed)
+        if encode_sizer is not None:
+            encode_sizer.observe(len(batch_names), encode_elapsed)
+
+        if vector_dims == FULL_DIMS or projection is not None:
+            _add_encoded(batch_names, dense_vecs, is_last_batch, rerank_outputs)
+            continue
+        held_batches.append((batch_names, np.asarray(dense_vecs, dtype=np.float32), is_last_batch, rerank_outputs))
+        held_count += len(batch_names)
+        if held_count < PCA_SAMPLE_SIZE and not is_last_batch:
+            continue
+        projection = _fit_projection(np.concatenate([held[1] for held in held_batches]), vector_dims, projection_path)
+        for held in held_batches:
+            _add_encoded(*held)
+        held_batches = []
+
     if docs_batch:
         logging.info("Writing final %d documents (up to id=%d)", len(docs_batch), next_id - 1)
         logging.debug("First doc of final batch: %s", docs_batch[0])
-        game_index.add_documents(docs_batch, wait=True)
+        _flush(docs_batch, True)
+    if tracker is not None:
+        tracker.wait(0)
+    if rerank_store is not None:
+        rerank_store.close()
+    if prefix_index is not None:
+        prefix_index.close()
 
     elapsed = time.time() - start_time
-    logging.info("Index build completed in %.2fs", elapsed)
+    logging.info("Indexed %d unique names in %.2fs", docs_done, elapsed)
+    if retry.total:
+        logging.info("Build needed %s", retry.summary())
+    if tracker is not None:
+        logging.info(
+            "Waited %.2fs for Meilisearch tasks over %d batched polls (pipeline depth %d)",
+            tracker.wait_seconds,
+            tracker.polls,
+            pipeline_depth,
+        )
+    if upload_sizer is not None:
+        logging.info(
+            "Adaptive batching ended at index_batch_size=%d encode_batch_size=%d (best %.1f upload / %.1f encode docs/s)",
+            _upload_limit(),
+            _encode_batch_size(),
+            upload_sizer.best_rate,
+            encode_sizer.best_rate,
+        )
+    if padding.real_tokens:
+        logging.info(
+            "Encoded %d real tokens as %d padded tokens (%.2fx; fixed-size batches would pad to %d)",
+            padding.real_tokens,
+            padding.padded_tokens,
+            padding.padding_ratio,
+            padding.unbucketed_padded_tokens,
+        )
@@ -1,18 +1,228 @@
 """Lightweight Meilisearch wrapper for game indexing and search."""
 
+import hashlib
+import json
 import logging
-from typing import Any, Dict, List
+import os
+import random
+import time
+from typing import Any, Callable, Dict, List
 
 import meilisearch
 try:  # SDK versions differ on exported error types
     from meilisearch.errors import MeiliSearchApiError
 except Exception:  # noqa: BLE001
     MeiliSearchApiError = Exception  # type: ignore[misc,assignment]
+try:
+    from meilisearch.errors import MeilisearchCommunicationError, MeilisearchTimeoutError
+except Exception:  # noqa: BLE001
+    _SDK_TRANSIENT_ERRORS: tuple = ()
+else:
+    _SDK_TRANSIENT_ERRORS = (MeilisearchCommunicationError, MeilisearchTimeoutError)
+TRANSIENT_ERRORS = _SDK_TRANSIENT_ERRORS + (ConnectionError, TimeoutError)
+# Failed tasks of these error types are server-side trouble, not bad documents.
+TRANSIENT_TASK_ERROR_TYPES = {"internal", "system"}
+
+from .metrics import MEILI_TASK_WAIT_SECONDS, UPLOAD_BYTES, UPLOAD_BYTES_PER_SECOND
+
+
+def is_transient_error(exc: BaseException) -> bool:
+    """True for errors worth retrying: timeouts, connection failures, 5xx/408/429 responses."""
+    status = getattr(exc, "status_code", None)
+    if isinstance(status, int):
+        return status >= 500 or status in (408, 429)
+    return isinstance(exc, TRANSIENT_ERRORS)
+
+
+def settings_fingerprint(settings: Dict[str, Any]) -> str:
+    """Stable hash of index settings, for remembering that they were applied."""
+    canonical = json.dumps(settings, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class RetryBudgetExhausted(RuntimeError):
+    """Raised when a build has used up its Meilisearch failure budget."""
+
+
+class MeiliRetry:
+    """
+    Retry policy and counters shared by every MeiliGameIndex of one build.
+
+    Each failing call is retried up to ``max_retries`` times with exponential
+    backoff (``backoff_seconds`` doubling up to ``max_backoff_seconds``, with
+    jitter over the upper half so concurrent builds spread out). Retries of
+    all kinds draw from one ``failure_budget``; when it runs out the build
+    stops with RetryBudgetExhausted instead of hammering a struggling server.
+    Either limit at 0 disables retries.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 5,
+        backoff_seconds: float = 0.5,
+        failure_budget: int = 50,
+        *,
+        max_backoff_seconds: float = 30.0,
+        task_timeout_seconds: float = 60.0,
+        sleep: Callable[[float], None] = time.sleep,
+        seed: int | None = None,
+    ):
+        self.max_retries = max(max_retries, 0)
+        self.backoff_seconds = max(backoff_seconds, 0.0)
+        self.failure_budget = max(failure_budget, 0)
+        self.max_backoff_seconds = max_backoff_seconds
+        self.task_timeout_seconds = task_timeout_seconds
+        self.sleep = sleep
+        self.upload_retries = 0
+        self.poll_retries = 0
+        self.resubmits = 0
+        self._rng = random.Random(seed)
+
+    @property
+    def total(self) -> int:
+        return self.upload_retries + self.poll_retries + self.resubmits
+
+    def backoff(self, attempt: int) -> float:
+        ceiling = min(self.max_backoff_seconds, self.backoff_seconds * (2**attempt))
+        return ceiling / 2 + self._rng.uniform(0.0, ceiling / 2)
+
+    def before_retry(self, kind: str, attempt: int, exc: BaseException) -> None:
+        """
+        Count and sleep before retry number ``attempt + 1`` of a ``kind`` call.
+
+        Re-raises ``exc`` when the call has no attempts left, and raises
+        RetryBudgetExhausted when the build's budget is used up.
+        """
+        if attempt >= self.max_retries:
+            raise exc
+        if self.total >= self.failure_budget:
+            raise RetryBudgetExhausted(
+                f"Meilisearch failure budget of {self.failure_budget} retries exhausted; last error: {exc}"
+            ) from exc
+        if kind == "upload":
+            self.upload_retries += 1
+        elif kind == "poll":
+            self.poll_retries += 1
+        else:
+            self.resubmits += 1
+        delay = self.backoff(attempt)
+        logging.warning(
+            "Meilisearch %s failed (%s); retry %d/%d in %.2fs", kind, exc, attempt + 1, self.max_retries, delay
+        )
+        self.sleep(delay)
+
+    def summary(self) -> str:
+        return (
+            f"{self.total} Meilisearch retries ({self.upload_retries} upload, {self.poll_retries} task poll, "
+            f"{self.resubmits} re-submitted batches; budget {self.failure_budget})"
+        )
+
+
+class TaskTracker:
+    """
+    Follow many enqueued Meilisearch tasks with one ``GET /tasks?uids=...`` per poll.
+
+    Builds add each uploaded batch with ``add`` and call ``wait(max_pending)``
+    to keep at most that many tasks in flight, so encoding and uploading the
+    next batches overlaps with Meilisearch indexing the earlier ones. The
+    poll interval starts at ``min_interval``, doubles while nothing finishes
+    (up to ``max_interval``) and halves when tasks complete. A failed task
+    raises on the poll that sees it; with a retry policy, server-side task
+    failures are re-submitted through the callable given to ``add``.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        *,
+        retry: MeiliRetry | None = None,
+        min_interval: float = 0.01,
+        max_interval: float = 1.0,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.client = client
+        self.retry = retry
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = min_interval
+        self.sleep = sleep
+        self.polls = 0
+        self.wait_seconds = 0.0
+        # task uid -> (resubmit callable, attempts so far)
+        self._pending: Dict[Any, tuple] = {}
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def add(self, task_uid: Any, resubmit: Callable[[], Any] | None = None) -> None:
+        """Track ``task_uid``; ``resubmit`` uploads the batch again and returns the new task uid."""
+        if task_uid is not None:
+            self._pending[task_uid] = (resubmit, 0)
+
+    def _fetch(self, uids: List[Any]) -> List[Any]:
+        if not hasattr(self.client, "get_tasks"):
+            # SDKs without task listing: fall back to waiting on each task.
+            return [self.client.wait_for_task(uid) for uid in uids]
+        attempt = 0
+        while True:
+            try:
+                result = self.client.get_tasks({"uids": [str(uid) for uid in uids], "limit": len(uids)})
+                return MeiliGameIndex._extract_results(result)
+            except Exception as exc:  # noqa: BLE001
+                if self.retry is None or not is_transient_error(exc):
+                    raise
+                self.retry.before_retry("poll", attempt, exc)
+                attempt += 1
+
+    def poll(self) -> int:
+        """Check every pending task in one request; return how many finished."""
+        if not self._pending:
+            return 0
+        self.polls += 1
+        finished = 0
+        for task in self._fetch(list(self._pending)):
+            uid = MeiliGameIndex._extract_task_uid(task)
+            status = task.get("status") if isinstance(task, dict) else getattr(task, "status", None)
+            if uid not in self._pending or status in ("enqueued", "processing"):
+                continue
+            resubmit, attempts = self._pending.pop(uid)
+            if self.retry is not None and resubmit is not None and MeiliGameIndex._is_transient_task_failure(task):
+                try:
+                    MeiliGameIndex._raise_for_terminal_task_failure(task)
+                except RuntimeError as exc:
+                    self.retry.before_retry("resubmit", attempts, exc)
+                self._pending[resubmit()] = (resubmit, attempts + 1)
+                continue
+            MeiliGameIndex._raise_for_terminal_task_failure(task)
+            finished += 1
+        return finished
+
+    def wait(self, max_pending: int = 0) -> float:
+        """Poll until at most ``max_pending`` tasks are outstanding; return the seconds spent."""
+        if len(self._pending) <= max_pending:
+            return 0.0
+        started = time.perf_counter()
+        while len(self._pending) > max_pending:
+            if self.poll():
+                self.interval = max(self.min_interval, self.interval / 2)
+                continue
+            self.sleep(self.interval)
+            self.interval = min(self.max_interval, self.interval * 2)
+        waited = time.perf_counter() - started
+        MEILI_TASK_WAIT_SECONDS.observe(waited)
+        self.wait_seconds += waited
+        return waited
 
 
 class MeiliGameIndex:
     """Helper around a Meilisearch index configured for BGE-M3 vectors."""
 
+    retry: MeiliRetry | None = None
+    settings_state_path: str | None = None
+    # True while the index is known to be empty because this client created it.
+    fresh = False
+
     def __init__(
         self,
         url: str,
@@ -22,8 +232,12 @@ class MeiliGameIndex:
         embedding_dim: int = 1024,
         displayed_attributes: list[str] | None = None,
         searchable_attributes: list[str] | None = None,
+        retry: MeiliRetry | None = None,
+        settings_state_path: str | None = None,
     ):
         self.client = meilisearch.Client(url, api_key)
+        self.retry = retry
+        self.settings_state_path = settings_state_path
         self.index_uid = index_uid
         self.embedder_name = embedder_name
         self.embedding_dim = embedding_dim
@@ -128,8 +342,26 @@ class MeiliGameIndex:
         except Exception as exc:  # noqa: BLE001
             # If already exists or other races, proceed to return index anyway
             logging.debug("create_index returned %s", exc)
+        else:
+            self.fresh = True
         return self.client.index(self.index_uid)
 
+    def recreate_index(self):
+        """
+        Delete the index and create an empty one through this client.
+
+        Meilisearch runs tasks in the order they were enqueued, so settings
+        sent by the next ``ensure_settings`` apply to the empty index ahead of
+        any document instead of reindexing a populated one.
+        """
+        self.delete_index()
+        try:
+            self.client.create_index(uid=self.index_uid, options={"primaryKey": "id"})
+        except Exception as exc:  # noqa: BLE001
+            logging.debug("create_index returned %s", exc)
+        self.index = self.client.index(self.index_uid)
+        self.fresh = True
+
     def delete_index(self):
         """Delete the index if it exists."""
         try:
@@ -221,18 +453,103 @@ class MeiliGameIndex:
         logging.debug("Fetched %d names for refine", len(all_names))
         return all_names
 
+    def target_settings(self) -> Dict[str, Any]:
+        """The embedder/searchable/displayed settings this index should have."""
+        return {
+            "embedders": {
+                self.embedder_name: {
+                    "source": "userProvided",
+                    "dimensions": self.embedding_dim,
+                }
+            },
+            "searchableAttributes": self.searchable_attributes,
+            "displayedAttributes": self.displayed_attributes,
+        }
+
+    def _stored_settings_fingerprint(self) -> str | None:
+        if not self.settings_state_path or not os.path.exists(self.settings_state_path):
+            return None
+        try:
+            with open(self.settings_state_path, "r", encoding="utf-8") as handle:
+                state = json.load(handle)
+        except (OSError, ValueError) as exc:
+            logging.warning("Ignoring unreadable settings state %s: %s", self.settings_state_path, exc)
+            return None
+        if not isinstance(state, dict) or state.get("index_uid") != self.index_uid:
+            return None
+        return state.get("fingerprint")
+
+    def _store_settings_fingerprint(self, fingerprint: str) -> None:
+        if not self.settings_state_path:
+            return
+        directory = os.path.dirname(self.settings_state_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.settings_state_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            json.dump({"index_uid": self.index_uid, "fingerprint": fingerprint}, handle)
+        os.replace(tmp_path, self.settings_state_path)
+
+    def _document_count(self) -> int | None:
+        try:
+            stats = self.index.get_stats()
+        except Exception as exc:  # noqa: BLE001
+            logging.debug("Unable to read index stats: %s", exc)
+            return None
+        if isinstance(stats, dict):
+            return stats.get("numberOfDocuments")
+        return getattr(stats, "number_of_documents", None)
+
     def ensure_settings(self):
         """
         Ensure embedders/searchable/displayed settings exist.
 
+        An index this client just created gets the full settings without a
+        ``get_settings`` round trip, ahead of its first document. Otherwise
+        the current settings are diffed against the target, unless the
+        fingerprint in ``settings_state_path`` shows the same target was
+        already applied to this index. Changing the embedder of a populated
+        index makes Meilisearch re-embed every document, which is logged as
+        a warning.
+
         Logs warnings instead of raising if the Meilisearch version lacks support.
         """
-        target_embedder = {
-            self.embedder_name: {
-                "source": "userProvided",
-                "dimensions": self.embedding_dim,
-            }
-        }
+        target = self.target_settings()
+        fingerprint = settings_fingerprint(target)
+        if self.fresh:
+            updates = target
+        elif self._stored_settings_fingerprint() == fingerprint:
+            logging.debug("Settings of %s match stored fingerprint; skipping get_settings.", self.index_uid)
+            return
+        else:
+            updates = self._settings_updates(target)
+
+        if not updates:
+            logging.debug("No settings changes required.")
+            self._store_settings_fingerprint(fingerprint)
+            return
+
+        try:
+            task = self.index.update_settings(updates)
+        except Exception as exc:  # noqa: BLE001
+            logging.warning("Failed to update index settings (likely unsupported): %s", exc)
+            return
+        logging.debug("Settings update sent: %s", updates)
+        if self.settings_state_path:
+            # Only remember settings Meilisearch actually accepted.
+            task_uid = self._extract_task_uid(task)
+            if task_uid is not None:
+                try:
+                    self._raise_for_terminal_task_failure(self._wait_for_task(task_uid))
+                except Exception as exc:  # noqa: BLE001
+                    logging.warning("Index settings update did not succeed: %s", exc)
+                    return
+            self._store_settings_fingerprint(fingerprint)
+        self.fresh = False
+
+    def _settings_updates(self, target: Dict[str, Any]) -> Dict[str, Any]:
+        """Settings in ``target`` that differ from the index's current ones."""
+        target_embedder = target["embedders"]
 
         try:
             current = self.index.get_settings()
@@ -251,6 +568,17 @@ class MeiliGameIndex:
             merged = dict(existing_embedders)
             merged.update(target_embedder)
             updates["embedders"] = merged
+            documents = self._document_count() if existing_embedders else 0
+            if documents != 0:
+                logging.warning(
+                    "Changing embedder '%s' of index %s from %s to %s makes Meilisearch re-embed all %s "
+                    "documents; rebuild the index instead if this is unintended.",
+                    self.embedder_name,
+                    self.index_uid,
+                    existing_embedders.get(self.embedder_name),
+                    target_embedder[self.embedder_name],
+                    documents if documents is not None else "its",
+                )
 
         if current.get("searchableAttributes") != self.searchable_attributes:
             updates["searchableAttributes"] = self.searchable_attributes
@@ -258,31 +586,106 @@ class MeiliGameIndex:
         if current.get("displayedAttributes") != self.displayed_attributes:
             updates["displayedAttributes"] = self.displayed_attributes
 
-        if not updates:
-            logging.debug("No settings changes required.")
-            return
+        return updates
 
-        try:
-            self.index.update_settings(updates)
-        except Exception as exc:  # noqa: BLE001
-            logging.warning("Failed to update index settings (likely unsupported): %s", exc)
-        else:
-            logging.debug("Settings update sent: %s", updates)
+    def add_documents(self, docs: List[Dict[str, Any]], wait: bool = False) -> Dict[str, Any] | None:
+        """
+        Add a batch of documents to the index.
 
-    def add_documents(self, docs: List[Dict[str, Any]], wait: bool = False):
-        """Add a batch of documents to the index."""
+        Returns the payload size and the serialize/upload/task-wait timings
+        (seconds) for the batch, plus the ``task_uid`` to hand to a
+        TaskTracker when not waiting, or None when there was nothing to send.
+
+        With a ``retry`` policy, transient upload errors and task polls are
+        retried with backoff, and a batch whose task failed on the server side
+        is submitted again. Re-submission is safe because documents carry
+        their ids, so a repeated batch replaces itself. ``retries`` in the
+        result counts the retries this batch needed.
+        """
         if not docs:
-            return
+            return None
         logging.debug("Adding %d documents", len(docs))
         target_index = self.index
         if not hasattr(target_index, "add_documents"):
             target_index = self.client.index(self.index_uid)
-        task = target_index.add_documents(docs)
-        if wait:
+        # Serialize once so the upload size is known; the SDK would otherwise
+        # serialize the same list internally.
+        serialize_started = time.perf_counter()
+        payload = json.dumps(docs, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        serialize_seconds = time.perf_counter() - serialize_started
+        retries_before = self.retry.total if self.retry is not None else 0
+        attempt = 0
+        while True:
+            upload_started = time.perf_counter()
+            try:
+                if hasattr(target_index, "add_documents_raw"):
+                    task = target_index.add_documents_raw(payload, content_type="application/json")
+                else:
+                    task = target_index.add_documents(docs)
+            except Exception as exc:  # noqa: BLE001
+                if self.retry is None or not is_transient_error(exc):
+                    raise
+                self.retry.before_retry("upload", attempt, exc)
+                attempt += 1
+                continue
+            upload_seconds = time.perf_counter() - upload_started
+            UPLOAD_BYTES.inc(len(payload))
+            if upload_seconds > 0:
+                UPLOAD_BYTES_PER_SECOND.observe(len(payload) / upload_seconds)
+            task_seconds = 0.0
+            if not wait:
+                break
             task_uid = self._extract_task_uid(task)
             if task_uid is not None and hasattr(self.client, "wait_for_task"):
-                task = self.client.wait_for_task(task_uid)
+                task_started = time.perf_counter()
+                try:
+                    task = self._wait_for_task(task_uid)
+                finally:
+                    task_seconds = time.perf_counter() - task_started
+                    MEILI_TASK_WAIT_SECONDS.observe(task_seconds)
+            if self.retry is not None and self._is_transient_task_failure(task):
+                try:
+                    self._raise_for_terminal_task_failure(task)
+                except RuntimeError as exc:
+                    self.retry.before_retry("resubmit", attempt, exc)
+                attempt += 1
+                continue
             self._raise_for_terminal_task_failure(task)
+            break
+        return {
+            "bytes": float(len(payload)),
+            "serialize_seconds": serialize_seconds,
+            "upload_seconds": upload_seconds,
+            "task_seconds": task_seconds,
+            "retries": float(self.retry.total - retries_before) if self.retry is not None else 0.0,
+            "task_uid": self._extract_task_uid(task),
+        }
+
+    def _wait_for_task(self, task_uid: Any) -> Any:
+        """Wait for a task, retrying transient polling errors when a retry policy is set."""
+        if self.retry is None:
+            return self.client.wait_for_task(task_uid)
+        attempt = 0
+        while True:
+            try:
+                return self.client.wait_for_task(
+                    task_uid, timeout_in_ms=int(self.retry.task_timeout_seconds * 1000)
+                )
+            except Exception as exc:  # noqa: BLE001
+                if not is_transient_error(exc):
+                    raise
+                self.retry.before_retry("poll", attempt, exc)
+                attempt += 1
+
+    @staticmethod
+    def _is_transient_task_failure(task: Any) -> bool:
+        status = task.get("status") if isinstance(task, dict) else getattr(task, "status", None)
+        if status != "failed":
+            return False
+        error = task.get("error") if isinstance(task, dict) else getattr(task, "error", None)
+        return isinstance(error, dict) and (
+            error.get("type") in TRANSIENT_TASK_ERROR_TYPES or error.get("code") == "internal"
+        )
 
     def fetch_documents(self, fields: list[str] | None = None, page_size: int = 1000) -> list[dict]:
         """
@@ -320,15 +723,102 @@ class MeiliGameIndex:
         query_vector: List[float],
         limit: int = 10,
         embedder_key: str | None = None,
+        query_text: str = "",
+        semantic_ratio: float = 1.0,
+        show_ranking_score: bool = False,
+        offset: int = 0,
     ) -> List[Dict[str, Any]]:
-        """Search using a dense vector with embedder-aware payload."""
+        """
+        Search using a dense vector with embedder-aware payload.
+
+        With the defaults this is a pure vector search. Passing `query_text`
+        with `semantic_ratio` below 1.0 lets Meilisearch blend its keyword
+        ranking with vector similarity in the same request.
+        `show_ranking_score` adds `_rankingScore` to each hit; `offset` skips
+        that many hits for paging.
+        """
         target_embedder = embedder_key or self.embedder_name
         payload = {
             "vector": query_vector,
-            "hybrid": {"semanticRatio": 1.0, "embedder": target_embedder},
+            "hybrid": {"semanticRatio": semantic_ratio, "embedder": target_embedder},
             "limit": limit,
         }
-        result = self.index.search("", payload)
+        if offset:
+            payload["offset"] = offset
+        if show_ranking_score:
+            payload["showRankingScore"] = True
+        result = self.index.search(query_text, payload)
         hits = result.get("hits", [])
         logging.debug("Vector search succeeded with %d hits", len(hits))
         return hits
+
+    def multi_search_by_vectors(
+        self,
+        query_vectors: List[List[float]],
+        limit: int = 10,
+        embedder_key: str | None = None,
+        query_texts: List[str] | None = None,
+        semantic_ratio: float = 1.0,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Run several vector searches in one multi-search request.
+
+        Returns one hit list per query vector, in input order. Hits carry
+        `_rankingScore` so callers can report similarity scores. `query_texts`
+        and `semantic_ratio` enable hybrid ranking as in `search_by_vector`.
+        """
+        if not query_vectors:
+            return []
+        if query_texts is not None and len(query_texts) != len(query_vectors):
+            raise ValueError("query_texts must match query_vectors in length")
+        return self.multi_search_indexes(
+            [
+                {
+                    "index_uid": self.index_uid,
+                    "vector": query_vector,
+                    "limit": limit,
+                    "query_text": query_texts[position] if query_texts is not None else "",
+                    "semantic_ratio": semantic_ratio,
+                }
+                for position, query_vector in enumerate(query_vectors)
+            ],
+            embedder_key=embedder_key,
+        )
+
+    def multi_search_indexes(
+        self,
+        searches: List[Dict[str, Any]],
+        embedder_key: str | None = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Run vector searches against any indexes on this server in one multi-search request.
+
+        Each search gives `index_uid`, `vector` and `limit`, plus optional
+        `query_text`, `semantic_ratio` and `offset` as in `search_by_vector`. Returns
+        one hit list per search, in input order, with `_rankingScore` on
+        every hit.
+        """
+        if not searches:
+            return []
+        target_embedder = embedder_key or self.embedder_name
+        queries = [
+            {
+                "indexUid": search["index_uid"],
+                "q": search.get("query_text", ""),
+                "vector": search["vector"],
+                "hybrid": {"semanticRatio": search.get("semantic_ratio", 1.0), "embedder": target_embedder},
+                "limit": search.get("limit", 10),
+                "showRankingScore": True,
+                **({"offset": search["offset"]} if search.get("offset") else {}),
+            }
+            for search in searches
+        ]
+        result = self.client.multi_search(queries)
+        results = self._extract_results(result)
+        if len(results) != len(queries):
+            raise RuntimeError(
+                f"Multi-search returned {len(results)} result sets for {len(queries)} queries"
+            )
+        hit_lists = [self._extract_results(item) if isinstance(item, dict) else [] for item in results]
+        logging.debug("Multi-search succeeded for %d queries", len(hit_lists))
+        return hit_lists
@@ -0,0 +1,239 @@
+"""Tiny in-process metrics registry with Prometheus text exposition."""
+
+import math
+import threading
+import time
+from contextlib import ContextDecorator
+from typing import Dict, List, Sequence
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+JOB_DURATION_BUCKETS = (1.0, 5.0, 15.0, 30.0, 60.0, 300.0, 900.0, 1800.0, 3600.0, 7200.0, 14400.0)
+DOCS_PER_SECOND_BUCKETS = (1.0, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 500.0, 1000.0, 2500.0, 5000.0)
+BYTES_PER_SECOND_BUCKETS = (1e4, 1e5, 5e5, 1e6, 5e6, 1e7, 5e7, 1e8, 5e8)
+AUTOCOMPLETE_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25)
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Counter:
+    """Monotonically increasing value."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str):
+        self.name = name
+        self.documentation = documentation
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    def samples(self) -> List[str]:
+        return [f"{self.name} {_format_value(self._value)}"]
+
+
+class Gauge:
+    """Value that can go up and down."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str):
+        self.name = name
+        self.documentation = documentation
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def set(self, value: float) -> None:
+        with self._lock:
+            self._value = float(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value -= amount
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    def samples(self) -> List[str]:
+        return [f"{self.name} {_format_value(self._value)}"]
+
+
+class _Timer(ContextDecorator):
+    def __init__(self, histogram: "Histogram"):
+        self._histogram = histogram
+        self._started = 0.0
+
+    def _recreate_cm(self):
+        # As a decorator, every call gets its own start time, so concurrent calls don't mix.
+        return _Timer(self._histogram)
+
+    def __enter__(self):
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *_exc):
+        self._histogram.observe(time.perf_counter() - self._started)
+        return False
+
+
+class Histogram:
+    """Cumulative-bucket histogram of observed values."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.buckets = tuple(sorted(float(bound) for bound in buckets)) + (math.inf,)
+        self._counts = [0] * len(self.buckets)
+        self._sum = 0.0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        with self._lock:
+            for position, bound in enumerate(self.buckets):
+                if value <= bound:
+                    self._counts[position] += 1
+                    break
+            self._sum += value
+            self._count += 1
+
+    def time(self) -> _Timer:
+        """Context manager / decorator that observes elapsed wall-clock seconds."""
+        return _Timer(self)
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def sum(self) -> float:
+        return self._sum
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            counts = list(self._counts)
+            total = self._sum
+            count = self._count
+        lines = []
+        cumulative = 0
+        for bound, bucket_count in zip(self.buckets, counts):
+            cumulative += bucket_count
+            lines.append(f'{self.name}_bucket{{le="{_format_value(bound)}"}} {cumulative}')
+        lines.append(f"{self.name}_sum {_format_value(total)}")
+        lines.append(f"{self.name}_count {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """Holds named metrics and renders them in the Prometheus text format."""
+
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric):
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric):
+                    raise ValueError(f"Metric {metric.name} already registered as {existing.kind}")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str) -> Counter:
+        return self._register(Counter(name, documentation))
+
+    def gauge(self, name: str, documentation: str) -> Gauge:
+        return self._register(Gauge(name, documentation))
+
+    def histogram(self, name: str, documentation: str, buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, buckets))
+
+    def render(self) -> str:
+        """Return every metric in text exposition format 0.0.4."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: List[str] = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+QUERY_EMBEDDING_SECONDS = REGISTRY.histogram(
+    "game_search_query_embedding_seconds",
+    "Time spent encoding search queries with the embedding model.",
+)
+MEILI_SEARCH_SECONDS = REGISTRY.histogram(
+    "game_search_meili_seconds",
+    "Time spent in Meilisearch vector/multi-search requests.",
+)
+RERANK_SECONDS = REGISTRY.histogram(
+    "game_search_rerank_seconds",
+    "Time spent reranking dense candidates with lexical/ColBERT scores.",
+)
+SEARCH_SECONDS = REGISTRY.histogram(
+    "game_search_seconds",
+    "End-to-end search latency including readiness checks and cache lookups.",
+)
+AUTOCOMPLETE_SECONDS = REGISTRY.histogram(
+    "game_autocomplete_seconds",
+    "End-to-end autocomplete latency including the readiness check.",
+    AUTOCOMPLETE_BUCKETS,
+)
+BUILD_ENCODE_DOCS_PER_SECOND = REGISTRY.histogram(
+    "game_build_encode_docs_per_second",
+    "Documents encoded per second, observed per encode batch.",
+    DOCS_PER_SECOND_BUCKETS,
+)
+BUILD_DOCS_ENCODED = REGISTRY.counter(
+    "game_build_docs_encoded_total",
+    "Documents encoded by index builds.",
+)
+UPLOAD_BYTES_PER_SECOND = REGISTRY.histogram(
+    "game_meili_upload_bytes_per_second",
+    "Document upload throughput, observed per add-documents request.",
+    BYTES_PER_SECOND_BUCKETS,
+)
+UPLOAD_BYTES = REGISTRY.counter(
+    "game_meili_upload_bytes_total",
+    "Serialized document bytes sent to Meilisearch.",
+)
+MEILI_TASK_WAIT_SECONDS = REGISTRY.histogram(
+    "game_meili_task_wait_seconds",
+    "Time spent waiting for Meilisearch tasks to reach a terminal state.",
+)
+JOB_QUEUE_DEPTH = REGISTRY.gauge(
+    "game_job_queue_depth",
+    "Build jobs currently queued.",
+)
+JOB_DURATION_SECONDS = REGISTRY.histogram(
+    "game_job_duration_seconds",
+    "Wall-clock duration of executed build jobs.",
+    JOB_DURATION_BUCKETS,
+)
@@ -0,0 +1,197 @@
+"""ONNX Runtime backend for BGE-M3 dense vectors, plus export and parity helpers."""
+
+import os
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from .config import DEFAULT_ONNX_MODEL_DIR
+from .embedding import DenseEmbedder
+
+ONNX_MODEL_FILENAME = "model.onnx"
+ONNX_INT8_MODEL_FILENAME = "model.int8.onnx"
+PARITY_MIN_COSINE = 0.99
+
+
+def model_slug(model_name: str) -> str:
+    """Directory name for a model id, e.g. ``BAAI/bge-m3`` -> ``BAAI__bge-m3``."""
+    return model_name.strip().replace("/", "__")
+
+
+def onnx_model_path(model_name: str, model_dir: Optional[str] = None, quantized: bool = False) -> str:
+    """Where ``bin/export_onnx.py`` writes (and the backend reads) a model's ONNX graph."""
+    root = model_dir or os.getenv("ONNX_MODEL_DIR") or DEFAULT_ONNX_MODEL_DIR
+    filename = ONNX_INT8_MODEL_FILENAME if quantized else ONNX_MODEL_FILENAME
+    return os.path.join(root, model_slug(model_name), filename)
+
+
+class OnnxBgeM3Embedder(DenseEmbedder):
+    """
+    Dense-only BGE-M3 encoder running on ONNX Runtime (CPU).
+
+    The graph takes ``input_ids``/``attention_mask`` and returns the
+    normalized CLS vector as ``dense_vecs``; the tokenizer is loaded from the
+    same directory. Requires ``onnxruntime`` and ``transformers``.
+    """
+
+    def __init__(
+        self,
+        model_name: str = "BAAI/bge-m3",
+        model_dir: Optional[str] = None,
+        quantized: bool = False,
+        intra_op_threads: Optional[int] = None,
+    ):
+        import onnxruntime
+        from transformers import AutoTokenizer
+
+        self.model_path = onnx_model_path(model_name, model_dir, quantized)
+        if not os.path.exists(self.model_path):
+            raise FileNotFoundError(
+                f"ONNX model not found at {self.model_path}; export it with bin/export_onnx.py"
+                + (" --quantize" if quantized else "")
+            )
+        self.tokenizer = AutoTokenizer.from_pretrained(os.path.dirname(self.model_path))
+        options = onnxruntime.SessionOptions()
+        options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if intra_op_threads:
+            options.intra_op_num_threads = intra_op_threads
+        self.session = onnxruntime.InferenceSession(
+            self.model_path,
+            sess_options=options,
+            providers=["CPUExecutionProvider"],
+        )
+
+    def token_lengths(self, texts: List[str], max_length: int = 128) -> List[int]:
+        input_ids = self.tokenizer(
+            list(texts),
+            add_special_tokens=True,
+            truncation=True,
+            max_length=max_length,
+        )["input_ids"]
+        return [len(ids) for ids in input_ids]
+
+    def _encode_batch(self, texts: List[str], batch_size: int, max_length: int) -> np.ndarray:
+        chunks = []
+        batch_size = max(batch_size, 1)
+        for start in range(0, len(texts), batch_size):
+            encoded = self.tokenizer(
+                list(texts[start : start + batch_size]),
+                padding=True,
+                truncation=True,
+                max_length=max_length,
+                return_tensors="np",
+            )
+            (dense_vecs,) = self.session.run(
+                ["dense_vecs"],
+                {
+                    "input_ids": np.asarray(encoded["input_ids"], dtype=np.int64),
+                    "attention_mask": np.asarray(encoded["attention_mask"], dtype=np.int64),
+                },
+            )
+            chunks.append(np.asarray(dense_vecs, dtype=np.float32))
+        return np.concatenate(chunks, axis=0)
+
+
+def dense_parity(reference: np.ndarray, candidate: np.ndarray) -> Dict[str, float]:
+    """Row-wise cosine similarity between two vector sets (min / mean)."""
+    reference = np.asarray(reference, dtype=np.float32)
+    candidate = np.asarray(candidate, dtype=np.float32)
+    if reference.shape != candidate.shape:
+        raise ValueError(f"Vector shapes differ: {reference.shape} vs {candidate.shape}")
+    norms = np.linalg.norm(reference, axis=1) * np.linalg.norm(candidate, axis=1)
+    cosines = np.sum(reference * candidate, axis=1) / np.maximum(norms, 1e-12)
+    return {"min_cosine": float(cosines.min()), "mean_cosine": float(cosines.mean())}
+
+
+def measure_throughput(
+    embedder: DenseEmbedder,
+    texts: List[str],
+    *,
+    batch_size: int = 64,
+    max_length: int = 128,
+    repeats: int = 3,
+) -> float:
+    """Best-of-``repeats`` encode throughput in texts per second (after one warm-up call)."""
+    embedder.encode_dense(texts[:batch_size], batch_size=batch_size, max_length=max_length)
+    best = float("inf")
+    for _ in range(max(repeats, 1)):
+        started = time.perf_counter()
+        embedder.encode_dense(texts, batch_size=batch_size, max_length=max_length)
+        best = min(best, time.perf_counter() - started)
+    return len(texts) / best if best > 0 else 0.0
+
+
+def export_dense_onnx(
+    model_name: str,
+    model_dir: Optional[str] = None,
+    *,
+    quantize: bool = False,
+    opset_version: int = 17,
+) -> Dict[str, str]:
+    """
+    Export the dense head of BGE-M3 to ONNX (and optionally an int8 copy).
+
+    Only the encoder and the normalized CLS pooling are exported; sparse and
+    ColBERT heads are dropped. Requires torch, FlagEmbedding and onnxruntime.
+    """
+    import torch
+    from FlagEmbedding import BGEM3FlagModel
+
+    flag_model = BGEM3FlagModel(model_name, use_fp16=False)
+    encoder = _transformer_encoder(flag_model)
+    tokenizer = flag_model.tokenizer
+
+    class DenseHead(torch.nn.Module):
+        def __init__(self, inner):
+            super().__init__()
+            self.inner = inner
+
+        def forward(self, input_ids, attention_mask):
+            hidden = self.inner(input_ids=input_ids, attention_mask=attention_mask).last_hidden_state
+            return torch.nn.functional.normalize(hidden[:, 0], dim=-1)
+
+    output_path = onnx_model_path(model_name, model_dir)
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    tokenizer.save_pretrained(os.path.dirname(output_path))
+
+    head = DenseHead(encoder).eval()
+    sample = tokenizer(["BGE-M3 ONNX export"], return_tensors="pt")
+    with torch.no_grad():
+        torch.onnx.export(
+            head,
+            (sample["input_ids"], sample["attention_mask"]),
+            output_path,
+            input_names=["input_ids", "attention_mask"],
+            output_names=["dense_vecs"],
+            dynamic_axes={
+                "input_ids": {0: "batch", 1: "sequence"},
+                "attention_mask": {0: "batch", 1: "sequence"},
+                "dense_vecs": {0: "batch"},
+            },
+            opset_version=opset_version,
+        )
+    paths = {"onnx": output_path}
+
+    if quantize:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+
+        quantized_path = onnx_model_path(model_name, model_dir, quantized=True)
+        quantize_dynamic(
+            output_path,
+            quantized_path,
+            weight_type=QuantType.QInt8,
+            use_external_data_format=True,
+        )
+        paths["onnx-int8"] = quantized_path
+    return paths
+
+
+def _transformer_encoder(flag_model):
+    """Find the Hugging Face encoder inside a BGEM3FlagModel (layout varies by version)."""
+    candidate = getattr(flag_model, "model", None)
+    while candidate is not None and not hasattr(candidate, "embeddings"):
+        candidate = getattr(candidate, "model", None)
+    if candidate is None:
+        raise RuntimeError("Could not locate the transformer encoder inside BGEM3FlagModel")
+    return candidate
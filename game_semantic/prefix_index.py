@@ -0,0 +1,176 @@
+"""Prefix index of game names for search-as-you-type autocomplete."""
+
+import os
+import sqlite3
+import threading
+import unicodedata
+from typing import Dict, Iterable, List, Tuple
+
+# Name positions indexed besides the start: the first few word starts.
+MAX_WORD_KEYS = 6
+# Prefix matches read from disk per lookup before ranking; bounds short prefixes.
+COMPLETE_SCAN_LIMIT = 256
+
+_KATAKANA_START, _KATAKANA_END = 0x30A1, 0x30F6
+_HIRAGANA_OFFSET = 0x60
+
+_ROMAJI = {
+    "あ": "a", "い": "i", "う": "u", "え": "e", "お": "o",
+    "か": "ka", "き": "ki", "く": "ku", "け": "ke", "こ": "ko",
+    "さ": "sa", "し": "shi", "す": "su", "せ": "se", "そ": "so",
+    "た": "ta", "ち": "chi", "つ": "tsu", "て": "te", "と": "to",
+    "な": "na", "に": "ni", "ぬ": "nu", "ね": "ne", "の": "no",
+    "は": "ha", "ひ": "hi", "ふ": "fu", "へ": "he", "ほ": "ho",
+    "ま": "ma", "み": "mi", "む": "mu", "め": "me", "も": "mo",
+    "や": "ya", "ゆ": "yu", "よ": "yo",
+    "ら": "ra", "り": "ri", "る": "ru", "れ": "re", "ろ": "ro",
+    "わ": "wa", "ゐ": "i", "ゑ": "e", "を": "o", "ん": "n",
+    "が": "ga", "ぎ": "gi", "ぐ": "gu", "げ": "ge", "ご": "go",
+    "ざ": "za", "じ": "ji", "ず": "zu", "ぜ": "ze", "ぞ": "zo",
+    "だ": "da", "ぢ": "ji", "づ": "zu", "で": "de", "ど": "do",
+    "ば": "ba", "び": "bi", "ぶ": "bu", "べ": "be", "ぼ": "bo",
+    "ぱ": "pa", "ぴ": "pi", "ぷ": "pu", "ぺ": "pe", "ぽ": "po",
+    "ゔ": "vu",
+    "ぁ": "a", "ぃ": "i", "ぅ": "u", "ぇ": "e", "ぉ": "o",
+    "ゃ": "ya", "ゅ": "yu", "ょ": "yo", "ゎ": "wa",
+}
+# Consonant + small ya/yu/yo: きゃ -> kya, しゃ -> sha, ちゃ -> cha, じゃ -> ja.
+_YOUON = {"ゃ": "a", "ゅ": "u", "ょ": "o"}
+_YOUON_STEMS = {"し": "sh", "ち": "ch", "じ": "j", "ぢ": "j"}
+# Consonant + small vowel, mostly in loanwords: ふぁ -> fa, てぃ -> ti.
+_SMALL_VOWELS = {"ぁ": "a", "ぃ": "i", "ぅ": "u", "ぇ": "e", "ぉ": "o"}
+
+
+def fold_text(text: str) -> str:
+    """Normalize for matching: NFKC, case-folded, katakana as hiragana, letters and digits only."""
+    folded = []
+    for char in unicodedata.normalize("NFKC", text).casefold():
+        code = ord(char)
+        if _KATAKANA_START <= code <= _KATAKANA_END:
+            char = chr(code - _HIRAGANA_OFFSET)
+        if char == "ー" or unicodedata.category(char)[0] in "LN":
+            folded.append(char)
+    return "".join(folded)
+
+
+def romanize(folded: str) -> str:
+    """Hepburn romaji of the kana in ``folded`` text; other characters pass through."""
+    out = []
+    position = 0
+    while position < len(folded):
+        char = folded[position]
+        following = folded[position + 1] if position + 1 < len(folded) else ""
+        if char == "っ":
+            # Sokuon doubles the next consonant: がっこう -> gakkou.
+            romaji = _ROMAJI.get(following, "")
+            out.append("t" if romaji.startswith("ch") else romaji[:1] if romaji[:1] not in "aeiou" else "")
+        elif following in _YOUON and char in _ROMAJI and len(_ROMAJI[char]) > 1:
+            stem = _YOUON_STEMS.get(char, _ROMAJI[char][:-1] + "y")
+            out.append(stem + _YOUON[following])
+            position += 1
+        elif following in _SMALL_VOWELS and char in _ROMAJI and len(_ROMAJI[char]) > 1:
+            out.append(_YOUON_STEMS.get(char, _ROMAJI[char][:-1]) + _SMALL_VOWELS[following])
+            position += 1
+        elif char != "ー":
+            out.append(_ROMAJI.get(char, char))
+        position += 1
+    return "".join(out)
+
+
+def prefix_keys(name: str) -> List[str]:
+    """Keys a name is found under: the folded name and its romaji, from the start and from word starts."""
+    words = [fold_text(word) for word in unicodedata.normalize("NFKC", name).split()]
+    words = [word for word in words if word]
+    keys = []
+    for start in range(min(len(words), MAX_WORD_KEYS + 1)):
+        tail = "".join(words[start:])
+        keys.append(tail)
+        keys.append(romanize(tail))
+    return list(dict.fromkeys(keys))
+
+
+class PrefixIndex:
+    """
+    On-disk prefix index from normalized name keys to documents.
+
+    Keys live in a sqlite b-tree, so a lookup is one range scan and stays in
+    the low milliseconds however many names the index holds. Every name is
+    reachable from its start and from its first few word starts, by its
+    folded text (case, width and katakana/hiragana ignored) and by the Hepburn
+    romaji of its kana. Kanji readings are not indexed. Safe to share
+    between threads.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("pragma journal_mode=wal")
+        self._conn.execute("create table if not exists name (id integer primary key, name text not null)")
+        self._conn.execute(
+            """
+            create table if not exists prefix_key (
+              key text not null,
+              id integer not null,
+              primary key (key, id)
+            ) without rowid
+            """
+        )
+        self._conn.commit()
+
+    def put_many(self, rows: Iterable[Tuple[int, str]]) -> int:
+        names = []
+        keys = []
+        for doc_id, name in rows:
+            names.append((int(doc_id), name))
+            keys.extend((key, int(doc_id)) for key in prefix_keys(name))
+        if not names:
+            return 0
+        with self._lock:
+            self._conn.executemany("insert or replace into name (id, name) values (?, ?)", names)
+            self._conn.executemany("insert or ignore into prefix_key (key, id) values (?, ?)", keys)
+            self._conn.commit()
+        return len(names)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("delete from prefix_key")
+            self._conn.execute("delete from name")
+            self._conn.commit()
+
+    def complete(self, prefix: str, limit: int = 10) -> List[Dict[str, object]]:
+        """
+        Names matching ``prefix`` as ``{"id", "name"}`` dicts, best first.
+
+        Matches at the start of a name rank before word-start matches, then
+        shorter names first. Only the first ``COMPLETE_SCAN_LIMIT`` keys in
+        the prefix range are ranked, which bounds one- or two-letter prefixes.
+        """
+        folded = fold_text(prefix)
+        if not folded or limit <= 0:
+            return []
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                select k.id, n.name
+                from prefix_key k join name n on n.id = k.id
+                where k.key >= ? and k.key < ?
+                limit ?
+                """,
+                (folded, folded + "\U0010ffff", COMPLETE_SCAN_LIMIT),
+            ).fetchall()
+        ranked = {}
+        for doc_id, name in rows:
+            if doc_id in ranked:
+                continue
+            whole = fold_text(name)
+            from_start = whole.startswith(folded) or romanize(whole).startswith(folded)
+            ranked[doc_id] = (not from_start, len(name), doc_id, name)
+        return [{"id": doc_id, "name": name} for _, _, doc_id, name in sorted(ranked.values())[:limit]]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,112 @@
+"""PCA projection of dense vectors to fewer dimensions, plus a recall/size report."""
+
+import json
+import os
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+FULL_DIMS = 1024
+# Names sampled across the input to fit on; the fit only needs a few thousand rows.
+PCA_SAMPLE_SIZE = 4096
+
+
+@dataclass
+class PcaProjection:
+    """Centered linear projection onto the top principal components, L2-normalized."""
+
+    mean: np.ndarray
+    components: np.ndarray  # shape (dims, input_dims)
+
+    @property
+    def dims(self) -> int:
+        return int(self.components.shape[0])
+
+    def project(self, vectors) -> np.ndarray:
+        vectors = np.asarray(vectors, dtype=np.float32)
+        projected = (vectors - self.mean) @ self.components.T
+        norms = np.linalg.norm(projected, axis=-1, keepdims=True)
+        return (projected / np.maximum(norms, 1e-12)).astype(np.float32)
+
+    def save(self, path: str) -> None:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.tmp.npz"
+        np.savez(tmp_path, mean=self.mean, components=self.components)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "PcaProjection":
+        with np.load(path) as data:
+            return cls(mean=data["mean"].astype(np.float32), components=data["components"].astype(np.float32))
+
+
+def fit_pca(vectors, dims: int) -> PcaProjection:
+    """
+    Fit a ``dims``-component PCA on a sample of vectors.
+
+    ``dims`` must be smaller than both the vector width and the sample size.
+    """
+    vectors = np.asarray(vectors, dtype=np.float32)
+    if vectors.ndim != 2:
+        raise ValueError("Expected a 2-D array of vectors")
+    if not 0 < dims < vectors.shape[1]:
+        raise ValueError(f"Projection dims must be between 1 and {vectors.shape[1] - 1}")
+    if dims > vectors.shape[0]:
+        raise ValueError(f"Need at least {dims} vectors to fit {dims} dims, got {vectors.shape[0]}")
+    mean = vectors.mean(axis=0)
+    # Rows of vt are the principal axes, ordered by explained variance.
+    _, _, vt = np.linalg.svd(vectors - mean, full_matrices=False)
+    return PcaProjection(mean=mean.astype(np.float32), components=vt[:dims].astype(np.float32))
+
+
+def _top_k(doc_vectors: np.ndarray, query_vectors: np.ndarray, k: int) -> np.ndarray:
+    scores = query_vectors @ doc_vectors.T
+    k = min(k, doc_vectors.shape[0])
+    top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    return top
+
+
+def projection_report(
+    doc_vectors,
+    query_vectors,
+    dims_list: Sequence[int],
+    k: int = 10,
+    fit_vectors: Optional[np.ndarray] = None,
+) -> List[Dict[str, float]]:
+    """
+    Compare neighbour recall@k and storage size across projection widths.
+
+    Ground truth is the exact top-k under the full vectors; each row reports
+    how much of it survives the projection, plus float32 bytes and JSON bytes
+    per stored vector (what Meilisearch uploads). ``fit_vectors`` defaults to
+    ``doc_vectors``.
+    """
+    doc_vectors = np.asarray(doc_vectors, dtype=np.float32)
+    query_vectors = np.asarray(query_vectors, dtype=np.float32)
+    fit_vectors = doc_vectors if fit_vectors is None else np.asarray(fit_vectors, dtype=np.float32)
+    truth = _top_k(doc_vectors, query_vectors, k)
+    full_json_bytes = len(json.dumps(doc_vectors[0].tolist(), separators=(",", ":")))
+
+    rows = []
+    for dims in sorted(set(int(value) for value in dims_list), reverse=True):
+        if dims >= doc_vectors.shape[1]:
+            docs, queries = doc_vectors, query_vectors
+        else:
+            projection = fit_pca(fit_vectors, dims)
+            docs, queries = projection.project(doc_vectors), projection.project(query_vectors)
+        found = _top_k(docs, queries, k)
+        hits = sum(len(set(expected) & set(actual)) for expected, actual in zip(truth.tolist(), found.tolist()))
+        json_bytes = len(json.dumps(docs[0].tolist(), separators=(",", ":")))
+        rows.append(
+            {
+                "dims": min(dims, doc_vectors.shape[1]),
+                f"recall_at_{k}": hits / float(truth.size) if truth.size else 0.0,
+                "float32_bytes": min(dims, doc_vectors.shape[1]) * 4,
+                "json_bytes": json_bytes,
+                "size_ratio": json_bytes / full_json_bytes,
+            }
+        )
+    return rows
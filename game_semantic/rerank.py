@@ -0,0 +1,259 @@
+"""Second-stage reranking with BGE-M3 lexical weights and ColBERT late interaction."""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .config import RERANK_BOTH, RERANK_COLBERT, RERANK_MODES, RERANK_SPARSE
+from .metrics import RERANK_SECONDS
+
+
+@dataclass(frozen=True)
+class RerankWeights:
+    """Weights of the combined score; BGE-M3's suggested dense/sparse/ColBERT mix."""
+
+    dense: float = 0.4
+    sparse: float = 0.2
+    colbert: float = 0.4
+
+    def total(self, mode: str) -> float:
+        """Sum of the weights ``mode`` combines; dividing by it puts combined scores back near [0, 1]."""
+        return (
+            self.dense
+            + (self.sparse if mode_uses_sparse(mode) else 0.0)
+            + (self.colbert if mode_uses_colbert(mode) else 0.0)
+        )
+
+
+def mode_uses_sparse(mode: str) -> bool:
+    return mode in (RERANK_SPARSE, RERANK_BOTH)
+
+
+def mode_uses_colbert(mode: str) -> bool:
+    return mode in (RERANK_COLBERT, RERANK_BOTH)
+
+
+def lexical_score(query_weights: Dict[str, float], doc_weights: Dict[str, float]) -> float:
+    """Sum of weight products over tokens shared by query and document."""
+    if len(doc_weights) < len(query_weights):
+        query_weights, doc_weights = doc_weights, query_weights
+    return float(sum(weight * doc_weights[token] for token, weight in query_weights.items() if token in doc_weights))
+
+
+def colbert_score(query_vecs: np.ndarray, doc_vecs: np.ndarray) -> float:
+    """Late interaction: mean over query tokens of the best-matching document token."""
+    if len(query_vecs) == 0 or len(doc_vecs) == 0:
+        return 0.0
+    return float((np.asarray(query_vecs) @ np.asarray(doc_vecs).T).max(axis=1).mean())
+
+
+@dataclass
+class CandidateOutputs:
+    lexical_weights: Optional[Dict[str, float]] = None
+    colbert_vecs: Optional[np.ndarray] = None
+
+
+class CandidateStore:
+    """
+    On-disk cache of per-document lexical weights and ColBERT vectors.
+
+    Keyed by document id; ColBERT vectors are stored as float16 to halve the
+    file size. Safe to share between threads.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("pragma journal_mode=wal")
+        self._conn.execute(
+            """
+            create table if not exists candidate (
+              id integer primary key,
+              lexical text,
+              colbert blob,
+              colbert_dim integer
+            )
+            """
+        )
+        self._conn.commit()
+
+    def put_many(self, rows: Iterable[Tuple[int, CandidateOutputs]]) -> int:
+        records = []
+        for doc_id, outputs in rows:
+            lexical = json.dumps(outputs.lexical_weights, separators=(",", ":")) if outputs.lexical_weights is not None else None
+            colbert = None
+            colbert_dim = None
+            if outputs.colbert_vecs is not None:
+                vecs = np.asarray(outputs.colbert_vecs, dtype=np.float16)
+                colbert = vecs.tobytes()
+                colbert_dim = int(vecs.shape[1]) if vecs.ndim == 2 else 0
+            records.append((int(doc_id), lexical, colbert, colbert_dim))
+        if not records:
+            return 0
+        with self._lock:
+            # Keep whichever outputs an earlier write already stored.
+            self._conn.executemany(
+                """
+                insert into candidate (id, lexical, colbert, colbert_dim) values (?, ?, ?, ?)
+                on conflict(id) do update set
+                  lexical = coalesce(excluded.lexical, candidate.lexical),
+                  colbert = coalesce(excluded.colbert, candidate.colbert),
+                  colbert_dim = coalesce(excluded.colbert_dim, candidate.colbert_dim)
+                """,
+                records,
+            )
+            self._conn.commit()
+        return len(records)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("delete from candidate")
+            self._conn.commit()
+
+    def get_many(self, doc_ids: Sequence[int]) -> Dict[int, CandidateOutputs]:
+        if not doc_ids:
+            return {}
+        placeholders = ",".join("?" for _ in doc_ids)
+        with self._lock:
+            rows = self._conn.execute(
+                f"select id, lexical, colbert, colbert_dim from candidate where id in ({placeholders})",
+                [int(doc_id) for doc_id in doc_ids],
+            ).fetchall()
+        found = {}
+        for doc_id, lexical, colbert, colbert_dim in rows:
+            vecs = None
+            if colbert is not None and colbert_dim:
+                vecs = np.frombuffer(colbert, dtype=np.float16).reshape(-1, colbert_dim).astype(np.float32)
+            found[int(doc_id)] = CandidateOutputs(
+                lexical_weights=json.loads(lexical) if lexical is not None else None,
+                colbert_vecs=vecs,
+            )
+        return found
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def outputs_from_encoding(encoded: Dict[str, Any], position: int) -> CandidateOutputs:
+    lexical = encoded.get("lexical_weights")
+    colbert = encoded.get("colbert_vecs")
+    return CandidateOutputs(
+        lexical_weights=lexical[position] if lexical is not None else None,
+        colbert_vecs=colbert[position] if colbert is not None else None,
+    )
+
+
+@dataclass
+class RerankStats:
+    candidates: int = 0
+    cached: int = 0
+    encoded: int = 0
+    skipped: int = 0
+    seconds: float = 0.0
+
+
+class Reranker:
+    """
+    Rerank dense candidates with lexical weights and/or ColBERT scores.
+
+    Candidate outputs come from the store; up to ``encode_budget`` uncached
+    candidates are encoded together with the query in one batched pass (and
+    written back to the store). Candidates over budget keep only their dense
+    score, so reranking cost stays bounded per query.
+    """
+
+    def __init__(
+        self,
+        embedder,
+        mode: str,
+        store: Optional[CandidateStore] = None,
+        *,
+        encode_budget: int = 32,
+        max_length: int = 128,
+        weights: RerankWeights = RerankWeights(),
+    ):
+        if mode not in RERANK_MODES:
+            raise ValueError(f"Unknown rerank mode '{mode}' (expected one of {', '.join(RERANK_MODES)})")
+        self.embedder = embedder
+        self.mode = mode
+        self.store = store
+        self.encode_budget = max(int(encode_budget), 0)
+        self.max_length = max_length
+        self.weights = weights
+
+    def rerank(self, query: str, hits: List[Dict[str, Any]], limit: int) -> Tuple[List[Dict[str, Any]], RerankStats]:
+        started = time.perf_counter()
+        stats = RerankStats(candidates=len(hits))
+        if not hits:
+            return [], stats
+        sparse = mode_uses_sparse(self.mode)
+        colbert = mode_uses_colbert(self.mode)
+
+        ids = [hit.get("id") for hit in hits]
+        known_ids = [doc_id for doc_id in ids if doc_id is not None]
+        cached = self.store.get_many(known_ids) if self.store is not None else {}
+        stats.cached = len(cached)
+        missing = [position for position, doc_id in enumerate(ids) if doc_id not in cached]
+        to_encode = missing[: self.encode_budget]
+        stats.encoded = len(to_encode)
+        stats.skipped = len(missing) - len(to_encode)
+
+        texts = [query] + [str(hits[position].get("name", "")) for position in to_encode]
+        encoded = self.embedder.encode_multi(
+            texts,
+            batch_size=len(texts),
+            max_length=self.max_length,
+            sparse=sparse,
+            colbert=colbert,
+        )
+        query_outputs = outputs_from_encoding(encoded, 0)
+        outputs: Dict[int, CandidateOutputs] = {}
+        fresh = []
+        for offset, position in enumerate(to_encode, start=1):
+            outputs[position] = outputs_from_encoding(encoded, offset)
+            if ids[position] is not None:
+                fresh.append((ids[position], outputs[position]))
+        for position, doc_id in enumerate(ids):
+            if doc_id in cached:
+                outputs[position] = cached[doc_id]
+        if self.store is not None and fresh:
+            self.store.put_many(fresh)
+
+        scored = []
+        for position, hit in enumerate(hits):
+            dense = _dense_score(hit, position, len(hits))
+            score = self.weights.dense * dense
+            candidate = outputs.get(position)
+            if candidate is None:
+                # Over budget: scale dense so it competes with fully scored hits.
+                score = dense * self.weights.total(self.mode)
+            else:
+                if sparse and candidate.lexical_weights is not None:
+                    score += self.weights.sparse * lexical_score(query_outputs.lexical_weights or {}, candidate.lexical_weights)
+                if colbert and candidate.colbert_vecs is not None:
+                    score += self.weights.colbert * colbert_score(query_outputs.colbert_vecs, candidate.colbert_vecs)
+            scored.append((score, position, {**hit, "_rerankScore": score}))
+
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        stats.seconds = time.perf_counter() - started
+        RERANK_SECONDS.observe(stats.seconds)
+        return [hit for _, _, hit in scored[:limit]], stats
+
+
+def _dense_score(hit: Dict[str, Any], position: int, total: int) -> float:
+    """Meilisearch ranking score when present, otherwise a rank-based stand-in."""
+    score = hit.get("_rankingScore")
+    if isinstance(score, (int, float)):
+        return float(score)
+    return 1.0 - position / max(total, 1)
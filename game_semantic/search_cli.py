@@ -4,8 +4,9 @@ import logging
 import sys
 
 from .config import Config
-from .embedding import BgeM3Embedder
+from .embedding import create_embedder
 from .meili_client import MeiliGameIndex
+from .projection import FULL_DIMS
 
 
 def interactive_search(config: Config):
@@ -20,26 +21,97 @@ def interactive_search(config: Config):
             api_key=config.meili_api_key,
             index_uid=config.meili_index_uid,
             embedder_name="bge_m3",
-            embedding_dim=1024,
+            embedding_dim=config.vector_dims if 0 < config.vector_dims < FULL_DIMS else FULL_DIMS,
         )
     except Exception as exc:  # noqa: BLE001
         print(f"无法连接 Meilisearch：{exc}", file=sys.stderr)
         return
 
     try:
-        embedder = BgeM3Embedder(model_name=config.bge_model_name, use_fp16=config.bge_use_fp16)
+        embedder = create_embedder(
+            config.bge_model_name,
+            config.bge_use_fp16,
+            config.embedder_backend,
+            config.onnx_model_dir,
+        )
     except Exception as exc:  # noqa: BLE001
         print(f"加载 BGE-M3 模型失败：{exc}", file=sys.stderr)
         return
 
+    projection = None
+    if 0 < config.vector_dims < FULL_DIMS:
+        from .index_builder import load_projection, projection_path_for
+
+        try:
+            projection = load_projection(projection_path_for(config), config.vector_dims)
+        except (OSError, ValueError) as exc:
+            print(f"加载向量投影失败：{exc}", file=sys.stderr)
+            return
+
+    reranker = None
+    if config.rerank_mode:
+        from .index_builder import check_rerank_mode, rerank_store_path_for
+        from .rerank import CandidateStore, Reranker
+
+        try:
+            check_rerank_mode(config)
+            reranker = Reranker(
+                embedder,
+                config.rerank_mode,
+                CandidateStore(rerank_store_path_for(config)),
+                encode_budget=config.rerank_encode_budget,
+                max_length=config.embedding_max_length,
+            )
+        except (OSError, ValueError) as exc:
+            print(f"初始化重排失败：{exc}", file=sys.stderr)
+            return
+
     def highlight(text: str, query: str) -> str:
         """Highlight exact query substring in red if present."""
         if not query or not text:
             return text
         return text.replace(query, f"\033[31m{query}\033[0m")
 
-    print("输入查询（任意语言），按 Enter 进行向量搜索；直接回车退出。")
+    def fetch_page(query: str, query_vec: list, offset: int) -> tuple[list, bool]:
+        """Return one page of `top_k` hits after `offset` and whether more follow."""
+        query_text = query if config.semantic_ratio < 1.0 else ""
+        if reranker is None:
+            hits = game_index.search_by_vector(
+                query_vec,
+                limit=config.top_k + 1,
+                query_text=query_text,
+                semantic_ratio=config.semantic_ratio,
+                show_ranking_score=True,
+                offset=offset,
+            )
+            return hits[: config.top_k], len(hits) > config.top_k
+
+        # Reranking reorders the whole head, so rerank everything up to the page end and slice.
+        window = offset + config.top_k + 1
+        candidates = game_index.search_by_vector(
+            query_vec,
+            limit=max(config.rerank_candidates, window),
+            query_text=query_text,
+            semantic_ratio=config.semantic_ratio,
+            show_ranking_score=True,
+        )
+        hits, stats = reranker.rerank(query, candidates, window)
+        logging.debug(
+            "Reranked %d candidates in %.3fs (cached=%d encoded=%d skipped=%d)",
+            stats.candidates,
+            stats.seconds,
+            stats.cached,
+            stats.encoded,
+            stats.skipped,
+        )
+        return hits[offset : offset + config.top_k], len(hits) > offset + config.top_k
+
+    print("输入查询（任意语言），按 Enter 进行向量搜索；输入 :n 查看下一页；直接回车退出。")
 
+    # The last query and its vector, so `:n` pages without re-encoding.
+    last_query = ""
+    last_vec: list = []
+    offset = 0
     while True:
         try:
             query = input("请输入查询> ").strip()
@@ -51,20 +123,34 @@ def interactive_search(config: Config):
             print("空行，退出。")
             break
 
-        logging.debug("User query: %s", query)
-        dense = embedder.encode_dense([query], batch_size=1, max_length=128)
-        query_vec = dense[0].tolist()
-        logging.debug("Encoded query vector dim=%d", len(query_vec))
+        if query == ":n":
+            if not last_vec:
+                print("（还没有可翻页的查询）\n")
+                continue
+            query = last_query
+            offset += config.top_k
+        else:
+            logging.debug("User query: %s", query)
+            dense = embedder.encode_dense([query], batch_size=1, max_length=128)
+            if projection is not None:
+                dense = projection.project(dense)
+            last_query, last_vec, offset = query, dense[0].tolist(), 0
+            logging.debug("Encoded query vector dim=%d", len(last_vec))
 
-        hits = game_index.search_by_vector(query_vec, limit=config.top_k)
+        hits, has_more = fetch_page(query, last_vec, offset)
         logging.debug("Search returned %d hits", len(hits))
 
         if not hits:
             print("（没有找到相似的游戏）\n")
+            last_vec = []
             continue
 
-        print(f"Top {len(hits)} 相似结果：")
-        for idx, doc in enumerate(hits, 1):
+        print(f"第 {offset + 1}-{offset + len(hits)} 个相似结果：")
+        for idx, doc in enumerate(hits, offset + 1):
             name = doc.get("name", "")
-            print(f"{idx}. {highlight(name, query)}")
+            score = doc.get("_rerankScore", doc.get("_rankingScore"))
+            suffix = f"  ({score:.3f})" if isinstance(score, (int, float)) else ""
+            print(f"{idx}. {highlight(name, query)}{suffix}")
+        if has_more:
+            print("输入 :n 查看下一页。")
         print("")
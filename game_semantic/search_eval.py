@@ -0,0 +1,179 @@
+"""Recall and latency evaluation for vector / hybrid search on a labelled query set."""
+
+import json
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Sequence
+
+import numpy as np
+
+
+@dataclass
+class LabelledQuery:
+    """One evaluation query and the document names that count as correct answers."""
+
+    query: str
+    relevant: List[str]
+
+
+def load_labelled_queries(path: str) -> List[LabelledQuery]:
+    """
+    Read labelled queries from a JSON list or JSON-lines file.
+
+    Each entry looks like `{"query": "クラナド", "relevant": ["CLANNAD -クラナド-"]}`;
+    `relevant` may also be a single string. Entries without a query or any
+    relevant names are skipped.
+    """
+    with open(path, "r", encoding="utf-8") as handle:
+        text = handle.read()
+    stripped = text.lstrip()
+    if stripped.startswith("["):
+        entries = json.loads(stripped)
+    else:
+        entries = [json.loads(line) for line in text.splitlines() if line.strip()]
+
+    labelled: List[LabelledQuery] = []
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+        query = str(entry.get("query") or "").strip()
+        relevant = entry.get("relevant") or []
+        if isinstance(relevant, str):
+            relevant = [relevant]
+        relevant = [str(name) for name in relevant if name]
+        if not query or not relevant:
+            logging.debug("Skipping incomplete labelled entry: %s", entry)
+            continue
+        labelled.append(LabelledQuery(query=query, relevant=relevant))
+    return labelled
+
+
+def recall_at_k(hits: Sequence[Dict[str, Any]], relevant: Iterable[str], k: int) -> float:
+    """Fraction of relevant names found among the first k hits."""
+    relevant_set = set(relevant)
+    if not relevant_set:
+        return 0.0
+    found = {hit.get("name") for hit in hits[:k]} & relevant_set
+    return len(found) / len(relevant_set)
+
+
+def evaluate_semantic_ratios(
+    game_index,
+    embedder,
+    labelled: List[LabelledQuery],
+    ratios: Sequence[float],
+    k: int = 10,
+    max_length: int = 128,
+    encode_batch_size: int = 64,
+) -> List[Dict[str, float]]:
+    """
+    Measure recall@k and Meilisearch latency for each semantic ratio.
+
+    Queries are embedded once up front, so the reported latency covers only
+    the search request and the modes are compared on equal footing.
+    """
+    if not labelled:
+        return []
+    queries = [item.query for item in labelled]
+    vectors = embedder.encode_dense(
+        queries,
+        batch_size=min(encode_batch_size, len(queries)),
+        max_length=max_length,
+    )
+
+    report: List[Dict[str, float]] = []
+    for ratio in ratios:
+        latencies_ms: List[float] = []
+        recalls: List[float] = []
+        for item, vec in zip(labelled, vectors):
+            search_kwargs: Dict[str, Any] = {}
+            if ratio < 1.0:
+                search_kwargs = {"query_text": item.query, "semantic_ratio": ratio}
+            started = time.perf_counter()
+            hits = game_index.search_by_vector(vec.tolist(), limit=k, **search_kwargs)
+            latencies_ms.append((time.perf_counter() - started) * 1000.0)
+            recalls.append(recall_at_k(hits, item.relevant, k))
+        report.append(
+            {
+                "semantic_ratio": float(ratio),
+                "queries": float(len(recalls)),
+                f"recall_at_{k}": float(np.mean(recalls)),
+                "latency_p50_ms": float(np.percentile(latencies_ms, 50)),
+                "latency_p95_ms": float(np.percentile(latencies_ms, 95)),
+            }
+        )
+        logging.info(
+            "semanticRatio=%.2f recall@%d=%.3f p50=%.1fms p95=%.1fms",
+            ratio,
+            k,
+            report[-1][f"recall_at_{k}"],
+            report[-1]["latency_p50_ms"],
+            report[-1]["latency_p95_ms"],
+        )
+    return report
+
+
+def evaluate_rerank(
+    game_index,
+    reranker,
+    labelled: List[LabelledQuery],
+    k: int = 10,
+    candidates: int = 50,
+    max_length: int = 128,
+    encode_batch_size: int = 64,
+) -> List[Dict[str, float]]:
+    """
+    Compare dense-only ranking with reranked candidates on the same queries.
+
+    Each query fetches ``candidates`` dense hits once; the dense row scores
+    their first k, the rerank row scores the reranker's top k. Latency is the
+    Meilisearch request for the dense row and request plus rerank for the
+    rerank row, so the difference is the rerank cost.
+    """
+    if not labelled:
+        return []
+    queries = [item.query for item in labelled]
+    vectors = reranker.embedder.encode_dense(
+        queries,
+        batch_size=min(encode_batch_size, len(queries)),
+        max_length=max_length,
+    )
+
+    dense_recalls: List[float] = []
+    rerank_recalls: List[float] = []
+    dense_ms: List[float] = []
+    rerank_ms: List[float] = []
+    for item, vec in zip(labelled, vectors):
+        started = time.perf_counter()
+        hits = game_index.search_by_vector(vec.tolist(), limit=max(candidates, k), show_ranking_score=True)
+        search_ms = (time.perf_counter() - started) * 1000.0
+        reranked, stats = reranker.rerank(item.query, hits, k)
+        dense_ms.append(search_ms)
+        rerank_ms.append(search_ms + stats.seconds * 1000.0)
+        dense_recalls.append(recall_at_k(hits, item.relevant, k))
+        rerank_recalls.append(recall_at_k(reranked, item.relevant, k))
+
+    report: List[Dict[str, float]] = []
+    for mode, recalls, latencies_ms in (
+        ("dense", dense_recalls, dense_ms),
+        (reranker.mode, rerank_recalls, rerank_ms),
+    ):
+        report.append(
+            {
+                "mode": mode,
+                "queries": float(len(recalls)),
+                f"recall_at_{k}": float(np.mean(recalls)),
+                "latency_p50_ms": float(np.percentile(latencies_ms, 50)),
+                "latency_p95_ms": float(np.percentile(latencies_ms, 95)),
+            }
+        )
+        logging.info(
+            "mode=%s recall@%d=%.3f p50=%.1fms p95=%.1fms",
+            mode,
+            k,
+            report[-1][f"recall_at_{k}"],
+            report[-1]["latency_p50_ms"],
+            report[-1]["latency_p95_ms"],
+        )
+    return report
@@ -1,7 +1,7 @@
-def build_index(config):
+def build_index(config, progress=None, expected_docs=None):
     from game_semantic.index_builder import build_index as _build_index
 
-    return _build_index(config)
+    return _build_index(config, progress=progress, expected_docs=expected_docs)
 
 
 def search_games(config):
@@ -0,0 +1,391 @@
+"""Reproducible synthetic catalogues of mixed Chinese/Japanese/English game titles."""
+
+import json
+import math
+import random
+from dataclasses import asdict, dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from .hashset import HashSet64
+
+# (English, Japanese, Chinese) renderings of title words.
+VOCABULARY: Tuple[Tuple[str, str, str], ...] = (
+    ("Dragon", "ドラゴン", "龙"),
+    ("Quest", "クエスト", "勇者"),
+    ("Fantasy", "ファンタジー", "幻想"),
+    ("Final", "ファイナル", "最终"),
+    ("Legend", "レジェンド", "传说"),
+    ("Star", "スター", "星之"),
+    ("Ocean", "オーシャン", "海洋"),
+    ("Tales", "テイルズ", "传奇"),
+    ("Chronicle", "クロニクル", "编年史"),
+    ("Knight", "ナイト", "骑士"),
+    ("Souls", "ソウル", "灵魂"),
+    ("Hollow", "ホロウ", "空洞"),
+    ("Sword", "ソード", "剑"),
+    ("Magic", "マジック", "魔法"),
+    ("Kingdom", "キングダム", "王国"),
+    ("Hearts", "ハーツ", "之心"),
+    ("Monster", "モンスター", "怪物"),
+    ("Hunter", "ハンター", "猎人"),
+    ("Shadow", "シャドウ", "暗影"),
+    ("Spirit", "スピリット", "精灵"),
+    ("Dream", "ドリーム", "梦境"),
+    ("Island", "アイランド", "岛屿"),
+    ("Witch", "ウィッチ", "魔女"),
+    ("Academy", "アカデミー", "学园"),
+    ("Princess", "プリンセス", "公主"),
+    ("Galaxy", "ギャラクシー", "银河"),
+    ("Memories", "メモリーズ", "回忆"),
+    ("Summer", "サマー", "夏日"),
+    ("Night", "ナイト", "夜"),
+    ("Blade", "ブレイド", "之刃"),
+    ("Eternal", "エターナル", "永恒"),
+    ("Crystal", "クリスタル", "水晶"),
+    ("Heroes", "ヒーローズ", "英雄"),
+    ("Wild", "ワイルド", "荒野"),
+    ("Garden", "ガーデン", "花园"),
+    ("Sky", "スカイ", "天空"),
+    ("Fire", "ファイア", "火焰"),
+    ("Emblem", "エムブレム", "纹章"),
+    ("Gate", "ゲート", "之门"),
+    ("World", "ワールド", "世界"),
+    ("Saga", "サーガ", "传说"),
+    ("Arcana", "アルカナ", "秘仪"),
+    ("Requiem", "レクイエム", "镇魂曲"),
+    ("Festival", "フェスティバル", "祭典"),
+    ("Journey", "ジャーニー", "旅途"),
+    ("Clock", "クロック", "时钟"),
+    ("Tower", "タワー", "之塔"),
+    ("Moon", "ムーン", "月"),
+)
+EDITIONS: Tuple[Tuple[str, str, str], ...] = (
+    ("Remastered", "リマスター", "重制版"),
+    ("Deluxe Edition", "デラックスエディション", "豪华版"),
+    ("Complete Edition", "完全版", "完全版"),
+    ("Director's Cut", "ディレクターズカット", "导演剪辑版"),
+    ("HD", "HD", "高清版"),
+)
+SEQUELS = ("2", "3", "II", "III", "IV", "Zero", "Origins")
+TAGS = ("[Steam]", "(v1.0.2)", "【汉化版】", "(Limited)", "[DL版]", "(Demo)", "[GOG]")
+FILE_EXTENSIONS = (".zip", ".7z", ".rar", ".iso", ".exe")
+LANGUAGES = ("en", "ja", "zh")
+LANGUAGE_WEIGHTS = (0.4, 0.35, 0.25)
+# Originals kept in memory for variants and repeats to refer back to.
+SOURCE_WINDOW = 10000
+_EPOCH_2015 = 1420070400.0
+_TEN_YEARS = 10 * 365 * 86400.0
+
+KIND_ORIGINAL = "original"
+KIND_VARIANT = "variant"
+KIND_REPEAT = "repeat"
+
+
+@dataclass
+class CatalogueSpec:
+    """
+    Shape of a synthetic catalogue.
+
+    ``variant_rate`` is the share of rows that are near-duplicates of an
+    earlier title (alias order, ``-クラナド-`` style wrapping, editions,
+    tags, casing); ``repeat_rate`` is the share of exact repeats.
+    ``mean_words`` sets the mean title length in words (Poisson, capped at
+    ``max_words``) and ``subtitle_rate`` how often a subtitle is appended.
+    """
+
+    rows: int = 10000
+    seed: int = 0
+    variant_rate: float = 0.1
+    repeat_rate: float = 0.02
+    alias_rate: float = 0.3
+    mean_words: float = 2.5
+    max_words: int = 8
+    subtitle_rate: float = 0.2
+    files: bool = False  # attach path / size / ctime / mtime like scan_filesystem output
+
+    def validate(self) -> None:
+        if self.rows < 0:
+            raise ValueError("rows must not be negative")
+        for name in ("variant_rate", "repeat_rate", "alias_rate", "subtitle_rate"):
+            if not 0.0 <= getattr(self, name) <= 1.0:
+                raise ValueError(f"{name} must be between 0 and 1")
+        if self.variant_rate + self.repeat_rate > 1.0:
+            raise ValueError("variant_rate + repeat_rate must not exceed 1")
+        if self.mean_words < 1.0 or self.max_words < 1:
+            raise ValueError("mean_words and max_words must be at least 1")
+
+
+@dataclass
+class CatalogueRow:
+    name: str
+    kind: str
+    path: Optional[str] = None
+    ctime: Optional[float] = None
+    mtime: Optional[float] = None
+    size: Optional[int] = None
+
+    def to_item(self) -> Dict[str, object]:
+        """The record shape ``load_items_from_json`` reads."""
+        return {"name": self.name, "path": self.path, "ctime": self.ctime, "mtime": self.mtime, "size": self.size}
+
+
+@dataclass
+class _Title:
+    words: List[int]
+    sequel: Optional[str]
+    subtitle: List[int]
+    languages: List[str]  # primary first, then aliases
+
+    def render(self, language: str, with_subtitle: bool = True) -> str:
+        column = LANGUAGES.index(language)
+        parts = [VOCABULARY[word][column] for word in self.words]
+        if language == "en":
+            text = " ".join(parts)
+        elif language == "ja":
+            text = "・".join(parts)
+        else:
+            text = "".join(parts)
+        if self.sequel:
+            text = f"{text} {self.sequel}"
+        if with_subtitle and self.subtitle:
+            sub = [VOCABULARY[word][column] for word in self.subtitle]
+            if language == "en":
+                text = f"{text}: {' '.join(sub)}"
+            elif language == "ja":
+                text = f"{text} ～{''.join(sub)}～"
+            else:
+                text = f"{text}：{''.join(sub)}"
+        return text
+
+    def name(self, separator: str = " / ") -> str:
+        return separator.join(self.render(language) for language in self.languages)
+
+
+@dataclass
+class _Source:
+    title: _Title
+    name: str
+    path: Optional[str] = None
+    size: Optional[int] = None
+    mtime: Optional[float] = None
+
+
+@dataclass
+class CatalogueStats:
+    rows: int = 0
+    originals: int = 0
+    variants: int = 0
+    repeats: int = 0
+    unique_names: int = 0
+    chars_p50: float = 0.0
+    chars_p95: float = 0.0
+    chars_max: int = 0
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+class CatalogueGenerator:
+    """Stream rows for a CatalogueSpec; the same spec always yields the same rows."""
+
+    def __init__(self, spec: CatalogueSpec):
+        spec.validate()
+        self.spec = spec
+        self.rng = random.Random(spec.seed)
+        self.seen = HashSet64()
+        self.sources: List[_Source] = []
+        self._next_source = 0
+        self._fallback = 0
+
+    def __iter__(self) -> Iterator[CatalogueRow]:
+        for _ in range(self.spec.rows):
+            roll = self.rng.random()
+            if self.sources and roll < self.spec.repeat_rate:
+                yield self._repeat()
+            elif self.sources and roll < self.spec.repeat_rate + self.spec.variant_rate:
+                yield self._variant()
+            else:
+                yield self._original()
+
+    def _word_count(self, mean: float) -> int:
+        # Knuth's Poisson sampler on mean - 1, shifted so titles have at least one word.
+        limit = math.exp(-(mean - 1.0))
+        count, product = 0, self.rng.random()
+        while product > limit:
+            count += 1
+            product *= self.rng.random()
+        return min(count + 1, self.spec.max_words)
+
+    def _new_title(self) -> _Title:
+        rng = self.rng
+        words = [rng.randrange(len(VOCABULARY)) for _ in range(self._word_count(self.spec.mean_words))]
+        sequel = rng.choice(SEQUELS) if rng.random() < 0.15 else None
+        subtitle = []
+        if rng.random() < self.spec.subtitle_rate:
+            subtitle = [rng.randrange(len(VOCABULARY)) for _ in range(self._word_count(2.0))]
+        primary = rng.choices(LANGUAGES, weights=LANGUAGE_WEIGHTS)[0]
+        languages = [primary]
+        if rng.random() < self.spec.alias_rate:
+            others = [language for language in LANGUAGES if language != primary]
+            rng.shuffle(others)
+            languages.extend(others[: rng.randint(1, 2)])
+        return _Title(words=words, sequel=sequel, subtitle=subtitle, languages=languages)
+
+    def _claim(self, name: str) -> bool:
+        return self.seen.add_name(name)
+
+    def _remember(self, source: _Source) -> None:
+        if len(self.sources) < SOURCE_WINDOW:
+            self.sources.append(source)
+        else:
+            self.sources[self._next_source] = source
+            self._next_source = (self._next_source + 1) % SOURCE_WINDOW
+
+    def _original(self) -> CatalogueRow:
+        for _ in range(8):
+            title = self._new_title()
+            name = title.name()
+            if self._claim(name):
+                break
+        else:
+            # The vocabulary ran out of fresh combinations; number the title instead.
+            self._fallback += 1
+            title.sequel = f"{title.sequel or ''} {self._fallback}".strip()
+            name = title.name()
+            self._claim(name)
+        row = CatalogueRow(name=name, kind=KIND_ORIGINAL)
+        source = _Source(title=title, name=name)
+        if self.spec.files:
+            mtime = _EPOCH_2015 + self.rng.random() * _TEN_YEARS
+            source.size = int(self.rng.lognormvariate(19.0, 1.6))
+            source.mtime = mtime
+            self._attach_file(row, name, folder=self._folder(name), size=source.size, mtime=mtime)
+            source.path = row.path
+        self._remember(source)
+        return row
+
+    def _variant_name(self, source: _Source) -> str:
+        rng = self.rng
+        title = source.title
+        operation = rng.randrange(7)
+        if operation == 0:
+            latin = title.render("en")
+            other = title.render(rng.choice(("ja", "zh")))
+            return f"{latin} -{other}-"
+        if operation == 1:
+            languages = list(title.languages) if len(title.languages) > 1 else [title.languages[0], rng.choice(LANGUAGES)]
+            rng.shuffle(languages)
+            separator = rng.choice(("/", " / ", "／", " | "))
+            return separator.join(title.render(language) for language in dict.fromkeys(languages))
+        if operation == 2:
+            edition = rng.choice(EDITIONS)[LANGUAGES.index(title.languages[0])]
+            return f"{source.name} {edition}"
+        if operation == 3:
+            return f"{source.name} {rng.choice(TAGS)}"
+        if operation == 4:
+            return source.name.upper() if rng.random() < 0.5 else source.name.lower()
+        if operation == 5:
+            return title.render(title.languages[0], with_subtitle=not title.subtitle)
+        return source.name.replace(" ", "", 1) if " " in source.name else f"{source.name}!"
+
+    def _variant(self) -> CatalogueRow:
+        source = self.rng.choice(self.sources)
+        for _ in range(8):
+            name = self._variant_name(source)
+            if self._claim(name):
+                break
+        else:
+            self._fallback += 1
+            name = f"{source.name} ({self._fallback})"
+            self._claim(name)
+        row = CatalogueRow(name=name, kind=KIND_VARIANT)
+        if self.spec.files:
+            size = source.size
+            if size is not None and self.rng.random() < 0.7:
+                size = max(1, int(size * (1.0 + self.rng.uniform(-0.02, 0.02))))
+            mtime = (source.mtime or _EPOCH_2015) + self.rng.uniform(-600.0, 600.0)
+            self._attach_file(row, name, folder=self._folder(source.name), size=size, mtime=mtime)
+        return row
+
+    def _repeat(self) -> CatalogueRow:
+        source = self.rng.choice(self.sources)
+        row = CatalogueRow(name=source.name, kind=KIND_REPEAT)
+        if self.spec.files:
+            mtime = (source.mtime or _EPOCH_2015) + self.rng.uniform(0.0, 86400.0 * 30)
+            self._attach_file(row, source.name, folder="backup", size=source.size, mtime=mtime)
+        return row
+
+    @staticmethod
+    def _folder(name: str) -> str:
+        initial = name[:1].upper()
+        return initial if initial.isascii() and initial.isalnum() else "_"
+
+    def _attach_file(self, row: CatalogueRow, name: str, *, folder: str, size: Optional[int], mtime: float) -> None:
+        # Filenames cannot contain "/", so aliases use the full-width slash like real downloads.
+        filename = name.replace("/", "／") + self.rng.choice(FILE_EXTENSIONS)
+        row.name = filename
+        row.path = f"/data/games/{folder}/{filename}"
+        row.size = size
+        row.mtime = round(mtime, 3)
+        row.ctime = round(mtime + self.rng.uniform(0.0, 86400.0), 3)
+
+
+def generate_catalogue(spec: CatalogueSpec) -> Iterator[CatalogueRow]:
+    """Yield ``spec.rows`` rows without holding the catalogue in memory."""
+    return iter(CatalogueGenerator(spec))
+
+
+class _StatsCollector:
+    def __init__(self):
+        self.stats = CatalogueStats()
+        self.unique = HashSet64()
+        self.lengths = np.zeros(1025, dtype=np.int64)
+
+    def add(self, row: CatalogueRow) -> None:
+        self.stats.rows += 1
+        if row.kind == KIND_ORIGINAL:
+            self.stats.originals += 1
+        elif row.kind == KIND_VARIANT:
+            self.stats.variants += 1
+        else:
+            self.stats.repeats += 1
+        if self.unique.add_name(row.name):
+            self.stats.unique_names += 1
+        self.lengths[min(len(row.name), len(self.lengths) - 1)] += 1
+        self.stats.chars_max = max(self.stats.chars_max, len(row.name))
+
+    def finish(self) -> CatalogueStats:
+        total = int(self.lengths.sum())
+        if total:
+            cumulative = np.cumsum(self.lengths)
+            self.stats.chars_p50 = float(np.searchsorted(cumulative, 0.5 * total))
+            self.stats.chars_p95 = float(np.searchsorted(cumulative, 0.95 * total))
+        return self.stats
+
+
+def write_catalogue(rows: Iterable[CatalogueRow], path: str, fmt: str = "txt") -> CatalogueStats:
+    """
+    Stream rows to ``path`` and return summary statistics.
+
+    ``txt`` writes one name per line (``games.txt``); ``json`` writes the list
+    ``load_items_from_json`` reads; ``ndjson`` writes one record per line.
+    """
+    if fmt not in ("txt", "json", "ndjson"):
+        raise ValueError(f"Unknown catalogue format '{fmt}'")
+    collector = _StatsCollector()
+    with open(path, "w", encoding="utf-8") as handle:
+        if fmt == "json":
+            handle.write("[")
+        for position, row in enumerate(rows):
+            collector.add(row)
+            if fmt == "txt":
+                handle.write(row.name + "\n")
+            elif fmt == "ndjson":
+                handle.write(json.dumps(row.to_item(), ensure_ascii=False) + "\n")
+            else:
+                handle.write(("\n" if position == 0 else ",\n") + json.dumps(row.to_item(), ensure_ascii=False))
+        if fmt == "json":
+            handle.write("\n]\n")
+    return collector.finish()
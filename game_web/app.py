@@ -1,30 +1,55 @@
 import os
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI
 from fastapi.templating import Jinja2Templates
 
 from game_web.db import init_db
+from game_web.routes.api import router as api_router
 from game_web.routes.auth import router as auth_router
 from game_web.routes.jobs import router as jobs_router
 from game_web.routes.library import router as library_router
 from game_web.routes.library_detail import router as library_detail_router
+from game_web.routes.metrics import router as metrics_router
 from game_web.routes.search import router as search_router
 from game_web.routes.settings import router as settings_router
 from game_web.runtime import resolve_data_dir
 
 
-def create_app(db_path: str = "app.db", data_dir: str | Path | None = None) -> FastAPI:
+def create_app(
+    db_path: str = "app.db",
+    data_dir: str | Path | None = None,
+    *,
+    warm_up: bool = False,
+    metrics_token: str | None = None,
+) -> FastAPI:
+    """Build the app; ``warm_up`` loads query embedders in the background once serving starts.
+
+    ``/metrics`` needs a login session, or ``metrics_token`` as a bearer token when one is set.
+    """
     init_db(db_path)
-    app = FastAPI()
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        if warm_up:
+            from game_web.services.search_executor import start_query_embedder_warm_up
+
+            app.state.warm_up_thread = start_query_embedder_warm_up(db_path)
+        yield
+
+    app = FastAPI(lifespan=lifespan)
     app.state.db_path = db_path
     app.state.data_dir = resolve_data_dir(data_dir, db_path)
+    app.state.metrics_token = metrics_token or None
     template_dir = Path(__file__).resolve().parent / "templates"
     app.state.templates = Jinja2Templates(directory=str(template_dir))
+    app.include_router(api_router)
     app.include_router(auth_router)
     app.include_router(jobs_router)
     app.include_router(library_router)
     app.include_router(library_detail_router)
+    app.include_router(metrics_router)
     app.include_router(search_router)
     app.include_router(settings_router)
 
@@ -44,4 +69,6 @@ def create_web_ui_app() -> FastAPI:
     else:
         resolved_data_dir = resolve_data_dir(data_dir, db_path)
     resolved_data_dir.mkdir(parents=True, exist_ok=True)
-    return create_app(db_path=db_path, data_dir=resolved_data_dir)
+    warm_up = os.environ.get("GAME_WEB_WARM_UP", "1").strip().lower() not in {"0", "false", "no", "off"}
+    metrics_token = os.environ.get("GAME_WEB_METRICS_TOKEN", "").strip() or None
+    return create_app(db_path=db_path, data_dir=resolved_data_dir, warm_up=warm_up, metrics_token=metrics_token)
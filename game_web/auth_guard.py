@@ -1,4 +1,5 @@
 import datetime
+import hmac
 from typing import NoReturn, cast
 
 from fastapi import HTTPException, Request
@@ -50,6 +51,18 @@ def require_login(request: Request) -> str:
     return session_id
 
 
+def require_login_or_metrics_token(request: Request) -> str:
+    """Allow a logged-in session, or a scraper sending ``Authorization: Bearer <metrics token>``.
+
+    The token is only accepted when the app was started with one.
+    """
+    token = getattr(request.app.state, "metrics_token", None)
+    scheme, _, credentials = request.headers.get("authorization", "").partition(" ")
+    if token and scheme.lower() == "bearer" and hmac.compare_digest(credentials.strip(), token):
+        return "metrics-token"
+    return require_login(request)
+
+
 def require_login_redirect(request: Request) -> str:
     try:
         return require_login(request)
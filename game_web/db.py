@@ -23,6 +23,9 @@ create table if not exists dataset (
   storage_path text not null,
   size_bytes integer not null,
   created_at text not null,
+  line_count integer,
+  unique_line_count integer,
+  content_sha256 text,
   foreign key (library_id) references library(id) on delete cascade
 );
 create table if not exists job (
@@ -35,6 +38,8 @@ create table if not exists job (
   error text,
   created_at text not null,
   updated_at text not null,
+  progress text,
+  input_fingerprint text,
   foreign key (library_id) references library(id) on delete cascade,
   foreign key (dataset_id) references dataset(id) on delete cascade
 );
@@ -48,6 +53,13 @@ create table if not exists embedding_profile (
   variant text not null default 'raw',
   enabled integer not null default 1,
   created_at text not null,
+  semantic_ratio real not null default 1.0,
+  backend text not null default 'torch',
+  vector_dims integer not null default 0,
+  rerank_mode text not null default '',
+  rerank_candidates integer not null default 50,
+  rerank_encode_budget integer not null default 32,
+  adaptive_batching integer not null default 0,
   foreign key (library_id) references library(id) on delete cascade
 );
 create table if not exists session (
@@ -127,6 +139,13 @@ def migrate_db(conn: sqlite3.Connection) -> None:
         ("max_length", "integer not null default 128"),
         ("variant", "text not null default 'raw'"),
         ("enabled", "integer not null default 1"),
+        ("semantic_ratio", "real not null default 1.0"),
+        ("backend", "text not null default 'torch'"),
+        ("vector_dims", "integer not null default 0"),
+        ("rerank_mode", "text not null default ''"),
+        ("rerank_candidates", "integer not null default 50"),
+        ("rerank_encode_budget", "integer not null default 32"),
+        ("adaptive_batching", "integer not null default 0"),
     ]
     for name, ddl in columns:
         if name not in existing:
@@ -138,5 +157,24 @@ def migrate_db(conn: sqlite3.Connection) -> None:
     conn.execute(
         "create index if not exists dataset_library_idx on dataset (library_id)"
     )
+    cur = conn.execute("pragma table_info(dataset)")
+    existing = {row[1] for row in cur.fetchall()}
+    dataset_columns = [
+        ("line_count", "integer"),
+        ("unique_line_count", "integer"),
+        ("content_sha256", "text"),
+    ]
+    for name, ddl in dataset_columns:
+        if name not in existing:
+            conn.execute(f"alter table dataset add column {name} {ddl}")
+    cur = conn.execute("pragma table_info(job)")
+    existing = {row[1] for row in cur.fetchall()}
+    job_columns = [
+        ("progress", "text"),
+        ("input_fingerprint", "text"),
+    ]
+    for name, ddl in job_columns:
+        if name not in existing:
+            conn.execute(f"alter table job add column {name} {ddl}")
     conn.execute("create index if not exists job_status_idx on job (status)")
     conn.execute("create index if not exists job_library_idx on job (library_id)")
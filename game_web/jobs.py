@@ -1,5 +1,184 @@
+import os
+import queue
+import threading
+import time
+from datetime import datetime, timezone
+
+JOB_LOG_MAX_BYTES = 50 * 1024 * 1024
+JOB_LOG_BACKUP_COUNT = 3
+JOB_LOG_FLUSH_INTERVAL_SECONDS = 0.5
+
+
+def _normalize_line(line: str) -> str:
+    return line.replace("\r\n", " ").replace("\n", " ").replace("\r", " ")
+
+
 def write_log_line(path: str, line: str) -> None:
     """Append a single line (newlines normalized to spaces), UTF-8."""
-    normalized = line.replace("\r\n", " ").replace("\n", " ").replace("\r", " ")
+    normalized = _normalize_line(line)
     with open(path, "a", encoding="utf-8") as handle:
         handle.write(normalized + "\n")
+
+
+_CLOSE = object()
+
+
+class JobLogWriter:
+    """Append-only job log that keeps the file open and writes from a background thread.
+
+    ``write``/``log`` only enqueue; the writer thread formats, buffers and flushes
+    at most every ``flush_interval`` seconds. When the file would grow past
+    ``max_bytes`` it is rotated to ``<path>.1`` … ``<path>.<backup_count>``.
+    ``close`` drains the queue and flushes, and must be called when the job
+    finishes, succeeds or fails. Errors raised by the writer thread surface on
+    the next ``write``, ``flush`` or ``close``.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        flush_interval: float = JOB_LOG_FLUSH_INTERVAL_SECONDS,
+        max_bytes: int = JOB_LOG_MAX_BYTES,
+        backup_count: int = JOB_LOG_BACKUP_COUNT,
+    ) -> None:
+        self.path = str(path)
+        self._flush_interval = flush_interval
+        self._max_bytes = max_bytes
+        self._backup_count = backup_count
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._error: BaseException | None = None
+        self._closed = False
+        self._handle = open(self.path, "ab")
+        self._size = self._handle.tell()
+        self._timestamp_second: int | None = None
+        self._timestamp_text = ""
+        self._thread = threading.Thread(target=self._run, name=f"job-log:{os.path.basename(self.path)}", daemon=True)
+        self._thread.start()
+
+    def write(self, line: str) -> None:
+        """Queue one raw line (newlines normalized to spaces)."""
+        self._check_open()
+        self._queue.put((None, None, line))
+
+    def log(self, message: str, level: str = "INFO") -> None:
+        """Queue ``<utc timestamp> [LEVEL] message``, timestamped at call time."""
+        self._check_open()
+        self._queue.put((time.time(), level, message))
+
+    def flush(self) -> None:
+        """Block until every queued line has been written to the file."""
+        self._check_open()
+        done = threading.Event()
+        self._queue.put(done)
+        while not done.wait(timeout=self._flush_interval):
+            if not self._thread.is_alive():
+                break
+        self._check()
+
+    def close(self) -> None:
+        if self._closed:
+            self._check()
+            return
+        self._closed = True
+        self._queue.put(_CLOSE)
+        self._thread.join()
+        self._check()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def __enter__(self) -> "JobLogWriter":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+    def _check(self) -> None:
+        if self._error is not None:
+            raise RuntimeError(f"Job log writer failed: {self._error}") from self._error
+
+    def _check_open(self) -> None:
+        self._check()
+        if self._closed:
+            raise RuntimeError("Job log writer is closed")
+
+    def _timestamp(self, created: float) -> str:
+        second = int(created)
+        if second != self._timestamp_second:
+            self._timestamp_second = second
+            self._timestamp_text = datetime.fromtimestamp(second, timezone.utc).isoformat()
+        return self._timestamp_text
+
+    def _format(self, item: tuple) -> bytes:
+        created, level, message = item
+        line = _normalize_line(message)
+        if created is not None:
+            line = f"{self._timestamp(created)} [{level}] {line}"
+        return (line + "\n").encode("utf-8")
+
+    def _rotate(self) -> None:
+        self._handle.close()
+        if self._backup_count > 0:
+            for number in range(self._backup_count - 1, 0, -1):
+                source = f"{self.path}.{number}"
+                if os.path.exists(source):
+                    os.replace(source, f"{self.path}.{number + 1}")
+            os.replace(self.path, f"{self.path}.1")
+            self._handle = open(self.path, "ab")
+        else:
+            self._handle = open(self.path, "wb")
+        self._size = 0
+
+    def _write(self, item: tuple) -> None:
+        data = self._format(item)
+        if self._size and self._size + len(data) > self._max_bytes:
+            self._handle.flush()
+            self._rotate()
+        self._handle.write(data)
+        self._size += len(data)
+
+    def _run(self) -> None:
+        dirty = False
+        last_flush = time.monotonic()
+        try:
+            while True:
+                try:
+                    item = self._queue.get(timeout=self._flush_interval if dirty else None)
+                except queue.Empty:
+                    item = None
+                if item is _CLOSE:
+                    break
+                if isinstance(item, threading.Event):
+                    self._handle.flush()
+                    dirty = False
+                    last_flush = time.monotonic()
+                    item.set()
+                    continue
+                if item is not None:
+                    self._write(item)
+                    dirty = True
+                now = time.monotonic()
+                if dirty and now - last_flush >= self._flush_interval:
+                    self._handle.flush()
+                    dirty = False
+                    last_flush = now
+        except BaseException as exc:  # noqa: BLE001
+            self._error = exc
+            self._drain_waiters()
+        finally:
+            try:
+                self._handle.close()
+            except Exception as exc:  # noqa: BLE001
+                if self._error is None:
+                    self._error = exc
+
+    def _drain_waiters(self) -> None:
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if isinstance(item, threading.Event):
+                item.set()
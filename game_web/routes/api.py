@@ -0,0 +1,120 @@
+from fastapi import APIRouter, Depends, HTTPException, Request
+from pydantic import BaseModel
+
+from game_web.auth_guard import require_login
+from game_web.services.search_executor import (
+    SearchConnectionError,
+    SearchExecutionError,
+    SearchLibraryNotFoundError,
+    SearchModelError,
+    SearchNotReadyError,
+    execute_autocomplete,
+    execute_batch_search,
+)
+
+router = APIRouter()
+
+SEARCH_API_MAX_QUERIES = 256
+SEARCH_API_MAX_LIMIT = 100
+AUTOCOMPLETE_MAX_LIMIT = 20
+
+
+class BatchSearchRequest(BaseModel):
+    queries: list[str]
+    limit: int | None = None
+
+
+def _hit_payload(hit: dict) -> dict:
+    # Reranked hits are ordered by the rerank score, so report that one.
+    score = hit["_rerankScore"] if "_rerankScore" in hit else hit.get("_rankingScore")
+    return {
+        "id": hit.get("id"),
+        "name": hit.get("name"),
+        "score": score,
+    }
+
+
+@router.post("/api/libraries/{library_id}/search")
+def batch_search(
+    request: Request,
+    library_id: int,
+    body: BatchSearchRequest,
+    _: str = Depends(require_login),
+):
+    if not body.queries:
+        raise HTTPException(status_code=400, detail="At least one query is required")
+    if len(body.queries) > SEARCH_API_MAX_QUERIES:
+        raise HTTPException(
+            status_code=413,
+            detail=f"At most {SEARCH_API_MAX_QUERIES} queries are allowed per request",
+        )
+    limit = body.limit
+    if limit is not None and not 1 <= limit <= SEARCH_API_MAX_LIMIT:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Limit must be between 1 and {SEARCH_API_MAX_LIMIT}",
+        )
+
+    try:
+        hit_lists = execute_batch_search(
+            request.app.state.db_path,
+            library_id,
+            body.queries,
+            limit,
+            data_dir=getattr(request.app.state, "data_dir", None),
+        )
+    except SearchLibraryNotFoundError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except SearchNotReadyError as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
+    except SearchConnectionError as exc:
+        raise HTTPException(status_code=503, detail=str(exc)) from exc
+    except SearchModelError as exc:
+        raise HTTPException(status_code=503, detail=str(exc)) from exc
+    except SearchExecutionError as exc:
+        raise HTTPException(status_code=502, detail=str(exc)) from exc
+
+    return {
+        "library_id": library_id,
+        "results": [
+            {
+                "query": query,
+                "hits": [_hit_payload(hit) for hit in hits],
+            }
+            for query, hits in zip(body.queries, hit_lists)
+        ],
+    }
+
+
+@router.get("/api/libraries/{library_id}/autocomplete")
+def autocomplete(
+    request: Request,
+    library_id: int,
+    q: str = "",
+    limit: int | None = None,
+    _: str = Depends(require_login),
+):
+    if limit is not None and not 1 <= limit <= AUTOCOMPLETE_MAX_LIMIT:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Limit must be between 1 and {AUTOCOMPLETE_MAX_LIMIT}",
+        )
+
+    try:
+        suggestions = execute_autocomplete(
+            request.app.state.db_path,
+            library_id,
+            q,
+            limit,
+            data_dir=getattr(request.app.state, "data_dir", None),
+        )
+    except SearchLibraryNotFoundError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except SearchNotReadyError as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
+
+    return {
+        "library_id": library_id,
+        "query": q,
+        "suggestions": [{"id": item["id"], "name": item["name"]} for item in suggestions],
+    }
@@ -1,11 +1,14 @@
+import asyncio
+import os
 from pathlib import Path
 from threading import Thread
 from urllib.parse import urlencode
 
-from fastapi import APIRouter, Depends, Form, HTTPException, Request
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi import APIRouter, Depends, Form, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import HTMLResponse, RedirectResponse, StreamingResponse
 
-from game_web.auth_guard import require_login_redirect
+from game_web.auth_guard import require_login, require_login_redirect
 from game_web.csrf import require_csrf
 from game_web.db import connect_db
 from game_web.routes.library import _active_profile_is_valid, _get_meili_health_for_request
@@ -19,6 +22,12 @@ from game_web.services.job_service import get_job, list_jobs
 
 router = APIRouter()
 
+JOB_LOG_TAIL_BYTES = 200 * 1024
+JOB_LOG_STREAM_CHUNK_BYTES = 64 * 1024
+JOB_LOG_STREAM_POLL_SECONDS = 0.5
+JOB_LOG_STREAM_KEEPALIVE_POLLS = 30
+ACTIVE_JOB_STATUSES = ("queued", "running")
+
 
 def _redirect_with_message(path: str, *, notice: str | None = None, error: str | None = None) -> RedirectResponse:
     params = {}
@@ -31,6 +40,142 @@ def _redirect_with_message(path: str, *, notice: str | None = None, error: str |
     return RedirectResponse(path, status_code=302)
 
 
+def _resolve_job_log_path(request: Request, job: dict) -> Path | None:
+    """Return the job's log path, or raise 404 when it escapes the jobs directory."""
+    if not job.get("log_path"):
+        return None
+    data_dir = resolve_data_dir(
+        getattr(request.app.state, "data_dir", None),
+        request.app.state.db_path,
+    )
+    base_dir = resolve_jobs_dir(data_dir)
+    log_path = Path(job["log_path"])
+    if log_path.is_absolute():
+        log_path = log_path.resolve()
+    else:
+        log_path = (data_dir / log_path).resolve()
+    if log_path != base_dir and base_dir not in log_path.parents:
+        raise HTTPException(status_code=404)
+    if log_path.exists() and not log_path.is_file():
+        raise HTTPException(status_code=404)
+    return log_path
+
+
+def _read_log_tail(log_path: Path, max_bytes: int) -> tuple[str, int]:
+    """Read the last ``max_bytes`` of a log, starting on a line boundary.
+
+    Returns the text and the byte offset where a live tail should continue.
+    """
+    with open(log_path, "rb") as handle:
+        size = handle.seek(0, 2)
+        start = max(0, size - max_bytes)
+        handle.seek(start)
+        data = handle.read(size - start)
+    if start > 0:
+        newline = data.find(b"\n")
+        data = data[newline + 1 :] if newline >= 0 else b""
+    return data.decode("utf-8", errors="replace"), size
+
+
+def _load_job(db_path: str, job_id: int) -> dict | None:
+    conn = connect_db(db_path)
+    try:
+        return get_job(conn, job_id)
+    finally:
+        conn.close()
+
+
+def _job_status(db_path: str, job_id: int) -> str | None:
+    job = _load_job(db_path, job_id)
+    return job["status"] if job is not None else None
+
+
+def _was_rotated(handle, log_path: Path, position: int) -> bool:
+    try:
+        current = log_path.stat()
+    except FileNotFoundError:
+        return False
+    return current.st_ino != os.fstat(handle.fileno()).st_ino or current.st_size < position
+
+
+def _open_at(log_path: Path, position: int):
+    """Open a log at ``position``, clamped to its end.
+
+    An offset past the end (a reconnect after the file was rotated or
+    truncated) continues from the current tail instead of replaying the log.
+    """
+    handle = open(log_path, "rb")
+    size = handle.seek(0, 2)
+    position = min(position, size)
+    handle.seek(position)
+    return handle, position
+
+
+async def _stream_job_log(request: Request, db_path: str, job_id: int, log_path: Path | None, offset: int):
+    """Yield SSE events for lines appended to a job log after ``offset``.
+
+    Memory stays bounded by one read chunk plus one partial line. The stream
+    ends with an ``end`` event once the job is no longer queued or running and
+    the file has been read to its end, or as soon as the client disconnects.
+    After a rotation the old file is read to its end before following the new
+    one from the start; an ``offset`` past the end of the file resumes at its
+    tail. A queued job has no log path until it is claimed, so
+    the job row is re-read while the path is unknown. Waiting never holds a threadpool worker; file and
+    database reads are handed to the pool one at a time.
+    """
+    position = offset
+    partial = b""
+    handle = None
+    draining = False
+    idle_polls = 0
+    try:
+        while True:
+            if await request.is_disconnected():
+                return
+            if handle is None and log_path is not None and await run_in_threadpool(log_path.exists):
+                handle, position = await run_in_threadpool(_open_at, log_path, position)
+            chunk = await run_in_threadpool(handle.read, JOB_LOG_STREAM_CHUNK_BYTES) if handle is not None else b""
+            if chunk:
+                lines = (partial + chunk).split(b"\n")
+                partial = lines.pop()
+                for line in lines:
+                    position += len(line) + 1
+                    text = line.decode("utf-8", errors="replace")
+                    yield f"id: {position}\ndata: {text}\n\n"
+                continue
+            if handle is not None and await run_in_threadpool(_was_rotated, handle, log_path, position):
+                handle.close()
+                handle = None
+                position = 0
+                partial = b""
+                continue
+            if log_path is None:
+                job = await run_in_threadpool(_load_job, db_path, job_id)
+                if job is not None and job.get("log_path"):
+                    try:
+                        log_path = _resolve_job_log_path(request, job)
+                    except HTTPException:
+                        yield "event: end\ndata: missing\n\n"
+                        return
+                    continue
+            status = await run_in_threadpool(_job_status, db_path, job_id)
+            if status not in ACTIVE_JOB_STATUSES:
+                # Logs are flushed before the status changes; read once more
+                # so lines written just before the transition are not lost.
+                if draining:
+                    yield f"event: end\ndata: {status or 'missing'}\n\n"
+                    return
+                draining = True
+                continue
+            idle_polls += 1
+            if idle_polls % JOB_LOG_STREAM_KEEPALIVE_POLLS == 0:
+                yield ": keep-alive\n\n"
+            await asyncio.sleep(JOB_LOG_STREAM_POLL_SECONDS)
+    finally:
+        if handle is not None:
+            handle.close()
+
+
 @router.get("/jobs", response_class=HTMLResponse)
 def jobs_page(request: Request, _: str = Depends(require_login_redirect)):
     conn = connect_db(request.app.state.db_path)
@@ -80,25 +225,10 @@ def job_detail(request: Request, job_id: int, _: str = Depends(require_login_red
         )
 
     log_text = None
-    if job.get("log_path"):
-        data_dir = resolve_data_dir(
-            getattr(request.app.state, "data_dir", None),
-            request.app.state.db_path,
-        )
-        base_dir = resolve_jobs_dir(data_dir)
-        log_path = Path(job["log_path"])
-        if log_path.is_absolute():
-            log_path = log_path.resolve()
-        else:
-            log_path = (data_dir / log_path).resolve()
-        if log_path != base_dir and base_dir not in log_path.parents:
-            raise HTTPException(status_code=404)
-        if log_path.exists() and not log_path.is_file():
-            raise HTTPException(status_code=404)
-        if log_path.exists():
-            max_bytes = 200 * 1024
-            with open(log_path, "rb") as handle:
-                log_text = handle.read(max_bytes).decode("utf-8", errors="replace")
+    log_offset = 0
+    log_path = _resolve_job_log_path(request, job)
+    if log_path is not None and log_path.exists():
+        log_text, log_offset = _read_log_tail(log_path, JOB_LOG_TAIL_BYTES)
 
     templates = request.app.state.templates
     return templates.TemplateResponse(
@@ -110,11 +240,54 @@ def job_detail(request: Request, job_id: int, _: str = Depends(require_login_red
             "library": library,
             "library_status": library_status,
             "log_text": log_text,
+            "log_offset": log_offset,
             "show_nav": True,
         },
     )
 
 
+@router.get("/jobs/{job_id}/log/stream")
+def job_log_stream(
+    request: Request,
+    job_id: int,
+    offset: int = Query(0, ge=0),
+    _: str = Depends(require_login),
+):
+    conn = connect_db(request.app.state.db_path)
+    try:
+        job = get_job(conn, job_id)
+    finally:
+        conn.close()
+    if job is None:
+        raise HTTPException(status_code=404)
+    log_path = _resolve_job_log_path(request, job)
+    last_event_id = request.headers.get("last-event-id", "")
+    if last_event_id.isdigit():
+        offset = int(last_event_id)
+    return StreamingResponse(
+        _stream_job_log(request, request.app.state.db_path, job_id, log_path, offset),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/jobs/{job_id}/progress")
+def job_progress(request: Request, job_id: int, _: str = Depends(require_login)):
+    conn = connect_db(request.app.state.db_path)
+    try:
+        job = get_job(conn, job_id)
+    finally:
+        conn.close()
+    if job is None:
+        raise HTTPException(status_code=404)
+    return {
+        "id": job["id"],
+        "status": job["status"],
+        "updated_at": job["updated_at"],
+        "progress": job["progress"],
+    }
+
+
 @router.post("/jobs/run")
 def run_next_job(
     request: Request,
@@ -4,6 +4,7 @@ from urllib.parse import urlencode
 from fastapi import APIRouter, Depends, Form, HTTPException, Request
 from fastapi.responses import HTMLResponse, RedirectResponse
 
+from game_semantic.config import BACKEND_TORCH, EMBEDDER_BACKENDS, RERANK_MODES
 from game_web.auth_guard import require_login_redirect
 from game_web.csrf import require_csrf
 from game_web.db import connect_db
@@ -15,6 +16,7 @@ from game_web.services.library_service import create_library, delete_library, li
 from game_web.services.library_status import derive_library_status
 from game_web.services.meili_health_service import get_meili_health
 from game_web.services.settings_service import get_setting
+from game_web.services.vector_projection import profile_vector_dims
 
 router = APIRouter()
 
@@ -28,7 +30,13 @@ def _active_profile_is_valid(profile: dict) -> bool:
         max_length = int(profile.get("max_length", 0))
     except (TypeError, ValueError):
         return False
-    return use_fp16 in (0, 1) and max_length > 0
+    backend = profile.get("backend") or BACKEND_TORCH
+    if profile.get("vector_dims") and not profile_vector_dims(profile):
+        return False
+    rerank_mode = profile.get("rerank_mode") or ""
+    if rerank_mode and (rerank_mode not in RERANK_MODES or backend != BACKEND_TORCH):
+        return False
+    return use_fp16 in (0, 1) and max_length > 0 and backend in EMBEDDER_BACKENDS
 
 
 def _get_meili_health_for_request(conn, request: Request):
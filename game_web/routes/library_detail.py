@@ -5,12 +5,13 @@ from urllib.parse import urlencode
 from fastapi import APIRouter, Depends, File, Form, HTTPException, Request, UploadFile
 from fastapi.responses import HTMLResponse, RedirectResponse
 
+from game_semantic.config import EMBEDDER_BACKENDS, RERANK_MODES
 from game_web.auth_guard import require_login_redirect
 from game_web.csrf import require_csrf
 from game_web.db import connect_db
 from game_web.routes.library import _active_profile_is_valid, _get_meili_health_for_request
 from game_web.runtime import resolve_data_dir
-from game_web.services.dataset_service import UploadTooLarge, save_upload
+from game_web.services.dataset_service import UnsupportedUpload, UploadTooLarge, save_upload
 from game_web.services.embedding_profile import get_active_profile, upsert_active_profile
 from game_web.services import job_service
 from game_web.services.library_service import get_library
@@ -45,6 +46,9 @@ def _library_detail_context(conn, request: Request, library_id: int) -> dict | N
         "active_profile": active_profile,
         "library_status": library_status,
         "recent_build": recent_build,
+        "latest_dataset": latest_dataset,
+        "embedder_backends": EMBEDDER_BACKENDS,
+        "rerank_modes": RERANK_MODES,
         "show_nav": True,
     }
 
@@ -130,18 +134,50 @@ def dataset_upload(
         dataset_id = dataset.get("id")
         if dataset_id is None:
             raise HTTPException(status_code=500)
-        job_service.create_job(
-            conn,
-            library_id=library_id,
-            dataset_id=int(dataset_id),
-            job_type="build",
-            status="queued",
-            commit=False,
+        input_fingerprint = job_service.build_input_fingerprint(
+            content_sha256=dataset.get("content_sha256"),
+            index_uid=library["index_uid"],
+            profile=get_active_profile(conn, library_id),
         )
-        job_service.supersede_queued_jobs(conn, library_id)
+        satisfied_by = job_service.find_satisfying_build_job(conn, library_id, input_fingerprint)
+        if satisfied_by is not None:
+            # Same bytes and same embedding inputs as the index already holds.
+            job_id = job_service.create_job(
+                conn,
+                library_id=library_id,
+                dataset_id=int(dataset_id),
+                job_type="build",
+                status="done",
+                commit=False,
+                input_fingerprint=input_fingerprint,
+            )
+            job_service.update_job_progress(
+                conn,
+                job_id,
+                job_service.reused_build_progress(dataset, int(satisfied_by["id"])),
+                commit=False,
+            )
+            job_service.supersede_queued_jobs(conn, library_id, keep_newest=False)
+            conn.commit()
+            notice = f"Dataset unchanged since job {satisfied_by['id']}; rebuild skipped"
+        else:
+            job_service.create_job(
+                conn,
+                library_id=library_id,
+                dataset_id=int(dataset_id),
+                job_type="build",
+                status="queued",
+                commit=False,
+                input_fingerprint=input_fingerprint,
+            )
+            job_service.supersede_queued_jobs(conn, library_id)
+            notice = "Build job queued"
     except UploadTooLarge:
         conn.rollback()
         return render_error("Upload too large", status_code=413)
+    except UnsupportedUpload as exc:
+        conn.rollback()
+        return render_error(str(exc))
     except Exception:
         conn.rollback()
         if dataset is not None:
@@ -159,7 +195,7 @@ def dataset_upload(
             pass
         conn.close()
 
-    return _redirect_with_notice(f"/libraries/{library_id}", "Build job queued")
+    return _redirect_with_notice(f"/libraries/{library_id}", notice)
 
 
 @router.post("/libraries/{library_id}/search-config")
@@ -170,6 +206,13 @@ def update_search_config(
     model_name: str = Form(""),
     use_fp16: str = Form("0"),
     max_length: str = Form("128"),
+    semantic_ratio: str | None = Form(None),
+    backend: str | None = Form(None),
+    vector_dims: str | None = Form(None),
+    rerank_mode: str | None = Form(None),
+    rerank_candidates: str | None = Form(None),
+    rerank_encode_budget: str | None = Form(None),
+    adaptive_batching: str | None = Form(None),
     csrf_token: str = Form(""),
 ):
     require_csrf(request, csrf_token)
@@ -206,6 +249,15 @@ def update_search_config(
                 model_name=model_name,
                 use_fp16=int(use_fp16),
                 max_length=int(max_length),
+                semantic_ratio=semantic_ratio.strip() if semantic_ratio is not None else None,
+                backend=backend,
+                vector_dims=(vector_dims.strip() or 0) if vector_dims is not None else None,
+                rerank_mode=rerank_mode,
+                rerank_candidates=(rerank_candidates.strip() or 50) if rerank_candidates is not None else None,
+                rerank_encode_budget=(
+                    (rerank_encode_budget.strip() or 32) if rerank_encode_budget is not None else None
+                ),
+                adaptive_batching=(adaptive_batching.strip() or 0) if adaptive_batching is not None else None,
                 commit=False,
             )
         except ValueError as exc:
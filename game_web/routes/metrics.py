@@ -0,0 +1,52 @@
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import HTMLResponse, PlainTextResponse
+
+from game_semantic.metrics import JOB_QUEUE_DEPTH, REGISTRY
+from game_web.auth_guard import require_login_or_metrics_token, require_login_redirect
+from game_web.db import connect_db
+from game_web.services.job_service import count_queued_jobs
+from game_web.services.search_cache import get_search_cache
+
+router = APIRouter()
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _render_search_cache_metrics() -> str:
+    stats = get_search_cache().stats()
+    lines = []
+    for name, kind, key, documentation in (
+        ("game_search_cache_hits_total", "counter", "hits", "Search result cache hits."),
+        ("game_search_cache_misses_total", "counter", "misses", "Search result cache misses."),
+        ("game_search_cache_hit_ratio", "gauge", "hit_ratio", "Search result cache hit ratio."),
+        ("game_search_cache_bytes", "gauge", "bytes", "Bytes held by the search result cache."),
+    ):
+        lines.append(f"# HELP {name} {documentation}")
+        lines.append(f"# TYPE {name} {kind}")
+        lines.append(f"{name} {stats[key]}")
+    return "\n".join(lines) + "\n"
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+def prometheus_metrics(request: Request, _: str = Depends(require_login_or_metrics_token)):
+    conn = connect_db(request.app.state.db_path)
+    try:
+        JOB_QUEUE_DEPTH.set(count_queued_jobs(conn))
+    finally:
+        conn.close()
+    body = REGISTRY.render() + _render_search_cache_metrics()
+    return PlainTextResponse(body, media_type=PROMETHEUS_CONTENT_TYPE)
+
+
+@router.get("/admin/metrics", response_class=HTMLResponse)
+def admin_metrics_page(request: Request, _: str = Depends(require_login_redirect)):
+    templates = request.app.state.templates
+    return templates.TemplateResponse(
+        request,
+        "admin_metrics.html",
+        {
+            "request": request,
+            "search_cache": get_search_cache().stats(),
+            "show_nav": True,
+        },
+    )
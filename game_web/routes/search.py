@@ -1,3 +1,5 @@
+from urllib.parse import urlencode
+
 from fastapi import APIRouter, Depends, Request
 from fastapi.responses import HTMLResponse
 
@@ -13,11 +15,24 @@ from game_web.services.search_executor import (
     SearchExecutionError,
     SearchModelError,
     SearchNotReadyError,
-    execute_search,
+    execute_search_page,
 )
 
 router = APIRouter()
 
+# `library` value of the search form that fans the query out to every searchable library.
+ALL_LIBRARIES = "all"
+SEARCH_PAGE_SIZE = 10
+
+
+def _page_href(library: str, query_text: str, offset: int, cursor: str | None) -> str:
+    params = {"library": library, "q": query_text}
+    if offset:
+        params["offset"] = offset
+    if cursor:
+        params["cursor"] = cursor
+    return f"/search?{urlencode(params)}"
+
 
 def _searchable_libraries(conn, request: Request) -> list[dict]:
     meili_health = _get_meili_health_for_request(conn, request)
@@ -44,10 +59,13 @@ def search_page(
     _: str = Depends(require_login_redirect),
     library: str | None = None,
     q: str | None = None,
+    offset: int = 0,
+    cursor: str | None = None,
 ):
     query_text = (q or "").strip()
     library_id = None
-    if library:
+    search_all = library == ALL_LIBRARIES
+    if library and not search_all:
         try:
             library_id = int(library)
         except ValueError:
@@ -60,15 +78,26 @@ def search_page(
 
     results = []
     error_message = None
-    searched = bool(library_id is not None and query_text)
-    if searched and library_id is not None:
+    next_href = None
+    prev_href = None
+    offset = max(offset, 0)
+    searched = bool((library_id is not None or search_all) and query_text)
+    if searched:
         try:
-            results = execute_search(
+            page = execute_search_page(
                 request.app.state.db_path,
-                library_id,
+                None if search_all else library_id,
                 query_text,
+                offset=offset,
+                limit=SEARCH_PAGE_SIZE,
+                cursor=cursor,
                 data_dir=getattr(request.app.state, "data_dir", None),
             )
+            results = page.hits
+            if page.has_more:
+                next_href = _page_href(library, query_text, offset + SEARCH_PAGE_SIZE, page.cursor)
+            if offset:
+                prev_href = _page_href(library, query_text, max(offset - SEARCH_PAGE_SIZE, 0), page.cursor)
         except SearchNotReadyError as exc:
             error_message = str(exc)
         except SearchConnectionError as exc:
@@ -88,8 +117,11 @@ def search_page(
             "results": results,
             "searched": searched,
             "error_message": error_message,
-            "selected_library": library_id,
+            "selected_library": ALL_LIBRARIES if search_all else library_id,
+            "all_libraries": ALL_LIBRARIES,
             "query": query_text,
+            "next_href": next_href,
+            "prev_href": prev_href,
             "show_nav": True,
         },
     )
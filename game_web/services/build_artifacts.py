@@ -0,0 +1,54 @@
+import logging
+from pathlib import Path
+
+from game_web.services.prefix_index_store import close_prefix_index
+from game_web.services.rerank_store import close_rerank_store
+from game_web.services.vector_projection import clear_projection_cache
+
+# Directories under data_dir holding per-build files named library-<id>-<key>.<ext>
+# (see projection_path, rerank_store_path and prefix_index_path).
+BUILD_ARTIFACT_DIRS = ("projections", "rerank", "prefix")
+
+logger = logging.getLogger(__name__)
+
+
+def _artifact_key(path: Path, library_id: int) -> str | None:
+    prefix = f"library-{library_id}-"
+    if not path.name.startswith(prefix):
+        return None
+    # Keys never contain dots; sqlite side files (-wal, -shm) share their database's key.
+    return path.name[len(prefix) :].split(".", 1)[0]
+
+
+def prune_build_artifacts(data_dir: Path, library_id: int, keep_keys: set[str]) -> list[Path]:
+    """Delete a library's build artifacts whose key is not in ``keep_keys``; return the removed paths.
+
+    Shared handles on removed stores and indexes are closed first. Files that
+    cannot be removed are logged and left for the next prune.
+    """
+    removed = []
+    for directory in BUILD_ARTIFACT_DIRS:
+        root = Path(data_dir) / directory
+        if not root.is_dir():
+            continue
+        for path in sorted(root.glob(f"library-{library_id}-*")):
+            key = _artifact_key(path, library_id)
+            if key is None or key in keep_keys or not path.is_file():
+                continue
+            handle_path = Path(str(path).removesuffix("-wal").removesuffix("-shm"))
+            close_rerank_store(handle_path)
+            close_prefix_index(handle_path)
+            try:
+                path.unlink()
+            except OSError:
+                logger.warning("Could not remove stale build artifact %s", path, exc_info=True)
+                continue
+            removed.append(path)
+    if removed:
+        clear_projection_cache()
+    return removed
+
+
+def delete_library_artifacts(data_dir: Path, library_id: int) -> list[Path]:
+    """Delete every build artifact of a library."""
+    return prune_build_artifacts(data_dir, library_id, set())
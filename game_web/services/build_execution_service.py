@@ -1,13 +1,26 @@
+import time
 from pathlib import Path
 from typing import Any, Callable
 
-from game_semantic.config import Config
+from game_semantic.config import BACKEND_TORCH, EMBEDDER_BACKENDS, RERANK_MODES, Config
 from game_semantic.service import build_index
 from game_web.db import connect_db
 from game_web.secrets import decrypt_secret
+from game_web.services.build_artifacts import prune_build_artifacts
 from game_web.services.embedding_profile import get_active_profile
+from game_web.services.job_service import (
+    build_input_fingerprint,
+    find_satisfying_build_job,
+    list_running_build_jobs,
+    reused_build_progress,
+    set_job_input_fingerprint,
+    update_job_progress,
+)
 from game_web.services.library_service import get_library
+from game_web.services.prefix_index_store import prefix_index_path
+from game_web.services.rerank_store import rerank_store_path
 from game_web.services.settings_service import get_setting
+from game_web.services.vector_projection import build_artifact_key, profile_vector_dims, projection_path
 
 
 def _get_job_dataset(conn: Any, dataset_id: int) -> dict[str, Any] | None:
@@ -18,7 +31,10 @@ def _get_job_dataset(conn: Any, dataset_id: int) -> dict[str, Any] | None:
             filename,
             storage_path,
             size_bytes,
-            created_at
+            created_at,
+            line_count,
+            unique_line_count,
+            content_sha256
         from dataset
         where id = ?
         """,
@@ -34,6 +50,9 @@ def _get_job_dataset(conn: Any, dataset_id: int) -> dict[str, Any] | None:
         "storage_path": row[3],
         "size_bytes": row[4],
         "created_at": row[5],
+        "line_count": row[6],
+        "unique_line_count": row[7],
+        "content_sha256": row[8],
     }
 
 
@@ -44,7 +63,44 @@ def _resolve_owned_dataset_path(data_dir: Path, storage_path: str) -> Path:
     return candidate
 
 
-def _normalize_profile(profile: dict[str, Any]) -> tuple[str, bool, int]:
+PROGRESS_PERSIST_INTERVAL_SECONDS = 1.0
+
+
+def _make_progress_reporter(
+    db_path: str,
+    job_id: int,
+    log: Callable[[str], None],
+    *,
+    clock: Callable[[], float] = time.monotonic,
+) -> Callable[[Any], None]:
+    """Stream per-batch build telemetry to the job log and the job row.
+
+    Every batch is logged; the structured snapshot on the job row is written at
+    most once per PROGRESS_PERSIST_INTERVAL_SECONDS, plus the final batch.
+    """
+    last_persisted = [None]
+
+    def report(progress: Any) -> None:
+        log(progress.format_line())
+        now = clock()
+        finished = progress.finished
+        if (
+            not finished
+            and last_persisted[0] is not None
+            and now - last_persisted[0] < PROGRESS_PERSIST_INTERVAL_SECONDS
+        ):
+            return
+        last_persisted[0] = now
+        conn = connect_db(db_path)
+        try:
+            update_job_progress(conn, job_id, progress.to_dict())
+        finally:
+            conn.close()
+
+    return report
+
+
+def _normalize_profile(profile: dict[str, Any]) -> tuple[str, bool, int, str]:
     model_name = str(profile.get("model_name", "")).strip()
     if not model_name:
         raise RuntimeError("Active search configuration is invalid: model name is blank")
@@ -63,7 +119,34 @@ def _normalize_profile(profile: dict[str, Any]) -> tuple[str, bool, int]:
     if max_length <= 0:
         raise RuntimeError("Active search configuration is invalid: max_length")
 
-    return model_name, bool(use_fp16_value), max_length
+    backend = str(profile.get("backend") or BACKEND_TORCH)
+    if backend not in EMBEDDER_BACKENDS:
+        raise RuntimeError("Active search configuration is invalid: backend")
+    if profile.get("vector_dims") and not profile_vector_dims(profile):
+        raise RuntimeError("Active search configuration is invalid: vector_dims")
+    rerank_mode = str(profile.get("rerank_mode") or "")
+    if rerank_mode and (rerank_mode not in RERANK_MODES or backend != BACKEND_TORCH):
+        raise RuntimeError("Active search configuration is invalid: rerank_mode")
+
+    return model_name, bool(use_fp16_value), max_length, backend
+
+
+def _prune_stale_artifacts(db_path: str, data_dir: Path, job: dict[str, Any], input_fingerprint: str | None, log) -> None:
+    """Remove the library's artifacts from earlier builds, keeping this one's and any running build's."""
+    library_id = int(job["library_id"])
+    conn = connect_db(db_path)
+    try:
+        running = list_running_build_jobs(conn, library_id)
+    finally:
+        conn.close()
+    keep = {build_artifact_key(job_id=int(job["id"]), input_fingerprint=input_fingerprint)}
+    keep.update(
+        build_artifact_key(job_id=int(other["id"]), input_fingerprint=other.get("input_fingerprint"))
+        for other in running
+    )
+    removed = prune_build_artifacts(data_dir, library_id, keep)
+    if removed:
+        log(f"Removed {len(removed)} stale build artifact file(s)")
 
 
 def execute_build_job(*, db_path: str, data_dir: Path, job: dict[str, Any], log: Callable[[str], None]) -> None:
@@ -88,10 +171,33 @@ def execute_build_job(*, db_path: str, data_dir: Path, job: dict[str, Any], log:
 
     meili_api_key = decrypt_secret(data_dir, encrypted_api_key or "") if encrypted_api_key else ""
 
-    model_name, use_fp16, max_length = _normalize_profile(active_profile)
+    model_name, use_fp16, max_length, backend = _normalize_profile(active_profile)
     txt_path = _resolve_owned_dataset_path(data_dir, str(dataset["storage_path"]))
 
     log(f"Resolved dataset {dataset['filename']} for job {job['id']}")
+
+    input_fingerprint = build_input_fingerprint(
+        content_sha256=dataset.get("content_sha256"),
+        index_uid=str(library["index_uid"]),
+        profile=active_profile,
+    )
+    conn = connect_db(db_path)
+    try:
+        set_job_input_fingerprint(conn, int(job["id"]), input_fingerprint)
+        satisfied_by = find_satisfying_build_job(
+            conn,
+            int(job["library_id"]),
+            input_fingerprint,
+            exclude_job_id=int(job["id"]),
+        )
+        if satisfied_by is not None:
+            update_job_progress(conn, int(job["id"]), reused_build_progress(dataset, int(satisfied_by["id"])))
+    finally:
+        conn.close()
+    if satisfied_by is not None:
+        log(f"Dataset and search configuration match job {satisfied_by['id']}; skipping rebuild")
+        _prune_stale_artifacts(db_path, data_dir, job, input_fingerprint, log)
+        return
     log(f"Running rebuild for library {library['index_uid']}")
 
     build_index(
@@ -103,8 +209,41 @@ def execute_build_job(*, db_path: str, data_dir: Path, job: dict[str, Any], log:
             bge_model_name=model_name,
             bge_use_fp16=use_fp16,
             embedding_max_length=max_length,
+            embedder_backend=backend,
+            vector_dims=profile_vector_dims(active_profile),
+            projection_path=str(
+                projection_path(
+                    data_dir,
+                    int(library["id"]),
+                    job_id=int(job["id"]),
+                    input_fingerprint=input_fingerprint,
+                )
+            ),
+            rerank_mode=str(active_profile.get("rerank_mode") or ""),
+            rerank_store_path=str(
+                rerank_store_path(
+                    data_dir,
+                    int(library["id"]),
+                    job_id=int(job["id"]),
+                    input_fingerprint=input_fingerprint,
+                )
+            ),
+            prefix_index_path=str(
+                prefix_index_path(
+                    data_dir,
+                    int(library["id"]),
+                    job_id=int(job["id"]),
+                    input_fingerprint=input_fingerprint,
+                )
+            ),
             txt_path=str(txt_path),
-        )
+            # The live index belongs to the library, not to one build's inputs.
+            settings_state_path=str(Path(data_dir) / "meili_settings" / f"library-{int(library['id'])}.json"),
+            adaptive_batching=bool(active_profile.get("adaptive_batching", Config.adaptive_batching)),
+        ),
+        progress=_make_progress_reporter(db_path, int(job["id"]), log),
+        expected_docs=dataset.get("unique_line_count"),
     )
 
+    _prune_stale_artifacts(db_path, data_dir, job, input_fingerprint, log)
     log(f"Build completed for job {job['id']}")
@@ -1,21 +1,137 @@
+import codecs
 import datetime
+import gzip
+import hashlib
 import io
 from pathlib import Path
 from typing import Any
 
-UPLOAD_MAX_BYTES = 10 * 1024 * 1024
-UPLOAD_CHUNK_SIZE = 64 * 1024
+from game_semantic.hashset import HashSet64
+
+try:  # optional: only needed for .zst uploads
+    import zstandard
+except ImportError:  # pragma: no cover - depends on environment
+    zstandard = None
+
+UPLOAD_MAX_BYTES = 2 * 1024 * 1024 * 1024
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+COMPRESSED_SUFFIXES = (".gz", ".zst")
 
 
 class UploadTooLarge(Exception):
     pass
 
 
+class UnsupportedUpload(Exception):
+    pass
+
+
+class _PrefixedReader:
+    """Replay bytes already read for format sniffing before the rest of a stream."""
+
+    def __init__(self, prefix: bytes, file_obj: Any):
+        self._prefix = prefix
+        self._file_obj = file_obj
+
+    def read(self, size: int = -1) -> bytes:
+        if self._prefix:
+            if size is None or size < 0:
+                data, self._prefix = self._prefix + self._file_obj.read(), b""
+                return data
+            data, self._prefix = self._prefix[:size], self._prefix[size:]
+            if len(data) < size:
+                data += self._file_obj.read(size - len(data))
+            return data
+        return self._file_obj.read(size)
+
+
+def _open_decompressed(file_obj: Any) -> Any:
+    """Return a reader of the upload's plain bytes, sniffing gzip/zstd by magic number."""
+    head = file_obj.read(len(ZSTD_MAGIC))
+    source = _PrefixedReader(head, file_obj)
+    if head.startswith(GZIP_MAGIC):
+        return gzip.GzipFile(fileobj=source, mode="rb")
+    if head.startswith(ZSTD_MAGIC):
+        if zstandard is None:
+            raise UnsupportedUpload("zstd uploads require the optional 'zstandard' package")
+        return zstandard.ZstdDecompressor().stream_reader(source, read_across_frames=True)
+    return source
+
+
+class _DatasetStats:
+    """Line count, unique-line count and SHA-256 computed while the upload is written.
+
+    Lines are read the way the index builder reads them: strict UTF-8 with
+    universal newlines, stripped, with blank lines ignored. An upload the
+    builder could not decode is rejected here instead of failing the build.
+    Unique lines are tracked in the same 64-bit hash set the build uses, so
+    the count matches what will be indexed.
+    """
+
+    def __init__(self):
+        self._sha256 = hashlib.sha256()
+        self._decoder = io.IncrementalNewlineDecoder(
+            codecs.getincrementaldecoder("utf-8")(errors="strict"), translate=True
+        )
+        self._partial = ""
+        self._seen = HashSet64()
+        self.line_count = 0
+
+    def update(self, chunk: bytes) -> None:
+        self._sha256.update(chunk)
+        self._add_text(self._decode(chunk, final=False))
+
+    def finish(self) -> None:
+        self._add_text(self._decode(b"", final=True))
+        if self._partial:
+            self._add_line(self._partial)
+            self._partial = ""
+
+    def _decode(self, chunk: bytes, final: bool) -> str:
+        try:
+            return self._decoder.decode(chunk, final=final)
+        except UnicodeDecodeError as exc:
+            raise UnsupportedUpload("Upload is not valid UTF-8 text") from exc
+
+    def _add_text(self, text: str) -> None:
+        lines = (self._partial + text).split("\n")
+        self._partial = lines.pop()
+        for line in lines:
+            self._add_line(line)
+
+    def _add_line(self, line: str) -> None:
+        name = line.strip()
+        if not name:
+            return
+        self.line_count += 1
+        self._seen.add_name(name)
+
+    @property
+    def unique_line_count(self) -> int:
+        return len(self._seen)
+
+    @property
+    def content_sha256(self) -> str:
+        return self._sha256.hexdigest()
+
+
 def _safe_filename(filename: str) -> str:
     name = Path(filename).name
     return name or "upload.bin"
 
 
+def _stored_filename(filename: str) -> str:
+    """Drop a compression suffix, since uploads are stored decompressed."""
+    name = _safe_filename(filename)
+    for suffix in COMPRESSED_SUFFIXES:
+        if name.lower().endswith(suffix) and len(name) > len(suffix):
+            return name[: -len(suffix)]
+    return name
+
+
 def _unique_path(directory: Path, filename: str) -> Path:
     candidate = directory / filename
     if not candidate.exists():
@@ -30,25 +146,34 @@ def _unique_path(directory: Path, filename: str) -> Path:
         counter += 1
 
 
-def _write_stream(path: Path, file_obj: Any) -> int:
+def _write_stream(path: Path, file_obj: Any, stats: _DatasetStats | None = None) -> int:
     bytes_written = 0
     try:
         with open(path, "wb") as handle:
+            reader = _open_decompressed(file_obj)
             while True:
-                chunk = file_obj.read(UPLOAD_CHUNK_SIZE)
+                chunk = reader.read(UPLOAD_CHUNK_SIZE)
                 if not chunk:
                     break
                 bytes_written += len(chunk)
                 if bytes_written > UPLOAD_MAX_BYTES:
                     raise UploadTooLarge()
                 handle.write(chunk)
-    except UploadTooLarge:
+                if stats is not None:
+                    stats.update(chunk)
+        if stats is not None:
+            stats.finish()
+    except (UploadTooLarge, UnsupportedUpload):
         if path.exists():
             path.unlink()
         raise
-    except OSError:
+    except Exception as exc:
         if path.exists():
             path.unlink()
+        if isinstance(exc, (gzip.BadGzipFile, EOFError)) or (
+            zstandard is not None and isinstance(exc, zstandard.ZstdError)
+        ):
+            raise UnsupportedUpload("Compressed upload is corrupt") from exc
         raise
     return bytes_written
 
@@ -63,19 +188,38 @@ def save_upload(
 ) -> dict[str, Any]:
     uploads_dir = data_dir / "uploads" / str(library_id)
     uploads_dir.mkdir(parents=True, exist_ok=True)
-    safe_name = _safe_filename(filename)
+    safe_name = _stored_filename(filename)
     path = _unique_path(uploads_dir, safe_name)
-    size_bytes = _write_stream(path, file_obj)
+    stats = _DatasetStats()
+    size_bytes = _write_stream(path, file_obj, stats)
     now = datetime.datetime.now(datetime.timezone.utc).replace(microsecond=0)
     timestamp = now.isoformat()
     storage_path = str(path.relative_to(data_dir))
     try:
         cur = conn.execute(
             """
-            insert into dataset (library_id, filename, storage_path, size_bytes, created_at)
-            values (?, ?, ?, ?, ?)
+            insert into dataset (
+                library_id,
+                filename,
+                storage_path,
+                size_bytes,
+                created_at,
+                line_count,
+                unique_line_count,
+                content_sha256
+            )
+            values (?, ?, ?, ?, ?, ?, ?, ?)
             """,
-            (library_id, path.name, storage_path, size_bytes, timestamp),
+            (
+                library_id,
+                path.name,
+                storage_path,
+                size_bytes,
+                timestamp,
+                stats.line_count,
+                stats.unique_line_count,
+                stats.content_sha256,
+            ),
         )
         if commit:
             conn.commit()
@@ -90,6 +234,9 @@ def save_upload(
         "storage_path": storage_path,
         "size_bytes": size_bytes,
         "created_at": timestamp,
+        "line_count": stats.line_count,
+        "unique_line_count": stats.unique_line_count,
+        "content_sha256": stats.content_sha256,
         "path": path,
     }
 
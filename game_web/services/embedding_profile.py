@@ -1,6 +1,8 @@
 import datetime
 from typing import Any
 
+from game_semantic.config import BACKEND_TORCH, EMBEDDER_BACKENDS, RERANK_MODES, Config
+from game_semantic.rerank import mode_uses_colbert, mode_uses_sparse
 
 ACTIVE_PROFILE_KEY = "bge_m3"
 ACTIVE_PROFILE_VARIANT = "raw"
@@ -8,6 +10,16 @@ ACTIVE_PROFILE_ENABLED = 1
 DEFAULT_MODEL_NAME = "BAAI/bge-m3"
 DEFAULT_USE_FP16 = 0
 DEFAULT_MAX_LENGTH = 128
+DEFAULT_SEMANTIC_RATIO = 1.0
+DEFAULT_BACKEND = BACKEND_TORCH
+DEFAULT_VECTOR_DIMS = 0
+MAX_VECTOR_DIMS = 1024
+DEFAULT_RERANK_MODE = ""
+DEFAULT_RERANK_CANDIDATES = 50
+DEFAULT_RERANK_ENCODE_BUDGET = 32
+DEFAULT_ADAPTIVE_BATCHING = int(Config.adaptive_batching)
+# Meilisearch caps a search at maxTotalHits (1000 by default).
+MAX_RERANK_CANDIDATES = 1000
 
 
 def _row_to_profile(row: Any) -> dict[str, Any]:
@@ -21,6 +33,13 @@ def _row_to_profile(row: Any) -> dict[str, Any]:
         "variant": row[6],
         "enabled": row[7],
         "created_at": row[8],
+        "semantic_ratio": row[9],
+        "backend": row[10],
+        "vector_dims": row[11],
+        "rerank_mode": row[12],
+        "rerank_candidates": row[13],
+        "rerank_encode_budget": row[14],
+        "adaptive_batching": row[15],
     }
 
 
@@ -35,7 +54,14 @@ def _get_profile_row(conn: Any, library_id: int, key: str) -> dict[str, Any] | N
             max_length,
             variant,
             enabled,
-            created_at
+            created_at,
+            semantic_ratio,
+            backend,
+            vector_dims,
+            rerank_mode,
+            rerank_candidates,
+            rerank_encode_budget,
+            adaptive_batching
         from embedding_profile
         where library_id = ? and key = ?
         order by id
@@ -56,11 +82,13 @@ def _coerce_existing_int(value: Any) -> Any:
         return value
 
 
-def _normalized_existing_values(profile: dict[str, Any]) -> tuple[Any, Any, Any]:
+def _normalized_existing_values(profile: dict[str, Any]) -> tuple[Any, Any, Any, Any, Any]:
     return (
         str(profile.get("model_name", "")).strip(),
         _coerce_existing_int(profile.get("use_fp16")),
         _coerce_existing_int(profile.get("max_length")),
+        str(profile.get("backend") or DEFAULT_BACKEND),
+        _coerce_existing_int(profile.get("vector_dims") or DEFAULT_VECTOR_DIMS),
     )
 
 
@@ -91,11 +119,94 @@ def _normalize_max_length(max_length: Any) -> int:
     return normalized
 
 
+def _normalize_backend(backend: Any) -> str:
+    normalized = str(backend or "").strip().lower()
+    if normalized not in EMBEDDER_BACKENDS:
+        raise ValueError(f"Backend must be one of {', '.join(EMBEDDER_BACKENDS)}")
+    return normalized
+
+
+def _normalize_vector_dims(vector_dims: Any) -> int:
+    try:
+        normalized = int(vector_dims)
+    except (TypeError, ValueError) as exc:
+        raise ValueError(f"Vector dims must be 0 (full) or between 1 and {MAX_VECTOR_DIMS - 1}") from exc
+    if normalized == MAX_VECTOR_DIMS:
+        return DEFAULT_VECTOR_DIMS
+    if not 0 <= normalized < MAX_VECTOR_DIMS:
+        raise ValueError(f"Vector dims must be 0 (full) or between 1 and {MAX_VECTOR_DIMS - 1}")
+    return normalized
+
+
+def _normalize_rerank_mode(rerank_mode: Any, backend: str) -> str:
+    normalized = str(rerank_mode or "").strip().lower()
+    if normalized and normalized not in RERANK_MODES:
+        raise ValueError(f"Rerank mode must be empty or one of {', '.join(RERANK_MODES)}")
+    if normalized and backend != BACKEND_TORCH:
+        raise ValueError("Reranking requires the torch backend")
+    return normalized
+
+
+def _normalize_rerank_candidates(rerank_candidates: Any) -> int:
+    try:
+        normalized = int(rerank_candidates)
+    except (TypeError, ValueError) as exc:
+        raise ValueError(f"Rerank candidates must be between 1 and {MAX_RERANK_CANDIDATES}") from exc
+    if not 1 <= normalized <= MAX_RERANK_CANDIDATES:
+        raise ValueError(f"Rerank candidates must be between 1 and {MAX_RERANK_CANDIDATES}")
+    return normalized
+
+
+def _normalize_rerank_encode_budget(rerank_encode_budget: Any) -> int:
+    try:
+        normalized = int(rerank_encode_budget)
+    except (TypeError, ValueError) as exc:
+        raise ValueError(f"Rerank encode budget must be between 0 and {MAX_RERANK_CANDIDATES}") from exc
+    if not 0 <= normalized <= MAX_RERANK_CANDIDATES:
+        raise ValueError(f"Rerank encode budget must be between 0 and {MAX_RERANK_CANDIDATES}")
+    return normalized
+
+
+def _rerank_outputs_missing(current_mode: Any, requested_mode: str) -> bool:
+    """Whether ``requested_mode`` needs candidate outputs a build for ``current_mode`` did not store."""
+    current_mode = str(current_mode or "")
+    return (mode_uses_sparse(requested_mode) and not mode_uses_sparse(current_mode)) or (
+        mode_uses_colbert(requested_mode) and not mode_uses_colbert(current_mode)
+    )
+
+
+def _normalize_adaptive_batching(adaptive_batching: Any) -> int:
+    try:
+        normalized = int(adaptive_batching)
+    except (TypeError, ValueError) as exc:
+        raise ValueError("Adaptive batching must be 0 or 1") from exc
+    if normalized not in (0, 1):
+        raise ValueError("Adaptive batching must be 0 or 1")
+    return normalized
+
+
+def _normalize_semantic_ratio(semantic_ratio: Any) -> float:
+    try:
+        normalized = float(semantic_ratio)
+    except (TypeError, ValueError) as exc:
+        raise ValueError("Semantic ratio must be between 0 and 1") from exc
+    if not 0.0 <= normalized <= 1.0:
+        raise ValueError("Semantic ratio must be between 0 and 1")
+    return normalized
+
+
 def _default_profile_values() -> dict[str, Any]:
     return {
         "model_name": DEFAULT_MODEL_NAME,
         "use_fp16": DEFAULT_USE_FP16,
         "max_length": DEFAULT_MAX_LENGTH,
+        "semantic_ratio": DEFAULT_SEMANTIC_RATIO,
+        "backend": DEFAULT_BACKEND,
+        "vector_dims": DEFAULT_VECTOR_DIMS,
+        "rerank_mode": DEFAULT_RERANK_MODE,
+        "rerank_candidates": DEFAULT_RERANK_CANDIDATES,
+        "rerank_encode_budget": DEFAULT_RERANK_ENCODE_BUDGET,
+        "adaptive_batching": DEFAULT_ADAPTIVE_BATCHING,
     }
 
 
@@ -130,6 +241,13 @@ def add_profile(
     max_length: int = 128,
     variant: str = "raw",
     enabled: int = 1,
+    semantic_ratio: float = DEFAULT_SEMANTIC_RATIO,
+    backend: str = DEFAULT_BACKEND,
+    vector_dims: int = DEFAULT_VECTOR_DIMS,
+    rerank_mode: str = DEFAULT_RERANK_MODE,
+    rerank_candidates: int = DEFAULT_RERANK_CANDIDATES,
+    rerank_encode_budget: int = DEFAULT_RERANK_ENCODE_BUDGET,
+    adaptive_batching: int = DEFAULT_ADAPTIVE_BATCHING,
     commit: bool = True,
 ) -> None:
     now = datetime.datetime.now(datetime.timezone.utc).replace(microsecond=0)
@@ -144,11 +262,34 @@ def add_profile(
             max_length,
             variant,
             enabled,
-            created_at
+            created_at,
+            semantic_ratio,
+            backend,
+            vector_dims,
+            rerank_mode,
+            rerank_candidates,
+            rerank_encode_budget,
+            adaptive_batching
         )
-        values (?, ?, ?, ?, ?, ?, ?, ?)
+        values (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         """,
-        (library_id, key, model_name, use_fp16, max_length, variant, enabled, timestamp),
+        (
+            library_id,
+            key,
+            model_name,
+            use_fp16,
+            max_length,
+            variant,
+            enabled,
+            timestamp,
+            semantic_ratio,
+            backend,
+            vector_dims,
+            rerank_mode,
+            rerank_candidates,
+            rerank_encode_budget,
+            adaptive_batching,
+        ),
     )
     if commit:
         conn.commit()
@@ -165,7 +306,14 @@ def list_profiles(conn: Any, library_id: int) -> list[dict[str, Any]]:
             max_length,
             variant,
             enabled,
-            created_at
+            created_at,
+            semantic_ratio,
+            backend,
+            vector_dims,
+            rerank_mode,
+            rerank_candidates,
+            rerank_encode_budget,
+            adaptive_batching
         from embedding_profile
         where library_id = ?
         order by id
@@ -189,6 +337,13 @@ def get_active_profile(conn: Any, library_id: int, *, commit: bool = False) -> d
             model_name=source["model_name"],
             use_fp16=source.get("use_fp16", DEFAULT_USE_FP16),
             max_length=source.get("max_length", DEFAULT_MAX_LENGTH),
+            semantic_ratio=source.get("semantic_ratio", DEFAULT_SEMANTIC_RATIO),
+            backend=source.get("backend", DEFAULT_BACKEND),
+            vector_dims=source.get("vector_dims", DEFAULT_VECTOR_DIMS),
+            rerank_mode=source.get("rerank_mode", DEFAULT_RERANK_MODE),
+            rerank_candidates=source.get("rerank_candidates", DEFAULT_RERANK_CANDIDATES),
+            rerank_encode_budget=source.get("rerank_encode_budget", DEFAULT_RERANK_ENCODE_BUDGET),
+            adaptive_batching=source.get("adaptive_batching", DEFAULT_ADAPTIVE_BATCHING),
             variant=ACTIVE_PROFILE_VARIANT,
             enabled=ACTIVE_PROFILE_ENABLED,
             commit=False,
@@ -208,20 +363,89 @@ def upsert_active_profile(
     model_name: str,
     use_fp16: int,
     max_length: int,
+    semantic_ratio: float | None = None,
+    backend: str | None = None,
+    vector_dims: Any = None,
+    rerank_mode: str | None = None,
+    rerank_candidates: Any = None,
+    rerank_encode_budget: Any = None,
+    adaptive_batching: Any = None,
     commit: bool = False,
 ) -> bool:
-    """Persist the canonical bge_m3 row and report whether values materially changed."""
+    """Persist the canonical bge_m3 row and report whether values materially changed.
+
+    Only build-affecting fields count as a material change; the semantic ratio
+    is applied at query time and never requires a rebuild. Switching the
+    embedding backend or the stored vector width changes the stored vectors,
+    so it does. ``backend=None`` / ``vector_dims=None`` keep the current value.
+    Candidate lexical/ColBERT outputs are only stored at build time, so a rerank
+    mode that needs outputs the current mode did not store is a material
+    change; turning reranking off or narrowing it is not. The candidate count
+    and encode budget are query-time settings like the semantic ratio. Adaptive
+    batching only changes how fast a build runs, not what it stores. ``None``
+    keeps any of these settings as it is.
+    """
     normalized_model_name = _normalize_model_name(model_name)
     normalized_use_fp16 = _normalize_use_fp16(use_fp16)
     normalized_max_length = _normalize_max_length(max_length)
+    normalized_semantic_ratio = None
+    if semantic_ratio is not None:
+        normalized_semantic_ratio = _normalize_semantic_ratio(semantic_ratio)
 
     profile = get_active_profile(conn, library_id, commit=commit)
+    normalized_backend = (
+        _normalize_backend(backend) if backend is not None else str(profile.get("backend") or DEFAULT_BACKEND)
+    )
+    normalized_vector_dims = (
+        _normalize_vector_dims(vector_dims)
+        if vector_dims is not None
+        else _coerce_existing_int(profile.get("vector_dims") or DEFAULT_VECTOR_DIMS)
+    )
+    normalized_rerank_mode = _normalize_rerank_mode(
+        rerank_mode if rerank_mode is not None else profile.get("rerank_mode"),
+        normalized_backend,
+    )
+    normalized_rerank_candidates = None
+    if rerank_candidates is not None:
+        normalized_rerank_candidates = _normalize_rerank_candidates(rerank_candidates)
+    normalized_rerank_encode_budget = None
+    if rerank_encode_budget is not None:
+        normalized_rerank_encode_budget = _normalize_rerank_encode_budget(rerank_encode_budget)
+    normalized_adaptive_batching = None
+    if adaptive_batching is not None:
+        normalized_adaptive_batching = _normalize_adaptive_batching(adaptive_batching)
     changed = _normalized_existing_values(profile) != (
         normalized_model_name,
         normalized_use_fp16,
         normalized_max_length,
-    )
+        normalized_backend,
+        normalized_vector_dims,
+    ) or _rerank_outputs_missing(profile.get("rerank_mode"), normalized_rerank_mode)
 
+    if normalized_semantic_ratio is not None:
+        conn.execute(
+            "update embedding_profile set semantic_ratio = ? where id = ?",
+            (normalized_semantic_ratio, profile["id"]),
+        )
+    if normalized_rerank_candidates is not None:
+        conn.execute(
+            "update embedding_profile set rerank_candidates = ? where id = ?",
+            (normalized_rerank_candidates, profile["id"]),
+        )
+    if normalized_rerank_encode_budget is not None:
+        conn.execute(
+            "update embedding_profile set rerank_encode_budget = ? where id = ?",
+            (normalized_rerank_encode_budget, profile["id"]),
+        )
+    if normalized_adaptive_batching is not None:
+        conn.execute(
+            "update embedding_profile set adaptive_batching = ? where id = ?",
+            (normalized_adaptive_batching, profile["id"]),
+        )
+    conn.execute(
+        "update embedding_profile set backend = ?, vector_dims = ?, rerank_mode = ? where id = ?",
+        (normalized_backend, normalized_vector_dims, normalized_rerank_mode, profile["id"]),
+    )
     conn.execute(
         """
         update embedding_profile
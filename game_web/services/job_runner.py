@@ -1,11 +1,15 @@
+import time
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Callable
 
+from game_semantic.metrics import JOB_DURATION_SECONDS
 from game_web.db import connect_db
+from game_web.jobs import JobLogWriter
 from game_web.runtime import resolve_data_dir, resolve_jobs_dir
 from game_web.services.build_execution_service import execute_build_job
 from game_web.services import job_service
+from game_web.services.search_cache import cache_namespace, get_search_cache
 
 LogFn = Callable[[str], None]
 ExecuteFn = Callable[..., None]
@@ -91,6 +95,7 @@ class JobRunner:
             full_log_path = (self._data_dir / log_path).resolve()
         try:
             full_log_path.parent.mkdir(parents=True, exist_ok=True)
+            log_writer = JobLogWriter(str(full_log_path))
         except Exception as exc:
             conn = connect_db(self._db_path)
             try:
@@ -105,8 +110,7 @@ class JobRunner:
                 conn.close()
             raise
 
-        def log_line(message: str) -> None:
-            job_service.append_job_log(str(full_log_path), message)
+        log_line = log_writer.log
 
         try:
             future = self._executor.submit(
@@ -117,6 +121,7 @@ class JobRunner:
                 log=log_line,
             )
         except Exception as exc:
+            log_writer.close()
             conn = connect_db(self._db_path)
             try:
                 job_service.update_job(
@@ -129,13 +134,23 @@ class JobRunner:
             finally:
                 conn.close()
             raise
+        started = time.perf_counter()
         try:
             future.result()
+            JOB_DURATION_SECONDS.observe(time.perf_counter() - started)
+            # Flush the buffered log before the job is visible as done.
+            log_writer.close()
         except Exception as exc:
+            if not log_writer.closed:
+                JOB_DURATION_SECONDS.observe(time.perf_counter() - started)
             try:
                 log_line(f"Job failed: {exc}")
             except Exception:
                 pass
+            try:
+                log_writer.close()
+            except Exception:
+                pass
             conn = connect_db(self._db_path)
             try:
                 job_service.update_job(
@@ -160,6 +175,7 @@ class JobRunner:
             )
         finally:
             conn.close()
+        get_search_cache().invalidate_library(cache_namespace(self._db_path), int(job["library_id"]))
         return job_id
 
     def shutdown(self) -> None:
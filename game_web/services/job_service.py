@@ -1,6 +1,9 @@
+import hashlib
+import json
 from datetime import datetime, timezone
 from typing import Any
 
+from game_semantic.config import BACKEND_TORCH
 from game_web.jobs import write_log_line
 
 
@@ -8,6 +11,16 @@ def _timestamp() -> str:
     return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
 
 
+def _load_progress(value: str | None) -> dict[str, Any] | None:
+    if not value:
+        return None
+    try:
+        progress = json.loads(value)
+    except ValueError:
+        return None
+    return progress if isinstance(progress, dict) else None
+
+
 def _row_to_dataset(row: Any) -> dict[str, Any]:
     return {
         "id": row[0],
@@ -16,6 +29,9 @@ def _row_to_dataset(row: Any) -> dict[str, Any]:
         "storage_path": row[3],
         "size_bytes": row[4],
         "created_at": row[5],
+        "line_count": row[6],
+        "unique_line_count": row[7],
+        "content_sha256": row[8],
     }
 
 
@@ -28,6 +44,7 @@ def create_job(
     log_path: str | None = None,
     error: str | None = None,
     commit: bool = True,
+    input_fingerprint: str | None = None,
 ) -> int:
     timestamp = _timestamp()
     cur = conn.execute(
@@ -40,11 +57,12 @@ def create_job(
             log_path,
             error,
             created_at,
-            updated_at
+            updated_at,
+            input_fingerprint
         )
-        values (?, ?, ?, ?, ?, ?, ?, ?)
+        values (?, ?, ?, ?, ?, ?, ?, ?, ?)
         """,
-        (library_id, dataset_id, job_type, status, log_path, error, timestamp, timestamp),
+        (library_id, dataset_id, job_type, status, log_path, error, timestamp, timestamp, input_fingerprint),
     )
     if commit:
         conn.commit()
@@ -103,7 +121,9 @@ def get_job(conn: Any, job_id: int) -> dict[str, Any] | None:
             job.log_path,
             job.error,
             job.created_at,
-            job.updated_at
+            job.updated_at,
+            job.progress,
+            job.input_fingerprint
         from job
         join library on library.id = job.library_id
         join dataset on dataset.id = job.dataset_id
@@ -126,6 +146,8 @@ def get_job(conn: Any, job_id: int) -> dict[str, Any] | None:
         "error": row[8],
         "created_at": row[9],
         "updated_at": row[10],
+        "progress": _load_progress(row[11]),
+        "input_fingerprint": row[12],
     }
 
 
@@ -148,6 +170,14 @@ def has_queued_build_jobs(conn: Any) -> bool:
     return row is not None
 
 
+def count_queued_jobs(conn: Any) -> int:
+    row = conn.execute(
+        "select count(*) from job where status = ?",
+        ("queued",),
+    ).fetchone()
+    return int(row[0])
+
+
 def claim_next_executable_job(conn: Any) -> dict[str, Any] | None:
     """Return the next queued build job that has not been superseded, or None when no executable job exists."""
     while True:
@@ -209,7 +239,10 @@ def get_latest_dataset_for_library(conn: Any, library_id: int) -> dict[str, Any]
             filename,
             storage_path,
             size_bytes,
-            created_at
+            created_at,
+            line_count,
+            unique_line_count,
+            content_sha256
         from dataset
         where library_id = ?
         order by id desc
@@ -248,8 +281,11 @@ def get_latest_relevant_build_job(conn: Any, library_id: int) -> dict[str, Any]
     return get_job(conn, int(row[0]))
 
 
-def supersede_queued_jobs(conn: Any, library_id: int) -> int:
-    """Mark older queued build jobs for one library as superseded."""
+def supersede_queued_jobs(conn: Any, library_id: int, *, keep_newest: bool = True) -> int:
+    """Mark older queued build jobs for one library as superseded.
+
+    With ``keep_newest=False`` every queued build job for the library is superseded.
+    """
     cur = conn.execute(
         """
         select id
@@ -266,7 +302,7 @@ def supersede_queued_jobs(conn: Any, library_id: int) -> int:
     if row is None:
         return 0
 
-    newest_job_id = int(row[0])
+    newest_job_id = int(row[0]) if keep_newest else 0
     cur = conn.execute(
         """
         update job
@@ -283,6 +319,124 @@ def supersede_queued_jobs(conn: Any, library_id: int) -> int:
     return cur.rowcount
 
 
+def build_input_fingerprint(
+    *,
+    content_sha256: str | None,
+    index_uid: str,
+    profile: dict[str, Any],
+) -> str | None:
+    """Hash everything a rebuild's index contents depend on.
+
+    Returns None when the dataset has no content hash (rows uploaded before
+    hashing existed) or the profile is not valid, so such builds never match.
+    Query-time settings such as ``semantic_ratio`` are deliberately excluded.
+    The rerank mode decides which candidate outputs the build stores, so it
+    is included. The embedding backend, stored vector width and rerank mode
+    are only hashed when they differ from the defaults, so fingerprints
+    recorded before those options existed keep matching.
+    """
+    if not content_sha256:
+        return None
+    try:
+        inputs = {
+            "content_sha256": content_sha256,
+            "index_uid": str(index_uid),
+            "model_name": str(profile.get("model_name", "")).strip(),
+            "use_fp16": int(profile.get("use_fp16", 0)),
+            "max_length": int(profile.get("max_length", 0)),
+            "variant": str(profile.get("variant", "raw")),
+        }
+    except (TypeError, ValueError):
+        return None
+    backend = str(profile.get("backend") or BACKEND_TORCH)
+    if backend != BACKEND_TORCH:
+        inputs["backend"] = backend
+    if profile.get("vector_dims"):
+        inputs["vector_dims"] = profile.get("vector_dims")
+    if profile.get("rerank_mode"):
+        inputs["rerank_mode"] = str(profile.get("rerank_mode"))
+    payload = json.dumps(inputs, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def list_running_build_jobs(conn: Any, library_id: int) -> list[dict[str, Any]]:
+    """Return the library's build jobs that are currently running."""
+    rows = conn.execute(
+        "select id from job where library_id = ? and job_type = ? and status = ? order by id",
+        (library_id, "build", "running"),
+    ).fetchall()
+    return [job for job in (get_job(conn, int(row[0])) for row in rows) if job is not None]
+
+
+def find_satisfying_build_job(
+    conn: Any,
+    library_id: int,
+    input_fingerprint: str | None,
+    *,
+    exclude_job_id: int | None = None,
+) -> dict[str, Any] | None:
+    """Return the library's last successful build if it was built from the same inputs.
+
+    Only a ``done`` build that is the newest non-superseded build of the
+    library counts, and only while no other build is queued or running: a
+    later failed build may have emptied the index after ``recreate_index``,
+    and a pending one is about to replace it.
+    """
+    if not input_fingerprint:
+        return None
+    row = conn.execute(
+        """
+        select id, status, input_fingerprint
+        from job
+        where library_id = ?
+          and job_type = ?
+          and status != ?
+          and id != ?
+        order by id desc
+        limit 1
+        """,
+        (library_id, "build", "superseded", exclude_job_id or 0),
+    ).fetchone()
+    if row is None or row[1] != "done" or row[2] != input_fingerprint:
+        return None
+    pending = conn.execute(
+        """
+        select 1
+        from job
+        where library_id = ?
+          and job_type = ?
+          and status in (?, ?)
+          and id != ?
+        limit 1
+        """,
+        (library_id, "build", "queued", "running", exclude_job_id or 0),
+    ).fetchone()
+    if pending is not None:
+        return None
+    return get_job(conn, int(row[0]))
+
+
+def reused_build_progress(dataset: dict[str, Any], reused_job_id: int) -> dict[str, Any]:
+    """Progress snapshot for a build satisfied by an earlier job without running."""
+    docs = int(dataset.get("unique_line_count") or 0)
+    return {
+        "docs_done": docs,
+        "docs_total": docs,
+        "docs_per_second": 0.0,
+        "eta_seconds": 0.0,
+        "reused_job_id": reused_job_id,
+    }
+
+
+def set_job_input_fingerprint(conn: Any, job_id: int, input_fingerprint: str | None, *, commit: bool = True) -> None:
+    conn.execute(
+        "update job set input_fingerprint = ? where id = ?",
+        (input_fingerprint, job_id),
+    )
+    if commit:
+        conn.commit()
+
+
 def update_job(
     conn: Any,
     job_id: int,
@@ -308,6 +462,26 @@ def update_job(
         conn.commit()
 
 
+def update_job_progress(
+    conn: Any,
+    job_id: int,
+    progress: dict[str, Any],
+    *,
+    commit: bool = True,
+) -> None:
+    conn.execute(
+        """
+        update job
+        set progress = ?,
+            updated_at = ?
+        where id = ?
+        """,
+        (json.dumps(progress, separators=(",", ":")), _timestamp(), job_id),
+    )
+    if commit:
+        conn.commit()
+
+
 def claim_job(
     conn: Any,
     job_id: int,
@@ -2,6 +2,7 @@ import datetime
 from pathlib import Path
 from typing import Any
 
+from game_web.services.build_artifacts import delete_library_artifacts
 from game_web.services.embedding_profile import (
     ACTIVE_PROFILE_ENABLED,
     ACTIVE_PROFILE_KEY,
@@ -151,9 +152,11 @@ def delete_library(conn: Any, library_id: int, *, data_dir: Path | None = None)
                 _restore_owned_files(owned_file_backups)
             return False
         conn.commit()
-        return True
     except Exception:
         conn.rollback()
         if owned_file_backups:
             _restore_owned_files(owned_file_backups)
         raise
+    if data_dir is not None:
+        delete_library_artifacts(data_dir, library_id)
+    return True
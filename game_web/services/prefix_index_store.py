@@ -0,0 +1,32 @@
+import threading
+from pathlib import Path
+
+from game_semantic.prefix_index import PrefixIndex
+from game_web.services.vector_projection import build_artifact_key
+
+_indexes: dict[str, PrefixIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def prefix_index_path(data_dir: Path, library_id: int, *, job_id: int, input_fingerprint: str | None) -> Path:
+    """Where a build's autocomplete prefix index lives."""
+    key = build_artifact_key(job_id=job_id, input_fingerprint=input_fingerprint)
+    return Path(data_dir) / "prefix" / f"library-{library_id}-{key}.sqlite"
+
+
+def open_prefix_index(path: Path) -> PrefixIndex:
+    """Return the shared index for ``path``, opening it on first use."""
+    with _indexes_lock:
+        index = _indexes.get(str(path))
+        if index is None:
+            index = PrefixIndex(str(path))
+            _indexes[str(path)] = index
+        return index
+
+
+def close_prefix_index(path: Path) -> None:
+    """Close and forget the shared index for ``path``, if one is open."""
+    with _indexes_lock:
+        index = _indexes.pop(str(path), None)
+    if index is not None:
+        index.close()
@@ -0,0 +1,32 @@
+import threading
+from pathlib import Path
+
+from game_semantic.rerank import CandidateStore
+from game_web.services.vector_projection import build_artifact_key
+
+_stores: dict[str, CandidateStore] = {}
+_stores_lock = threading.Lock()
+
+
+def rerank_store_path(data_dir: Path, library_id: int, *, job_id: int, input_fingerprint: str | None) -> Path:
+    """Where a build's cached candidate lexical weights / ColBERT vectors live."""
+    key = build_artifact_key(job_id=job_id, input_fingerprint=input_fingerprint)
+    return Path(data_dir) / "rerank" / f"library-{library_id}-{key}.sqlite"
+
+
+def open_rerank_store(path: Path) -> CandidateStore:
+    """Return the shared store for ``path``, opening (and creating) it on first use."""
+    with _stores_lock:
+        store = _stores.get(str(path))
+        if store is None:
+            store = CandidateStore(str(path))
+            _stores[str(path)] = store
+        return store
+
+
+def close_rerank_store(path: Path) -> None:
+    """Close and forget the shared store for ``path``, if one is open."""
+    with _stores_lock:
+        store = _stores.pop(str(path), None)
+    if store is not None:
+        store.close()
@@ -0,0 +1,116 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Hashable
+
+SEARCH_CACHE_MAX_BYTES = 32 * 1024 * 1024
+SEARCH_CACHE_TTL_SECONDS = 600.0
+
+
+class SearchResultCache:
+    """Bounded LRU cache of search hits with a TTL and a byte budget.
+
+    Keys start with ``(namespace, library_id, ...)`` so one library's entries
+    can be dropped when a new build for it completes. Hits are stored as JSON
+    text, which keeps cached results immutable and makes the byte budget exact.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_bytes: int = SEARCH_CACHE_MAX_BYTES,
+        ttl_seconds: float = SEARCH_CACHE_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_bytes = max_bytes
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[float, str, int]] = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> list[dict] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            expires_at, payload, _ = entry
+            if expires_at <= self._clock():
+                self._drop(key)
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+        return json.loads(payload)
+
+    def put(self, key: Hashable, hits: list[dict]) -> None:
+        try:
+            payload = json.dumps(hits, ensure_ascii=False, separators=(",", ":"))
+        except (TypeError, ValueError):
+            return
+        size = len(payload.encode("utf-8"))
+        if size > self._max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (self._clock() + self._ttl_seconds, payload, size)
+            self._bytes += size
+            while self._bytes > self._max_bytes and self._entries:
+                oldest = next(iter(self._entries))
+                self._drop(oldest)
+                self._evictions += 1
+
+    def invalidate_library(self, namespace: Hashable, library_id: int) -> int:
+        """Drop every entry cached for one library; return how many were removed."""
+        with self._lock:
+            stale = [key for key in self._entries if key[:2] == (namespace, library_id)]
+            for key in stale:
+                self._drop(key)
+            if stale:
+                self._invalidations += 1
+        return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": (self._hits / lookups) if lookups else 0.0,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self._max_bytes,
+                "ttl_seconds": self._ttl_seconds,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+            }
+
+    def _drop(self, key: Hashable) -> None:
+        _, _, size = self._entries.pop(key)
+        self._bytes -= size
+
+
+_search_cache = SearchResultCache()
+
+
+def cache_namespace(db_path: str) -> str:
+    """Identify one app database so libraries from different apps never share entries."""
+    return str(Path(db_path).resolve())
+
+
+def get_search_cache() -> SearchResultCache:
+    """Return the process-wide search result cache."""
+    return _search_cache
@@ -0,0 +1,87 @@
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+import numpy as np
+
+SEARCH_CURSOR_MAX_BYTES = 8 * 1024 * 1024
+SEARCH_CURSOR_TTL_SECONDS = 600.0
+
+
+class SearchCursorStore:
+    """Bounded LRU of query vectors behind opaque cursor tokens, with a TTL and a byte budget.
+
+    A cursor remembers the query vector of every embedding group a search
+    encoded, so later pages of the same search skip the encoder. Vectors are
+    kept as float32 arrays before any per-library projection, one per group,
+    and projected again at use; a rebuild that changes the projection needs
+    no invalidation. A token only resolves for the scope (app, library
+    selection and query) it was issued for.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_bytes: int = SEARCH_CURSOR_MAX_BYTES,
+        ttl_seconds: float = SEARCH_CURSOR_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_bytes = max_bytes
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, Hashable, dict[Hashable, np.ndarray], int]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def issue(self, scope: Hashable, vectors: dict[Hashable, np.ndarray]) -> str | None:
+        """Store ``vectors`` and return their token, or None when they exceed the whole budget."""
+        vectors = {group: np.asarray(vector, dtype=np.float32) for group, vector in vectors.items()}
+        size = sum(vector.nbytes for vector in vectors.values())
+        if size > self._max_bytes:
+            return None
+        token = secrets.token_urlsafe(16)
+        with self._lock:
+            self._entries[token] = (self._clock() + self._ttl_seconds, scope, vectors, size)
+            self._bytes += size
+            while self._bytes > self._max_bytes and self._entries:
+                self._drop(next(iter(self._entries)))
+        return token
+
+    def get(self, token: str, scope: Hashable) -> dict[Hashable, np.ndarray] | None:
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is None:
+                return None
+            expires_at, issued_scope, vectors, size = entry
+            if expires_at <= self._clock():
+                self._drop(token)
+                return None
+            if issued_scope != scope:
+                return None
+            # Paging keeps a cursor alive for another TTL.
+            self._entries[token] = (self._clock() + self._ttl_seconds, issued_scope, vectors, size)
+            self._entries.move_to_end(token)
+            return dict(vectors)
+
+    def _drop(self, token: str) -> None:
+        _, _, _, size = self._entries.pop(token)
+        self._bytes -= size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+_search_cursors = SearchCursorStore()
+
+
+def get_search_cursors() -> SearchCursorStore:
+    """Return the process-wide search cursor store."""
+    return _search_cursors
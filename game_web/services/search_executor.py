@@ -1,3 +1,12 @@
+import logging
+import threading
+from dataclasses import dataclass
+
+import numpy as np
+
+from game_semantic.config import BACKEND_TORCH, EMBEDDER_BACKENDS, RERANK_MODES
+from game_semantic.metrics import AUTOCOMPLETE_SECONDS, MEILI_SEARCH_SECONDS, QUERY_EMBEDDING_SECONDS, SEARCH_SECONDS
+from game_semantic.rerank import Reranker, RerankWeights
 from game_web.db import connect_db
 from game_web.runtime import resolve_data_dir
 from game_web.secrets import decrypt_secret
@@ -6,7 +15,12 @@ from game_web.services.job_service import get_latest_dataset_for_library, get_la
 from game_web.services.library_service import list_libraries
 from game_web.services.library_status import derive_library_status
 from game_web.services.meili_health_service import get_meili_health
+from game_web.services.prefix_index_store import open_prefix_index, prefix_index_path
+from game_web.services.rerank_store import open_rerank_store, rerank_store_path
+from game_web.services.search_cache import cache_namespace, get_search_cache
+from game_web.services.search_cursor import get_search_cursors
 from game_web.services.settings_service import get_setting
+from game_web.services.vector_projection import load_projection, profile_vector_dims, projection_path
 
 
 class SearchNotReadyError(RuntimeError):
@@ -25,6 +39,29 @@ class SearchExecutionError(RuntimeError):
     """Raised when a search request cannot complete truthfully."""
 
 
+class SearchLibraryNotFoundError(RuntimeError):
+    """Raised when a batch search targets a library that does not exist."""
+
+
+@dataclass(frozen=True)
+class SearchPage:
+    """One page of search hits; ``cursor`` resumes the same query without re-encoding it."""
+
+    hits: list[dict]
+    offset: int
+    limit: int
+    has_more: bool
+    cursor: str | None
+
+
+SEARCH_BATCH_ENCODE_SIZE = 64
+
+logger = logging.getLogger(__name__)
+
+_query_embedders: dict[tuple, object] = {}
+_query_embedders_lock = threading.Lock()
+
+
 def _as_int(value, default: int) -> int:
     if value is None:
         return default
@@ -46,47 +83,126 @@ def _as_int(value, default: int) -> int:
         return default
 
 
-def execute_search(
-    db_path: str,
-    library_id: int,
-    query: str,
-    limit: int | None = None,
-    *,
-    data_dir=None,
-) -> list[dict]:
-    if not query:
-        return []
+def _semantic_ratio(profile: dict) -> float:
+    try:
+        ratio = float(profile.get("semantic_ratio", 1.0))
+    except (TypeError, ValueError):
+        return 1.0
+    return min(max(ratio, 0.0), 1.0)
+
+
+def _hybrid_search_kwargs(profile: dict, **query_text) -> dict:
+    """Return hybrid-mode keyword arguments, or none for pure vector search."""
+    semantic_ratio = _semantic_ratio(profile)
+    if semantic_ratio >= 1.0:
+        return {}
+    return {"semantic_ratio": semantic_ratio, **query_text}
+
 
+def _rerank_mode(profile: dict) -> str:
+    mode = str(profile.get("rerank_mode") or "")
+    if mode not in RERANK_MODES or str(profile.get("backend") or BACKEND_TORCH) != BACKEND_TORCH:
+        return ""
+    return mode
+
+
+def _candidate_limit(profile: dict, limit: int) -> int:
+    """How many dense hits to request: the rerank candidate pool when reranking."""
+    if not _rerank_mode(profile):
+        return limit
+    return max(_as_int(profile.get("rerank_candidates", 50), 50), limit)
+
+
+def _rerank_encode_budget(profile: dict) -> int:
+    """Uncached candidates encoded per query when reranking; the rest keep their dense score."""
+    return max(_as_int(profile.get("rerank_encode_budget", 32), 32), 0)
+
+
+def _library_search_inputs(conn, library_id: int) -> dict:
+    return {
+        "profile": get_active_profile(conn, library_id),
+        "latest_dataset": get_latest_dataset_for_library(conn, library_id),
+        "latest_job": get_latest_relevant_build_job(conn, library_id),
+    }
+
+
+def _library_status(meili_state: str, inputs: dict):
+    profile = inputs["profile"]
+    latest_job = inputs["latest_job"]
+    return derive_library_status(
+        meili_state=meili_state,
+        has_dataset=inputs["latest_dataset"] is not None,
+        config_valid=bool(str(profile.get("model_name", "")).strip())
+        and _as_int(profile.get("use_fp16", 0), -1) in (0, 1)
+        and _as_int(profile.get("max_length", 0), 0) > 0,
+        latest_relevant_job_status=latest_job["status"] if latest_job else None,
+    )
+
+
+def _meili_api_key(resolved_data_dir, api_key_value) -> str | None:
+    if api_key_value:
+        decrypted = decrypt_secret(resolved_data_dir, api_key_value)
+        if decrypted:
+            return decrypted
+    return None
+
+
+def _search_target(library: dict, inputs: dict, meili_url: str, meili_api_key, resolved_data_dir) -> dict:
+    library_id = library["id"]
+    profile = inputs["profile"]
+    latest_job = inputs["latest_job"]
+    return {
+        "library": library,
+        "profile": profile,
+        "meili_url": meili_url,
+        "meili_api_key": meili_api_key,
+        "index_version": (latest_job["id"], latest_job["updated_at"]),
+        "projection_path": (
+            projection_path(
+                resolved_data_dir,
+                library_id,
+                job_id=int(latest_job["id"]),
+                input_fingerprint=latest_job.get("input_fingerprint"),
+            )
+            if profile_vector_dims(profile)
+            else None
+        ),
+        "rerank_store_path": (
+            rerank_store_path(
+                resolved_data_dir,
+                library_id,
+                job_id=int(latest_job["id"]),
+                input_fingerprint=latest_job.get("input_fingerprint"),
+            )
+            if _rerank_mode(profile)
+            else None
+        ),
+    }
+
+
+def _resolve_search_target(db_path: str, library_id: int, data_dir=None) -> dict | None:
+    """Load one library's search inputs and enforce the Searchable readiness gate.
+
+    Returns None when the library does not exist.
+    """
     conn = connect_db(db_path)
     try:
         libraries = list_libraries(conn)
         library = next((item for item in libraries if item["id"] == library_id), None)
         if library is None:
-            return []
-        profile = get_active_profile(conn, library_id)
-        latest_dataset = get_latest_dataset_for_library(conn, library_id)
-        latest_job = get_latest_relevant_build_job(conn, library_id)
+            return None
+        inputs = _library_search_inputs(conn, library_id)
         meili_url = (get_setting(conn, "meili_url") or "").strip()
         api_key_value = get_setting(conn, "meili_api_key")
     finally:
         conn.close()
 
-    meili_api_key = None
-    if api_key_value:
-        resolved_data_dir = resolve_data_dir(data_dir, db_path)
-        decrypted = decrypt_secret(resolved_data_dir, api_key_value)
-        if decrypted:
-            meili_api_key = decrypted
+    resolved_data_dir = resolve_data_dir(data_dir, db_path)
+    meili_api_key = _meili_api_key(resolved_data_dir, api_key_value)
 
     meili_health = get_meili_health(meili_url, meili_api_key)
-    status = derive_library_status(
-        meili_state=meili_health.state,
-        has_dataset=latest_dataset is not None,
-        config_valid=bool(str(profile.get("model_name", "")).strip())
-        and _as_int(profile.get("use_fp16", 0), -1) in (0, 1)
-        and _as_int(profile.get("max_length", 0), 0) > 0,
-        latest_relevant_job_status=latest_job["status"] if latest_job else None,
-    )
+    status = _library_status(meili_health.state, inputs)
+    latest_job = inputs["latest_job"]
     if meili_health.state == "connection_failed":
         raise SearchConnectionError("Meili connection failed")
     if status.state == "Failed" and latest_job is not None and latest_job.get("status") == "failed":
@@ -94,42 +210,529 @@ def execute_search(
     if status.state != "Searchable":
         raise SearchNotReadyError("Library is not searchable yet")
 
-    from game_semantic.embedding import BgeM3Embedder
-    from game_semantic.meili_client import MeiliGameIndex
+    return _search_target(library, inputs, meili_url, meili_api_key, resolved_data_dir)
 
-    use_fp16 = _as_int(profile.get("use_fp16", 0), 0)
-    max_length = _as_int(profile.get("max_length", 128), 128)
 
+def _resolve_searchable_targets(db_path: str, data_dir=None) -> list[dict]:
+    """Search targets of every Searchable library, checking Meilisearch health once."""
+    conn = connect_db(db_path)
     try:
-        embedder = BgeM3Embedder(
-            model_name=profile["model_name"],
-            use_fp16=bool(use_fp16),
-        )
+        libraries = list_libraries(conn)
+        inputs = {library["id"]: _library_search_inputs(conn, library["id"]) for library in libraries}
+        meili_url = (get_setting(conn, "meili_url") or "").strip()
+        api_key_value = get_setting(conn, "meili_api_key")
+    finally:
+        conn.close()
+
+    resolved_data_dir = resolve_data_dir(data_dir, db_path)
+    meili_api_key = _meili_api_key(resolved_data_dir, api_key_value)
+
+    meili_health = get_meili_health(meili_url, meili_api_key)
+    if meili_health.state == "connection_failed":
+        raise SearchConnectionError("Meili connection failed")
+    return [
+        _search_target(library, inputs[library["id"]], meili_url, meili_api_key, resolved_data_dir)
+        for library in libraries
+        if _library_status(meili_health.state, inputs[library["id"]]).state == "Searchable"
+    ]
+
+
+def _cache_key(db_path: str, target: dict, query: str, limit: int) -> tuple:
+    """Key cached hits by library, index build, query-time settings and request."""
+    profile = target["profile"]
+    return (
+        cache_namespace(db_path),
+        target["library"]["id"],
+        target["index_version"],
+        (
+            str(profile.get("model_name", "")),
+            _as_int(profile.get("use_fp16", 0), 0),
+            _as_int(profile.get("max_length", 128), 128),
+            str(profile.get("backend") or BACKEND_TORCH),
+            profile_vector_dims(profile),
+            _semantic_ratio(profile),
+            _rerank_mode(profile),
+            _candidate_limit(profile, limit),
+            _rerank_encode_budget(profile),
+        ),
+        query,
+        limit,
+    )
+
+
+def _embedding_group_key(profile: dict) -> tuple:
+    """Profiles with equal keys produce the same query vector before any projection."""
+    return (
+        str(profile.get("model_name", "")),
+        _as_int(profile.get("use_fp16", 0), 0),
+        _as_int(profile.get("max_length", 128), 128),
+        str(profile.get("backend") or BACKEND_TORCH),
+    )
+
+
+def _hit_score(hit: dict) -> float:
+    score = hit.get("_rankingScore")
+    return float(score) if isinstance(score, (int, float)) else 0.0
+
+
+def _federated_score(profile: dict, hit: dict) -> float:
+    """Score comparable across libraries: rerank scores are scaled back to Meili's [0, 1] range."""
+    mode = _rerank_mode(profile)
+    score = hit.get("_rerankScore")
+    if mode and isinstance(score, (int, float)):
+        return float(score) / RerankWeights().total(mode)
+    return _hit_score(hit)
+
+
+def _project_query_vectors(target: dict, dense):
+    """Map query vectors into the library's reduced space when it stores projected vectors."""
+    path = target.get("projection_path")
+    if path is None:
+        return dense
+    return load_projection(path).project(dense)
+
+
+def _rerank_hits(target: dict, embedder, query: str, hits: list[dict], limit: int) -> list[dict]:
+    """Rerank dense candidates with the profile's sparse/ColBERT mode; a no-op when off."""
+    mode = _rerank_mode(target["profile"])
+    if not mode:
+        return hits
+    reranker = Reranker(
+        embedder,
+        mode,
+        open_rerank_store(target["rerank_store_path"]),
+        encode_budget=_rerank_encode_budget(target["profile"]),
+        max_length=_as_int(target["profile"].get("max_length", 128), 128),
+    )
+    reranked, _ = reranker.rerank(query, hits, limit)
+    return reranked
+
+
+def _load_query_embedder(profile: dict):
+    """Return the process-wide query embedder for a profile, loading it on first use.
+
+    Instances are keyed by loader and build-affecting settings; the lock makes
+    concurrent first queries (or the startup warm-up) share one load.
+    """
+    model_name = profile["model_name"]
+    use_fp16 = bool(_as_int(profile.get("use_fp16", 0), 0))
+    backend = str(profile.get("backend") or BACKEND_TORCH)
+    try:
+        if backend == BACKEND_TORCH:
+            from game_semantic.embedding import BgeM3Embedder
+
+            loader, kwargs = BgeM3Embedder, {"model_name": model_name, "use_fp16": use_fp16}
+        else:
+            from game_semantic.embedding import create_embedder
+
+            loader, kwargs = create_embedder, {"model_name": model_name, "use_fp16": use_fp16, "backend": backend}
+        key = (loader, model_name, use_fp16, backend)
+        with _query_embedders_lock:
+            embedder = _query_embedders.get(key)
+            if embedder is None:
+                embedder = loader(**kwargs)
+                _query_embedders[key] = embedder
+        return embedder
     except Exception as exc:
         raise SearchModelError("Model failed to load") from exc
+
+
+def warm_up_query_embedders(db_path: str) -> int:
+    """Load the query embedder of every library's active profile; return how many loaded.
+
+    Failures are logged and skipped so a broken profile cannot stop the rest.
+    """
+    conn = connect_db(db_path)
     try:
-        dense = embedder.encode_dense(
-            [query],
-            batch_size=1,
-            max_length=max_length,
-        )
+        profiles = [get_active_profile(conn, int(library["id"])) for library in list_libraries(conn)]
+        conn.commit()
+    finally:
+        conn.close()
+
+    seen = set()
+    loaded = 0
+    for profile in profiles:
+        model_name = str(profile.get("model_name", "")).strip()
+        backend = str(profile.get("backend") or BACKEND_TORCH)
+        key = (model_name, _as_int(profile.get("use_fp16", 0), 0), backend)
+        if not model_name or backend not in EMBEDDER_BACKENDS or key in seen:
+            continue
+        seen.add(key)
+        try:
+            _load_query_embedder({**profile, "model_name": model_name})
+        except SearchModelError:
+            logger.exception("Warm-up failed for model %s (%s)", model_name, backend)
+            continue
+        loaded += 1
+    return loaded
+
+
+def start_query_embedder_warm_up(db_path: str) -> threading.Thread:
+    """Run warm_up_query_embedders on a daemon thread so startup is not delayed."""
+
+    def run() -> None:
+        try:
+            count = warm_up_query_embedders(db_path)
+        except Exception:  # noqa: BLE001
+            logger.exception("Query embedder warm-up failed")
+            return
+        logger.info("Warmed up %d query embedder(s)", count)
+
+    thread = threading.Thread(target=run, name="query-embedder-warm-up", daemon=True)
+    thread.start()
+    return thread
+
+
+@SEARCH_SECONDS.time()
+def execute_search(
+    db_path: str,
+    library_id: int,
+    query: str,
+    limit: int | None = None,
+    *,
+    data_dir=None,
+) -> list[dict]:
+    if not query:
+        return []
+
+    target = _resolve_search_target(db_path, library_id, data_dir)
+    if target is None:
+        return []
+    library = target["library"]
+    profile = target["profile"]
+    search_cache = get_search_cache()
+    cache_key = _cache_key(db_path, target, query, limit or 10)
+    cached_hits = search_cache.get(cache_key)
+    if cached_hits is not None:
+        return cached_hits
+
+    from game_semantic.meili_client import MeiliGameIndex
+
+    max_length = _as_int(profile.get("max_length", 128), 128)
+
+    embedder = _load_query_embedder(profile)
+    try:
+        with QUERY_EMBEDDING_SECONDS.time():
+            dense = embedder.encode_dense(
+                [query],
+                batch_size=1,
+                max_length=max_length,
+            )
         if len(dense) == 0:
             return []
+        dense = _project_query_vectors(target, dense)
         query_vec = dense[0].tolist()
 
         game_index = MeiliGameIndex(
-            url=meili_url,
-            api_key=meili_api_key,
+            url=target["meili_url"],
+            api_key=target["meili_api_key"],
             index_uid=library["index_uid"],
             embedder_name="bge_m3",
             embedding_dim=len(query_vec),
         )
-        return game_index.search_by_vector(
-            query_vec,
-            limit=limit or 10,
-            embedder_key="bge_m3",
+        search_kwargs = _hybrid_search_kwargs(profile, query_text=query)
+        if _rerank_mode(profile):
+            search_kwargs["show_ranking_score"] = True
+        with MEILI_SEARCH_SECONDS.time():
+            hits = game_index.search_by_vector(
+                query_vec,
+                limit=_candidate_limit(profile, limit or 10),
+                embedder_key="bge_m3",
+                **search_kwargs,
+            )
+        hits = _rerank_hits(target, embedder, query, hits, limit or 10)
+    except Exception as exc:  # noqa: BLE001
+        raise SearchExecutionError(
+            "Search could not be completed. Check Meilisearch and try again."
+        ) from exc
+
+    search_cache.put(cache_key, hits)
+    return hits
+
+
+@SEARCH_SECONDS.time()
+def execute_batch_search(
+    db_path: str,
+    library_id: int,
+    queries: list[str],
+    limit: int | None = None,
+    *,
+    data_dir=None,
+) -> list[list[dict]]:
+    """Embed all queries in one call and run them as a single Meili multi-search.
+
+    Returns one hit list per input query, in order. Blank queries get an empty
+    hit list without being embedded, and cached queries skip both the encoder
+    and Meilisearch.
+    """
+    target = _resolve_search_target(db_path, library_id, data_dir)
+    if target is None:
+        raise SearchLibraryNotFoundError(f"Library {library_id} was not found")
+
+    normalized = [str(query or "").strip() for query in queries]
+    results: list[list[dict]] = [[] for _ in normalized]
+
+    search_cache = get_search_cache()
+    cache_keys: dict[int, tuple] = {}
+    positions: list[int] = []
+    for position, query in enumerate(normalized):
+        if not query:
+            continue
+        cache_keys[position] = _cache_key(db_path, target, query, limit or 10)
+        cached_hits = search_cache.get(cache_keys[position])
+        if cached_hits is not None:
+            results[position] = cached_hits
+        else:
+            positions.append(position)
+    if not positions:
+        return results
+
+    library = target["library"]
+    profile = target["profile"]
+
+    from game_semantic.meili_client import MeiliGameIndex
+
+    max_length = _as_int(profile.get("max_length", 128), 128)
+
+    embedder = _load_query_embedder(profile)
+    try:
+        texts = [normalized[position] for position in positions]
+        with QUERY_EMBEDDING_SECONDS.time():
+            dense = embedder.encode_dense(
+                texts,
+                batch_size=min(len(texts), SEARCH_BATCH_ENCODE_SIZE),
+                max_length=max_length,
+            )
+        if len(dense) != len(texts):
+            raise RuntimeError(f"Encoder returned {len(dense)} vectors for {len(texts)} queries")
+        dense = _project_query_vectors(target, dense)
+        query_vecs = [vec.tolist() for vec in dense]
+
+        game_index = MeiliGameIndex(
+            url=target["meili_url"],
+            api_key=target["meili_api_key"],
+            index_uid=library["index_uid"],
+            embedder_name="bge_m3",
+            embedding_dim=len(query_vecs[0]),
         )
+        with MEILI_SEARCH_SECONDS.time():
+            hit_lists = game_index.multi_search_by_vectors(
+                query_vecs,
+                limit=_candidate_limit(profile, limit or 10),
+                embedder_key="bge_m3",
+                **_hybrid_search_kwargs(profile, query_texts=texts),
+            )
+        hit_lists = [_rerank_hits(target, embedder, text, hits, limit or 10) for text, hits in zip(texts, hit_lists)]
     except Exception as exc:  # noqa: BLE001
         raise SearchExecutionError(
             "Search could not be completed. Check Meilisearch and try again."
         ) from exc
+
+    for position, hits in zip(positions, hit_lists):
+        results[position] = hits
+        search_cache.put(cache_keys[position], hits)
+    return results
+
+
+def execute_search_all(
+    db_path: str,
+    query: str,
+    limit: int | None = None,
+    *,
+    data_dir=None,
+) -> list[dict]:
+    """Search every Searchable library in one Meili multi-search and merge the hits by score.
+
+    The first page of ``execute_search_page`` across all libraries; see there
+    for how hits are fetched, labelled and merged.
+    """
+    return execute_search_page(db_path, None, query, limit=limit, data_dir=data_dir).hits
+
+
+@SEARCH_SECONDS.time()
+def execute_search_page(
+    db_path: str,
+    library_id: int | None,
+    query: str,
+    *,
+    offset: int = 0,
+    limit: int | None = None,
+    cursor: str | None = None,
+    data_dir=None,
+) -> SearchPage:
+    """Return one page of hits for a library, or for every Searchable library when ``library_id`` is None.
+
+    A single library without reranking pages with Meilisearch ``offset``.
+    Otherwise each library fetches and reranks the first ``offset + limit + 1``
+    hits, which are merged by ``_federatedScore`` before slicing, so pages
+    stay consistent however libraries score. Across libraries every hit is
+    labelled with ``library_id`` and ``library_name``; ties keep library order.
+
+    The query is embedded once per group of libraries sharing an embedding
+    profile. When there is a next page, the returned ``cursor`` keeps those
+    vectors server-side, before projection; passing it back for later pages
+    of the same query skips the encoder. Cached hit windows skip Meilisearch.
+    """
+    limit = limit or 10
+    offset = max(offset, 0)
+    if not query:
+        return SearchPage([], offset, limit, False, None)
+
+    if library_id is None:
+        targets = _resolve_searchable_targets(db_path, data_dir)
+    else:
+        target = _resolve_search_target(db_path, library_id, data_dir)
+        targets = [target] if target is not None else []
+    if not targets:
+        return SearchPage([], offset, limit, False, None)
+
+    cursors = get_search_cursors()
+    scope = (cache_namespace(db_path), library_id, query)
+    cursor_vectors = (cursors.get(cursor, scope) if cursor else None) or {}
+
+    # One unreranked library can let Meilisearch skip hits; merged pages need every library's head.
+    direct = library_id is not None and not _rerank_mode(targets[0]["profile"])
+    window = offset + limit + 1
+    search_cache = get_search_cache()
+    hits_by_library: dict[int, list[dict]] = {}
+    pending: list[tuple[dict, tuple]] = []
+    for target in targets:
+        # Paging needs scores, which single-library hits may lack; keep these apart.
+        if direct:
+            cache_key = (*_cache_key(db_path, target, query, limit + 1), "scored", offset)
+        else:
+            cache_key = (*_cache_key(db_path, target, query, window), "scored")
+        cached_hits = search_cache.get(cache_key)
+        if cached_hits is not None:
+            hits_by_library[target["library"]["id"]] = cached_hits
+        else:
+            pending.append((target, cache_key))
+
+    # Unprojected query vector per embedding group; each library projects it at use.
+    vectors = dict(cursor_vectors)
+    encoded = False
+    if pending:
+        from game_semantic.meili_client import MeiliGameIndex
+
+        groups: dict[tuple, list[tuple[dict, tuple]]] = {}
+        for target, cache_key in pending:
+            groups.setdefault(_embedding_group_key(target["profile"]), []).append((target, cache_key))
+        embedders = {group_key: _load_query_embedder(members[0][0]["profile"]) for group_key, members in groups.items()}
+        try:
+            searches = []
+            owners = []
+            for group_key, members in groups.items():
+                if group_key not in vectors:
+                    with QUERY_EMBEDDING_SECONDS.time():
+                        dense = embedders[group_key].encode_dense([query], batch_size=1, max_length=group_key[2])
+                    if len(dense) == 0:
+                        continue
+                    vectors[group_key] = np.asarray(dense[0], dtype=np.float32)
+                    encoded = True
+                for target, cache_key in members:
+                    profile = target["profile"]
+                    searches.append(
+                        {
+                            "index_uid": target["library"]["index_uid"],
+                            "vector": _project_query_vectors(target, vectors[group_key][None, :])[0].tolist(),
+                            "limit": limit + 1 if direct else _candidate_limit(profile, window),
+                            **({"offset": offset} if direct else {}),
+                            **_hybrid_search_kwargs(profile, query_text=query),
+                        }
+                    )
+                    owners.append((target, cache_key, embedders[group_key]))
+
+            if searches:
+                game_index = MeiliGameIndex(
+                    url=targets[0]["meili_url"],
+                    api_key=targets[0]["meili_api_key"],
+                    index_uid=searches[0]["index_uid"],
+                    embedder_name="bge_m3",
+                    embedding_dim=len(searches[0]["vector"]),
+                )
+                with MEILI_SEARCH_SECONDS.time():
+                    if library_id is None:
+                        hit_lists = game_index.multi_search_indexes(searches, embedder_key="bge_m3")
+                    else:
+                        search = {key: value for key, value in searches[0].items() if key not in ("index_uid", "vector")}
+                        hit_lists = [
+                            game_index.search_by_vector(
+                                searches[0]["vector"],
+                                embedder_key="bge_m3",
+                                show_ranking_score=True,
+                                **search,
+                            )
+                        ]
+                reranked = [
+                    (target, cache_key, _rerank_hits(target, embedder, query, hits, window))
+                    for (target, cache_key, embedder), hits in zip(owners, hit_lists)
+                ]
+        except Exception as exc:  # noqa: BLE001
+            raise SearchExecutionError(
+                "Search could not be completed. Check Meilisearch and try again."
+            ) from exc
+
+        if searches:
+            for target, cache_key, hits in reranked:
+                hits_by_library[target["library"]["id"]] = hits
+                search_cache.put(cache_key, hits)
+
+    merged = []
+    for target in targets:
+        labels = (
+            {"library_id": target["library"]["id"], "library_name": target["library"]["name"]}
+            if library_id is None
+            else {}
+        )
+        for hit in hits_by_library.get(target["library"]["id"], []):
+            merged.append({**hit, **labels, "_federatedScore": _federated_score(target["profile"], hit)})
+    if direct:
+        hits, has_more = merged[:limit], len(merged) > limit
+    else:
+        merged.sort(key=lambda hit: -hit["_federatedScore"])
+        hits, has_more = merged[offset : offset + limit], len(merged) > offset + limit
+
+    # Only a page with a next page carries a cursor: a new one when the query
+    # was encoded here, otherwise the still-valid one it arrived with.
+    if not has_more:
+        cursor = None
+    elif encoded or not cursor_vectors:
+        cursor = cursors.issue(scope, vectors) if vectors else None
+    return SearchPage(hits, offset, limit, has_more, cursor)
+
+
+@AUTOCOMPLETE_SECONDS.time()
+def execute_autocomplete(
+    db_path: str,
+    library_id: int,
+    prefix: str,
+    limit: int | None = None,
+    *,
+    data_dir=None,
+) -> list[dict]:
+    """Complete a partial title from the library's prefix index.
+
+    Never loads the embedding model or contacts Meilisearch, so it only
+    checks that the latest build is done. Returns ``{"id", "name"}`` dicts;
+    empty when the build predates prefix indexes.
+    """
+    conn = connect_db(db_path)
+    try:
+        library = next((item for item in list_libraries(conn) if item["id"] == library_id), None)
+        latest_job = get_latest_relevant_build_job(conn, library_id) if library is not None else None
+    finally:
+        conn.close()
+    if library is None:
+        raise SearchLibraryNotFoundError(f"Library {library_id} was not found")
+    if latest_job is None or latest_job.get("status") != "done":
+        raise SearchNotReadyError("Library is not searchable yet")
+
+    path = prefix_index_path(
+        resolve_data_dir(data_dir, db_path),
+        library_id,
+        job_id=int(latest_job["id"]),
+        input_fingerprint=latest_job.get("input_fingerprint"),
+    )
+    if not path.exists():
+        return []
+    return open_prefix_index(path).complete(prefix, limit or 10)
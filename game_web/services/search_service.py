@@ -1,6 +1,6 @@
-def build_query_payload(query_vector, limit: int, embedder_key: str):
+def build_query_payload(query_vector, limit: int, embedder_key: str, semantic_ratio: float = 1.0):
     return {
         "vector": query_vector,
-        "hybrid": {"semanticRatio": 1.0, "embedder": embedder_key},
+        "hybrid": {"semanticRatio": semantic_ratio, "embedder": embedder_key},
         "limit": limit,
     }
@@ -0,0 +1,44 @@
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from game_semantic.projection import FULL_DIMS, PcaProjection
+
+
+def profile_vector_dims(profile: dict[str, Any]) -> int:
+    """Stored vector width for a profile; 0 means full-size vectors."""
+    try:
+        dims = int(profile.get("vector_dims") or 0)
+    except (TypeError, ValueError):
+        return 0
+    return dims if 0 < dims < FULL_DIMS else 0
+
+
+def build_artifact_key(*, job_id: int, input_fingerprint: str | None) -> str:
+    """File-name key for per-build artifacts.
+
+    Keyed by the build input fingerprint so a job that reuses an earlier build
+    resolves the same files; builds without a fingerprint fall back to the job id.
+    """
+    return input_fingerprint or f"job-{job_id}"
+
+
+def projection_path(data_dir: Path, library_id: int, *, job_id: int, input_fingerprint: str | None) -> Path:
+    """Where a build's PCA projection lives."""
+    key = build_artifact_key(job_id=job_id, input_fingerprint=input_fingerprint)
+    return Path(data_dir) / "projections" / f"library-{library_id}-{key}.npz"
+
+
+@lru_cache(maxsize=16)
+def _load_cached(path: str, mtime_ns: int) -> PcaProjection:
+    return PcaProjection.load(path)
+
+
+def load_projection(path: Path) -> PcaProjection:
+    """Load a projection, reusing the parsed arrays until the file changes."""
+    return _load_cached(str(path), Path(path).stat().st_mtime_ns)
+
+
+def clear_projection_cache() -> None:
+    """Drop every parsed projection, e.g. after their files were deleted."""
+    _load_cached.cache_clear()
@@ -0,0 +1,53 @@
+import pytest
+
+from game_semantic.batching import AdaptiveBatchSizer
+
+
+def _seconds(size):
+    # Fixed per-batch overhead plus a cost that grows faster than linearly; best docs/s near 200.
+    return 0.05 + size * 0.001 + (size / 400) ** 2 * 0.2
+
+
+def _run(sizer, batches=60, cost=_seconds):
+    sizes = []
+    for _ in range(batches):
+        sizes.append(sizer.size)
+        sizer.observe(sizer.size, cost(sizer.size))
+    return sizes
+
+
+def test_sizer_converges_near_best_throughput_from_either_side():
+    best_rate = max(size / _seconds(size) for size in range(32, 4096))
+
+    for initial in (32, 4096):
+        sizer = AdaptiveBatchSizer("upload", initial, minimum=32, maximum=8192)
+        sizes = _run(sizer)
+
+        assert sizer.settled
+        assert sizes[-1] == sizer.best_size
+        assert sizer.best_size / _seconds(sizer.best_size) == pytest.approx(best_rate, rel=0.1)
+
+
+def test_warmup_batches_are_ignored_and_limit_caps_the_size():
+    sizer = AdaptiveBatchSizer("encode", 64, minimum=8, maximum=512, warmup=1, samples=1)
+
+    sizer.observe(64, 100.0)
+    assert sizer.best_size is None
+
+    sizer.limit = 100
+    _run(sizer, cost=lambda size: 0.01)  # flat cost per batch: bigger is always better
+    assert sizer.size == 100
+
+
+def test_slow_batches_shrink_and_cap_the_size():
+    sizer = AdaptiveBatchSizer("upload", 1024, minimum=32, maximum=8192, warmup=0, max_seconds=1.0)
+
+    sizer.observe(1024, 5.0)
+
+    assert sizer.size == 512
+    assert sizer.maximum == 1023
+
+
+def test_rejects_invalid_bounds():
+    with pytest.raises(ValueError):
+        AdaptiveBatchSizer("upload", 10, minimum=0, maximum=5)
@@ -0,0 +1,62 @@
+import copy
+
+import pytest
+
+from benchmarks.suite import BenchSizes, compare_reports, run_suite
+
+
+def test_run_suite_reports_every_hot_path_offline():
+    sizes = BenchSizes(
+        build_docs=40,
+        upload_docs=20,
+        search_docs=40,
+        search_queries=5,
+        dedupe_sizes=[20],
+        library_counts=[2],
+    )
+
+    report = run_suite(sizes, repeats=1)
+
+    assert set(report["metrics"]) == {
+        "build_index.docs_per_second",
+        "upload.bytes_per_second",
+        "upload.docs_per_second",
+        "execute_search.p50_ms",
+        "execute_search.p95_ms",
+        "execute_search.p99_ms",
+        "execute_search_all.p50_ms[libraries=3]",
+        "execute_search_all.p95_ms[libraries=3]",
+        "execute_search_all.p99_ms[libraries=3]",
+        "dedupe_items.seconds[n=20]",
+        "library_list_context.ms[libraries=2]",
+    }
+    assert all(metric["value"] > 0 for metric in report["metrics"].values())
+    assert report["sizes"]["dedupe_sizes"] == [20]
+
+
+def test_compare_reports_flags_regressions_in_either_direction():
+    baseline = {
+        "schema": 1,
+        "sizes": {"build_docs": 10},
+        "metrics": {
+            "build_index.docs_per_second": {"value": 100.0, "unit": "docs/s", "higher_is_better": True},
+            "execute_search.p95_ms": {"value": 10.0, "unit": "ms", "higher_is_better": False},
+            "upload.docs_per_second": {"value": 50.0, "unit": "docs/s", "higher_is_better": True},
+        },
+    }
+    current = copy.deepcopy(baseline)
+    current["metrics"]["build_index.docs_per_second"]["value"] = 70.0
+    current["metrics"]["execute_search.p95_ms"]["value"] = 11.0
+    current["metrics"]["upload.docs_per_second"]["value"] = 80.0
+    current["metrics"]["dedupe_items.seconds[n=5]"] = {"value": 1.0, "unit": "s", "higher_is_better": False}
+
+    regressions = compare_reports(current, baseline, threshold=0.2)
+
+    assert [row["metric"] for row in regressions] == ["build_index.docs_per_second"]
+    assert regressions[0]["change"] == pytest.approx(-0.3)
+    assert [row["metric"] for row in compare_reports(current, baseline, threshold=0.05)] == [
+        "build_index.docs_per_second",
+        "execute_search.p95_ms",
+    ]
+    with pytest.raises(ValueError, match="different sizes"):
+        compare_reports(current, {**baseline, "sizes": {"build_docs": 20}}, threshold=0.2)
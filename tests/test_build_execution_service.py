@@ -1,10 +1,13 @@
 import importlib
 import sys
+from pathlib import Path
 from types import SimpleNamespace
 
+from game_semantic.config import Config
 from game_web.db import connect_db, init_db
 from game_web.secrets import encrypt_secret
 from game_web.services import dataset_service, job_service, library_service
+from game_web.services.embedding_profile import upsert_active_profile
 from game_web.services.settings_service import set_setting
 
 
@@ -72,7 +75,7 @@ def test_execute_build_job_uses_job_dataset_and_active_profile(monkeypatch, tmp_
 
     captured = {}
 
-    def _build_index(config):
+    def _build_index(config, progress=None, expected_docs=None):
         captured["meili_url"] = config.meili_url
         captured["meili_api_key"] = config.meili_api_key
         captured["txt_path"] = config.txt_path
@@ -81,6 +84,9 @@ def test_execute_build_job_uses_job_dataset_and_active_profile(monkeypatch, tmp_
         captured["bge_model_name"] = config.bge_model_name
         captured["bge_use_fp16"] = config.bge_use_fp16
         captured["embedding_max_length"] = config.embedding_max_length
+        captured["adaptive_batching"] = config.adaptive_batching
+        captured["settings_state_path"] = config.settings_state_path
+        captured["prefix_index_path"] = config.prefix_index_path
 
     monkeypatch.setattr("game_web.services.build_execution_service.build_index", _build_index)
 
@@ -95,6 +101,20 @@ def test_execute_build_job_uses_job_dataset_and_active_profile(monkeypatch, tmp_
     assert captured["bge_model_name"] == "BAAI/bge-m3"
     assert captured["bge_use_fp16"] is False
     assert captured["embedding_max_length"] == 128
+    assert captured["adaptive_batching"] is Config.adaptive_batching
+    assert captured["settings_state_path"] == str(data_dir / "meili_settings" / "library-1.json")
+    assert captured["prefix_index_path"].startswith(str(data_dir / "prefix" / "library-1-"))
+
+    conn = connect_db(str(db_path))
+    try:
+        upsert_active_profile(
+            conn, library_id=1, model_name="BAAI/bge-m3", use_fp16=0, max_length=128, adaptive_batching="1", commit=True
+        )
+    finally:
+        conn.close()
+    execute_build_job(db_path=str(db_path), data_dir=data_dir, job=job, log=log_lines.append)
+
+    assert captured["adaptive_batching"] is True
 
 
 def test_execute_build_job_allows_url_only_meili_configuration(monkeypatch, tmp_path):
@@ -152,7 +172,7 @@ def test_execute_build_job_allows_url_only_meili_configuration(monkeypatch, tmp_
 
     captured = {}
 
-    def _build_index(config):
+    def _build_index(config, progress=None, expected_docs=None):
         captured["meili_url"] = config.meili_url
         captured["meili_api_key"] = config.meili_api_key
 
@@ -184,3 +204,221 @@ def test_get_cached_bge_m3_reuses_same_instance(monkeypatch):
     assert created == [("BAAI/bge-m3", False)]
 
     embedding.get_cached_bge_m3.cache_clear()
+
+
+def test_progress_reporter_logs_every_batch_and_throttles_job_row_updates(monkeypatch, tmp_path):
+    _install_fake_flag_embedding(monkeypatch)
+    from game_semantic.index_builder import BuildProgress
+    from game_web.services.build_execution_service import _make_progress_reporter
+
+    db_path = tmp_path / "app.db"
+    data_dir = tmp_path / "data"
+    init_db(str(db_path))
+    conn = connect_db(str(db_path))
+    try:
+        library_service.create_library(conn, name="Main Library", index_uid="main-index")
+        dataset = dataset_service.create_dataset(
+            conn,
+            data_dir=data_dir,
+            library_id=1,
+            filename="games.txt",
+            content=b"A\n",
+        )
+        job_id = job_service.create_job(
+            conn,
+            library_id=1,
+            dataset_id=int(dataset["id"]),
+            job_type="build",
+            status="running",
+        )
+    finally:
+        conn.close()
+
+    now = [0.0]
+    log_lines = []
+    report = _make_progress_reporter(str(db_path), job_id, log_lines.append, clock=lambda: now[0])
+
+    def _progress(done):
+        return BuildProgress(
+            batch=done,
+            batch_docs=1,
+            docs_done=done,
+            docs_total=3,
+            encode_seconds=0.1,
+            serialize_seconds=0.0,
+            upload_seconds=0.0,
+            task_seconds=0.0,
+            elapsed_seconds=float(done),
+            docs_per_second=1.0,
+            eta_seconds=float(3 - done),
+            finished=done == 3,
+        )
+
+    def _stored_docs_done():
+        conn = connect_db(str(db_path))
+        try:
+            return job_service.get_job(conn, job_id)["progress"]["docs_done"]
+        finally:
+            conn.close()
+
+    report(_progress(1))
+    assert _stored_docs_done() == 1
+    now[0] = 0.5
+    report(_progress(2))
+    assert _stored_docs_done() == 1
+    report(_progress(3))
+    assert _stored_docs_done() == 3
+    assert len(log_lines) == 3
+    assert log_lines[1].startswith("Batch 2: 2/3 docs")
+
+
+def test_build_input_fingerprint_ignores_query_time_settings():
+    profile = {"model_name": "BAAI/bge-m3", "use_fp16": 0, "max_length": 128, "semantic_ratio": 1.0}
+    base = job_service.build_input_fingerprint(content_sha256="abc", index_uid="games", profile=profile)
+
+    assert base == job_service.build_input_fingerprint(
+        content_sha256="abc", index_uid="games", profile={**profile, "semantic_ratio": 0.4}
+    )
+    assert base != job_service.build_input_fingerprint(
+        content_sha256="abc", index_uid="games", profile={**profile, "max_length": 256}
+    )
+    assert base != job_service.build_input_fingerprint(content_sha256="abd", index_uid="games", profile=profile)
+    # Candidate outputs for reranking are written at build time only.
+    assert base == job_service.build_input_fingerprint(
+        content_sha256="abc", index_uid="games", profile={**profile, "rerank_mode": "", "rerank_candidates": 80}
+    )
+    assert base != job_service.build_input_fingerprint(
+        content_sha256="abc", index_uid="games", profile={**profile, "rerank_mode": "colbert"}
+    )
+    assert job_service.build_input_fingerprint(content_sha256=None, index_uid="games", profile=profile) is None
+
+
+def test_build_input_fingerprint_only_hashes_non_default_backend():
+    profile = {"model_name": "BAAI/bge-m3", "use_fp16": 0, "max_length": 128}
+    base = job_service.build_input_fingerprint(content_sha256="abc", index_uid="games", profile=profile)
+
+    assert base == job_service.build_input_fingerprint(
+        content_sha256="abc", index_uid="games", profile={**profile, "backend": "torch"}
+    )
+    assert base != job_service.build_input_fingerprint(
+        content_sha256="abc", index_uid="games", profile={**profile, "backend": "onnx-int8"}
+    )
+
+
+def test_execute_build_job_skips_when_inputs_match_last_successful_build(monkeypatch, tmp_path):
+    from game_web.services.build_execution_service import execute_build_job
+
+    db_path = tmp_path / "app.db"
+    data_dir = tmp_path / "data"
+    init_db(str(db_path))
+    conn = connect_db(str(db_path))
+    try:
+        set_setting(conn, "meili_url", "http://127.0.0.1:7700", commit=False)
+        library_service.create_library(conn, name="Main Library", index_uid="main-index")
+        job_ids = []
+        for _ in range(2):
+            dataset = dataset_service.create_dataset(
+                conn,
+                data_dir=data_dir,
+                library_id=1,
+                filename="games.txt",
+                content=b"A\nB\n",
+                commit=False,
+            )
+            job_ids.append(
+                job_service.create_job(
+                    conn,
+                    library_id=1,
+                    dataset_id=int(dataset["id"]),
+                    job_type="build",
+                    status="running",
+                    commit=False,
+                )
+            )
+        conn.commit()
+        first_job = job_service.get_job(conn, job_ids[0])
+        second_job = job_service.get_job(conn, job_ids[1])
+    finally:
+        conn.close()
+
+    builds = []
+    monkeypatch.setattr(
+        "game_web.services.build_execution_service.build_index",
+        lambda config, progress=None, expected_docs=None: builds.append(config),
+    )
+
+    execute_build_job(db_path=str(db_path), data_dir=data_dir, job=first_job, log=lambda _message: None)
+    conn = connect_db(str(db_path))
+    try:
+        job_service.update_job(conn, first_job["id"], status="done")
+    finally:
+        conn.close()
+    log_lines = []
+    execute_build_job(db_path=str(db_path), data_dir=data_dir, job=second_job, log=log_lines.append)
+
+    assert len(builds) == 1
+    assert log_lines[-1] == f"Dataset and search configuration match job {first_job['id']}; skipping rebuild"
+    conn = connect_db(str(db_path))
+    try:
+        stored = job_service.get_job(conn, second_job["id"])
+        reused = job_service.get_job(conn, first_job["id"])
+    finally:
+        conn.close()
+    assert stored["input_fingerprint"] == reused["input_fingerprint"]
+    assert stored["progress"]["reused_job_id"] == first_job["id"]
+
+
+def test_execute_build_job_prunes_stale_artifacts_and_keeps_running_builds(monkeypatch, tmp_path):
+    from game_web.services import rerank_store
+    from game_web.services.build_execution_service import execute_build_job
+
+    db_path = tmp_path / "app.db"
+    data_dir = tmp_path / "data"
+    init_db(str(db_path))
+    conn = connect_db(str(db_path))
+    try:
+        set_setting(conn, "meili_url", "http://127.0.0.1:7700", commit=False)
+        library_service.create_library(conn, name="Main Library", index_uid="main-index")
+        dataset = dataset_service.create_dataset(
+            conn, data_dir=data_dir, library_id=1, filename="games.txt", content=b"A\n", commit=False
+        )
+        other_id = job_service.create_job(
+            conn, library_id=1, dataset_id=int(dataset["id"]), job_type="build", status="running", commit=False
+        )
+        job_service.set_job_input_fingerprint(conn, other_id, "other-fp", commit=False)
+        job_id = job_service.create_job(
+            conn, library_id=1, dataset_id=int(dataset["id"]), job_type="build", status="running", commit=False
+        )
+        conn.commit()
+        job = job_service.get_job(conn, job_id)
+    finally:
+        conn.close()
+
+    def _artifact(directory, name):
+        path = data_dir / directory / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"x")
+        return path
+
+    stale = [
+        _artifact("projections", "library-1-old.npz"),
+        _artifact("prefix", "library-1-old.sqlite"),
+        _artifact("rerank", "library-1-old.sqlite-wal"),
+    ]
+    stale_store = data_dir / "rerank" / "library-1-old.sqlite"
+    rerank_store.open_rerank_store(stale_store)
+    stale.append(stale_store)
+    kept = [_artifact("rerank", "library-1-other-fp.sqlite"), _artifact("rerank", "library-11-old.sqlite")]
+
+    def _build_index(config, progress=None, expected_docs=None):
+        kept.extend(_artifact(Path(path).parent.name, Path(path).name) for path in (config.rerank_store_path, config.prefix_index_path))
+
+    monkeypatch.setattr("game_web.services.build_execution_service.build_index", _build_index)
+
+    log_lines = []
+    execute_build_job(db_path=str(db_path), data_dir=data_dir, job=job, log=log_lines.append)
+
+    assert [path for path in stale if path.exists()] == []
+    assert all(path.exists() for path in kept)
+    assert str(stale_store) not in rerank_store._stores
+    assert any(line.startswith("Removed ") and "stale build artifact" in line for line in log_lines)
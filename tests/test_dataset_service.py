@@ -45,3 +45,129 @@ class _FileObj:
         end = min(start + size, len(self._content))
         self._offset = end
         return self._content[start:end]
+
+
+class _RecordingConn:
+    def __init__(self):
+        self.params = None
+
+    def execute(self, _sql, params):
+        self.params = params
+        return type("Cursor", (), {"lastrowid": 1})()
+
+    def commit(self):
+        pass
+
+
+def test_save_upload_records_line_stats_and_content_hash(tmp_path):
+    import hashlib
+
+    content = "明日方舟\n  CLANNAD  \n\n明日方舟\r\nSteins;Gate".encode("utf-8")
+
+    dataset = dataset_service.save_upload(
+        _RecordingConn(),
+        data_dir=tmp_path,
+        library_id=1,
+        filename="games.txt",
+        file_obj=_FileObj(content),
+    )
+
+    assert dataset["line_count"] == 4
+    assert dataset["unique_line_count"] == 3
+    assert dataset["content_sha256"] == hashlib.sha256(content).hexdigest()
+    assert dataset["path"].read_bytes() == content
+
+
+def test_save_upload_counts_lines_like_the_builder_reads_them(tmp_path, monkeypatch):
+    from game_semantic.index_builder import iter_game_names, iter_unique
+
+    # Chunks of 3 bytes split both a "\r\n" pair and multi-byte characters.
+    monkeypatch.setattr(dataset_service, "UPLOAD_CHUNK_SIZE", 3)
+    content = "明日方舟\rCLANNAD\r\n明日方舟\rSteins;Gate\r".encode("utf-8")
+
+    dataset = dataset_service.save_upload(
+        _RecordingConn(),
+        data_dir=tmp_path,
+        library_id=1,
+        filename="games.txt",
+        file_obj=_FileObj(content),
+    )
+
+    built = list(iter_unique(iter_game_names(str(dataset["path"]))))
+    assert dataset["line_count"] == 4
+    assert dataset["unique_line_count"] == len(built) == 3
+
+
+def test_save_upload_rejects_text_the_builder_cannot_decode(tmp_path):
+    with pytest.raises(dataset_service.UnsupportedUpload, match="UTF-8"):
+        dataset_service.save_upload(
+            _RecordingConn(),
+            data_dir=tmp_path,
+            library_id=1,
+            filename="games.txt",
+            file_obj=_FileObj("明日方舟\n".encode("utf-8") + b"\xff\xfe broken\n"),
+        )
+
+    assert list((tmp_path / "uploads" / "1").iterdir()) == []
+
+
+def test_save_upload_decompresses_gzip_and_strips_suffix(tmp_path, monkeypatch):
+    import gzip
+
+    monkeypatch.setattr(dataset_service, "UPLOAD_CHUNK_SIZE", 7)
+    content = "".join(f"Game {i}\n" for i in range(50)).encode("utf-8")
+    conn = _RecordingConn()
+
+    dataset = dataset_service.save_upload(
+        conn,
+        data_dir=tmp_path,
+        library_id=1,
+        filename="games.txt.gz",
+        file_obj=_FileObj(gzip.compress(content)),
+    )
+
+    assert dataset["filename"] == "games.txt"
+    assert dataset["size_bytes"] == len(content)
+    assert dataset["path"].read_bytes() == content
+    assert dataset["line_count"] == dataset["unique_line_count"] == 50
+    assert conn.params[5:7] == (50, 50)
+
+
+def test_save_upload_limits_decompressed_size(tmp_path, monkeypatch):
+    import gzip
+
+    monkeypatch.setattr(dataset_service, "UPLOAD_MAX_BYTES", 100)
+
+    with pytest.raises(dataset_service.UploadTooLarge):
+        dataset_service.save_upload(
+            _RecordingConn(),
+            data_dir=tmp_path,
+            library_id=1,
+            filename="games.txt.gz",
+            file_obj=_FileObj(gzip.compress(b"x" * 1000)),
+        )
+
+    assert not (tmp_path / "uploads" / "1" / "games.txt").exists()
+
+
+def test_save_upload_rejects_corrupt_gzip_and_zstd_without_package(tmp_path, monkeypatch):
+    with pytest.raises(dataset_service.UnsupportedUpload, match="corrupt"):
+        dataset_service.save_upload(
+            _RecordingConn(),
+            data_dir=tmp_path,
+            library_id=1,
+            filename="games.txt.gz",
+            file_obj=_FileObj(b"\x1f\x8b\x08\x00garbage"),
+        )
+
+    monkeypatch.setattr(dataset_service, "zstandard", None)
+    with pytest.raises(dataset_service.UnsupportedUpload, match="zstandard"):
+        dataset_service.save_upload(
+            _RecordingConn(),
+            data_dir=tmp_path,
+            library_id=1,
+            filename="games.txt.zst",
+            file_obj=_FileObj(b"\x28\xb5\x2f\xfd" + b"\x00" * 8),
+        )
+
+    assert list((tmp_path / "uploads" / "1").iterdir()) == []
@@ -1040,3 +1040,93 @@ def test_run_jobs_requires_csrf_token(tmp_path, monkeypatch):
     response = client.post("/jobs/run", follow_redirects=False)
 
     assert response.status_code == 403
+
+
+def test_job_progress_endpoint_returns_persisted_build_progress(tmp_path):
+    db_path = tmp_path / "app.db"
+    app = create_app(str(db_path))
+    app.state.data_dir = tmp_path / "data"
+    client = TestClient(app)
+
+    response = client.get("/jobs/1/progress")
+    assert response.status_code == 401
+
+    _login(client)
+    library_id = int(_create_library(client))
+    conn = connect_db(str(db_path))
+    try:
+        dataset = dataset_service.create_dataset(
+            conn,
+            data_dir=tmp_path / "data",
+            library_id=library_id,
+            filename="games.txt",
+            content=b"A\nB\n",
+        )
+        job_id = job_service.create_job(
+            conn,
+            library_id=library_id,
+            dataset_id=int(dataset["id"]),
+            job_type="build",
+            status="running",
+        )
+        job_service.update_job_progress(
+            conn,
+            job_id,
+            {"docs_done": 1, "docs_total": 2, "docs_per_second": 4.0, "eta_seconds": 0.25},
+        )
+    finally:
+        conn.close()
+
+    response = client.get(f"/jobs/{job_id}/progress")
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "running"
+    assert response.json()["progress"]["docs_done"] == 1
+
+    response = client.get(f"/jobs/{job_id}")
+    assert '<progress id="job-progress-bar" max="2" value="1">' in response.text
+    assert client.get("/jobs/999/progress").status_code == 404
+
+
+def test_reupload_of_identical_dataset_skips_rebuild(tmp_path, monkeypatch):
+    db_path = tmp_path / "app.db"
+    app = create_app(str(db_path))
+    app.state.data_dir = tmp_path / "data"
+    client = TestClient(app)
+
+    _login(client)
+    _set_reachable_settings(db_path, monkeypatch)
+    library_id = int(_create_library(client))
+
+    def _upload(content: bytes):
+        return client.post(
+            f"/libraries/{library_id}/datasets/upload",
+            data={"csrf_token": _csrf_token(client)},
+            files={"file": ("games.txt", content)},
+            follow_redirects=True,
+        )
+
+    assert "Build job queued" in _upload(b"A\nB\n").text
+    conn = connect_db(str(db_path))
+    try:
+        first_job = job_service.get_latest_relevant_build_job(conn, library_id)
+        assert first_job["input_fingerprint"]
+        job_service.update_job(conn, first_job["id"], status="done")
+    finally:
+        conn.close()
+
+    response = _upload(b"A\nB\n")
+
+    assert f"Dataset unchanged since job {first_job['id']}; rebuild skipped" in response.text
+    conn = connect_db(str(db_path))
+    try:
+        reused_job = job_service.get_latest_relevant_build_job(conn, library_id)
+        assert reused_job["id"] != first_job["id"]
+        assert reused_job["status"] == "done"
+        assert reused_job["progress"]["reused_job_id"] == first_job["id"]
+        assert not job_service.has_queued_build_jobs(conn)
+    finally:
+        conn.close()
+    assert "Rebuild skipped" in client.get(f"/jobs/{reused_job['id']}").text
+
+    assert "Build job queued" in _upload(b"A\nB\nC\n").text
@@ -0,0 +1,199 @@
+import importlib
+import sys
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+
+def _load_embedding(monkeypatch, calls):
+    class FakeTokenizer:
+        def __call__(self, texts, add_special_tokens=True, truncation=True, max_length=128):
+            return {"input_ids": [list(range(min(len(text) + 2, max_length))) for text in texts]}
+
+    class FakeFlagModel:
+        def __init__(self, model_name, use_fp16=False):
+            self.tokenizer = FakeTokenizer()
+
+        def encode(self, texts, batch_size=64, max_length=128, **_kwargs):
+            calls.append(list(texts))
+            return {"dense_vecs": np.array([[float(len(text))] * 4 for text in texts], dtype=np.float32)}
+
+    monkeypatch.setitem(sys.modules, "FlagEmbedding", SimpleNamespace(BGEM3FlagModel=FakeFlagModel))
+    return importlib.reload(importlib.import_module("game_semantic.embedding"))
+
+
+def test_plan_length_buckets_sorts_by_length_and_respects_budget(monkeypatch):
+    plan_length_buckets = _load_embedding(monkeypatch, []).plan_length_buckets
+
+    lengths = [10, 3, 8, 3, 40, 9]
+
+    buckets = plan_length_buckets(lengths, max_batch_size=3, token_budget=30)
+
+    assert buckets == [[1, 3, 2], [5, 0], [4]]
+    for bucket in buckets[:-1]:
+        assert len(bucket) * max(lengths[position] for position in bucket) <= 30
+
+
+def test_encode_dense_buckets_by_length_and_restores_order(monkeypatch):
+    calls = []
+    embedding = _load_embedding(monkeypatch, calls)
+    embedder = embedding.BgeM3Embedder("fake")
+    texts = ["a" * 20, "b", "c" * 18, "d", "e" * 2]
+    stats = embedding.PaddingStats()
+
+    vecs = embedder.encode_dense(texts, batch_size=4, max_length=64, token_budget=48, stats=stats)
+
+    assert [row[0] for row in vecs] == [20.0, 1.0, 18.0, 1.0, 2.0]
+    assert calls == [["b", "d", "ee"], ["c" * 18, "a" * 20]]
+    assert stats.real_tokens == 22 + 3 + 20 + 3 + 4
+    assert stats.padded_tokens == 3 * 4 + 2 * 22
+    assert stats.unbucketed_padded_tokens == 4 * 22 + 4
+    assert stats.padding_ratio < stats.unbucketed_padded_tokens / stats.real_tokens
+
+
+def test_encode_dense_without_budget_keeps_single_call(monkeypatch):
+    calls = []
+    embedding = _load_embedding(monkeypatch, calls)
+    embedder = embedding.BgeM3Embedder("fake")
+
+    embedder.encode_dense(["long name", "x"], batch_size=2)
+
+    assert calls == [["long name", "x"]]
+
+
+def test_dense_embedder_requires_backends_to_implement_encoding():
+    from game_semantic.embedding import DenseEmbedder
+
+    class TokenCountOnly(DenseEmbedder):
+        def token_lengths(self, texts, max_length=128):
+            return [len(text) for text in texts]
+
+    with pytest.raises(TypeError, match="_encode_batch"):
+        TokenCountOnly()
+
+
+def _install_fake_onnx_runtime(monkeypatch, runs):
+    class FakeTokenizer:
+        def __call__(self, texts, padding=False, truncation=True, max_length=128, return_tensors=None, **_kwargs):
+            ids = [list(range(min(len(text) + 2, max_length))) for text in texts]
+            if not padding:
+                return {"input_ids": ids}
+            width = max(len(row) for row in ids)
+            return {
+                "input_ids": np.array([row + [0] * (width - len(row)) for row in ids]),
+                "attention_mask": np.array([[1] * len(row) + [0] * (width - len(row)) for row in ids]),
+            }
+
+    class FakeSession:
+        def __init__(self, path, sess_options=None, providers=None):
+            self.path = path
+
+        def run(self, output_names, feeds):
+            runs.append(feeds["input_ids"].shape)
+            lengths = feeds["attention_mask"].sum(axis=1).astype(np.float32)
+            return [np.repeat(lengths[:, None], 4, axis=1)]
+
+    fake_ort = SimpleNamespace(
+        SessionOptions=lambda: SimpleNamespace(),
+        GraphOptimizationLevel=SimpleNamespace(ORT_ENABLE_ALL=99),
+        InferenceSession=FakeSession,
+    )
+    fake_transformers = SimpleNamespace(AutoTokenizer=SimpleNamespace(from_pretrained=lambda path: FakeTokenizer()))
+    monkeypatch.setitem(sys.modules, "onnxruntime", fake_ort)
+    monkeypatch.setitem(sys.modules, "transformers", fake_transformers)
+
+
+def test_create_embedder_loads_exported_onnx_model(monkeypatch, tmp_path):
+    runs = []
+    embedding = _load_embedding(monkeypatch, [])
+    _install_fake_onnx_runtime(monkeypatch, runs)
+    onnx_embedder = importlib.reload(importlib.import_module("game_semantic.onnx_embedder"))
+    model_path = tmp_path / "BAAI__bge-m3" / "model.int8.onnx"
+    model_path.parent.mkdir()
+    model_path.write_bytes(b"onnx")
+
+    embedder = embedding.create_embedder("BAAI/bge-m3", backend="onnx-int8", onnx_model_dir=str(tmp_path))
+    vecs = embedder.encode_dense(["abcdef", "a", "abc"], batch_size=2, max_length=64, token_budget=16)
+
+    assert isinstance(embedder, onnx_embedder.OnnxBgeM3Embedder)
+    assert embedder.model_path == str(model_path)
+    assert [row[0] for row in vecs] == [8.0, 3.0, 5.0]
+    assert runs == [(2, 5), (1, 8)]
+
+
+def test_onnx_encode_batch_clamps_a_zero_batch_size(monkeypatch, tmp_path):
+    runs = []
+    embedding = _load_embedding(monkeypatch, [])
+    _install_fake_onnx_runtime(monkeypatch, runs)
+    importlib.reload(importlib.import_module("game_semantic.onnx_embedder"))
+    model_path = tmp_path / "BAAI__bge-m3" / "model.onnx"
+    model_path.parent.mkdir()
+    model_path.write_bytes(b"onnx")
+
+    embedder = embedding.create_embedder("BAAI/bge-m3", backend="onnx", onnx_model_dir=str(tmp_path))
+    vecs = embedder.encode_dense(["abc", "a"], batch_size=0, max_length=64)
+
+    assert [row[0] for row in vecs] == [5.0, 3.0]
+    assert runs == [(1, 5), (1, 3)]
+
+
+def test_onnx_backend_reports_missing_export(monkeypatch, tmp_path):
+    embedding = _load_embedding(monkeypatch, [])
+    _install_fake_onnx_runtime(monkeypatch, [])
+    importlib.reload(importlib.import_module("game_semantic.onnx_embedder"))
+
+    with pytest.raises(FileNotFoundError, match="bin/export_onnx.py"):
+        embedding.create_embedder("BAAI/bge-m3", backend="onnx", onnx_model_dir=str(tmp_path))
+    with pytest.raises(ValueError, match="Unknown embedder backend"):
+        embedding.create_embedder("BAAI/bge-m3", backend="tpu")
+
+
+def test_dense_parity_reports_row_cosines(monkeypatch):
+    _load_embedding(monkeypatch, [])
+    onnx_embedder = importlib.import_module("game_semantic.onnx_embedder")
+    reference = np.array([[1.0, 0.0], [0.0, 1.0]])
+
+    parity = onnx_embedder.dense_parity(reference, np.array([[1.0, 0.0], [1.0, 1.0]]))
+
+    assert parity["mean_cosine"] == pytest.approx((1.0 + 2**-0.5) / 2)
+    assert parity["min_cosine"] == pytest.approx(2**-0.5)
+    assert parity["min_cosine"] < onnx_embedder.PARITY_MIN_COSINE
+
+
+def test_encode_multi_returns_lexical_weights_and_colbert_vectors(monkeypatch):
+    embedding = _load_embedding(monkeypatch, [])
+    embedder = embedding.BgeM3Embedder("fake")
+    requested = {}
+
+    def encode(texts, batch_size=64, max_length=128, **kwargs):
+        requested.update(kwargs)
+        return {
+            "dense_vecs": np.ones((len(texts), 4), dtype=np.float32),
+            "lexical_weights": [{101: np.float16(0.5)} for _ in texts],
+            "colbert_vecs": [np.ones((len(text), 2), dtype=np.float16) for text in texts],
+        }
+
+    embedder.model.encode = encode
+    outputs = embedder.encode_multi(["ab", "abc"], colbert=True, sparse=True)
+
+    assert requested == {"return_dense": True, "return_sparse": True, "return_colbert_vecs": True}
+    assert outputs["lexical_weights"] == [{"101": 0.5}, {"101": 0.5}]
+    assert [vecs.shape for vecs in outputs["colbert_vecs"]] == [(2, 2), (3, 2)]
+    assert outputs["colbert_vecs"][0].dtype == np.float32
+    assert embedder.encode_multi([], sparse=False)["dense_vecs"].shape == (0, embedder.dim)
+
+
+def test_default_config_and_search_resolve_the_same_onnx_model_dir(monkeypatch, tmp_path):
+    from game_semantic.config import Config
+    from game_semantic.onnx_embedder import onnx_model_path
+
+    monkeypatch.setenv("ONNX_MODEL_DIR", str(tmp_path))
+    expected = str(tmp_path / "BAAI__bge-m3" / "model.onnx")
+
+    # Web builds construct Config() directly; web search passes no directory at all.
+    assert onnx_model_path("BAAI/bge-m3", Config().onnx_model_dir) == expected
+    assert onnx_model_path("BAAI/bge-m3", None) == expected
+
+    monkeypatch.delenv("ONNX_MODEL_DIR")
+    assert onnx_model_path("BAAI/bge-m3", Config().onnx_model_dir) == "models/onnx/BAAI__bge-m3/model.onnx"
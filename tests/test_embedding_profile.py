@@ -373,3 +373,185 @@ def test_upsert_active_profile_commit_true_is_atomic_when_final_update_fails(tmp
     assert persisted_profile_after_failure["model_name"] == "BAAI/bge-m3"
     assert persisted_profile_after_failure["use_fp16"] == 0
     assert persisted_profile_after_failure["max_length"] == 128
+
+
+def test_upsert_active_profile_semantic_ratio_is_not_a_material_change(tmp_path):
+    db_path = tmp_path / "app.db"
+    init_db(str(db_path))
+    conn = connect_db(str(db_path))
+    try:
+        create_library(
+            conn,
+            name="Main Library",
+            index_uid="main-index",
+            description="Primary games library",
+        )
+        library_id = list_libraries(conn)[0]["id"]
+        changed = upsert_active_profile(
+            conn,
+            library_id=library_id,
+            model_name="BAAI/bge-m3",
+            use_fp16=0,
+            max_length=128,
+            semantic_ratio=0.6,
+            commit=True,
+        )
+        profile = get_active_profile(conn, library_id)
+
+        with pytest.raises(ValueError, match="Semantic ratio must be between 0 and 1"):
+            upsert_active_profile(
+                conn,
+                library_id=library_id,
+                model_name="BAAI/bge-m3",
+                use_fp16=0,
+                max_length=128,
+                semantic_ratio=1.5,
+            )
+    finally:
+        conn.close()
+
+    assert changed is False
+    assert profile["semantic_ratio"] == 0.6
+
+
+def test_upsert_active_profile_backend_change_is_material(tmp_path):
+    db_path = tmp_path / "app.db"
+    init_db(str(db_path))
+    conn = connect_db(str(db_path))
+    try:
+        create_library(conn, name="Main Library", index_uid="main-index")
+        library_id = list_libraries(conn)[0]["id"]
+        kept = upsert_active_profile(
+            conn, library_id=library_id, model_name="BAAI/bge-m3", use_fp16=0, max_length=128, commit=True
+        )
+        switched = upsert_active_profile(
+            conn,
+            library_id=library_id,
+            model_name="BAAI/bge-m3",
+            use_fp16=0,
+            max_length=128,
+            backend="onnx",
+            commit=True,
+        )
+        profile = get_active_profile(conn, library_id)
+
+        with pytest.raises(ValueError, match="Backend must be one of"):
+            upsert_active_profile(
+                conn, library_id=library_id, model_name="BAAI/bge-m3", use_fp16=0, max_length=128, backend="tpu"
+            )
+    finally:
+        conn.close()
+
+    assert kept is False
+    assert switched is True
+    assert profile["backend"] == "onnx"
+
+
+def test_upsert_active_profile_vector_dims_validation_and_change(tmp_path):
+    db_path = tmp_path / "app.db"
+    init_db(str(db_path))
+    conn = connect_db(str(db_path))
+    try:
+        create_library(conn, name="Main Library", index_uid="main-index")
+        library_id = list_libraries(conn)[0]["id"]
+        reduced = upsert_active_profile(
+            conn, library_id=library_id, model_name="BAAI/bge-m3", use_fp16=0, max_length=128, vector_dims="256"
+        )
+        unchanged = upsert_active_profile(
+            conn, library_id=library_id, model_name="BAAI/bge-m3", use_fp16=0, max_length=128
+        )
+        full = upsert_active_profile(
+            conn, library_id=library_id, model_name="BAAI/bge-m3", use_fp16=0, max_length=128, vector_dims=1024
+        )
+        profile = get_active_profile(conn, library_id)
+
+        with pytest.raises(ValueError, match="Vector dims must be 0"):
+            upsert_active_profile(
+                conn, library_id=library_id, model_name="BAAI/bge-m3", use_fp16=0, max_length=128, vector_dims=4096
+            )
+    finally:
+        conn.close()
+
+    assert (reduced, unchanged, full) == (True, False, True)
+    assert profile["vector_dims"] == 0
+
+
+def test_upsert_active_profile_rerank_needs_a_rebuild_only_for_outputs_not_stored_yet(tmp_path):
+    db_path = tmp_path / "app.db"
+    init_db(str(db_path))
+    conn = connect_db(str(db_path))
+    try:
+        create_library(conn, name="Main Library", index_uid="main-index")
+        library_id = list_libraries(conn)[0]["id"]
+
+        def _rerank(mode, **kwargs):
+            return upsert_active_profile(
+                conn,
+                library_id=library_id,
+                model_name="BAAI/bge-m3",
+                use_fp16=0,
+                max_length=128,
+                rerank_mode=mode,
+                **kwargs,
+            )
+
+        enabled = _rerank("sparse")
+        widened = _rerank("Sparse+ColBERT")
+        tuned = _rerank("sparse+colbert", rerank_candidates="80", rerank_encode_budget="0")
+        narrowed = _rerank("colbert")
+        profile = get_active_profile(conn, library_id)
+
+        with pytest.raises(ValueError, match="Rerank mode must be empty"):
+            upsert_active_profile(
+                conn, library_id=library_id, model_name="BAAI/bge-m3", use_fp16=0, max_length=128, rerank_mode="bm25"
+            )
+        with pytest.raises(ValueError, match="Rerank candidates must be between"):
+            upsert_active_profile(
+                conn, library_id=library_id, model_name="BAAI/bge-m3", use_fp16=0, max_length=128, rerank_candidates=0
+            )
+        with pytest.raises(ValueError, match="Rerank encode budget must be between"):
+            upsert_active_profile(
+                conn,
+                library_id=library_id,
+                model_name="BAAI/bge-m3",
+                use_fp16=0,
+                max_length=128,
+                rerank_encode_budget=-1,
+            )
+        with pytest.raises(ValueError, match="requires the torch backend"):
+            upsert_active_profile(
+                conn, library_id=library_id, model_name="BAAI/bge-m3", use_fp16=0, max_length=128, backend="onnx"
+            )
+        disabled = _rerank("")
+    finally:
+        conn.close()
+
+    assert (enabled, widened, tuned, narrowed, disabled) == (True, True, False, False, False)
+    assert profile["rerank_mode"] == "colbert"
+    assert profile["rerank_candidates"] == 80
+    assert profile["rerank_encode_budget"] == 0
+
+
+def test_upsert_active_profile_adaptive_batching_is_not_a_material_change(tmp_path):
+    db_path = tmp_path / "app.db"
+    init_db(str(db_path))
+    conn = connect_db(str(db_path))
+    try:
+        create_library(conn, name="Main Library", index_uid="main-index")
+        library_id = list_libraries(conn)[0]["id"]
+        default = get_active_profile(conn, library_id)["adaptive_batching"]
+        changed = upsert_active_profile(
+            conn, library_id=library_id, model_name="BAAI/bge-m3", use_fp16=0, max_length=128, adaptive_batching="1"
+        )
+        profile = get_active_profile(conn, library_id)
+
+        with pytest.raises(ValueError, match="Adaptive batching must be 0 or 1"):
+            upsert_active_profile(
+                conn, library_id=library_id, model_name="BAAI/bge-m3", use_fp16=0, max_length=128, adaptive_batching=2
+            )
+    finally:
+        conn.close()
+
+    assert default == 0
+    assert changed is False
+    assert profile["adaptive_batching"] == 1
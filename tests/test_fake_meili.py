@@ -0,0 +1,136 @@
+import importlib
+import time
+
+import meilisearch
+import pytest
+
+from benchmarks.fake_meili import FakeMeiliProfile, FakeMeiliServer
+
+
+@pytest.fixture(autouse=True)
+def meili_client():
+    # Other tests reload the module against a stubbed SDK; talk HTTP through the real one.
+    return importlib.reload(importlib.import_module("game_semantic.meili_client"))
+
+
+def _docs():
+    return [
+        {"id": 1, "name": "Zelda", "_vectors": {"bge_m3": [1.0, 0.0, 0.0]}},
+        {"id": 2, "name": "Mario Kart", "_vectors": {"bge_m3": [0.0, 1.0, 0.0]}},
+        {"id": 3, "name": "Mario Party", "_vectors": {"bge_m3": [0.0, 0.8, 0.6]}},
+    ]
+
+
+@pytest.fixture
+def server():
+    with FakeMeiliServer() as fake:
+        yield fake
+
+
+def _game_index(server, uid="games", **kwargs):
+    from game_semantic.meili_client import MeiliGameIndex
+
+    index = MeiliGameIndex(server.url, "", index_uid=uid, embedding_dim=3, **kwargs)
+    server.state.wait_idle()
+    index.ensure_settings()
+    return index
+
+
+def test_meili_game_index_round_trip(server):
+    index = _game_index(server)
+    index.add_documents(_docs(), wait=True)
+
+    assert index.fetch_existing_names_and_max_id(page_size=2) == ({"Zelda", "Mario Kart", "Mario Party"}, 3)
+    assert [doc.id for doc in index.fetch_documents(fields=["id"], page_size=2)] == [1, 2, 3]
+
+    hits = index.search_by_vector([0.0, 1.0, 0.0], limit=2, show_ranking_score=True)
+    assert [hit["id"] for hit in hits] == [2, 3]
+    assert hits[0]["_rankingScore"] == pytest.approx(1.0)
+    assert "_vectors" not in hits[0]
+
+    hybrid = index.search_by_vector([1.0, 0.0, 0.0], limit=1, query_text="party", semantic_ratio=0.2)
+    assert [hit["id"] for hit in hybrid] == [3]
+
+    batches = index.multi_search_by_vectors([[1.0, 0.0, 0.0], [0.0, 0.6, 0.8]], limit=1)
+    assert [[hit["id"] for hit in hits] for hits in batches] == [[1], [3]]
+
+
+def test_tasks_are_asynchronous_and_failures_surface(server):
+    server.state.profile.task_latency = 0.05
+    index = _game_index(server)
+    client = meilisearch.Client(server.url)
+
+    info = client.index("games").add_documents(_docs())
+    assert client.get_task(info.task_uid).status in {"enqueued", "processing"}
+    assert client.wait_for_task(info.task_uid).status == "succeeded"
+
+    with pytest.raises(RuntimeError, match="Expected 3 dimensions"):
+        index.add_documents([{"id": 4, "name": "Bad", "_vectors": {"bge_m3": [1.0]}}], wait=True)
+
+    tasks = client.get_tasks({"statuses": ["failed"]})
+    assert [task.type for task in tasks.results] == ["documentAdditionOrUpdate"]
+
+
+def test_multi_search_spans_indexes(server):
+    retail = _game_index(server, "retail")
+    scans = _game_index(server, "scans")
+    retail.add_documents(_docs()[:2], wait=True)
+    scans.add_documents(_docs()[2:], wait=True)
+
+    hit_lists = retail.multi_search_indexes(
+        [
+            {"index_uid": "retail", "vector": [0.0, 1.0, 0.0], "limit": 1},
+            {"index_uid": "scans", "vector": [0.0, 1.0, 0.0], "limit": 1, "query_text": "party", "semantic_ratio": 0.5},
+        ]
+    )
+
+    assert [[hit["name"] for hit in hits] for hits in hit_lists] == [["Mario Kart"], ["Mario Party"]]
+    assert all("_rankingScore" in hits[0] for hits in hit_lists)
+
+
+def test_swap_exchanges_index_contents(server):
+    live = _game_index(server, "live")
+    staging = _game_index(server, "staging")
+    staging.add_documents(_docs()[:1], wait=True)
+
+    client = meilisearch.Client(server.url)
+    client.wait_for_task(client.swap_indexes([{"indexes": ["live", "staging"]}]).task_uid)
+
+    assert live.fetch_all_names_list() == ["Zelda"]
+    assert staging.fetch_all_names_list() == []
+
+
+def test_injected_failures_latency_and_request_counts():
+    profile = FakeMeiliProfile(request_latency=0.02)
+    with FakeMeiliServer(profile=profile, api_key="secret") as server:
+        client = meilisearch.Client(server.url, "secret")
+        server.state.fail_next(1, path_prefix="/indexes")
+
+        with pytest.raises(meilisearch.errors.MeilisearchApiError) as excinfo:
+            client.index("games").get_stats()
+        assert excinfo.value.status_code == 503
+
+        started = time.perf_counter()
+        with pytest.raises(meilisearch.errors.MeilisearchApiError) as excinfo:
+            client.index("games").get_stats()
+        assert excinfo.value.code == "index_not_found"
+        assert time.perf_counter() - started >= 0.02
+
+        with pytest.raises(meilisearch.errors.MeilisearchApiError) as excinfo:
+            meilisearch.Client(server.url, "wrong").index("games").get_stats()
+        assert excinfo.value.code == "invalid_api_key"
+
+    assert server.state.request_counts["GET /indexes/{uid}/stats"] == 3
+
+
+def test_seeded_task_failures_are_repeatable():
+    def failed_batches():
+        with FakeMeiliServer(profile=FakeMeiliProfile(task_failure_rate=0.5, seed=11)) as server:
+            client = meilisearch.Client(server.url)
+            uids = [client.index("games").add_documents([{"id": n}]).task_uid for n in range(8)]
+            return [client.wait_for_task(uid).status == "failed" for uid in uids]
+
+    first = failed_batches()
+
+    assert first == failed_batches()
+    assert 0 < sum(first) < 8
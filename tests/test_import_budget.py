@@ -0,0 +1,60 @@
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Model runtimes that must only load when an embedder is actually created.
+HEAVY_MODULES = {"FlagEmbedding", "torch", "transformers", "onnxruntime"}
+# Generous wall-clock ceiling for importing the CLI and web entry modules.
+IMPORT_BUDGET_SECONDS = 3.0
+
+
+def _import_times(code: str) -> dict[str, int]:
+    """Run ``python -X importtime`` and return cumulative microseconds per module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _self_us, cumulative_us, name = line[len("import time:") :].split("|", 2)
+        if cumulative_us.strip().isdigit():
+            timings[name.strip()] = int(cumulative_us)
+    return timings
+
+
+def test_cli_and_web_modules_import_without_model_runtimes():
+    entry_modules = [
+        "game_semantic.embedding",
+        "game_semantic.deduper",
+        "game_semantic.search_cli",
+        "game_semantic.index_builder",
+        "game_web.app",
+    ]
+    timings = _import_times("import " + ", ".join(entry_modules))
+
+    heavy = sorted(name for name in timings if name.split(".")[0] in HEAVY_MODULES)
+    assert heavy == []
+    total_seconds = sum(timings.get(name, 0) for name in entry_modules) / 1_000_000
+    assert total_seconds < IMPORT_BUDGET_SECONDS
+
+
+def test_dedupe_cli_help_does_not_load_model_runtimes():
+    code = (
+        "import runpy, sys\n"
+        "sys.argv = ['dedupe_items.py', '--help']\n"
+        "try:\n"
+        "    runpy.run_path('bin/dedupe_items.py', run_name='__main__')\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        f"print(sorted(m for m in sys.modules if m.split('.')[0] in {sorted(HEAVY_MODULES)!r}))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip().splitlines()[-1] == "[]"
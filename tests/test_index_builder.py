@@ -3,6 +3,7 @@ import sys
 from types import SimpleNamespace
 
 import numpy as np
+import pytest
 
 
 def _install_fake_flag_embedding(monkeypatch):
@@ -35,7 +36,7 @@ def test_build_index_uses_config_embedding_max_length(monkeypatch, tmp_path):
         def __init__(self, **_kwargs):
             pass
 
-        def delete_index(self):
+        def recreate_index(self):
             return None
 
         def ensure_settings(self):
@@ -46,14 +47,14 @@ def test_build_index_uses_config_embedding_max_length(monkeypatch, tmp_path):
             captured["wait"] = wait
 
     class FakeEmbedder:
-        def encode_dense(self, texts, batch_size=64, max_length=128):
+        def encode_dense(self, texts, batch_size=64, max_length=128, **_kwargs):
             captured["texts"] = texts
             captured["batch_size"] = batch_size
             captured["max_length"] = max_length
             return np.array([[1.0, 2.0, 3.0]], dtype=np.float32)
 
     monkeypatch.setattr(index_builder, "MeiliGameIndex", FakeIndex)
-    monkeypatch.setattr(index_builder, "get_cached_bge_m3", lambda model_name, use_fp16: FakeEmbedder())
+    monkeypatch.setattr(index_builder, "get_cached_embedder", lambda *_args: FakeEmbedder())
 
     txt_path = tmp_path / "games.txt"
     txt_path.write_text("Test Game\n", encoding="utf-8")
@@ -64,9 +65,400 @@ def test_build_index_uses_config_embedding_max_length(monkeypatch, tmp_path):
         meili_index_uid="games",
         txt_path=str(txt_path),
         embedding_max_length=256,
+        index_pipeline_depth=1,
     )
 
     index_builder.build_index(config)
 
     assert captured["max_length"] == 256
     assert captured["wait"] is True
+
+
+def test_build_index_reports_progress_per_uploaded_batch(monkeypatch, tmp_path):
+    _install_fake_flag_embedding(monkeypatch)
+    _install_fake_meilisearch(monkeypatch)
+    from game_semantic.config import Config
+
+    index_builder = importlib.reload(importlib.import_module("game_semantic.index_builder"))
+
+    class FakeIndex:
+        def __init__(self, **_kwargs):
+            pass
+
+        def recreate_index(self):
+            return None
+
+        def ensure_settings(self):
+            return None
+
+        def add_documents(self, docs, wait=False):
+            return {"bytes": 10.0, "serialize_seconds": 0.01, "upload_seconds": 0.02, "task_seconds": 0.03}
+
+    class FakeEmbedder:
+        def encode_dense(self, texts, batch_size=64, max_length=128, **_kwargs):
+            return np.ones((len(texts), 3), dtype=np.float32)
+
+    monkeypatch.setattr(index_builder, "MeiliGameIndex", FakeIndex)
+    monkeypatch.setattr(index_builder, "get_cached_embedder", lambda *_args: FakeEmbedder())
+
+    txt_path = tmp_path / "games.txt"
+    txt_path.write_text("".join(f"Game {i}\n" for i in range(5)), encoding="utf-8")
+    config = Config(txt_path=str(txt_path), encode_batch_size=2, index_batch_size=2)
+
+    reports = []
+    index_builder.build_index(config, progress=reports.append, expected_docs=5)
+
+    assert [report.docs_done for report in reports] == [2, 4, 5]
+    assert [report.finished for report in reports] == [False, False, True]
+    assert [report.batch_docs for report in reports] == [2, 2, 1]
+    assert all(report.docs_total == 5 for report in reports)
+    assert reports[0].task_seconds == 0.03
+    assert reports[-1].eta_seconds == 0
+    assert "Batch 3: 5/5 docs" in reports[-1].format_line()
+
+
+def test_build_index_streams_and_deduplicates_without_known_total(monkeypatch, tmp_path):
+    _install_fake_flag_embedding(monkeypatch)
+    _install_fake_meilisearch(monkeypatch)
+    from game_semantic.config import Config
+
+    index_builder = importlib.reload(importlib.import_module("game_semantic.index_builder"))
+    uploaded = []
+    encoded = []
+
+    class FakeIndex:
+        def __init__(self, **_kwargs):
+            pass
+
+        def recreate_index(self):
+            return None
+
+        def ensure_settings(self):
+            return None
+
+        def add_documents(self, docs, wait=False):
+            uploaded.extend(docs)
+
+    class FakeEmbedder:
+        def encode_dense(self, texts, batch_size=64, max_length=128, **_kwargs):
+            encoded.append(list(texts))
+            return np.ones((len(texts), 3), dtype=np.float32)
+
+    monkeypatch.setattr(index_builder, "MeiliGameIndex", FakeIndex)
+    monkeypatch.setattr(index_builder, "get_cached_embedder", lambda *_args: FakeEmbedder())
+
+    txt_path = tmp_path / "games.txt"
+    txt_path.write_text("A\n B \n\nA\nC\nB\nD\n", encoding="utf-8")
+    config = Config(txt_path=str(txt_path), encode_batch_size=2, encode_token_budget=0, index_batch_size=2)
+
+    reports = []
+    index_builder.build_index(config, progress=reports.append)
+
+    assert encoded == [["A", "B"], ["C", "D"]]
+    assert [(doc["id"], doc["name"]) for doc in uploaded] == [(1, "A"), (2, "B"), (3, "C"), (4, "D")]
+    assert [report.docs_total for report in reports] == [None, 4]
+    assert reports[-1].finished is True
+    assert "Batch 1: 2/? docs" in reports[0].format_line()
+
+
+def test_build_index_fits_projection_on_rebuild_and_reuses_it_on_append(monkeypatch, tmp_path):
+    _install_fake_flag_embedding(monkeypatch)
+    _install_fake_meilisearch(monkeypatch)
+    from game_semantic.config import Config
+
+    index_builder = importlib.reload(importlib.import_module("game_semantic.index_builder"))
+    uploaded = []
+    index_dims = []
+    rng = np.random.default_rng(3)
+
+    class FakeIndex:
+        def __init__(self, **kwargs):
+            index_dims.append(kwargs["embedding_dim"])
+
+        def recreate_index(self):
+            return None
+
+        def ensure_settings(self):
+            return None
+
+        def fetch_existing_names_and_max_id(self):
+            return {doc["name"] for doc in uploaded}, len(uploaded)
+
+        def add_documents(self, docs, wait=False):
+            uploaded.extend(docs)
+
+    class FakeEmbedder:
+        def encode_dense(self, texts, batch_size=64, max_length=128, **_kwargs):
+            return rng.normal(size=(len(texts), 8)).astype(np.float32)
+
+    monkeypatch.setattr(index_builder, "MeiliGameIndex", FakeIndex)
+    monkeypatch.setattr(index_builder, "get_cached_embedder", lambda *_args: FakeEmbedder())
+
+    txt_path = tmp_path / "games.txt"
+    txt_path.write_text("".join(f"Game {i}\n" for i in range(6)), encoding="utf-8")
+    projection_path = tmp_path / "pca.npz"
+    config = Config(
+        txt_path=str(txt_path),
+        encode_batch_size=2,
+        index_batch_size=4,
+        vector_dims=3,
+        projection_path=str(projection_path),
+    )
+
+    index_builder.build_index(config)
+    assert projection_path.exists()
+    assert [doc["id"] for doc in uploaded] == [1, 2, 3, 4, 5, 6]
+    assert all(len(doc["_vectors"]["bge_m3"]) == 3 for doc in uploaded)
+
+    txt_path.write_text("Game 0\nGame 9\n", encoding="utf-8")
+    stored = projection_path.stat().st_mtime_ns
+    index_builder.build_index(Config(**{**config.__dict__, "mode": "append"}))
+
+    assert [doc["name"] for doc in uploaded[6:]] == ["Game 9"]
+    assert len(uploaded[6]["_vectors"]["bge_m3"]) == 3
+    assert projection_path.stat().st_mtime_ns == stored
+    assert set(index_dims) == {3}
+
+
+def test_build_index_fits_projection_on_names_sampled_across_the_whole_input(monkeypatch, tmp_path):
+    _install_fake_flag_embedding(monkeypatch)
+    _install_fake_meilisearch(monkeypatch)
+    from game_semantic.config import Config
+
+    index_builder = importlib.reload(importlib.import_module("game_semantic.index_builder"))
+    monkeypatch.setattr(index_builder, "PCA_SAMPLE_SIZE", 8)
+    uploaded = []
+    encoded = []
+    rng = np.random.default_rng(5)
+
+    class FakeIndex:
+        def __init__(self, **_kwargs):
+            pass
+
+        def recreate_index(self):
+            return None
+
+        def ensure_settings(self):
+            return None
+
+        def add_documents(self, docs, wait=False):
+            uploaded.extend(docs)
+
+    class FakeEmbedder:
+        def encode_dense(self, texts, batch_size=64, max_length=128, **_kwargs):
+            encoded.append(list(texts))
+            return rng.normal(size=(len(texts), 8)).astype(np.float32)
+
+    monkeypatch.setattr(index_builder, "MeiliGameIndex", FakeIndex)
+    monkeypatch.setattr(index_builder, "get_cached_embedder", lambda *_args: FakeEmbedder())
+
+    txt_path = tmp_path / "games.txt"
+    txt_path.write_text("".join(f"Game {i}\n" for i in range(100)) + "Game 0\n", encoding="utf-8")
+    projection_path = tmp_path / "pca.npz"
+    index_builder.build_index(
+        Config(
+            txt_path=str(txt_path),
+            encode_batch_size=10,
+            encode_token_budget=0,
+            vector_dims=3,
+            projection_path=str(projection_path),
+        )
+    )
+
+    sample = encoded[0]
+    assert len(sample) == len(set(sample)) == 8
+    assert max(int(name.split()[1]) for name in sample) >= 50
+    assert projection_path.exists()
+    assert [doc["id"] for doc in uploaded] == list(range(1, 101))
+    assert all(len(doc["_vectors"]["bge_m3"]) == 3 for doc in uploaded)
+
+
+def test_sample_names_is_uniform_over_the_stream_and_counts_it():
+    index_builder = importlib.import_module("game_semantic.index_builder")
+
+    sample, total = index_builder._sample_names(iter(range(10_000)), 500)
+
+    assert total == 10_000
+    assert len(set(sample)) == 500
+    assert 4_000 < np.mean(sample) < 6_000
+    assert index_builder._sample_names(iter(range(3)), 500) == ([0, 1, 2], 3)
+
+
+def test_build_index_writes_prefix_index_on_rebuild_and_extends_it_on_append(monkeypatch, tmp_path):
+    _install_fake_flag_embedding(monkeypatch)
+    _install_fake_meilisearch(monkeypatch)
+    from game_semantic.config import Config
+    from game_semantic.prefix_index import PrefixIndex
+
+    index_builder = importlib.reload(importlib.import_module("game_semantic.index_builder"))
+    uploaded = []
+
+    class FakeIndex:
+        def __init__(self, **kwargs):
+            pass
+
+        def recreate_index(self):
+            uploaded.clear()
+
+        def ensure_settings(self):
+            return None
+
+        def fetch_existing_names_and_max_id(self):
+            return {doc["name"] for doc in uploaded}, len(uploaded)
+
+        def add_documents(self, docs, wait=False):
+            uploaded.extend(docs)
+
+    class FakeEmbedder:
+        def encode_dense(self, texts, batch_size=64, max_length=128, **_kwargs):
+            return np.ones((len(texts), 4), dtype=np.float32)
+
+    monkeypatch.setattr(index_builder, "MeiliGameIndex", FakeIndex)
+    monkeypatch.setattr(index_builder, "get_cached_embedder", lambda *_args: FakeEmbedder())
+
+    txt_path = tmp_path / "games.txt"
+    txt_path.write_text("クラナド\nZelda II\n", encoding="utf-8")
+    prefix_path = tmp_path / "prefix" / "games.sqlite"
+    config = Config(txt_path=str(txt_path), encode_batch_size=2, index_batch_size=2, prefix_index_path=str(prefix_path))
+
+    index_builder.build_index(config)
+    txt_path.write_text("Zelda\n", encoding="utf-8")
+    index_builder.build_index(Config(**{**config.__dict__, "mode": "append"}))
+
+    prefix_index = PrefixIndex(str(prefix_path))
+    try:
+        assert prefix_index.complete("kura") == [{"id": 1, "name": "クラナド"}]
+        assert prefix_index.complete("zel") == [{"id": 3, "name": "Zelda"}, {"id": 2, "name": "Zelda II"}]
+    finally:
+        prefix_index.close()
+
+    index_builder.build_index(Config(**{**config.__dict__, "txt_path": str(txt_path)}))
+    prefix_index = PrefixIndex(str(prefix_path))
+    try:
+        assert prefix_index.complete("kura") == []
+        assert prefix_index.complete("zel") == [{"id": 1, "name": "Zelda"}]
+    finally:
+        prefix_index.close()
+
+
+def test_build_index_caches_rerank_outputs_by_document_id(monkeypatch, tmp_path):
+    _install_fake_flag_embedding(monkeypatch)
+    _install_fake_meilisearch(monkeypatch)
+    from game_semantic.config import Config
+    from game_semantic.rerank import CandidateStore
+
+    index_builder = importlib.reload(importlib.import_module("game_semantic.index_builder"))
+    uploaded = []
+    requested = []
+
+    class FakeIndex:
+        def __init__(self, **_kwargs):
+            pass
+
+        def recreate_index(self):
+            return None
+
+        def ensure_settings(self):
+            return None
+
+        def add_documents(self, docs, wait=False):
+            uploaded.extend(docs)
+
+    class FakeEmbedder:
+        def encode_multi(self, texts, batch_size=64, max_length=128, *, sparse=True, colbert=True):
+            requested.append((sparse, colbert))
+            return {
+                "dense_vecs": np.ones((len(texts), 3), dtype=np.float32),
+                "lexical_weights": [{text: 1.0} for text in texts],
+            }
+
+    monkeypatch.setattr(index_builder, "MeiliGameIndex", FakeIndex)
+    monkeypatch.setattr(index_builder, "get_cached_embedder", lambda *_args: FakeEmbedder())
+
+    txt_path = tmp_path / "games.txt"
+    txt_path.write_text("A\nB\nC\n", encoding="utf-8")
+    store_path = tmp_path / "rerank.sqlite"
+    config = Config(
+        txt_path=str(txt_path),
+        encode_batch_size=2,
+        rerank_mode="sparse",
+        rerank_store_path=str(store_path),
+    )
+
+    index_builder.build_index(config)
+
+    assert [doc["id"] for doc in uploaded] == [1, 2, 3]
+    assert set(requested) == {(True, False)}
+    cached = CandidateStore(str(store_path)).get_many([1, 2, 3])
+    assert {doc_id: outputs.lexical_weights for doc_id, outputs in cached.items()} == {
+        1: {"A": 1.0},
+        2: {"B": 1.0},
+        3: {"C": 1.0},
+    }
+
+
+def test_build_index_rejects_rerank_with_dense_only_backend(tmp_path):
+    from game_semantic.config import Config
+    from game_semantic.index_builder import build_index
+
+    with pytest.raises(ValueError, match="torch backend"):
+        build_index(Config(txt_path=str(tmp_path / "games.txt"), rerank_mode="colbert", embedder_backend="onnx"))
+
+
+def test_hash_set_grows_and_tracks_membership():
+    from game_semantic.hashset import HashSet64, name_hash
+
+    seen = HashSet64(capacity=4)
+    names = [f"Game {i}" for i in range(1000)]
+
+    assert all(seen.add_name(name) for name in names)
+    assert not any(seen.add_name(name) for name in names)
+    assert len(seen) == 1000
+    assert name_hash("Game 5") in seen
+    assert name_hash("Game 1000") not in seen
+    assert seen.add(0) and not seen.add(1)
+
+
+def test_build_index_caps_upload_payload_and_reports_adaptive_sizes(monkeypatch, tmp_path):
+    _install_fake_flag_embedding(monkeypatch)
+    _install_fake_meilisearch(monkeypatch)
+    from game_semantic.config import Config
+
+    index_builder = importlib.reload(importlib.import_module("game_semantic.index_builder"))
+    uploaded = []
+
+    class FakeIndex:
+        def __init__(self, **_kwargs):
+            pass
+
+        def recreate_index(self):
+            return None
+
+        def ensure_settings(self):
+            return None
+
+        def add_documents(self, docs, wait=False):
+            uploaded.append(len(docs))
+            return {"bytes": 100.0 * len(docs), "serialize_seconds": 0.0, "upload_seconds": 0.01, "task_seconds": 0.01}
+
+    class FakeEmbedder:
+        def encode_dense(self, texts, batch_size=64, max_length=128, **_kwargs):
+            return np.ones((len(texts), 3), dtype=np.float32)
+
+    monkeypatch.setattr(index_builder, "MeiliGameIndex", FakeIndex)
+    monkeypatch.setattr(index_builder, "get_cached_embedder", lambda *_args: FakeEmbedder())
+    txt_path = tmp_path / "games.txt"
+    txt_path.write_text("".join(f"Game {i}\n" for i in range(40)), encoding="utf-8")
+
+    index_builder.build_index(Config(txt_path=str(txt_path), index_batch_size=256, index_max_payload_bytes=300))
+
+    assert sum(uploaded) == 40
+    assert max(uploaded[1:]) == 3
+
+    reports = []
+    config = Config(txt_path=str(txt_path), encode_batch_size=8, index_batch_size=32, adaptive_batching=True)
+    index_builder.build_index(config, progress=reports.append)
+
+    assert reports[-1].index_batch_size >= 32
+    assert reports[-1].encode_batch_size >= 8
+    assert "encode_batch_size=" in reports[-1].format_line()
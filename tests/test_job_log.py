@@ -1,10 +1,12 @@
+import asyncio
 from datetime import datetime
 
 from fastapi.testclient import TestClient
 
 from game_web.app import create_app
 from game_web.db import connect_db
-from game_web.jobs import write_log_line
+from game_web.jobs import JobLogWriter, write_log_line
+from game_web.routes import jobs as job_status_module
 from game_web.services.embedding_profile import add_profile, list_profiles
 from game_web.services import dataset_service, job_service, library_service
 from game_web.services.job_service import append_job_log
@@ -49,6 +51,43 @@ def test_append_job_log_includes_timestamp_level_and_message(tmp_path):
     datetime.fromisoformat(timestamp)
 
 
+def test_job_log_writer_buffers_until_flush_and_close(tmp_path):
+    log_path = tmp_path / "job.log"
+    writer = JobLogWriter(str(log_path), flush_interval=60)
+    writer.write("hello\nworld")
+    writer.log("step one")
+    writer.flush()
+
+    lines = log_path.read_text().splitlines()
+    assert lines[0] == "hello world"
+    timestamp, rest = lines[1].split(" ", 1)
+    datetime.fromisoformat(timestamp)
+    assert rest == "[INFO] step one"
+
+    writer.log("last line", level="ERROR")
+    writer.close()
+
+    assert log_path.read_text().splitlines()[-1].endswith("[ERROR] last line")
+    try:
+        writer.log("after close")
+    except RuntimeError:
+        pass
+    else:
+        raise AssertionError("writing to a closed log should fail")
+
+
+def test_job_log_writer_rotates_by_size(tmp_path):
+    log_path = tmp_path / "job.log"
+    with JobLogWriter(str(log_path), max_bytes=25, backup_count=2) as writer:
+        for number in range(5):
+            writer.write(f"line {number} padding")
+
+    assert log_path.read_text().splitlines() == ["line 4 padding"]
+    assert (tmp_path / "job.log.1").read_text().splitlines() == ["line 3 padding"]
+    assert (tmp_path / "job.log.2").read_text().splitlines() == ["line 2 padding"]
+    assert not (tmp_path / "job.log.3").exists()
+
+
 def test_job_detail_links_back_to_library_and_search_when_searchable(tmp_path, monkeypatch):
     db_path = tmp_path / "app.db"
     app = create_app(str(db_path))
@@ -216,3 +255,211 @@ def test_job_detail_persists_canonical_active_profile_from_legacy_seed(tmp_path,
         check_conn.close()
 
     assert after_keys == ["bge_m3", "legacy"]
+
+
+def _login(client: TestClient) -> None:
+    client.get("/setup", follow_redirects=False)
+    client.post(
+        "/setup",
+        data={"password": "secret123", "csrf_token": client.cookies.get("csrf_token")},
+        follow_redirects=False,
+    )
+    client.get("/login", follow_redirects=False)
+    client.post(
+        "/login",
+        data={"password": "secret123", "csrf_token": client.cookies.get("csrf_token")},
+        follow_redirects=False,
+    )
+
+
+def _seed_job_with_log(db_path, data_dir, status: str, lines: list[str]) -> int:
+    log_rel = "logs/jobs/job-1.log"
+    (data_dir / "logs" / "jobs").mkdir(parents=True, exist_ok=True)
+    (data_dir / log_rel).write_text("".join(f"{line}\n" for line in lines), encoding="utf-8")
+    conn = connect_db(str(db_path))
+    try:
+        library_service.create_library(conn, name="Primary Library", index_uid="primary-index")
+        dataset = dataset_service.create_dataset(
+            conn,
+            data_dir=data_dir,
+            library_id=1,
+            filename="games.txt",
+            content=b"A\n",
+            commit=False,
+        )
+        job_id = job_service.create_job(
+            conn,
+            library_id=1,
+            dataset_id=int(dataset["id"]),
+            job_type="build",
+            status=status,
+            log_path=log_rel,
+            commit=False,
+        )
+        conn.commit()
+    finally:
+        conn.close()
+    return job_id
+
+
+def _sse_events(text: str) -> list[tuple[str | None, str | None, str]]:
+    events = []
+    for block in text.split("\n\n"):
+        fields = {}
+        for line in block.splitlines():
+            if line.startswith(":"):
+                continue
+            key, _, value = line.partition(": ")
+            fields[key] = value
+        if fields:
+            events.append((fields.get("event"), fields.get("id"), fields.get("data", "")))
+    return events
+
+
+def test_job_detail_shows_log_tail_instead_of_head(tmp_path, monkeypatch):
+    db_path = tmp_path / "app.db"
+    app = create_app(str(db_path))
+    app.state.data_dir = tmp_path / "data"
+    client = TestClient(app)
+    _login(client)
+    monkeypatch.setattr("game_web.routes.jobs.JOB_LOG_TAIL_BYTES", 64)
+    job_id = _seed_job_with_log(db_path, app.state.data_dir, "done", [f"line {i:03d}" for i in range(100)])
+
+    response = client.get(f"/jobs/{job_id}")
+
+    assert response.status_code == 200
+    assert "line 099" in response.text
+    assert "line 000" not in response.text
+
+
+def test_job_log_stream_resumes_from_offset_and_ends_for_finished_job(tmp_path):
+    db_path = tmp_path / "app.db"
+    app = create_app(str(db_path))
+    app.state.data_dir = tmp_path / "data"
+    client = TestClient(app)
+    job_id = _seed_job_with_log(db_path, app.state.data_dir, "done", ["first", "second", "third"])
+
+    assert client.get(f"/jobs/{job_id}/log/stream").status_code == 401
+    _login(client)
+
+    response = client.get(f"/jobs/{job_id}/log/stream", params={"offset": len("first\n")})
+
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert _sse_events(response.text) == [
+        (None, str(len("first\nsecond\n")), "second"),
+        (None, str(len("first\nsecond\nthird\n")), "third"),
+        ("end", None, "done"),
+    ]
+
+
+def test_job_log_stream_reconnect_past_end_of_rotated_log_does_not_replay_it(tmp_path):
+    db_path = tmp_path / "app.db"
+    app = create_app(str(db_path))
+    app.state.data_dir = tmp_path / "data"
+    client = TestClient(app)
+    _login(client)
+    # The client last saw byte 4096 of the previous file; the log was rotated since.
+    job_id = _seed_job_with_log(db_path, app.state.data_dir, "done", ["after rotation"])
+
+    response = client.get(f"/jobs/{job_id}/log/stream", headers={"Last-Event-ID": "4096"})
+
+    assert _sse_events(response.text) == [("end", None, "done")]
+
+
+def test_job_log_stream_follows_lines_written_while_running(tmp_path, monkeypatch):
+    db_path = tmp_path / "app.db"
+    app = create_app(str(db_path))
+    app.state.data_dir = tmp_path / "data"
+    client = TestClient(app)
+    _login(client)
+    job_id = _seed_job_with_log(db_path, app.state.data_dir, "running", ["started"])
+    log_path = app.state.data_dir / "logs" / "jobs" / "job-1.log"
+    monkeypatch.setattr("game_web.routes.jobs.JOB_LOG_STREAM_POLL_SECONDS", 0.01)
+
+    polls = {"count": 0}
+    original_status = job_status_module._job_status
+
+    def _job_status(db_path_arg, job_id_arg):
+        polls["count"] += 1
+        if polls["count"] == 2:
+            write_log_line(str(log_path), "batch 1")
+        if polls["count"] == 3:
+            write_log_line(str(log_path), "finished")
+            conn = connect_db(str(db_path))
+            try:
+                job_service.update_job(conn, job_id, status="done")
+            finally:
+                conn.close()
+        return original_status(db_path_arg, job_id_arg)
+
+    monkeypatch.setattr("game_web.routes.jobs._job_status", _job_status)
+
+    response = client.get(f"/jobs/{job_id}/log/stream")
+
+    assert [data for _event, _id, data in _sse_events(response.text)] == ["started", "batch 1", "finished", "done"]
+
+
+def test_job_log_stream_stops_when_client_disconnects(tmp_path, monkeypatch):
+    db_path = tmp_path / "app.db"
+    app = create_app(str(db_path))
+    app.state.data_dir = tmp_path / "data"
+    job_id = _seed_job_with_log(db_path, app.state.data_dir, "running", ["started"])
+    log_path = app.state.data_dir / "logs" / "jobs" / "job-1.log"
+    monkeypatch.setattr("game_web.routes.jobs.JOB_LOG_STREAM_POLL_SECONDS", 0.01)
+
+    class DisconnectingRequest:
+        checks = 0
+
+        async def is_disconnected(self):
+            self.checks += 1
+            return self.checks > 5
+
+    async def _collect():
+        events = []
+        async for event in job_status_module._stream_job_log(DisconnectingRequest(), str(db_path), job_id, log_path, 0):
+            events.append(event)
+        return events
+
+    # The job stays running; only the disconnect ends the stream.
+    assert asyncio.run(_collect()) == [f"id: {len('started') + 1}\ndata: started\n\n"]
+
+
+def test_job_log_stream_opens_the_log_once_a_queued_job_is_claimed(tmp_path, monkeypatch):
+    db_path = tmp_path / "app.db"
+    app = create_app(str(db_path))
+    app.state.data_dir = tmp_path / "data"
+    client = TestClient(app)
+    _login(client)
+    job_id = _seed_job_with_log(db_path, app.state.data_dir, "queued", [])
+    log_path = app.state.data_dir / "logs" / "jobs" / "job-1.log"
+    log_path.unlink()
+    conn = connect_db(str(db_path))
+    try:
+        conn.execute("update job set log_path = null where id = ?", (job_id,))
+        conn.commit()
+    finally:
+        conn.close()
+    monkeypatch.setattr("game_web.routes.jobs.JOB_LOG_STREAM_POLL_SECONDS", 0.01)
+
+    polls = {"count": 0}
+    original_status = job_status_module._job_status
+
+    def _job_status(db_path_arg, job_id_arg):
+        polls["count"] += 1
+        conn = connect_db(str(db_path))
+        try:
+            if polls["count"] == 2:
+                job_service.claim_job(conn, job_id, log_path="logs/jobs/job-1.log")
+                write_log_line(str(log_path), "claimed")
+            if polls["count"] == 4:
+                write_log_line(str(log_path), "finished")
+                job_service.update_job(conn, job_id, status="done")
+        finally:
+            conn.close()
+        return original_status(db_path_arg, job_id_arg)
+
+    monkeypatch.setattr("game_web.routes.jobs._job_status", _job_status)
+
+    response = client.get(f"/jobs/{job_id}/log/stream")
+
+    assert [data for _event, _id, data in _sse_events(response.text)] == ["claimed", "finished", "done"]
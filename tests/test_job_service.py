@@ -240,3 +240,52 @@ def test_claim_next_executable_job_blocks_queued_work_while_another_library_buil
     assert running_job["status"] == "running"
     assert queued_job is not None
     assert queued_job["status"] == "queued"
+
+
+def test_find_satisfying_build_job_ignores_a_match_followed_by_a_failed_or_pending_build(tmp_path):
+    db_path = tmp_path / "app.db"
+    data_dir = tmp_path / "data"
+    init_db(str(db_path))
+    conn = connect_db(str(db_path))
+    try:
+        library_service.create_library(conn, name="Primary Library", index_uid="primary-index")
+        library_id = library_service.list_libraries(conn)[0]["id"]
+        dataset = dataset_service.create_dataset(
+            conn,
+            data_dir=data_dir,
+            library_id=library_id,
+            filename="games.txt",
+            content=b"A\n",
+        )
+
+        def _build(status, fingerprint):
+            return job_service.create_job(
+                conn,
+                library_id=library_id,
+                dataset_id=int(dataset["id"]),
+                job_type="build",
+                status=status,
+                input_fingerprint=fingerprint,
+            )
+
+        done_id = _build("done", "fp-a")
+        _build("superseded", "fp-b")
+        matched = job_service.find_satisfying_build_job(conn, library_id, "fp-a")
+
+        # B's rebuild fails after recreating the index; re-uploading A must rebuild.
+        failed_id = _build("failed", "fp-b")
+        after_failure = job_service.find_satisfying_build_job(conn, library_id, "fp-a")
+
+        job_service.update_job(conn, failed_id, status="superseded")
+        running_id = _build("running", "fp-c")
+        while_running = job_service.find_satisfying_build_job(conn, library_id, "fp-a")
+        excluding_itself = job_service.find_satisfying_build_job(
+            conn, library_id, "fp-a", exclude_job_id=running_id
+        )
+    finally:
+        conn.close()
+
+    assert matched is not None and matched["id"] == done_id
+    assert after_failure is None
+    assert while_running is None
+    assert excluding_itself is not None and excluding_itself["id"] == done_id
@@ -102,6 +102,9 @@ def test_delete_library_removes_owned_files_but_not_remote_index(tmp_path):
         log_path = data_dir / f"logs/jobs/job-{job_id}.log"
         log_path.parent.mkdir(parents=True, exist_ok=True)
         log_path.write_text("queued")
+        artifact_path = data_dir / "rerank" / f"library-{library_id}-job-{job_id}.sqlite"
+        artifact_path.parent.mkdir(parents=True, exist_ok=True)
+        artifact_path.write_bytes(b"cache")
 
         deleted = delete_library(conn, library_id=library_id, data_dir=data_dir)
         libraries = list_libraries(conn)
@@ -122,6 +125,7 @@ def test_delete_library_removes_owned_files_but_not_remote_index(tmp_path):
     assert job_count == 0
     assert not upload_path.exists()
     assert not log_path.exists()
+    assert not artifact_path.exists()
 
 
 def test_delete_library_restores_owned_files_when_a_later_delete_fails(tmp_path, monkeypatch):
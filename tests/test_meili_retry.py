@@ -0,0 +1,109 @@
+import importlib
+
+import pytest
+
+from benchmarks.fake_meili import FakeMeiliProfile, FakeMeiliServer
+
+
+@pytest.fixture
+def meili_client():
+    # Other tests reload the module against a stubbed SDK; talk HTTP through the real one.
+    return importlib.reload(importlib.import_module("game_semantic.meili_client"))
+
+
+def _docs(count=3):
+    return [{"id": n, "name": f"Game {n}", "_vectors": {"bge_m3": [1.0, 0.0, float(n)]}} for n in range(1, count + 1)]
+
+
+def _index(meili_client, server, retry):
+    index = meili_client.MeiliGameIndex(server.url, "", index_uid="games", embedding_dim=3, retry=retry)
+    server.state.wait_idle()
+    index.ensure_settings()
+    return index
+
+
+def test_upload_and_poll_errors_are_retried_with_backoff(meili_client):
+    delays = []
+    retry = meili_client.MeiliRetry(max_retries=3, backoff_seconds=0.1, sleep=delays.append, seed=1)
+    with FakeMeiliServer() as server:
+        index = _index(meili_client, server, retry)
+        server.state.fail_next(2, path_prefix="/indexes/games/documents")
+        server.state.fail_next(1, path_prefix="/tasks")
+
+        timings = index.add_documents(_docs(), wait=True)
+
+        assert len(server.state.indexes["games"].documents) == 3
+    assert (retry.upload_retries, retry.poll_retries, retry.resubmits) == (2, 1, 0)
+    assert timings["retries"] == 3
+    assert 0.05 <= delays[0] <= 0.1 and 0.1 <= delays[1] <= 0.2
+    assert "3 Meilisearch retries" in retry.summary()
+
+
+def test_server_side_task_failures_are_resubmitted(meili_client):
+    retry = meili_client.MeiliRetry(max_retries=5, sleep=lambda _delay: None)
+    with FakeMeiliServer(profile=FakeMeiliProfile(task_failure_rate=0.6, seed=3)) as server:
+        index = _index(meili_client, server, retry)
+
+        for start in range(0, 12, 3):
+            index.add_documents(_docs(12)[start : start + 3], wait=True)
+
+        assert len(server.state.indexes["games"].documents) == 12
+    assert retry.resubmits > 0
+
+
+def test_permanent_errors_are_not_retried(meili_client):
+    retry = meili_client.MeiliRetry(sleep=lambda _delay: None)
+    with FakeMeiliServer() as server:
+        index = _index(meili_client, server, retry)
+
+        with pytest.raises(RuntimeError, match="Expected 3 dimensions"):
+            index.add_documents([{"id": 1, "name": "Bad", "_vectors": {"bge_m3": [1.0]}}], wait=True)
+    assert retry.total == 0
+
+
+def test_retry_limits_and_failure_budget(meili_client):
+    with FakeMeiliServer() as server:
+        per_call = meili_client.MeiliRetry(max_retries=1, sleep=lambda _delay: None)
+        index = _index(meili_client, server, per_call)
+        server.state.fail_next(2, path_prefix="/indexes/games/documents")
+
+        with pytest.raises(Exception) as excinfo:
+            index.add_documents(_docs(), wait=True)
+        assert getattr(excinfo.value, "status_code", None) == 503
+
+        budget = meili_client.MeiliRetry(max_retries=5, failure_budget=2, sleep=lambda _delay: None)
+        index.retry = budget
+        server.state.fail_next(3, path_prefix="/indexes/games/documents")
+
+        with pytest.raises(meili_client.RetryBudgetExhausted, match="budget of 2"):
+            index.add_documents(_docs(), wait=True)
+    assert budget.upload_retries == 2
+
+
+def test_build_survives_transient_failures_and_reports_retries(meili_client, monkeypatch, tmp_path):
+    from benchmarks.fakes import HashEmbedder
+    from game_semantic import index_builder
+    from game_semantic.config import Config
+
+    monkeypatch.setattr(index_builder, "MeiliGameIndex", meili_client.MeiliGameIndex)
+    monkeypatch.setattr(index_builder, "MeiliRetry", meili_client.MeiliRetry)
+    monkeypatch.setattr(index_builder, "get_cached_embedder", lambda *_args: HashEmbedder())
+    txt_path = tmp_path / "games.txt"
+    txt_path.write_text("".join(f"Game {n}\n" for n in range(10)), encoding="utf-8")
+    reports = []
+
+    with FakeMeiliServer() as server:
+        server.state.fail_next(2, path_prefix="/indexes/games/documents")
+        server.state.fail_next(1, path_prefix="/tasks")
+        config = Config(
+            meili_url=server.url,
+            meili_index_uid="games",
+            txt_path=str(txt_path),
+            index_batch_size=4,
+            meili_retry_backoff=0.0,
+        )
+        index_builder.build_index(config, progress=reports.append)
+
+        assert len(server.state.indexes["games"].documents) == 10
+    assert reports[-1].retries == 3
+    assert "retries=3" in reports[-1].format_line()
@@ -107,3 +107,79 @@ def test_get_or_create_index_raises_unexpected_errors():
         assert str(exc) == "boom"
     else:
         raise AssertionError("Expected RuntimeError")
+
+
+def test_multi_search_by_vectors_sends_one_request_with_ranking_scores():
+    class DummyClient:
+        def __init__(self):
+            self.calls = []
+
+        def multi_search(self, queries):
+            self.calls.append(queries)
+            return {
+                "results": [
+                    {"indexUid": "games", "hits": [{"id": 1, "name": "A", "_rankingScore": 0.8}]},
+                    {"indexUid": "games", "hits": []},
+                ]
+            }
+
+    index = MeiliGameIndex.__new__(MeiliGameIndex)
+    index.embedder_name = "bge_m3"
+    index.index_uid = "games"
+    index.client = DummyClient()
+
+    hit_lists = index.multi_search_by_vectors([[0.1], [0.2]], limit=4)
+
+    assert len(index.client.calls) == 1
+    queries = index.client.calls[0]
+    assert [query["vector"] for query in queries] == [[0.1], [0.2]]
+    assert all(query["indexUid"] == "games" and query["limit"] == 4 for query in queries)
+    assert all(query["showRankingScore"] is True for query in queries)
+    assert hit_lists == [[{"id": 1, "name": "A", "_rankingScore": 0.8}], []]
+
+
+def test_search_by_vector_hybrid_mode_sends_query_text_and_ratio():
+    class RecordingIndex:
+        def search(self, query, payload):
+            self.query = query
+            self.payload = payload
+            return {"hits": []}
+
+    index = MeiliGameIndex.__new__(MeiliGameIndex)
+    index.embedder_name = "bge_m3"
+    index.index = RecordingIndex()
+
+    index.search_by_vector([0.1], query_text="CLANNAD", semantic_ratio=0.4)
+
+    assert index.index.query == "CLANNAD"
+    assert index.index.payload["hybrid"] == {"semanticRatio": 0.4, "embedder": "bge_m3"}
+
+
+def test_search_by_vector_defaults_to_pure_vector_search():
+    index = MeiliGameIndex.__new__(MeiliGameIndex)
+    index.embedder_name = "bge_m3"
+    index.index = DummyIndex()
+
+    index.search_by_vector([0.1])
+
+    assert index.index.last_payload["hybrid"]["semanticRatio"] == 1.0
+    assert "showRankingScore" not in index.index.last_payload
+
+    index.search_by_vector([0.1], show_ranking_score=True)
+
+    assert index.index.last_payload["showRankingScore"] is True
+
+
+def test_search_by_vector_sends_offset_only_when_paging():
+    index = MeiliGameIndex.__new__(MeiliGameIndex)
+    index.embedder_name = "bge_m3"
+    index.index = DummyIndex()
+
+    index.search_by_vector([0.1], limit=6)
+
+    assert "offset" not in index.index.last_payload
+
+    index.search_by_vector([0.1], limit=6, offset=5)
+
+    assert index.index.last_payload["offset"] == 5
+    assert index.index.last_payload["limit"] == 6
@@ -0,0 +1,68 @@
+import importlib
+import logging
+
+import meilisearch
+import pytest
+
+from benchmarks.fake_meili import FakeMeiliServer
+
+GET_SETTINGS = "GET /indexes/{uid}/settings"
+
+
+@pytest.fixture
+def meili_client():
+    # Other tests reload the module against a stubbed SDK; talk HTTP through the real one.
+    return importlib.reload(importlib.import_module("game_semantic.meili_client"))
+
+
+def _docs(dims=3):
+    return [{"id": n, "name": f"Game {n}", "_vectors": {"bge_m3": [1.0] * dims}} for n in range(1, 4)]
+
+
+def test_fresh_index_gets_settings_before_documents_without_reading_them(meili_client):
+    with FakeMeiliServer() as server:
+        index = meili_client.MeiliGameIndex(server.url, "", index_uid="games", embedding_dim=3)
+        index.add_documents(_docs(), wait=True)
+
+        index.recreate_index()
+        index.ensure_settings()
+        index.add_documents(_docs(), wait=True)
+
+        state = server.state
+        types = [task["type"] for task in sorted(state.tasks.values(), key=lambda task: task["uid"])]
+        assert types[-4:] == ["indexDeletion", "indexCreation", "settingsUpdate", "documentAdditionOrUpdate"]
+        assert state.indexes["games"].settings["embedders"]["bge_m3"]["dimensions"] == 3
+        assert len(state.indexes["games"].documents) == 3
+    assert state.request_counts[GET_SETTINGS] == 0
+    assert not index.fresh
+
+
+def test_stored_fingerprint_skips_reading_unchanged_settings(meili_client, tmp_path):
+    state_path = str(tmp_path / "state" / "library-1.json")
+    with FakeMeiliServer() as server:
+        client = meilisearch.Client(server.url)
+        client.wait_for_task(client.create_index("games", {"primaryKey": "id"}).task_uid)
+        first = meili_client.MeiliGameIndex(server.url, "", index_uid="games", embedding_dim=3, settings_state_path=state_path)
+        first.ensure_settings()
+        assert server.state.request_counts[GET_SETTINGS] == 1
+
+        again = meili_client.MeiliGameIndex(server.url, "", index_uid="games", embedding_dim=3, settings_state_path=state_path)
+        again.ensure_settings()
+    assert server.state.request_counts[GET_SETTINGS] == 1
+    assert meili_client.settings_fingerprint(first.target_settings()) in open(state_path, encoding="utf-8").read()
+
+
+def test_embedder_change_on_populated_index_warns(meili_client, tmp_path, caplog):
+    state_path = str(tmp_path / "library-1.json")
+    with FakeMeiliServer() as server:
+        index = meili_client.MeiliGameIndex(server.url, "", index_uid="games", embedding_dim=3, settings_state_path=state_path)
+        index.ensure_settings()
+        index.add_documents(_docs(), wait=True)
+
+        wider = meili_client.MeiliGameIndex(server.url, "", index_uid="games", embedding_dim=4, settings_state_path=state_path)
+        with caplog.at_level(logging.WARNING):
+            wider.ensure_settings()
+
+        assert server.state.request_counts[GET_SETTINGS] == 1
+        assert server.state.indexes["games"].settings["embedders"]["bge_m3"]["dimensions"] == 4
+    assert "re-embed all 3 documents" in caplog.text
@@ -0,0 +1,180 @@
+import importlib
+import sys
+import threading
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+from game_semantic.metrics import (
+    MEILI_TASK_WAIT_SECONDS,
+    UPLOAD_BYTES,
+    Counter,
+    Histogram,
+    MetricsRegistry,
+)
+from game_web.app import create_app
+from game_web.db import connect_db
+from game_web.services import dataset_service, job_service, library_service
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("demo_seconds", "Demo latency.", buckets=(0.1, 1.0))
+    histogram.observe(0.05)
+    histogram.observe(0.5)
+    histogram.observe(5.0)
+
+    text = registry.render()
+
+    assert "# TYPE demo_seconds histogram" in text
+    assert 'demo_seconds_bucket{le="0.1"} 1' in text
+    assert 'demo_seconds_bucket{le="1"} 2' in text
+    assert 'demo_seconds_bucket{le="+Inf"} 3' in text
+    assert "demo_seconds_sum 5.55" in text
+    assert "demo_seconds_count 3" in text
+
+
+def test_histogram_timer_works_as_decorator():
+    histogram = Histogram("timed_seconds", "Timed.")
+
+    @histogram.time()
+    def work():
+        return "done"
+
+    assert work() == "done"
+    assert work() == "done"
+    assert histogram.count == 2
+
+
+def test_histogram_timer_decorator_times_concurrent_calls_separately(monkeypatch):
+    histogram = Histogram("overlapping_seconds", "Overlapping.")
+    observed = []
+    monkeypatch.setattr(histogram, "observe", observed.append)
+    clock = {"now": 0.0}
+    monkeypatch.setattr("game_semantic.metrics.time.perf_counter", lambda: clock["now"])
+    entered = {name: threading.Event() for name in ("first", "second")}
+    release = {name: threading.Event() for name in ("first", "second")}
+
+    @histogram.time()
+    def work(name):
+        entered[name].set()
+        release[name].wait(5)
+
+    first = threading.Thread(target=work, args=("first",))
+    first.start()
+    entered["first"].wait(5)
+    clock["now"] = 0.2
+    second = threading.Thread(target=work, args=("second",))
+    second.start()
+    entered["second"].wait(5)
+    clock["now"] = 0.3
+    release["first"].set()
+    first.join(5)
+    clock["now"] = 1.2
+    release["second"].set()
+    second.join(5)
+
+    assert observed == [pytest.approx(0.3), pytest.approx(1.0)]
+
+
+def test_registry_returns_existing_metric_and_rejects_kind_conflicts():
+    registry = MetricsRegistry()
+    counter = registry.counter("demo_total", "Demo.")
+
+    assert registry.counter("demo_total", "Demo.") is counter
+    with pytest.raises(ValueError):
+        registry.gauge("demo_total", "Demo.")
+    with pytest.raises(ValueError):
+        Counter("x", "x").inc(-1)
+
+
+def test_add_documents_records_upload_bytes_and_task_wait(monkeypatch):
+    monkeypatch.setitem(sys.modules, "meilisearch", SimpleNamespace(Client=object))
+    meili_client = importlib.reload(importlib.import_module("game_semantic.meili_client"))
+
+    class DummyIndex:
+        def __init__(self):
+            self.payloads = []
+
+        def add_documents(self, docs):
+            raise AssertionError("raw upload should be preferred")
+
+        def add_documents_raw(self, payload, content_type=None):
+            self.payloads.append((payload, content_type))
+            return {"taskUid": 3}
+
+    class DummyClient:
+        def wait_for_task(self, task_uid):
+            return {"status": "succeeded"}
+
+    index = meili_client.MeiliGameIndex.__new__(meili_client.MeiliGameIndex)
+    index.client = DummyClient()
+    index.index = DummyIndex()
+    index.index_uid = "games"
+    uploaded_before = UPLOAD_BYTES.value
+    waits_before = MEILI_TASK_WAIT_SECONDS.count
+
+    index.add_documents([{"id": 1, "name": "明日方舟"}], wait=True)
+
+    payload, content_type = index.index.payloads[0]
+    assert content_type == "application/json"
+    assert payload == '[{"id":1,"name":"明日方舟"}]'.encode("utf-8")
+    assert UPLOAD_BYTES.value - uploaded_before == len(payload)
+    assert MEILI_TASK_WAIT_SECONDS.count == waits_before + 1
+
+
+def test_metrics_endpoint_requires_login_or_the_metrics_token(tmp_path):
+    db_path = tmp_path / "app.db"
+    app = create_app(str(db_path), metrics_token="scrape-secret")
+    conn = connect_db(str(db_path))
+    try:
+        library_service.create_library(conn, name="Main Library", index_uid="main-index")
+        dataset = dataset_service.create_dataset(
+            conn,
+            data_dir=tmp_path / "data",
+            library_id=1,
+            filename="games.txt",
+            content=b"A\n",
+            commit=False,
+        )
+        for _ in range(2):
+            job_service.create_job(
+                conn,
+                library_id=1,
+                dataset_id=int(dataset["id"]),
+                job_type="build",
+                status="queued",
+                commit=False,
+            )
+        conn.commit()
+    finally:
+        conn.close()
+    client = TestClient(app)
+
+    assert client.get("/metrics").status_code == 401
+    assert client.get("/metrics", headers={"Authorization": "Bearer wrong"}).status_code == 401
+    assert create_app(str(db_path)).state.metrics_token is None
+
+    response = client.get("/metrics", headers={"Authorization": "Bearer scrape-secret"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "game_job_queue_depth 2" in response.text
+    assert "# TYPE game_search_seconds histogram" in response.text
+    assert "# TYPE game_job_duration_seconds histogram" in response.text
+    assert "game_search_cache_hit_ratio" in response.text
+
+    client.get("/setup", follow_redirects=False)
+    client.post(
+        "/setup",
+        data={"password": "secret123", "csrf_token": client.cookies.get("csrf_token")},
+        follow_redirects=False,
+    )
+    client.get("/login", follow_redirects=False)
+    client.post(
+        "/login",
+        data={"password": "secret123", "csrf_token": client.cookies.get("csrf_token")},
+        follow_redirects=False,
+    )
+    assert client.get("/metrics").status_code == 200
@@ -0,0 +1,51 @@
+import pytest
+
+from game_semantic.prefix_index import PrefixIndex, fold_text, prefix_keys, romanize
+
+
+@pytest.mark.parametrize(
+    ("text", "folded", "romaji"),
+    [
+        ("クラナド", "くらなど", "kuranado"),
+        ("ＦＩＮＡＬ Fantasy", "finalfantasy", "finalfantasy"),
+        ("がっこうぐらし！", "がっこうぐらし", "gakkougurashi"),
+        ("しゅうまっち", "しゅうまっち", "shuumatchi"),
+        ("ファンタジー", "ふぁんたじー", "fantaji"),
+    ],
+)
+def test_fold_and_romanize(text, folded, romaji):
+    assert fold_text(text) == folded
+    assert romanize(fold_text(text)) == romaji
+
+
+def test_prefix_keys_cover_word_starts_and_romaji():
+    keys = prefix_keys("Legend of ゼルダ")
+
+    assert keys == ["legendofぜるだ", "legendofzeruda", "ofぜるだ", "ofzeruda", "ぜるだ", "zeruda"]
+
+
+def test_complete_ranks_name_starts_then_shorter_names(tmp_path):
+    index = PrefixIndex(str(tmp_path / "prefix.sqlite"))
+    try:
+        index.put_many(
+            [
+                (1, "The Legend of Zelda"),
+                (2, "Zelda II: The Adventure of Link"),
+                (3, "Zelda"),
+                (4, "ゼルダの伝説"),
+                (5, "Mario Kart"),
+            ]
+        )
+
+        assert [hit["id"] for hit in index.complete("zel")] == [3, 2, 1]
+        assert [hit["id"] for hit in index.complete("ZEL", limit=1)] == [3]
+        assert [hit["id"] for hit in index.complete("ぜる")] == [4]
+        assert [hit["id"] for hit in index.complete("ゼルダの")] == [4]
+        assert [hit["id"] for hit in index.complete("zeruda")] == [4]
+        assert index.complete("  ") == []
+        assert index.complete("luigi") == []
+
+        index.clear()
+        assert index.complete("zel") == []
+    finally:
+        index.close()
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from game_semantic.projection import PcaProjection, fit_pca, projection_report
+
+
+def _clustered_vectors(count=200, width=32, seed=7):
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(8, width))
+    labels = rng.integers(0, len(centers), size=count)
+    vectors = centers[labels] + 0.05 * rng.normal(size=(count, width))
+    return (vectors / np.linalg.norm(vectors, axis=1, keepdims=True)).astype(np.float32)
+
+
+def test_fit_pca_projects_to_unit_vectors_and_round_trips(tmp_path):
+    vectors = _clustered_vectors()
+
+    projection = fit_pca(vectors, 8)
+    projected = projection.project(vectors)
+    path = tmp_path / "nested" / "projection.npz"
+    projection.save(str(path))
+    loaded = PcaProjection.load(str(path))
+
+    assert projected.shape == (200, 8)
+    assert np.allclose(np.linalg.norm(projected, axis=1), 1.0, atol=1e-5)
+    assert loaded.dims == 8
+    assert np.allclose(loaded.project(vectors[:3]), projected[:3], atol=1e-6)
+
+
+def test_fit_pca_rejects_widths_it_cannot_fit():
+    vectors = _clustered_vectors(count=10)
+
+    with pytest.raises(ValueError, match="between 1 and 31"):
+        fit_pca(vectors, 32)
+    with pytest.raises(ValueError, match="Need at least 16 vectors"):
+        fit_pca(vectors, 16)
+
+
+def test_projection_report_trades_size_for_recall():
+    vectors = _clustered_vectors()
+
+    report = projection_report(vectors, vectors[:40], [32, 8, 2], k=5)
+
+    assert [row["dims"] for row in report] == [32, 8, 2]
+    assert report[0]["recall_at_5"] == 1.0
+    assert report[0]["size_ratio"] == 1.0
+    assert report[1]["float32_bytes"] == 32
+    assert report[2]["json_bytes"] < report[1]["json_bytes"] < report[0]["json_bytes"]
+    assert report[2]["recall_at_5"] <= report[1]["recall_at_5"]
@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+
+from game_semantic.rerank import CandidateOutputs, CandidateStore, Reranker, colbert_score, lexical_score
+
+
+class FakeMultiEmbedder:
+    """Tokens are lower-cased words; each word gets a one-hot ColBERT vector."""
+
+    vocabulary = ["zelda", "breath", "wild", "mario", "kart", "link"]
+
+    def __init__(self):
+        self.calls = []
+
+    def encode_multi(self, texts, batch_size=64, max_length=128, *, sparse=True, colbert=True):
+        self.calls.append(list(texts))
+        outputs = {"dense_vecs": np.zeros((len(texts), 4), dtype=np.float32)}
+        words = [[word for word in text.lower().split() if word in self.vocabulary] for text in texts]
+        if sparse:
+            outputs["lexical_weights"] = [{word: 1.0 for word in row} for row in words]
+        if colbert:
+            eye = np.eye(len(self.vocabulary), dtype=np.float32)
+            outputs["colbert_vecs"] = [
+                np.array([eye[self.vocabulary.index(word)] for word in row], dtype=np.float32).reshape(-1, len(eye))
+                for row in words
+            ]
+        return outputs
+
+
+def test_lexical_and_colbert_scores():
+    assert lexical_score({"a": 0.5, "b": 0.2}, {"b": 2.0, "c": 1.0}) == pytest.approx(0.4)
+    assert lexical_score({}, {"a": 1.0}) == 0.0
+
+    query = np.array([[1.0, 0.0], [0.0, 1.0]])
+    doc = np.array([[1.0, 0.0], [0.6, 0.8]])
+    assert colbert_score(query, doc) == pytest.approx((1.0 + 0.8) / 2)
+    assert colbert_score(query, np.zeros((0, 2))) == 0.0
+
+
+def test_candidate_store_round_trips_and_keeps_earlier_outputs(tmp_path):
+    store = CandidateStore(str(tmp_path / "nested" / "rerank.sqlite"))
+    vecs = np.array([[0.5, 0.25], [1.0, 0.0]], dtype=np.float32)
+    store.put_many([(1, CandidateOutputs(lexical_weights={"7": 0.3}, colbert_vecs=vecs))])
+    store.put_many([(1, CandidateOutputs(lexical_weights={"8": 0.1})), (2, CandidateOutputs(colbert_vecs=vecs[:1]))])
+
+    found = store.get_many([1, 2, 3])
+
+    assert set(found) == {1, 2}
+    assert found[1].lexical_weights == {"8": 0.1}
+    assert np.allclose(found[1].colbert_vecs, vecs)
+    assert found[2].lexical_weights is None
+    assert found[2].colbert_vecs.shape == (1, 2)
+    store.clear()
+    assert store.get_many([1, 2]) == {}
+
+
+def test_reranker_promotes_lexical_matches_and_caches_candidates(tmp_path):
+    embedder = FakeMultiEmbedder()
+    store = CandidateStore(str(tmp_path / "rerank.sqlite"))
+    reranker = Reranker(embedder, "sparse+colbert", store)
+    hits = [
+        {"id": 1, "name": "Mario Kart", "_rankingScore": 0.9},
+        {"id": 2, "name": "Zelda Breath Wild", "_rankingScore": 0.8},
+        {"id": 3, "name": "Link", "_rankingScore": 0.7},
+    ]
+
+    ranked, stats = reranker.rerank("zelda wild", hits, 2)
+
+    assert [hit["id"] for hit in ranked] == [2, 1]
+    assert ranked[0]["_rerankScore"] > ranked[1]["_rerankScore"]
+    assert embedder.calls == [["zelda wild", "Mario Kart", "Zelda Breath Wild", "Link"]]
+    assert (stats.candidates, stats.cached, stats.encoded, stats.skipped) == (3, 0, 3, 0)
+
+    _, stats = reranker.rerank("zelda wild", hits, 2)
+
+    assert embedder.calls[-1] == ["zelda wild"]
+    assert (stats.cached, stats.encoded) == (3, 0)
+
+
+def test_reranker_budget_leaves_extra_candidates_on_dense_score():
+    embedder = FakeMultiEmbedder()
+    reranker = Reranker(embedder, "sparse", encode_budget=1)
+    hits = [
+        {"id": 1, "name": "Mario", "_rankingScore": 0.9},
+        {"id": 2, "name": "Zelda", "_rankingScore": 0.5},
+        {"id": 3, "name": "Zelda Wild", "_rankingScore": 0.4},
+    ]
+
+    ranked, stats = reranker.rerank("zelda", hits, 3)
+
+    assert embedder.calls == [["zelda", "Mario"]]
+    assert stats.skipped == 2
+    assert [hit["id"] for hit in ranked] == [1, 2, 3]
+
+
+def test_reranker_rejects_unknown_mode():
+    with pytest.raises(ValueError, match="Unknown rerank mode"):
+        Reranker(FakeMultiEmbedder(), "dense")
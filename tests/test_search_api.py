@@ -0,0 +1,393 @@
+import sys
+from types import SimpleNamespace
+
+from fastapi.testclient import TestClient
+import numpy as np
+import pytest
+
+from game_semantic.prefix_index import PrefixIndex
+from game_web.app import create_app
+from game_web.db import connect_db
+from game_web.services import dataset_service, job_service
+from game_web.services.library_service import create_library, list_libraries
+from game_web.services.prefix_index_store import prefix_index_path
+from game_web.services.search_executor import (
+    SearchLibraryNotFoundError,
+    SearchNotReadyError,
+    execute_batch_search,
+    execute_search_all,
+    execute_search_page,
+)
+from game_web.services.embedding_profile import upsert_active_profile
+from game_web.services.settings_service import set_setting
+
+
+class FakeHealthyClient:
+    def __init__(self, _url: str, _api_key: str | None):
+        pass
+
+    def health(self) -> dict[str, str]:
+        return {"status": "available"}
+
+
+def _csrf_token(client: TestClient) -> str:
+    token = client.cookies.get("csrf_token")
+    assert token
+    return token
+
+
+def _login(client: TestClient) -> None:
+    response = client.get("/setup", follow_redirects=False)
+    assert response.status_code == 200
+    response = client.post(
+        "/setup",
+        data={"password": "secret123", "csrf_token": _csrf_token(client)},
+        follow_redirects=False,
+    )
+    assert response.status_code == 302
+    response = client.get("/login", follow_redirects=False)
+    assert response.status_code == 200
+    response = client.post(
+        "/login",
+        data={"password": "secret123", "csrf_token": _csrf_token(client)},
+        follow_redirects=False,
+    )
+    assert response.status_code == 302
+
+
+def _create_searchable_library(conn, data_dir, *, name: str, index_uid: str) -> int:
+    create_library(conn, name=name, index_uid=index_uid, description="Primary")
+    library_id = list_libraries(conn)[-1]["id"]
+    dataset = dataset_service.create_dataset(
+        conn,
+        data_dir=data_dir,
+        library_id=library_id,
+        filename=f"{index_uid}.txt",
+        content=b"A\n",
+        commit=False,
+    )
+    job_service.create_job(
+        conn,
+        library_id=library_id,
+        dataset_id=int(dataset["id"]),
+        job_type="build",
+        status="done",
+        commit=False,
+    )
+    return library_id
+
+
+def _install_fakes(monkeypatch, captured: dict) -> None:
+    class FakeEmbedder:
+        def __init__(self, model_name: str, use_fp16: bool = False):
+            pass
+
+        def encode_dense(self, texts, batch_size=64, max_length=128):
+            captured.setdefault("encode_calls", []).append(list(texts))
+            return np.array([[float(len(text)), 0.0] for text in texts], dtype=np.float32)
+
+    class FakeIndex:
+        def __init__(self, url, api_key, index_uid="games", embedder_name="bge_m3", embedding_dim=1024):
+            captured["index_uid"] = index_uid
+
+        def multi_search_by_vectors(self, query_vectors, limit=10, embedder_key=None):
+            captured.setdefault("multi_search_calls", []).append((query_vectors, limit))
+            return [
+                [{"id": idx, "name": f"hit-{vec[0]:.0f}", "_rankingScore": 0.9}]
+                for idx, vec in enumerate(query_vectors, 1)
+            ]
+
+        def multi_search_indexes(self, searches, embedder_key=None):
+            captured.setdefault("cross_index_calls", []).append(searches)
+            return [self._scored_hits(search["index_uid"], search.get("offset", 0), search["limit"]) for search in searches]
+
+        def search_by_vector(self, query_vector, limit=10, embedder_key=None, show_ranking_score=False, offset=0):
+            captured.setdefault("vector_calls", []).append((offset, limit, show_ranking_score))
+            return self._scored_hits(captured["index_uid"], offset, limit)
+
+        @staticmethod
+        def _scored_hits(index_uid, offset, limit):
+            return [
+                {"id": rank, "name": f"{index_uid}-{rank}", "_rankingScore": score}
+                for rank, score in enumerate(captured.get("scores", {}).get(index_uid, [0.5]), 1)
+            ][offset : offset + limit]
+
+    monkeypatch.setattr(
+        "game_web.services.meili_health_service.meilisearch.Client",
+        FakeHealthyClient,
+    )
+    monkeypatch.setitem(sys.modules, "game_semantic.embedding", SimpleNamespace(BgeM3Embedder=FakeEmbedder))
+    monkeypatch.setitem(sys.modules, "game_semantic.meili_client", SimpleNamespace(MeiliGameIndex=FakeIndex))
+
+
+def test_execute_batch_search_encodes_once_and_issues_one_multi_search(tmp_path, monkeypatch):
+    db_path = tmp_path / "app.db"
+    create_app(str(db_path))
+    conn = connect_db(str(db_path))
+    try:
+        set_setting(conn, "meili_url", "http://127.0.0.1:7700", commit=False)
+        library_id = _create_searchable_library(conn, tmp_path / "data", name="Main", index_uid="main-index")
+        conn.commit()
+    finally:
+        conn.close()
+
+    captured: dict = {}
+    _install_fakes(monkeypatch, captured)
+
+    results = execute_batch_search(str(db_path), library_id, ["zelda", "  ", "mario kart"], limit=5)
+
+    assert captured["encode_calls"] == [["zelda", "mario kart"]]
+    assert len(captured["multi_search_calls"]) == 1
+    assert captured["multi_search_calls"][0][1] == 5
+    assert captured["index_uid"] == "main-index"
+    assert [hits[0]["name"] if hits else None for hits in results] == ["hit-5", None, "hit-10"]
+
+
+def test_execute_search_all_fans_out_in_one_multi_search_and_merges_by_score(tmp_path, monkeypatch):
+    db_path = tmp_path / "app.db"
+    create_app(str(db_path))
+    conn = connect_db(str(db_path))
+    try:
+        set_setting(conn, "meili_url", "http://127.0.0.1:7700", commit=False)
+        _create_searchable_library(conn, tmp_path / "data", name="Retail", index_uid="retail")
+        _create_searchable_library(conn, tmp_path / "data", name="Scans", index_uid="scans")
+        long_id = _create_searchable_library(conn, tmp_path / "data", name="Long", index_uid="long")
+        upsert_active_profile(conn, library_id=long_id, model_name="BAAI/bge-m3", use_fp16=0, max_length=256)
+        create_library(conn, name="Empty", index_uid="empty", description="No dataset")
+        conn.commit()
+    finally:
+        conn.close()
+
+    captured: dict = {"scores": {"retail": [0.7, 0.2], "scans": [0.9, 0.1], "long": [0.8]}}
+    _install_fakes(monkeypatch, captured)
+
+    results = execute_search_all(str(db_path), "zelda", limit=3)
+
+    assert captured["encode_calls"] == [["zelda"], ["zelda"]]
+    assert len(captured["cross_index_calls"]) == 1
+    assert [search["index_uid"] for search in captured["cross_index_calls"][0]] == ["retail", "scans", "long"]
+    assert [(hit["name"], hit["library_name"]) for hit in results] == [
+        ("scans-1", "Scans"),
+        ("long-1", "Long"),
+        ("retail-1", "Retail"),
+    ]
+
+    assert execute_search_all(str(db_path), "zelda", limit=3) == results
+    assert len(captured["cross_index_calls"]) == 1
+
+
+def test_execute_search_page_pages_with_offset_and_reuses_the_cursor_vector(tmp_path, monkeypatch):
+    db_path = tmp_path / "app.db"
+    create_app(str(db_path))
+    conn = connect_db(str(db_path))
+    try:
+        set_setting(conn, "meili_url", "http://127.0.0.1:7700", commit=False)
+        library_id = _create_searchable_library(conn, tmp_path / "data", name="Main", index_uid="main")
+        conn.commit()
+    finally:
+        conn.close()
+
+    captured: dict = {"scores": {"main": [1.0 - n / 20 for n in range(12)]}}
+    _install_fakes(monkeypatch, captured)
+
+    first = execute_search_page(str(db_path), library_id, "zelda", limit=5)
+    second = execute_search_page(str(db_path), library_id, "zelda", offset=5, limit=5, cursor=first.cursor)
+    last = execute_search_page(str(db_path), library_id, "zelda", offset=10, limit=5, cursor=second.cursor)
+
+    assert [hit["id"] for hit in first.hits] == [1, 2, 3, 4, 5]
+    assert [hit["id"] for hit in second.hits] == [6, 7, 8, 9, 10]
+    assert [hit["id"] for hit in last.hits] == [11, 12]
+    assert (first.has_more, second.has_more, last.has_more) == (True, True, False)
+    assert first.cursor and second.cursor == first.cursor and last.cursor is None
+    assert captured["encode_calls"] == [["zelda"]]
+    assert captured["vector_calls"] == [(0, 6, True), (5, 6, True), (10, 6, True)]
+
+    # The last page served again from the result cache still has no next page.
+    cached_last = execute_search_page(str(db_path), library_id, "zelda", offset=10, limit=5, cursor=first.cursor)
+    assert len(captured["vector_calls"]) == 3
+    assert cached_last.hits == last.hits and cached_last.cursor is None
+    assert second.hits[0]["_federatedScore"] == pytest.approx(0.75)
+
+    assert execute_search_page(str(db_path), library_id, "zelda", offset=5, limit=5, cursor="stale").hits == second.hits
+    assert captured["encode_calls"] == [["zelda"]]
+
+    only_page = execute_search_page(str(db_path), library_id, "zelda", limit=20)
+    assert not only_page.has_more and only_page.cursor is None
+
+
+def test_execute_search_page_merges_libraries_before_slicing(tmp_path, monkeypatch):
+    db_path = tmp_path / "app.db"
+    create_app(str(db_path))
+    conn = connect_db(str(db_path))
+    try:
+        set_setting(conn, "meili_url", "http://127.0.0.1:7700", commit=False)
+        _create_searchable_library(conn, tmp_path / "data", name="Retail", index_uid="retail")
+        _create_searchable_library(conn, tmp_path / "data", name="Scans", index_uid="scans")
+        conn.commit()
+    finally:
+        conn.close()
+
+    captured: dict = {"scores": {"retail": [0.9, 0.7, 0.5], "scans": [0.8, 0.6]}}
+    _install_fakes(monkeypatch, captured)
+
+    first = execute_search_page(str(db_path), None, "zelda", limit=2)
+    second = execute_search_page(str(db_path), None, "zelda", offset=2, limit=2, cursor=first.cursor)
+    third = execute_search_page(str(db_path), None, "zelda", offset=4, limit=2, cursor=second.cursor)
+
+    assert [hit["name"] for hit in first.hits + second.hits + third.hits] == [
+        "retail-1",
+        "scans-1",
+        "retail-2",
+        "scans-2",
+        "retail-3",
+    ]
+    assert (first.has_more, second.has_more, third.has_more) == (True, True, False)
+    assert captured["encode_calls"] == [["zelda"]]
+    assert first.cursor and second.cursor == first.cursor and third.cursor is None
+    assert "offset" not in captured["cross_index_calls"][1][0]
+
+
+def test_execute_batch_search_rejects_unknown_library(tmp_path):
+    db_path = tmp_path / "app.db"
+    create_app(str(db_path))
+
+    with pytest.raises(SearchLibraryNotFoundError):
+        execute_batch_search(str(db_path), 99, ["zelda"])
+
+
+def test_batch_search_api_requires_login(tmp_path):
+    app = create_app(str(tmp_path / "app.db"))
+    client = TestClient(app)
+
+    response = client.post("/api/libraries/1/search", json={"queries": ["zelda"]})
+
+    assert response.status_code == 401
+
+
+def test_batch_search_api_returns_hits_with_scores(tmp_path, monkeypatch):
+    db_path = tmp_path / "app.db"
+    app = create_app(str(db_path))
+    app.state.data_dir = tmp_path / "data"
+    client = TestClient(app)
+    conn = connect_db(str(db_path))
+    try:
+        set_setting(conn, "meili_url", "http://127.0.0.1:7700", commit=False)
+        library_id = _create_searchable_library(conn, app.state.data_dir, name="Main", index_uid="main-index")
+        conn.commit()
+    finally:
+        conn.close()
+    _login(client)
+
+    captured: dict = {}
+    _install_fakes(monkeypatch, captured)
+
+    response = client.post(
+        f"/api/libraries/{library_id}/search",
+        json={"queries": ["zelda", "mario"], "limit": 3},
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "library_id": library_id,
+        "results": [
+            {"query": "zelda", "hits": [{"id": 1, "name": "hit-5", "score": 0.9}]},
+            {"query": "mario", "hits": [{"id": 2, "name": "hit-5", "score": 0.9}]},
+        ],
+    }
+    assert captured["multi_search_calls"][0][1] == 3
+
+
+def test_batch_search_api_validates_batch_size(tmp_path):
+    app = create_app(str(tmp_path / "app.db"))
+    client = TestClient(app)
+    _login(client)
+
+    response = client.post("/api/libraries/1/search", json={"queries": []})
+    assert response.status_code == 400
+
+    response = client.post("/api/libraries/1/search", json={"queries": ["x"] * 257})
+    assert response.status_code == 413
+
+
+def test_batch_search_api_maps_readiness_errors(tmp_path, monkeypatch):
+    app = create_app(str(tmp_path / "app.db"))
+    client = TestClient(app)
+    _login(client)
+
+    def _boom(*args, **kwargs):
+        raise SearchNotReadyError("Library is not searchable yet")
+
+    import game_web.routes.api as api_routes
+
+    monkeypatch.setattr(api_routes, "execute_batch_search", _boom)
+
+    response = client.post("/api/libraries/1/search", json={"queries": ["zelda"]})
+
+    assert response.status_code == 409
+    assert response.json()["detail"] == "Library is not searchable yet"
+
+
+def test_batch_search_api_reports_the_rerank_score_hits_are_ordered_by(tmp_path, monkeypatch):
+    app = create_app(str(tmp_path / "app.db"))
+    client = TestClient(app)
+    _login(client)
+
+    def _reranked(*args, **kwargs):
+        return [
+            [
+                {"id": 2, "name": "second", "_rankingScore": 0.6, "_rerankScore": 0.8},
+                {"id": 1, "name": "first", "_rankingScore": 0.9, "_rerankScore": 0.5},
+            ]
+        ]
+
+    import game_web.routes.api as api_routes
+
+    monkeypatch.setattr(api_routes, "execute_batch_search", _reranked)
+
+    response = client.post("/api/libraries/1/search", json={"queries": ["zelda"]})
+
+    assert response.status_code == 200
+    assert response.json()["results"][0]["hits"] == [
+        {"id": 2, "name": "second", "score": 0.8},
+        {"id": 1, "name": "first", "score": 0.5},
+    ]
+
+
+def test_autocomplete_api_serves_prefix_matches_without_the_model_or_meili(tmp_path, monkeypatch):
+    db_path = tmp_path / "app.db"
+    app = create_app(str(db_path))
+    app.state.data_dir = tmp_path / "data"
+    client = TestClient(app)
+    conn = connect_db(str(db_path))
+    try:
+        library_id = _create_searchable_library(conn, app.state.data_dir, name="Main", index_uid="main-index")
+        create_library(conn, name="Empty", index_uid="empty", description="No dataset")
+        empty_id = list_libraries(conn)[-1]["id"]
+        job = job_service.get_latest_relevant_build_job(conn, library_id)
+        conn.commit()
+    finally:
+        conn.close()
+    _login(client)
+    prefix_index = PrefixIndex(
+        str(prefix_index_path(app.state.data_dir, library_id, job_id=int(job["id"]), input_fingerprint=None))
+    )
+    prefix_index.put_many([(1, "クラナド"), (2, "Zelda II"), (3, "Zelda")])
+    prefix_index.close()
+    # Neither the model nor Meilisearch may be touched.
+    monkeypatch.setitem(sys.modules, "game_semantic.embedding", None)
+    monkeypatch.setitem(sys.modules, "game_semantic.meili_client", None)
+
+    response = client.get(f"/api/libraries/{library_id}/autocomplete", params={"q": "Zel", "limit": 5})
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "library_id": library_id,
+        "query": "Zel",
+        "suggestions": [{"id": 3, "name": "Zelda"}, {"id": 2, "name": "Zelda II"}],
+    }
+    response = client.get(f"/api/libraries/{library_id}/autocomplete", params={"q": "kura"})
+    assert [item["name"] for item in response.json()["suggestions"]] == ["クラナド"]
+
+    assert client.get(f"/api/libraries/{empty_id}/autocomplete", params={"q": "a"}).status_code == 409
+    assert client.get("/api/libraries/999/autocomplete", params={"q": "a"}).status_code == 404
+    assert client.get(f"/api/libraries/{library_id}/autocomplete", params={"q": "a", "limit": 21}).status_code == 400
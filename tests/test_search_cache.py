@@ -0,0 +1,189 @@
+import sys
+from types import SimpleNamespace
+
+from fastapi.testclient import TestClient
+
+from game_web.app import create_app
+from game_web.db import connect_db, init_db
+from game_web.services import dataset_service, job_service, library_service
+from game_web.services.job_runner import JobRunner
+from game_web.services.search_cache import SearchResultCache, cache_namespace, get_search_cache
+from game_web.services.search_executor import execute_search
+from game_web.services.settings_service import set_setting
+
+
+class FakeHealthyClient:
+    def __init__(self, _url: str, _api_key: str | None):
+        pass
+
+    def health(self) -> dict[str, str]:
+        return {"status": "available"}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_cache_returns_copies_and_tracks_hit_ratio():
+    cache = SearchResultCache()
+    key = ("db", 1, (1, "t"), (), "zelda", 10)
+
+    assert cache.get(key) is None
+    cache.put(key, [{"id": 1, "name": "Zelda"}])
+    first = cache.get(key)
+    first.append({"id": 2})
+
+    assert cache.get(key) == [{"id": 1, "name": "Zelda"}]
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"]) == (2, 1)
+    assert stats["hit_ratio"] == 2 / 3
+
+
+def test_cache_expires_entries_after_ttl():
+    clock = FakeClock()
+    cache = SearchResultCache(ttl_seconds=5, clock=clock)
+    key = ("db", 1, (1, "t"), (), "zelda", 10)
+    cache.put(key, [{"id": 1}])
+
+    clock.now = 4.9
+    assert cache.get(key) == [{"id": 1}]
+    clock.now = 5.0
+    assert cache.get(key) is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_cache_evicts_least_recently_used_entries_over_byte_budget():
+    cache = SearchResultCache(max_bytes=60)
+    keys = [("db", 1, (1, "t"), (), f"q{i}", 10) for i in range(3)]
+    cache.put(keys[0], [{"name": "a" * 10}])
+    cache.put(keys[1], [{"name": "b" * 10}])
+    cache.get(keys[0])
+    cache.put(keys[2], [{"name": "c" * 10}])
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None
+    assert cache.stats()["bytes"] <= 60
+    assert cache.stats()["evictions"] == 1
+
+
+def test_invalidate_library_only_drops_that_library():
+    cache = SearchResultCache()
+    cache.put(("db", 1, (1, "t"), (), "zelda", 10), [{"id": 1}])
+    cache.put(("db", 2, (5, "t"), (), "zelda", 10), [{"id": 2}])
+
+    assert cache.invalidate_library("db", 1) == 1
+    assert cache.get(("db", 1, (1, "t"), (), "zelda", 10)) is None
+    assert cache.get(("db", 2, (5, "t"), (), "zelda", 10)) == [{"id": 2}]
+
+
+def _seed_searchable_library(db_path, data_dir) -> None:
+    init_db(str(db_path))
+    conn = connect_db(str(db_path))
+    try:
+        set_setting(conn, "meili_url", "http://127.0.0.1:7700", commit=False)
+        library_service.create_library(conn, name="Main Library", index_uid="main-index")
+        dataset = dataset_service.create_dataset(
+            conn,
+            data_dir=data_dir,
+            library_id=1,
+            filename="games.txt",
+            content=b"A\n",
+            commit=False,
+        )
+        job_service.create_job(
+            conn,
+            library_id=1,
+            dataset_id=int(dataset["id"]),
+            job_type="build",
+            status="done",
+            commit=False,
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def test_execute_search_serves_repeated_query_from_cache_until_build_completes(tmp_path, monkeypatch):
+    db_path = tmp_path / "app.db"
+    data_dir = tmp_path / "data"
+    _seed_searchable_library(db_path, data_dir)
+
+    monkeypatch.setattr(
+        "game_web.services.meili_health_service.meilisearch.Client",
+        FakeHealthyClient,
+    )
+    calls = {"encode": 0, "search": 0}
+
+    class FakeEmbedder:
+        def __init__(self, model_name: str, use_fp16: bool = False):
+            pass
+
+        def encode_dense(self, texts, batch_size=64, max_length=128):
+            calls["encode"] += 1
+            return [SimpleNamespace(tolist=lambda: [0.1, 0.2, 0.3])]
+
+    class FakeIndex:
+        def __init__(self, url, api_key, index_uid="games", embedder_name="bge_m3", embedding_dim=1024):
+            pass
+
+        def search_by_vector(self, query_vec, limit=10, embedder_key=None):
+            calls["search"] += 1
+            return [{"id": 1, "name": "Test Game"}]
+
+    monkeypatch.setitem(sys.modules, "game_semantic.embedding", SimpleNamespace(BgeM3Embedder=FakeEmbedder))
+    monkeypatch.setitem(sys.modules, "game_semantic.meili_client", SimpleNamespace(MeiliGameIndex=FakeIndex))
+
+    assert execute_search(str(db_path), 1, "zelda") == [{"id": 1, "name": "Test Game"}]
+    assert execute_search(str(db_path), 1, "zelda") == [{"id": 1, "name": "Test Game"}]
+    assert calls == {"encode": 1, "search": 1}
+
+    conn = connect_db(str(db_path))
+    try:
+        job_service.create_job(conn, library_id=1, dataset_id=1, job_type="build", status="queued")
+    finally:
+        conn.close()
+
+    def _execute_build_job(*, db_path, data_dir, job, log):
+        log("built")
+
+    runner = JobRunner(db_path=str(db_path), data_dir=data_dir, execute_job=_execute_build_job)
+    try:
+        runner.run_next()
+    finally:
+        runner.shutdown()
+
+    namespace = cache_namespace(str(db_path))
+    assert not any(key[:2] == (namespace, 1) for key in get_search_cache()._entries)
+    execute_search(str(db_path), 1, "zelda")
+    assert calls == {"encode": 2, "search": 2}
+
+
+def test_admin_metrics_page_shows_cache_hit_ratio(tmp_path):
+    app = create_app(str(tmp_path / "app.db"))
+    client = TestClient(app)
+
+    response = client.get("/admin/metrics", follow_redirects=False)
+    assert response.status_code == 302
+
+    response = client.get("/setup", follow_redirects=False)
+    client.post(
+        "/setup",
+        data={"password": "secret123", "csrf_token": client.cookies.get("csrf_token")},
+        follow_redirects=False,
+    )
+    client.get("/login", follow_redirects=False)
+    client.post(
+        "/login",
+        data={"password": "secret123", "csrf_token": client.cookies.get("csrf_token")},
+        follow_redirects=False,
+    )
+
+    response = client.get("/admin/metrics", follow_redirects=False)
+
+    assert response.status_code == 200
+    assert "Search Result Cache" in response.text
+    assert "Hit ratio" in response.text
@@ -0,0 +1,47 @@
+import numpy as np
+
+from game_web.services.search_cursor import SearchCursorStore
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_cursor_returns_float32_vectors_only_for_its_scope():
+    store = SearchCursorStore()
+    group = ("BAAI/bge-m3", 0, 128, "torch")
+    token = store.issue(("app", 1, "zelda"), {group: [0.1, 0.2]})
+
+    vectors = store.get(token, ("app", 1, "zelda"))
+    assert list(vectors) == [group]
+    assert vectors[group].dtype == np.float32
+    assert vectors[group].tolist() == np.array([0.1, 0.2], dtype=np.float32).tolist()
+    assert store.get(token, ("app", 1, "mario")) is None
+    assert store.get("unknown", ("app", 1, "zelda")) is None
+
+
+def test_cursor_expires_after_idle_ttl_and_evicts_least_recently_used_by_bytes():
+    clock = FakeClock()
+    # Two 4-dim float32 vectors fit the budget, a third does not.
+    store = SearchCursorStore(max_bytes=32, ttl_seconds=10, clock=clock)
+    scope = ("app", None, "zelda")
+    first = store.issue(scope, {"g": np.ones(4)})
+    second = store.issue(scope, {"g": np.ones(4)})
+
+    clock.now = 8
+    assert store.get(first, scope) is not None
+    clock.now = 12
+    assert store.get(second, scope) is None
+    assert store.get(first, scope) is not None
+
+    third = store.issue(scope, {"g": np.ones(4)})
+    fourth = store.issue(scope, {"g": np.ones(4)})
+    assert store.get(first, scope) is None
+    assert len(store) == 2
+    assert store.get(third, scope) is not None and store.get(fourth, scope) is not None
+    assert store.issue(scope, {"g": np.ones(16)}) is None
+    assert len(store) == 2
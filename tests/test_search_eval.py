@@ -0,0 +1,99 @@
+import json
+
+import numpy as np
+
+from game_semantic.search_eval import (
+    LabelledQuery,
+    evaluate_rerank,
+    evaluate_semantic_ratios,
+    load_labelled_queries,
+    recall_at_k,
+)
+
+
+def test_recall_at_k_counts_relevant_names_within_cutoff():
+    hits = [{"name": "A"}, {"name": "B"}, {"name": "C"}]
+
+    assert recall_at_k(hits, ["A", "C"], k=2) == 0.5
+    assert recall_at_k(hits, ["A", "C"], k=3) == 1.0
+    assert recall_at_k(hits, [], k=3) == 0.0
+
+
+def test_load_labelled_queries_reads_jsonl_and_skips_incomplete_entries(tmp_path):
+    path = tmp_path / "labels.jsonl"
+    path.write_text(
+        "\n".join(
+            [
+                json.dumps({"query": "クラナド", "relevant": "CLANNAD -クラナド-"}, ensure_ascii=False),
+                json.dumps({"query": "", "relevant": ["x"]}),
+                json.dumps({"query": "arknights", "relevant": ["明日方舟 / アークナイツ / Arknights"]}, ensure_ascii=False),
+            ]
+        ),
+        encoding="utf-8",
+    )
+
+    labelled = load_labelled_queries(str(path))
+
+    assert [item.query for item in labelled] == ["クラナド", "arknights"]
+    assert labelled[0].relevant == ["CLANNAD -クラナド-"]
+
+
+def test_evaluate_semantic_ratios_reports_recall_per_mode():
+    class FakeEmbedder:
+        def encode_dense(self, texts, batch_size=64, max_length=128):
+            return np.zeros((len(texts), 2), dtype=np.float32)
+
+    class FakeIndex:
+        def __init__(self):
+            self.calls = []
+
+        def search_by_vector(self, query_vector, limit=10, query_text="", semantic_ratio=1.0):
+            self.calls.append((query_text, semantic_ratio))
+            if semantic_ratio < 1.0:
+                return [{"name": "CLANNAD"}]
+            return [{"name": "Other"}]
+
+    index = FakeIndex()
+    report = evaluate_semantic_ratios(
+        index,
+        FakeEmbedder(),
+        [LabelledQuery(query="CLANNAD", relevant=["CLANNAD"])],
+        ratios=[1.0, 0.5],
+        k=10,
+    )
+
+    assert [row["semantic_ratio"] for row in report] == [1.0, 0.5]
+    assert [row["recall_at_10"] for row in report] == [0.0, 1.0]
+    assert index.calls == [("", 1.0), ("CLANNAD", 0.5)]
+    assert all(row["latency_p95_ms"] >= 0.0 for row in report)
+
+
+def test_evaluate_rerank_compares_dense_and_reranked_recall():
+    from game_semantic.rerank import Reranker
+
+    class FakeEmbedder:
+        def encode_dense(self, texts, batch_size=64, max_length=128):
+            return np.zeros((len(texts), 2), dtype=np.float32)
+
+        def encode_multi(self, texts, batch_size=64, max_length=128, *, sparse=True, colbert=True):
+            return {
+                "dense_vecs": np.zeros((len(texts), 2), dtype=np.float32),
+                "lexical_weights": [{word: 1.0 for word in text.split()} for text in texts],
+            }
+
+    class FakeIndex:
+        def search_by_vector(self, query_vector, limit=10, show_ranking_score=False):
+            assert show_ranking_score
+            return [{"id": 1, "name": "Other", "_rankingScore": 0.9}, {"id": 2, "name": "CLANNAD", "_rankingScore": 0.8}]
+
+    report = evaluate_rerank(
+        FakeIndex(),
+        Reranker(FakeEmbedder(), "sparse"),
+        [LabelledQuery(query="CLANNAD", relevant=["CLANNAD"])],
+        k=1,
+        candidates=2,
+    )
+
+    assert [row["mode"] for row in report] == ["dense", "sparse"]
+    assert [row["recall_at_1"] for row in report] == [0.0, 1.0]
+    assert report[1]["latency_p50_ms"] >= report[0]["latency_p50_ms"]
@@ -440,3 +440,276 @@ def test_execute_search_raises_actionable_error_when_index_construction_fails(tm
         match="Search could not be completed. Check Meilisearch and try again.",
     ):
         execute_search(str(db_path), 1, "zelda")
+
+
+def test_execute_search_uses_hybrid_mode_when_semantic_ratio_below_one(tmp_path, monkeypatch):
+    db_path = tmp_path / "app.db"
+    data_dir = tmp_path / "data"
+    init_db(str(db_path))
+    conn = connect_db(str(db_path))
+    try:
+        set_setting(conn, "meili_url", "http://127.0.0.1:7700", commit=False)
+        library_service.create_library(
+            conn,
+            name="Main Library",
+            index_uid="main-index",
+            description="Primary games library",
+        )
+        conn.execute("update embedding_profile set semantic_ratio = ? where library_id = ?", (0.3, 1))
+        dataset = dataset_service.create_dataset(
+            conn,
+            data_dir=data_dir,
+            library_id=1,
+            filename="games.txt",
+            content=b"A\n",
+            commit=False,
+        )
+        job_service.create_job(
+            conn,
+            library_id=1,
+            dataset_id=int(dataset["id"]),
+            job_type="build",
+            status="done",
+            commit=False,
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+    monkeypatch.setattr(
+        "game_web.services.meili_health_service.meilisearch.Client",
+        FakeHealthyClient,
+    )
+
+    captured = {}
+
+    class FakeEmbedder:
+        def __init__(self, model_name: str, use_fp16: bool = False):
+            pass
+
+        def encode_dense(self, texts, batch_size=64, max_length=128):
+            return [SimpleNamespace(tolist=lambda: [0.1, 0.2, 0.3])]
+
+    class FakeIndex:
+        def __init__(self, url, api_key, index_uid="games", embedder_name="bge_m3", embedding_dim=1024):
+            pass
+
+        def search_by_vector(self, query_vec, limit=10, embedder_key=None, query_text="", semantic_ratio=1.0):
+            captured["query_text"] = query_text
+            captured["semantic_ratio"] = semantic_ratio
+            return [{"name": "CLANNAD"}]
+
+    monkeypatch.setitem(
+        sys.modules,
+        "game_semantic.embedding",
+        SimpleNamespace(BgeM3Embedder=FakeEmbedder),
+    )
+    monkeypatch.setitem(
+        sys.modules,
+        "game_semantic.meili_client",
+        SimpleNamespace(MeiliGameIndex=FakeIndex),
+    )
+
+    results = execute_search(str(db_path), 1, "CLANNAD")
+
+    assert results == [{"name": "CLANNAD"}]
+    assert captured == {"query_text": "CLANNAD", "semantic_ratio": 0.3}
+
+
+def test_warm_up_loads_each_active_profile_once_and_search_reuses_it(tmp_path, monkeypatch):
+    from game_web.services.search_executor import warm_up_query_embedders
+
+    db_path = tmp_path / "app.db"
+    init_db(str(db_path))
+    conn = connect_db(str(db_path))
+    try:
+        set_setting(conn, "meili_url", "http://127.0.0.1:7700", commit=False)
+        library_service.create_library(conn, name="Main Library", index_uid="main-index")
+        library_service.create_library(conn, name="Other Library", index_uid="other-index")
+        dataset = dataset_service.create_dataset(
+            conn,
+            data_dir=tmp_path / "data",
+            library_id=1,
+            filename="games.txt",
+            content=b"A\n",
+            commit=False,
+        )
+        job_service.create_job(
+            conn, library_id=1, dataset_id=int(dataset["id"]), job_type="build", status="done", commit=False
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+    monkeypatch.setattr(
+        "game_web.services.meili_health_service.meilisearch.Client",
+        FakeHealthyClient,
+    )
+    created = []
+
+    class FakeEmbedder:
+        def __init__(self, model_name: str, use_fp16: bool = False):
+            created.append(model_name)
+
+        def encode_dense(self, texts, batch_size=64, max_length=128):
+            return [SimpleNamespace(tolist=lambda: [0.1, 0.2, 0.3])]
+
+    class FakeIndex:
+        def __init__(self, url, api_key, index_uid="games", embedder_name="bge_m3", embedding_dim=1024):
+            pass
+
+        def search_by_vector(self, query_vec, limit=10, embedder_key=None):
+            return [{"name": "Test Game"}]
+
+    monkeypatch.setitem(sys.modules, "game_semantic.embedding", SimpleNamespace(BgeM3Embedder=FakeEmbedder))
+    monkeypatch.setitem(sys.modules, "game_semantic.meili_client", SimpleNamespace(MeiliGameIndex=FakeIndex))
+
+    assert warm_up_query_embedders(str(db_path)) == 1
+    assert execute_search(str(db_path), 1, "zelda") == [{"name": "Test Game"}]
+    assert execute_search(str(db_path), 1, "mario") == [{"name": "Test Game"}]
+    assert created == ["BAAI/bge-m3"]
+
+
+def test_execute_search_projects_query_with_the_builds_projection(tmp_path, monkeypatch):
+    import numpy as np
+
+    from game_semantic.projection import PcaProjection
+    from game_web.services.embedding_profile import upsert_active_profile
+    from game_web.services.vector_projection import projection_path
+
+    db_path = tmp_path / "app.db"
+    data_dir = tmp_path / "data"
+    init_db(str(db_path))
+    conn = connect_db(str(db_path))
+    try:
+        set_setting(conn, "meili_url", "http://127.0.0.1:7700", commit=False)
+        library_service.create_library(conn, name="Main Library", index_uid="main-index")
+        upsert_active_profile(
+            conn, library_id=1, model_name="BAAI/bge-m3", use_fp16=0, max_length=128, vector_dims=2
+        )
+        dataset = dataset_service.create_dataset(
+            conn, data_dir=data_dir, library_id=1, filename="games.txt", content=b"A\n", commit=False
+        )
+        job_id = job_service.create_job(
+            conn,
+            library_id=1,
+            dataset_id=int(dataset["id"]),
+            job_type="build",
+            status="done",
+            input_fingerprint="abc",
+            commit=False,
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+    PcaProjection(
+        mean=np.zeros(4, dtype=np.float32),
+        components=np.array([[0, 0, 1, 0], [0, 0, 0, 1]], dtype=np.float32),
+    ).save(str(projection_path(data_dir, 1, job_id=job_id, input_fingerprint="abc")))
+
+    monkeypatch.setattr(
+        "game_web.services.meili_health_service.meilisearch.Client",
+        FakeHealthyClient,
+    )
+    captured = {}
+
+    class FakeEmbedder:
+        def __init__(self, model_name: str, use_fp16: bool = False):
+            pass
+
+        def encode_dense(self, texts, batch_size=64, max_length=128):
+            return np.array([[9.0, 9.0, 3.0, 4.0]], dtype=np.float32)
+
+    class FakeIndex:
+        def __init__(self, url, api_key, index_uid="games", embedder_name="bge_m3", embedding_dim=1024):
+            captured["embedding_dim"] = embedding_dim
+
+        def search_by_vector(self, query_vec, limit=10, embedder_key=None):
+            captured["query_vec"] = query_vec
+            return [{"name": "Test Game"}]
+
+    monkeypatch.setitem(sys.modules, "game_semantic.embedding", SimpleNamespace(BgeM3Embedder=FakeEmbedder))
+    monkeypatch.setitem(sys.modules, "game_semantic.meili_client", SimpleNamespace(MeiliGameIndex=FakeIndex))
+
+    assert execute_search(str(db_path), 1, "zelda", data_dir=data_dir) == [{"name": "Test Game"}]
+    assert captured["embedding_dim"] == 2
+    assert captured["query_vec"] == pytest.approx([0.6, 0.8])
+
+
+def test_execute_search_reranks_dense_candidates_with_the_profile_mode(tmp_path, monkeypatch):
+    import numpy as np
+
+    from game_web.services.embedding_profile import upsert_active_profile
+
+    db_path = tmp_path / "app.db"
+    data_dir = tmp_path / "data"
+    init_db(str(db_path))
+    conn = connect_db(str(db_path))
+    try:
+        set_setting(conn, "meili_url", "http://127.0.0.1:7700", commit=False)
+        library_service.create_library(conn, name="Main Library", index_uid="main-index")
+        upsert_active_profile(
+            conn,
+            library_id=1,
+            model_name="BAAI/bge-m3",
+            use_fp16=0,
+            max_length=128,
+            rerank_mode="sparse",
+            rerank_candidates=5,
+        )
+        dataset = dataset_service.create_dataset(
+            conn, data_dir=data_dir, library_id=1, filename="games.txt", content=b"A\n", commit=False
+        )
+        job_service.create_job(
+            conn,
+            library_id=1,
+            dataset_id=int(dataset["id"]),
+            job_type="build",
+            status="done",
+            input_fingerprint="abc",
+            commit=False,
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+    monkeypatch.setattr(
+        "game_web.services.meili_health_service.meilisearch.Client",
+        FakeHealthyClient,
+    )
+    captured = {}
+
+    class FakeEmbedder:
+        def __init__(self, model_name: str, use_fp16: bool = False):
+            pass
+
+        def encode_dense(self, texts, batch_size=64, max_length=128):
+            return np.array([[1.0, 0.0]], dtype=np.float32)
+
+        def encode_multi(self, texts, batch_size=64, max_length=128, *, sparse=True, colbert=True):
+            return {
+                "dense_vecs": np.zeros((len(texts), 2), dtype=np.float32),
+                "lexical_weights": [{word: 1.0 for word in text.lower().split()} for text in texts],
+            }
+
+    class FakeIndex:
+        def __init__(self, url, api_key, index_uid="games", embedder_name="bge_m3", embedding_dim=1024):
+            pass
+
+        def search_by_vector(self, query_vec, limit=10, embedder_key=None, show_ranking_score=False):
+            captured["limit"] = limit
+            captured["show_ranking_score"] = show_ranking_score
+            return [
+                {"id": 1, "name": "Mario Kart", "_rankingScore": 0.9},
+                {"id": 2, "name": "Zelda", "_rankingScore": 0.8},
+            ]
+
+    monkeypatch.setitem(sys.modules, "game_semantic.embedding", SimpleNamespace(BgeM3Embedder=FakeEmbedder))
+    monkeypatch.setitem(sys.modules, "game_semantic.meili_client", SimpleNamespace(MeiliGameIndex=FakeIndex))
+
+    hits = execute_search(str(db_path), 1, "zelda", limit=1, data_dir=data_dir)
+
+    assert [hit["name"] for hit in hits] == ["Zelda"]
+    assert captured == {"limit": 5, "show_ranking_score": True}
+    assert list((data_dir / "rerank").glob("library-1-abc.sqlite"))
@@ -13,6 +13,7 @@ from game_web.services.search_executor import (
     SearchConnectionError,
     SearchModelError,
     SearchNotReadyError,
+    SearchPage,
 )
 from game_web.services.settings_service import set_setting
 
@@ -106,13 +107,13 @@ def test_search_route_uses_active_config_without_embedder_query(tmp_path, monkey
 
     called = {}
 
-    def _fake_execute(db_path_value, library_id_value, query_value, limit_value=None, data_dir=None):
-        called["args"] = (db_path_value, library_id_value, query_value, limit_value, data_dir)
-        return [{"name": "Test Game"}]
+    def _fake_execute(db_path_value, library_id_value, query_value, *, offset=0, limit=None, cursor=None, data_dir=None):
+        called["args"] = (db_path_value, library_id_value, query_value, offset, limit, cursor, data_dir)
+        return SearchPage([{"name": "Test Game", "_federatedScore": 0.5}], offset, limit, True, "tok")
 
     import game_web.routes.search as search_routes
 
-    monkeypatch.setattr(search_routes, "execute_search", _fake_execute, raising=False)
+    monkeypatch.setattr(search_routes, "execute_search_page", _fake_execute, raising=False)
 
     response = client.get(
         f"/search?library={library_id}&q=zelda",
@@ -120,7 +121,55 @@ def test_search_route_uses_active_config_without_embedder_query(tmp_path, monkey
     )
 
     assert response.status_code == 200
-    assert called["args"] == (str(db_path), library_id, "zelda", None, app.state.data_dir)
+    assert called["args"] == (str(db_path), library_id, "zelda", 0, 10, None, app.state.data_dir)
+    assert "<small>0.500</small>" in response.text
+    assert f"/search?library={library_id}&amp;q=zelda&amp;offset=10&amp;cursor=tok" in response.text
+    assert "Previous" not in response.text
+
+    response = client.get(f"/search?library={library_id}&q=zelda&offset=10&cursor=tok", follow_redirects=False)
+
+    assert called["args"] == (str(db_path), library_id, "zelda", 10, 10, "tok", app.state.data_dir)
+    assert f"/search?library={library_id}&amp;q=zelda&amp;cursor=tok" in response.text
+
+
+def test_search_all_libraries_renders_labelled_merged_hits(tmp_path, monkeypatch):
+    db_path = tmp_path / "app.db"
+    app = create_app(str(db_path))
+    app.state.data_dir = tmp_path / "data"
+    client = TestClient(app)
+
+    conn = connect_db(str(db_path))
+    try:
+        set_setting(conn, "meili_url", "http://127.0.0.1:7700", commit=False)
+        _create_searchable_library(conn, app.state.data_dir, name="Retail", index_uid="retail")
+        _create_searchable_library(conn, app.state.data_dir, name="Scans", index_uid="scans")
+        conn.commit()
+    finally:
+        conn.close()
+
+    _login(client)
+    monkeypatch.setattr(
+        "game_web.services.meili_health_service.meilisearch.Client",
+        FakeHealthyClient,
+    )
+
+    called = {}
+
+    def _fake_execute_all(db_path_value, library_id_value, query_value, *, offset=0, limit=None, cursor=None, data_dir=None):
+        called["args"] = (db_path_value, library_id_value, query_value, offset, data_dir)
+        hits = [{"name": "Zelda", "library_name": "Scans"}, {"name": "Zelda II", "library_name": "Retail"}]
+        return SearchPage(hits, offset, limit, False, None)
+
+    import game_web.routes.search as search_routes
+
+    monkeypatch.setattr(search_routes, "execute_search_page", _fake_execute_all)
+
+    response = client.get("/search?library=all&q=zelda", follow_redirects=False)
+
+    assert response.status_code == 200
+    assert called["args"] == (str(db_path), None, "zelda", 0, app.state.data_dir)
+    assert '<option value="all" selected>All libraries</option>' in response.text
+    assert "Zelda <small>Scans</small>" in response.text
 
 
 def test_search_manual_library_id_cannot_bypass_searchable_gating_when_settings_missing(tmp_path, monkeypatch):
@@ -214,7 +263,7 @@ def test_search_shows_library_not_searchable_yet_message(tmp_path, monkeypatch):
 
     import game_web.routes.search as search_routes
 
-    monkeypatch.setattr(search_routes, "execute_search", _boom, raising=False)
+    monkeypatch.setattr(search_routes, "execute_search_page", _boom, raising=False)
 
     response = client.get(
         f"/search?library={library_id}&q=zelda",
@@ -249,7 +298,7 @@ def test_search_shows_last_build_failed_message(tmp_path, monkeypatch):
 
     import game_web.routes.search as search_routes
 
-    monkeypatch.setattr(search_routes, "execute_search", _boom, raising=False)
+    monkeypatch.setattr(search_routes, "execute_search_page", _boom, raising=False)
 
     response = client.get(
         f"/search?library={library_id}&q=zelda",
@@ -284,7 +333,7 @@ def test_search_shows_meili_connection_failed_message(tmp_path, monkeypatch):
 
     import game_web.routes.search as search_routes
 
-    monkeypatch.setattr(search_routes, "execute_search", _boom, raising=False)
+    monkeypatch.setattr(search_routes, "execute_search_page", _boom, raising=False)
 
     response = client.get(
         f"/search?library={library_id}&q=zelda",
@@ -319,7 +368,7 @@ def test_search_shows_specific_error_message_when_model_load_fails(tmp_path, mon
 
     import game_web.routes.search as search_routes
 
-    monkeypatch.setattr(search_routes, "execute_search", _boom, raising=False)
+    monkeypatch.setattr(search_routes, "execute_search_page", _boom, raising=False)
 
     response = client.get(
         f"/search?library={library_id}&q=zelda",
@@ -356,11 +405,11 @@ def test_search_shows_exact_no_hit_message(tmp_path, monkeypatch):
     )
 
     def _empty(*args, **kwargs):
-        return []
+        return SearchPage([], 0, 10, False, None)
 
     import game_web.routes.search as search_routes
 
-    monkeypatch.setattr(search_routes, "execute_search", _empty, raising=False)
+    monkeypatch.setattr(search_routes, "execute_search_page", _empty, raising=False)
 
     response = client.get(
         f"/search?library={library_id}&q=zelda",
@@ -401,7 +450,7 @@ def test_search_shows_actionable_error_when_backend_search_fails(tmp_path, monke
 
     import game_web.routes.search as search_routes
 
-    monkeypatch.setattr(search_routes, "execute_search", _boom, raising=False)
+    monkeypatch.setattr(search_routes, "execute_search_page", _boom, raising=False)
 
     response = client.get(
         f"/search?library={library_id}&q=zelda",
@@ -0,0 +1,81 @@
+import json
+
+import pytest
+
+from game_semantic.deduper import load_items_from_json, load_items_from_txt
+from game_semantic.synthetic import CatalogueSpec, generate_catalogue, write_catalogue
+
+
+def test_same_spec_yields_same_rows_and_seed_changes_them():
+    spec = CatalogueSpec(rows=500, seed=7, files=True)
+
+    first = [row.to_item() for row in generate_catalogue(spec)]
+    second = [row.to_item() for row in generate_catalogue(spec)]
+    other = [row.to_item() for row in generate_catalogue(CatalogueSpec(rows=500, seed=8, files=True))]
+
+    assert first == second
+    assert first != other
+
+
+def test_rates_control_variants_and_exact_repeats():
+    rows = list(generate_catalogue(CatalogueSpec(rows=4000, seed=1, variant_rate=0.2, repeat_rate=0.05)))
+    kinds = [row.kind for row in rows]
+    names = [row.name for row in rows]
+
+    assert kinds.count("variant") / len(rows) == pytest.approx(0.2, abs=0.03)
+    assert kinds.count("repeat") / len(rows) == pytest.approx(0.05, abs=0.015)
+    assert len(set(names)) == len(rows) - kinds.count("repeat")
+    assert any(" / " in name for name in names)
+    assert any(ord(char) > 0x3000 for name in names for char in name)
+
+    unique = list(generate_catalogue(CatalogueSpec(rows=2000, seed=1, variant_rate=0.0, repeat_rate=0.0)))
+    assert len({row.name for row in unique}) == 2000
+
+
+def test_mean_words_shifts_the_length_distribution():
+    short = [len(row.name) for row in generate_catalogue(CatalogueSpec(rows=1000, mean_words=1.5, alias_rate=0.0))]
+    long = [len(row.name) for row in generate_catalogue(CatalogueSpec(rows=1000, mean_words=5.0, alias_rate=0.0))]
+
+    assert sum(long) / len(long) > 1.5 * sum(short) / len(short)
+
+
+def test_file_records_keep_variants_close_to_their_original():
+    rows = list(generate_catalogue(CatalogueSpec(rows=300, seed=2, files=True)))
+
+    for row in rows:
+        assert "/" not in row.name
+        assert row.path.startswith("/data/games/") and row.path.endswith(row.name)
+        assert row.size > 0 and row.ctime >= row.mtime
+    assert any(row.path.startswith("/data/games/backup/") for row in rows if row.kind == "repeat")
+
+
+@pytest.mark.parametrize("fmt", ["json", "ndjson"])
+def test_written_records_load_as_dedupe_input(tmp_path, fmt):
+    path = tmp_path / f"items.{fmt}"
+    spec = CatalogueSpec(rows=200, seed=3, files=True)
+
+    stats = write_catalogue(generate_catalogue(spec), str(path), fmt)
+    items = load_items_from_json(str(path))
+
+    assert stats.rows == len(items) == 200
+    assert stats.originals + stats.variants + stats.repeats == 200
+    assert [item.name for item in items] == [row.name for row in generate_catalogue(spec)]
+    assert all(item.size and item.mtime for item in items)
+    if fmt == "ndjson":
+        assert json.loads(path.read_text(encoding="utf-8").splitlines()[0])["name"] == items[0].name
+
+
+def test_txt_output_is_a_games_list(tmp_path):
+    path = tmp_path / "games.txt"
+
+    stats = write_catalogue(generate_catalogue(CatalogueSpec(rows=150, seed=4)), str(path), "txt")
+
+    assert len(load_items_from_txt(str(path))) == 150
+    assert 0 < stats.chars_p50 <= stats.chars_p95 <= stats.chars_max
+
+
+def test_spec_validation():
+    with pytest.raises(ValueError, match="must not exceed 1"):
+        CatalogueSpec(variant_rate=0.7, repeat_rate=0.5).validate()
+    with pytest.raises(ValueError, match="Unknown catalogue format"):
+        write_catalogue([], "unused", "csv")
@@ -0,0 +1,100 @@
+import importlib
+
+import meilisearch
+import pytest
+
+from benchmarks.fake_meili import FakeMeiliProfile, FakeMeiliServer
+
+
+@pytest.fixture
+def meili_client():
+    # Other tests reload the module against a stubbed SDK; talk HTTP through the real one.
+    return importlib.reload(importlib.import_module("game_semantic.meili_client"))
+
+
+def _docs(start, count, dims=3):
+    return [{"id": n, "name": f"Game {n}", "_vectors": {"bge_m3": [1.0] * dims}} for n in range(start, start + count)]
+
+
+def test_one_poll_covers_every_pending_task(meili_client):
+    with FakeMeiliServer(profile=FakeMeiliProfile(task_latency=0.01)) as server:
+        client = meilisearch.Client(server.url)
+        tracker = meili_client.TaskTracker(client)
+        for start in range(0, 40, 5):
+            tracker.add(client.index("games").add_documents(_docs(start, 5)).task_uid)
+        assert tracker.pending == 8
+
+        assert tracker.wait(6) > 0.0
+        assert tracker.pending <= 6
+        polls = tracker.polls
+        server.state.wait_idle()
+        tracker.wait()
+
+        assert tracker.pending == 0
+        assert len(server.state.indexes["games"].documents) == 40
+    assert tracker.polls == polls + 1
+    assert server.state.request_counts["GET /tasks"] == tracker.polls
+    assert server.state.request_counts["GET /tasks/{task_uid}"] == 0
+
+
+def test_first_failed_task_raises(meili_client):
+    with FakeMeiliServer() as server:
+        index = meili_client.MeiliGameIndex(server.url, "", index_uid="games", embedding_dim=3)
+        server.state.wait_idle()
+        index.ensure_settings()
+        tracker = meili_client.TaskTracker(index.client)
+        tracker.add(index.add_documents(_docs(1, 2), wait=False)["task_uid"])
+        tracker.add(index.add_documents(_docs(3, 2, dims=1), wait=False)["task_uid"])
+
+        with pytest.raises(RuntimeError, match="Expected 3 dimensions"):
+            tracker.wait()
+
+
+def test_transient_task_failures_are_resubmitted(meili_client):
+    retry = meili_client.MeiliRetry(max_retries=5, sleep=lambda _delay: None)
+    with FakeMeiliServer(profile=FakeMeiliProfile(task_failure_rate=0.5, seed=4)) as server:
+        client = meilisearch.Client(server.url)
+        tracker = meili_client.TaskTracker(client, retry=retry)
+        for start in range(0, 24, 3):
+            docs = _docs(start, 3)
+            resubmit = lambda docs=docs: client.index("games").add_documents(docs).task_uid
+            tracker.add(resubmit(), resubmit)
+        server.state.fail_next(1, path_prefix="/tasks")
+
+        tracker.wait()
+
+        assert len(server.state.indexes["games"].documents) == 24
+    assert retry.resubmits > 0
+    assert retry.poll_retries == 1
+
+
+def test_build_pipelines_uploads_through_the_tracker(meili_client, monkeypatch, tmp_path):
+    from benchmarks.fakes import HashEmbedder
+    from game_semantic import index_builder
+    from game_semantic.config import Config
+
+    monkeypatch.setattr(index_builder, "MeiliGameIndex", meili_client.MeiliGameIndex)
+    monkeypatch.setattr(index_builder, "MeiliRetry", meili_client.MeiliRetry)
+    monkeypatch.setattr(index_builder, "TaskTracker", meili_client.TaskTracker)
+    monkeypatch.setattr(index_builder, "get_cached_embedder", lambda *_args: HashEmbedder())
+    txt_path = tmp_path / "games.txt"
+    txt_path.write_text("".join(f"Game {n}\n" for n in range(30)), encoding="utf-8")
+    reports = []
+
+    with FakeMeiliServer(profile=FakeMeiliProfile(task_latency=0.02)) as server:
+        config = Config(
+            meili_url=server.url,
+            meili_index_uid="games",
+            txt_path=str(txt_path),
+            index_batch_size=4,
+            index_pipeline_depth=3,
+        )
+        index_builder.build_index(config, progress=reports.append)
+
+        assert len(server.state.indexes["games"].documents) == 30
+        statuses = {task["status"] for task in server.state.tasks.values()}
+    assert statuses == {"succeeded"}
+    assert reports[-1].finished and reports[-1].docs_done == 30
+    # Per-task polls are left to index setup; uploads are followed through the batched listing.
+    assert server.state.request_counts["GET /tasks/{task_uid}"] <= 3
+    assert server.state.request_counts["GET /tasks"] >= 1
@@ -43,6 +43,7 @@ def test_web_ui_main_uses_reload_compatible_factory(tmp_path, monkeypatch):
     )
     monkeypatch.delenv("GAME_WEB_DB_PATH", raising=False)
     monkeypatch.delenv("GAME_WEB_DATA_DIR", raising=False)
+    monkeypatch.delenv("GAME_WEB_WARM_UP", raising=False)
 
     module.main()
 
@@ -56,6 +57,7 @@ def test_web_ui_main_uses_reload_compatible_factory(tmp_path, monkeypatch):
     }
     assert os.environ["GAME_WEB_DB_PATH"] == str(data_dir / "app.db")
     assert os.environ["GAME_WEB_DATA_DIR"] == str(data_dir)
+    assert os.environ["GAME_WEB_WARM_UP"] == "1"
 
 
 def test_create_web_ui_app_reads_runtime_paths_from_env(tmp_path, monkeypatch):
@@ -79,3 +81,14 @@ def test_create_web_ui_app_defaults_db_path_under_data_dir(tmp_path, monkeypatch
 
     assert app.state.db_path == str(data_dir / "app.db")
     assert app.state.data_dir == data_dir
+
+
+def test_create_app_warm_up_runs_in_background_after_startup(tmp_path):
+    from fastapi.testclient import TestClient
+
+    app = app_module.create_app(str(tmp_path / "app.db"), warm_up=True)
+
+    with TestClient(app) as client:
+        assert client.get("/healthz").json() == {"status": "ok"}
+        app.state.warm_up_thread.join(timeout=5)
+        assert not app.state.warm_up_thread.is_alive()
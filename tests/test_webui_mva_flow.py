@@ -97,7 +97,7 @@ def test_admin_can_configure_create_upload_run_and_search(monkeypatch, tmp_path)
     fake_indexes: dict[str, list[dict[str, object]]] = {}
     build_calls: list[object] = []
 
-    def _fake_build_index(config):
+    def _fake_build_index(config, progress=None, expected_docs=None):
         build_calls.append(config)
         with open(config.txt_path, "r", encoding="utf-8") as handle:
             names = [line.strip() for line in handle if line.strip()]
@@ -123,8 +123,15 @@ def test_admin_can_configure_create_upload_run_and_search(monkeypatch, tmp_path)
             self.embedder_name = embedder_name
             self.embedding_dim = embedding_dim
 
-        def search_by_vector(self, query_vector, limit: int = 10, embedder_key: str | None = None):
-            return fake_indexes.get(self.index_uid, [])[:limit]
+        def search_by_vector(
+            self,
+            query_vector,
+            limit: int = 10,
+            embedder_key: str | None = None,
+            show_ranking_score: bool = False,
+            offset: int = 0,
+        ):
+            return fake_indexes.get(self.index_uid, [])[offset : offset + limit]
 
     monkeypatch.setattr(
         "game_web.services.meili_health_service.meilisearch.Client",
@@ -235,7 +242,7 @@ def test_failed_build_keeps_library_out_of_search_and_surfaces_job_error(monkeyp
     app = create_app(str(db_path), data_dir=data_dir)
     client = TestClient(app, raise_server_exceptions=False)
 
-    def _failing_build_index(config):
+    def _failing_build_index(config, progress=None, expected_docs=None):
         raise RuntimeError("build exploded")
 
     monkeypatch.setattr(